@@ -101,6 +101,23 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help=(
+            "Write the timeline of the integration setups to"
+            " CONFIG/home-assistant.startup-trace.json in the Chrome trace format"
+        ),
+    )
+    parser.add_argument(
+        "--timer-wheel-resolution",
+        type=float,
+        default=None,
+        help=(
+            "Group the timers of automations and integrations into slots of this"
+            " many seconds and fire each slot at once"
+        ),
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -196,6 +213,8 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        startup_trace=args.startup_trace,
+        timer_wheel_resolution=args.timer_wheel_resolution,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 import contextlib
+import dataclasses
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import logging.handlers
 import os
@@ -16,7 +19,7 @@ from typing import TYPE_CHECKING, Any
 import voluptuous as vol
 import yarl
 
-from . import config as conf_util, config_entries, core, loader
+from . import config as conf_util, config_entries, core, loader, requirements
 from .components import http
 from .const import (
     FORMAT_DATETIME,
@@ -36,6 +39,7 @@ from .helpers import (
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.json import save_json
 from .helpers.typing import ConfigType
 from .setup import (
     DATA_SETUP,
@@ -58,6 +62,10 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
 DATA_REGISTRIES_LOADED = "bootstrap_registries_loaded"
+# hass.data key for the SetupTimeline of bootstrap.
+DATA_SETUP_TIMELINE = "bootstrap_setup_timeline"
+
+STARTUP_TRACE_FILENAME = "home-assistant.startup-trace.json"
 
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
@@ -90,6 +98,9 @@ RECORDER_INTEGRATIONS = {
     "recorder",
 }
 DISCOVERY_INTEGRATIONS = ("bluetooth", "dhcp", "ssdp", "usb", "zeroconf")
+# Names of the setup jobs that start stage 1 and wait for stage 1
+_STAGE_1_START = "stage 1 start"
+_STAGE_1_DONE = "stage 1"
 STAGE_1_INTEGRATIONS = {
     # We need to make sure discovery integrations
     # update their deps before stage 2 integrations
@@ -111,6 +122,8 @@ async def async_setup_hass(
 ) -> core.HomeAssistant | None:
     """Set up Home Assistant."""
     hass = core.HomeAssistant(runtime_config.config_dir)
+    if runtime_config.timer_wheel_resolution:
+        hass.async_enable_timer_wheel(runtime_config.timer_wheel_resolution)
 
     async_enable_logging(
         hass,
@@ -198,6 +211,13 @@ async def async_setup_hass(
             hass,
         )
 
+    if runtime_config.startup_trace and DATA_SETUP_TIMELINE in hass.data:
+        await hass.async_add_executor_job(
+            save_json,
+            hass.config.path(STARTUP_TRACE_FILENAME),
+            hass.data[DATA_SETUP_TIMELINE].as_chrome_trace(),
+        )
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
@@ -536,6 +556,230 @@ async def async_setup_multi_components(
             )
 
 
+@dataclasses.dataclass(slots=True)
+class SetupTimelineEntry:
+    """Timing of a setup job, in seconds since the start of the timeline."""
+
+    name: str
+    category: str
+    started: float
+    finished: float | None = None
+    # The job that was waited for last before this job started
+    waited_for: str | None = None
+
+
+class SetupTimeline:
+    """Timings of the setup jobs of bootstrap."""
+
+    __slots__ = ("start", "entries")
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.start = monotonic()
+        self.entries: dict[str, SetupTimelineEntry] = {}
+
+    @core.callback
+    def async_start(
+        self, name: str, category: str, waited_for: str | None
+    ) -> SetupTimelineEntry:
+        """Record the start of a setup job."""
+        entry = self.entries[name] = SetupTimelineEntry(
+            name, category, monotonic() - self.start, waited_for=waited_for
+        )
+        return entry
+
+    @core.callback
+    def async_finish(self, entry: SetupTimelineEntry) -> None:
+        """Record the end of a setup job."""
+        entry.finished = monotonic() - self.start
+
+    def critical_path(self) -> list[SetupTimelineEntry]:
+        """Return the chain of jobs that held back the job that finished last."""
+        finished = [entry for entry in self.entries.values() if entry.finished]
+        if not finished:
+            return []
+        entry: SetupTimelineEntry | None = max(
+            finished, key=lambda entry: entry.finished or 0
+        )
+        path: list[SetupTimelineEntry] = []
+        while entry is not None:
+            path.append(entry)
+            entry = self.entries.get(entry.waited_for) if entry.waited_for else None
+        return path[::-1]
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the timeline in the Chrome trace event format.
+
+        The trace can be opened with chrome://tracing or Perfetto.
+        """
+        critical = {entry.name for entry in self.critical_path()}
+        lanes: list[float] = []
+        events: list[dict[str, Any]] = []
+        for entry in sorted(self.entries.values(), key=lambda entry: entry.started):
+            finished = entry.finished if entry.finished is not None else entry.started
+            # Put the job on the first lane that is free when it starts
+            lane = next(
+                (idx for idx, free in enumerate(lanes) if free <= entry.started),
+                len(lanes),
+            )
+            if lane == len(lanes):
+                lanes.append(finished)
+            else:
+                lanes[lane] = finished
+            events.append(
+                {
+                    "name": entry.name,
+                    "cat": entry.category,
+                    "ph": "X",
+                    "ts": round(entry.started * 1e6),
+                    "dur": round((finished - entry.started) * 1e6),
+                    "pid": 1,
+                    "tid": lane,
+                    "args": {
+                        "waited_for": entry.waited_for,
+                        "finished": entry.finished is not None,
+                        "critical_path": entry.name in critical,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+class _SetupGraph:
+    """Run setup jobs as soon as the jobs they wait for are done."""
+
+    __slots__ = ("hass", "timeline", "_jobs")
+
+    def __init__(self, hass: core.HomeAssistant, timeline: SetupTimeline) -> None:
+        """Initialize the graph."""
+        self.hass = hass
+        self.timeline = timeline
+        self._jobs: dict[
+            str,
+            tuple[str, Callable[[], Awaitable[Any]], set[str], float | None],
+        ] = {}
+
+    def add(
+        self,
+        name: str,
+        category: str,
+        job: Callable[[], Awaitable[Any]],
+        waits_for: set[str],
+        timeout: float | None = None,
+    ) -> None:
+        """Add a job that starts when the jobs it waits for are done.
+
+        Jobs that are waited for longer than the timeout are no
+        longer waited for.
+        """
+        self._jobs[name] = (category, job, waits_for, timeout)
+
+    async def async_run(self) -> None:
+        """Run all jobs and wait for them to finish."""
+        waits_for = {
+            name: waits_for & self._jobs.keys()
+            for name, (_, _, waits_for, _) in self._jobs.items()
+        }
+        if cyclic := _async_cyclic_jobs(waits_for):
+            _LOGGER.warning(
+                "Circular setup dependencies between %s, setting them up together",
+                ", ".join(sorted(cyclic)),
+            )
+            for name in cyclic:
+                waits_for[name] -= cyclic
+        tasks: dict[str, asyncio.Task[None]] = {}
+        for name, (category, job, _, timeout) in self._jobs.items():
+            tasks[name] = self.hass.async_create_task(
+                self._async_run_job(
+                    name, category, job, waits_for[name], timeout, tasks
+                ),
+                f"bootstrap setup {name}",
+            )
+        if tasks:
+            await asyncio.wait(tasks.values())
+
+    async def _async_run_job(
+        self,
+        name: str,
+        category: str,
+        job: Callable[[], Awaitable[Any]],
+        waits_for: set[str],
+        timeout: float | None,
+        tasks: dict[str, asyncio.Task[None]],
+    ) -> None:
+        """Run a job when the jobs it waits for are done."""
+        if waits_for:
+            waiting = [tasks[waited] for waited in waits_for]
+            if timeout is None:
+                await asyncio.wait(waiting)
+            else:
+                try:
+                    async with self.hass.timeout.async_timeout(
+                        timeout, cool_down=COOLDOWN_TIME
+                    ):
+                        await asyncio.wait(waiting)
+                except asyncio.TimeoutError:
+                    _LOGGER.warning("Setup timed out for %s - moving forward", name)
+        entries = self.timeline.entries
+        waited_for = max(
+            (
+                waited
+                for waited in waits_for
+                if waited in entries and entries[waited].finished is not None
+            ),
+            key=lambda waited: entries[waited].finished or 0,
+            default=None,
+        )
+        entry = self.timeline.async_start(name, category, waited_for)
+        result = (await asyncio.gather(job(), return_exceptions=True))[0]
+        self.timeline.async_finish(entry)
+        if isinstance(result, BaseException):
+            _LOGGER.error(
+                "Error setting up integration %s - received exception"
+                if category == "setup"
+                else "Error running setup job %s - received exception",
+                name,
+                exc_info=(type(result), result, result.__traceback__),
+            )
+
+
+def _async_cyclic_jobs(waits_for: dict[str, set[str]]) -> set[str]:
+    """Return the jobs that wait for each other in a cycle."""
+    remaining = {name: set(waited) for name, waited in waits_for.items()}
+    # Remove the jobs that can start, then the jobs nothing else waits for
+    while done := [name for name, waited in remaining.items() if not waited]:
+        for name in done:
+            del remaining[name]
+        for waited in remaining.values():
+            waited.difference_update(done)
+    while unwaited := remaining.keys() - set().union(*remaining.values()):
+        for name in unwaited:
+            del remaining[name]
+    return set(remaining)
+
+
+async def _async_process_requirements(hass: core.HomeAssistant, domain: str) -> None:
+    """Process the requirements of an integration and its dependencies.
+
+    Failures are logged when the integration is set up.
+    """
+    with contextlib.suppress(HomeAssistantError, loader.LoaderError):
+        await requirements.async_get_integration_with_requirements(hass, domain)
+
+
+def _async_promote_dependencies(
+    domains: set[str],
+    candidates: set[str],
+    integration_cache: dict[str, loader.Integration],
+) -> set[str]:
+    """Return the domains with all of their dependencies within the candidates."""
+    promoted = set(domains)
+    for domain in domains:
+        if (itg := integration_cache.get(domain)) is not None:
+            promoted.update(itg.all_dependencies & candidates)
+    return promoted
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -587,83 +831,127 @@ async def _async_set_up_integrations(
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
 
-    # Load logging as soon as possible
-    if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
-        _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
-
-    # Setup frontend
-    if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
-        _LOGGER.info("Setting up frontend: %s", frontend_domains)
-        await async_setup_multi_components(hass, frontend_domains, config)
-
-    # Setup recorder
-    if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
-        _LOGGER.info("Setting up recorder: %s", recorder_domains)
-        await async_setup_multi_components(hass, recorder_domains, config)
-
-    # Start up debuggers. Start these first in case they want to wait.
-    if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
-        _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
-
-    # calculate what components to setup in what stage
-    stage_1_domains: set[str] = set()
-
-    # Find all dependencies of any dependency of any stage 1 integration that
-    # we plan on loading and promote them to stage 1. This is done only to not
-    # get misleading log messages
-    deps_promotion: set[str] = STAGE_1_INTEGRATIONS
-    while deps_promotion:
-        old_deps_promotion = deps_promotion
-        deps_promotion = set()
-
-        for domain in old_deps_promotion:
-            if domain not in domains_to_setup or domain in stage_1_domains:
-                continue
-
-            stage_1_domains.add(domain)
-
-            if (dep_itg := integration_cache.get(domain)) is None:
-                continue
-
-            deps_promotion.update(dep_itg.all_dependencies)
-
-    stage_2_domains = (
-        domains_to_setup
-        - logging_domains
-        - frontend_domains
-        - recorder_domains
-        - debuggers
-        - stage_1_domains
+    # Integrations that have to be set up before others, with the
+    # dependencies they need promoted to their group
+    groups: dict[str, set[str]] = {}
+    for group, group_domains in (
+        ("logging", LOGGING_INTEGRATIONS),
+        ("debuggers", DEBUGGER_INTEGRATIONS),
+        ("frontend", FRONTEND_INTEGRATIONS),
+        ("recorder", RECORDER_INTEGRATIONS),
+        ("stage 1", STAGE_1_INTEGRATIONS),
+    ):
+        groups[group] = _async_promote_dependencies(
+            domains_to_setup.difference(*groups.values()) & group_domains,
+            domains_to_setup.difference(*groups.values()),
+            integration_cache,
+        )
+    stage_1_domains = groups["stage 1"]
+    stage_2_domains = domains_to_setup.difference(*groups.values())
+    groups["stage 2"] = stage_2_domains
+    group_index = {
+        domain: index
+        for index, group_domains in enumerate(groups.values())
+        for domain in group_domains
+    }
+    discovery_domains = stage_1_domains.intersection(DISCOVERY_INTEGRATIONS)
+
+    timeline = hass.data[DATA_SETUP_TIMELINE] = SetupTimeline()
+    graph = _SetupGraph(hass, timeline)
+
+    # Integrations are set up as soon as the integrations they depend on are
+    # set up, and the integrations that have to be set up before others:
+    # - logging, to set the log levels
+    # - debuggers, in case they want to wait
+    # - frontend, before recorder
+    # - frontend and recorder, before stage 1 and stage 2, so integrations
+    #   can rely on the recorder being set up. The after dependencies of
+    #   stage 1 are only enabled then, so integrations set up before stage 1
+    #   do not wait for stage 1 integrations that wait for them.
+    # - stage 1, before stage 2. Discovery integrations only have to update
+    #   their requirements first, which stage 2 integrations might import.
+    # After dependencies on integrations of later groups are ignored.
+    for domain, index in group_index.items():
+        waits_for: set[str] = set()
+        if (integration := integration_cache.get(domain)) is not None:
+            waits_for.update(integration.all_dependencies)
+            waits_for.update(
+                dep
+                for dep in integration.after_dependencies
+                if group_index.get(dep, index + 1) <= index
+            )
+        if domain not in groups["logging"]:
+            waits_for |= groups["logging"]
+            if domain not in groups["debuggers"]:
+                waits_for |= groups["debuggers"]
+        if domain in groups["recorder"]:
+            waits_for |= groups["frontend"]
+        if domain in stage_1_domains or domain in stage_2_domains:
+            waits_for.add(_STAGE_1_START)
+        if domain in stage_2_domains:
+            waits_for.add(_STAGE_1_DONE)
+        waits_for.discard(domain)
+        graph.add(
+            domain,
+            "setup",
+            partial(async_setup_component, hass, domain, config),
+            waits_for,
+        )
+
+    for domain in discovery_domains:
+        graph.add(
+            f"{domain} requirements",
+            "requirements",
+            partial(_async_process_requirements, hass, domain),
+            set(),
+        )
+
+    async def _async_stage_1_start() -> None:
+        """Enable after dependencies when setting up stage 1 domains."""
+        async_set_domains_to_be_loaded(hass, stage_1_domains)
+
+    graph.add(
+        _STAGE_1_START,
+        "bootstrap",
+        _async_stage_1_start,
+        groups["logging"]
+        | groups["debuggers"]
+        | groups["frontend"]
+        | groups["recorder"],
     )
 
-    # Enables after dependencies when setting up stage 1 domains
-    async_set_domains_to_be_loaded(hass, stage_1_domains)
+    stage_1_done = asyncio.Event()
+
+    async def _async_stage_1_done() -> None:
+        """Enable after dependencies when setting up stage 2 domains."""
+        async_set_domains_to_be_loaded(hass, stage_2_domains)
+        stage_1_done.set()
+
+    graph.add(
+        _STAGE_1_DONE,
+        "bootstrap",
+        _async_stage_1_done,
+        _async_promote_dependencies(
+            stage_1_domains - discovery_domains, stage_1_domains, integration_cache
+        )
+        | {f"{domain} requirements" for domain in discovery_domains},
+        STAGE_1_TIMEOUT,
+    )
 
     # Start setup
-    if stage_1_domains:
-        _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
-
-    # Add after dependencies when setting up stage 2 domains
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
-
-    if stage_2_domains:
-        _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+    _LOGGER.info("Setting up stage 1: %s", domains_to_setup - stage_2_domains)
+    _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+    setup_task = hass.async_create_task(graph.async_run(), "bootstrap setup")
+    # Do not wait for stage 1 forever if the setup ends without it
+    setup_task.add_done_callback(lambda _: stage_1_done.set())
+    # The stage 1 job stops waiting for stage 1 after STAGE_1_TIMEOUT and
+    # logs the timeout itself
+    await stage_1_done.wait()
+    try:
+        async with hass.timeout.async_timeout(STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME):
+            await setup_task
+    except asyncio.TimeoutError:
+        _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -676,6 +964,14 @@ async def _async_set_up_integrations(
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
 
+    _LOGGER.debug(
+        "Integration setup critical path: %s",
+        " -> ".join(
+            f"{entry.name} ({(entry.finished or 0) - entry.started:.2f}s)"
+            for entry in timeline.critical_path()
+        ),
+    )
+
     _LOGGER.debug(
         "Integration setup times: %s",
         {
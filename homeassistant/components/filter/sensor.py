@@ -321,6 +321,8 @@ class SensorFilter(SensorEntity):
 
             # Retrieve the largest window_size of each type
             if largest_window_items > 0:
+                # The filters also process the updates of only the attributes,
+                # which the history cache does not keep, so load the last rows
                 filter_history = await get_instance(self.hass).async_add_executor_job(
                     partial(
                         history.get_last_state_changes,
@@ -333,22 +335,16 @@ class SensorFilter(SensorEntity):
                     history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
                 start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                history_cache = get_instance(self.hass).history_cache
+                history_list.extend(
+                    [
+                        state
+                        for state in await history_cache.async_state_changes(
+                            self._entity, start, include_start_time_state=True
+                        )
+                        if state not in history_list
+                    ]
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
 
             # Sort the window states
             history_list = sorted(history_list, key=lambda s: s.last_updated)
@@ -5,3 +5,7 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Historical states are sent to stream subscribers in
+# chunks of at most this many states per message
+MAX_HISTORY_STATES_PER_MESSAGE = 2000
@@ -38,7 +38,11 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    MAX_HISTORY_STATES_PER_MESSAGE,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,8 +76,27 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
+    if (
+        columnar
+        and entity_ids
+        and (
+            columns := history.get_significant_states_columnar(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        )
+        is not None
+    ):
+        return messages.construct_result_message(msg_id, columns.to_json())
     return JSON_DUMP(
         messages.result_message(
             msg_id,
@@ -103,6 +126,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -166,6 +190,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg["columnar"],
         )
     )
 
@@ -200,13 +225,17 @@ def _generate_websocket_response(
     start_time: dt,
     end_time: dt,
     states: MutableMapping[str, list[dict[str, Any]]],
+    partial: bool = False,
 ) -> str:
     """Generate a websocket response."""
-    return JSON_DUMP(
-        messages.event_message(
-            msg_id, _generate_stream_message(states, start_time, end_time)
-        )
-    )
+    message = _generate_stream_message(states, start_time, end_time)
+    if partial:
+        # This is a hint to consumers of the api that
+        # we are about to send another chunk of historical
+        # states in case the UI needs to show that historical
+        # data is still loading
+        message["partial"] = True
+    return JSON_DUMP(messages.event_message(msg_id, message))
 
 
 def _generate_historical_response(
@@ -214,52 +243,64 @@ def _generate_historical_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
-) -> tuple[float, dt | None, str | None]:
-    """Generate a historical response."""
-    states = cast(
-        MutableMapping[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    last_time_ts: float,
+    cursor: history.SignificantStatesCursor | None,
+) -> tuple[str | None, float, history.SignificantStatesCursor | None]:
+    """Fetch a chunk of historical states and convert it to json in the executor.
+
+    Returns the message or None if there is nothing to send, the time of
+    the newest state and the cursor of the next chunk.
+    """
+    chunk, cursor = history.get_significant_states_chunk(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        MAX_HISTORY_STATES_PER_MESSAGE,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        cursor,
     )
-    last_time_ts = 0.0
-    for state_list in states.values():
+    for state_list in chunk.values():
         if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
+            state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED]
+        ) > last_time_ts:
             last_time_ts = cast(float, state_last_time)
-
-    if last_time_ts == 0:
-        # If we did not send any states ever, we need to send an empty response
-        # so the websocket client knows it should render/process/consume the
-        # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
-
+    if cursor is not None:
+        # More chunks follow
+        if not chunk:
+            return None, last_time_ts, cursor
+        return (
+            _generate_websocket_response(
+                msg_id,
+                start_time,
+                dt_util.utc_from_timestamp(last_time_ts),
+                chunk,
+                partial=True,
+            ),
+            last_time_ts,
+            cursor,
+        )
+    # If we did not send any states ever, we need to send an empty response
+    # so the websocket client knows it should render/process/consume the
+    # data.
+    if not chunk and not send_empty:
+        return None, last_time_ts, None
+    last_time_dt = (
+        dt_util.utc_from_timestamp(last_time_ts) if last_time_ts else end_time
+    )
     return (
+        _generate_websocket_response(msg_id, start_time, last_time_dt, chunk),
         last_time_ts,
-        last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        None,
     )
 
 
@@ -269,31 +310,58 @@ async def _async_send_historical_states(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    The states are fetched in chunks and the next chunk is only fetched
+    once the client has caught up, so the memory used does not depend
+    on the length of the time period and no database session is held
+    while waiting for the client. All chunks but the last one are sent
+    as partial.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    last_time_ts = 0.0
+    cursor: history.SignificantStatesCursor | None = None
+    while True:
+        message, last_time_ts, cursor = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            # The last chunk ends the partial ones which were sent
+            send_empty or bool(last_time_ts),
+            last_time_ts,
+            cursor,
+        )
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while fetching historical states
+            break
+        if cursor is None:
+            if message:
+                connection.send_message(message)
+            break
+        if message:
+            try:
+                await connection.async_send_message_and_wait(msg_id, message)
+            except TimeoutError:
+                # The subscription was ended
+                _LOGGER.debug(
+                    "Client did not catch up with the history of %s in time", msg_id
+                )
+                break
+    return dt_util.utc_from_timestamp(last_time_ts) if last_time_ts else None
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
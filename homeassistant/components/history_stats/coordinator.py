@@ -37,6 +37,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         self._subscriber_count = 0
         self._at_start_listener: CALLBACK_TYPE | None = None
         self._track_events_listener: CALLBACK_TYPE | None = None
+        self._track_history_listener: CALLBACK_TYPE | None = None
         super().__init__(
             hass,
             _LOGGER,
@@ -70,10 +71,14 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         if self._at_start_listener:
             self._at_start_listener()
             self._at_start_listener = None
+        if self._track_history_listener:
+            self._track_history_listener()
+            self._track_history_listener = None
 
     @callback
     def _async_add_listener(self) -> None:
         """Add a listener to start tracking state changes after start."""
+        self._track_history_listener = self._history_stats.async_track_history()
         self._at_start_listener = async_at_start(
             self.hass, self._async_add_events_listener
         )
@@ -4,8 +4,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 import datetime
 
-from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import HomeAssistant, State
+from homeassistant.components.recorder import get_instance
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import EventType
@@ -138,38 +138,29 @@ class HistoryStats:
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
+    @callback
+    def async_track_history(self) -> CALLBACK_TYPE:
+        """Keep the history of the entity cached and return a callback to release it."""
+        return get_instance(self.hass).history_cache.async_track_entity(self.entity_id)
+
     async def _async_history_from_db(
         self,
         current_period_start_timestamp: float,
         current_period_end_timestamp: float,
     ) -> None:
         """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
+        states = await get_instance(self.hass).history_cache.async_state_changes(
+            self.entity_id,
+            dt_util.utc_from_timestamp(current_period_start_timestamp),
+            dt_util.utc_from_timestamp(current_period_end_timestamp),
+            include_start_time_state=True,
+            no_attributes=True,
         )
         self._history_current_period = [
             HistoryState(state.state, state.last_changed.timestamp())
             for state in states
         ]
 
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
-
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
     ) -> tuple[float, int]:
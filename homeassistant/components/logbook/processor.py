@@ -10,6 +10,7 @@ from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -142,32 +143,76 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+            return self.humanify(self._select_rows(session, start_day, end_day))
+
+    def get_events_chunk(
+        self,
+        start_day: dt,
+        end_day: dt,
+        chunk_size: int,
+    ) -> tuple[list[dict[str, Any]], dt | None]:
+        """Get the events of at most chunk_size rows of a period of time.
+
+        Returns the events and the time the next chunk starts after,
+        which is None after the last chunk. Every chunk is selected in
+        a session of its own, so nothing is kept open in the database
+        between the chunks.
+
+        Limited selects also select the rows of the contexts of their
+        rows, which are not in the period of time, so they are not split
+        and all their events are returned at once.
+        """
+        if self.limited_select:
+            return self.get_events(start_day, end_day), None
+        with session_scope(hass=self.hass, read_only=True) as session:
+            # One more row tells if the next chunk has rows of the same time
+            rows = list(self._select_rows(session, start_day, end_day, chunk_size + 1))
+            next_start_day: dt | None = None
+            if len(rows) > chunk_size:
+                next_row = rows.pop()
+                # The next chunk starts after the time of the last row,
+                # leave out the rows of the same time so they are
+                # selected again with the next chunk
+                end = len(rows)
+                while end and rows[end - 1].time_fired_ts == next_row.time_fired_ts:
+                    end -= 1
+                if end:
+                    del rows[end:]
+                next_start_day = dt_util.utc_from_timestamp(rows[-1].time_fired_ts)
+            return self.humanify(rows), next_start_day
+
+    def _select_rows(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+        limit: int | None = None,
+    ) -> Sequence[Row] | Result:
+        """Select the rows for a period of time, the first limit rows if set."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        stmt = statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+        if limit is not None:
+            stmt += lambda s: s.limit(limit)
+        return execute_stmt_lambda_element(session, stmt, orm_rows=False)
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
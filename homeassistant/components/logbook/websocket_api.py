@@ -29,6 +29,8 @@ from .models import LogbookConfig, async_event_to_row
 from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
+# historical events are sent in chunks of at most this many events per message
+MAX_LOGBOOK_EVENTS_PER_MESSAGE = 2000
 EVENT_COALESCE_TIME = 0.35
 # minimum size that we will split the query
 BIG_QUERY_HOURS = 25
@@ -90,7 +92,8 @@ async def _async_send_historical_events(
     two chunks so that they get the recent events first and the select
     that is expected to take a long time comes in after to ensure
     they are not stuck at a loading screen and can start looking at
-    the data right away.
+    the data right away. Each of them is sent in chunks of at most
+    MAX_LOGBOOK_EVENTS_PER_MESSAGE events.
 
     This function returns the time of the most recent event we sent to the
     websocket.
@@ -102,80 +105,108 @@ async def _async_send_historical_events(
     )
 
     if not is_big_query:
-        message, last_event_time = await _async_get_ws_stream_events(
+        return await _async_send_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
             formatter,
             event_processor,
             partial,
+            force_send,
         )
-        # If there is no last_event_time, there are no historical
-        # results, but we still send an empty message
-        # if its the last one (not partial) so
-        # consumers of the api know their request was
-        # answered but there were no results
-        if last_event_time or not partial or force_send:
-            connection.send_message(message)
-        return last_event_time
 
     # This is a big query so we deliver
     # the first three hours and then
     # we fetch the old data
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
-    recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
+    recent_query_last_event_time = await _async_send_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
         formatter,
         event_processor,
         partial=True,
+        force_send=False,
     )
-    if recent_query_last_event_time:
-        connection.send_message(recent_message)
-
-    older_message, older_query_last_event_time = await _async_get_ws_stream_events(
+    older_query_last_event_time = await _async_send_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
         formatter,
         event_processor,
         partial,
+        force_send,
     )
-    # If there is no last_event_time, there are no historical
-    # results, but we still send an empty message
-    # if its the last one (not partial) so
-    # consumers of the api know their request was
-    # answered but there were no results
-    if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
 
     # Returns the time of the newest event
     return recent_query_last_event_time or older_query_last_event_time
 
 
-async def _async_get_ws_stream_events(
+async def _async_send_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[str, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
-        _ws_stream_get_events,
-        msg_id,
-        start_time,
-        end_time,
-        formatter,
-        event_processor,
-        partial,
-    )
+    force_send: bool,
+) -> dt | None:
+    """Fetch events and send them to the websocket in chunks.
+
+    The next chunk is only fetched once the client has caught up, so the
+    memory used does not depend on the length of the time period and no
+    database session is held while waiting for the client. All chunks
+    but the last one are sent as partial.
+
+    Returns the time of the most recent event.
+    """
+    instance = get_instance(hass)
+    last_event_time: dt | None = None
+    chunk_start: dt | None = start_time
+    while chunk_start is not None:
+        (
+            message,
+            chunk_last_event_time,
+            chunk_start,
+        ) = await instance.async_add_executor_job(
+            _ws_stream_get_events_chunk,
+            msg_id,
+            chunk_start,
+            start_time,
+            end_time,
+            formatter,
+            event_processor,
+            partial,
+            # The last chunk ends the partial ones which were sent
+            force_send or last_event_time is not None,
+        )
+        last_event_time = chunk_last_event_time or last_event_time
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while fetching historical events
+            break
+        if message is None:
+            continue
+        if chunk_start is None:
+            connection.send_message(message)
+            break
+        try:
+            await connection.async_send_message_and_wait(msg_id, message)
+        except TimeoutError:
+            # The subscription was ended
+            _LOGGER.debug(
+                "Client did not catch up with the logbook events of %s in time",
+                msg_id,
+            )
+            break
+    return last_event_time
 
 
 def _generate_stream_message(
@@ -189,19 +220,15 @@ def _generate_stream_message(
     }
 
 
-def _ws_stream_get_events(
+def _ws_stream_format_events(
     msg_id: int,
     start_day: dt,
     end_day: dt,
     formatter: Callable[[int, Any], dict[str, Any]],
-    event_processor: EventProcessor,
+    events: list[dict[str, Any]],
     partial: bool,
-) -> tuple[str, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
-    last_time = None
-    if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+) -> str:
+    """Convert events to json."""
     message = _generate_stream_message(events, start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
@@ -209,7 +236,48 @@ def _ws_stream_get_events(
         # data in case the UI needs to show that historical
         # data is still loading in the future
         message["partial"] = True
-    return JSON_DUMP(formatter(msg_id, message)), last_time
+    return JSON_DUMP(formatter(msg_id, message))
+
+
+def _ws_stream_get_events_chunk(
+    msg_id: int,
+    chunk_start: dt,
+    start_day: dt,
+    end_day: dt,
+    formatter: Callable[[int, Any], dict[str, Any]],
+    event_processor: EventProcessor,
+    partial: bool,
+    force_send: bool,
+) -> tuple[str | None, dt | None, dt | None]:
+    """Fetch a chunk of events and convert them to json in the executor.
+
+    Returns the message or None if there is nothing to send, the time
+    of the most recent event and the start of the next chunk.
+    """
+    events, next_chunk_start = event_processor.get_events_chunk(
+        chunk_start, end_day, MAX_LOGBOOK_EVENTS_PER_MESSAGE
+    )
+    last_time = None
+    if events:
+        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+    if next_chunk_start is not None:
+        if not events:
+            return None, None, next_chunk_start
+        message = _ws_stream_format_events(
+            msg_id, start_day, end_day, formatter, events, True
+        )
+        return message, last_time, next_chunk_start
+    # If there is no last_event_time, there are no historical
+    # results, but we still send an empty message
+    # if its the last one (not partial) so
+    # consumers of the api know their request was
+    # answered but there were no results
+    if not events and partial and not force_send:
+        return None, None, None
+    message = _ws_stream_format_events(
+        msg_id, start_day, end_day, formatter, events, partial
+    )
+    return message, last_time, None
 
 
 async def _async_events_consumer(
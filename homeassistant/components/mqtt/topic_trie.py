@@ -0,0 +1,162 @@
+"""Match MQTT topics against topic filters with a trie."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+
+
+class _TopicTrieNode(Generic[_T]):
+    """A level of the topic filters in a TopicTrie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: list[_T] = []
+
+
+class TopicTrie(Generic[_T]):
+    """A trie of MQTT topic filters and the values added for them.
+
+    Every level of a topic filter is a node of the trie, so matching a
+    topic walks the levels of the topic once instead of testing each
+    filter on its own. Wildcards follow the MQTT specification: "+"
+    matches exactly one level and "#" matches any number of levels,
+    including the parent level. Topics starting with "$" are not matched
+    by a wildcard on the first level.
+    """
+
+    __slots__ = ("_root", "_len")
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the trie."""
+        return self._len
+
+    def __contains__(self, topic_filter: object) -> bool:
+        """Return if values were added for a topic filter."""
+        if not isinstance(topic_filter, str):
+            return False
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over all values in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.values
+            nodes.extend(reversed(node.children.values()))
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values.append(value)
+        self._len += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        levels = topic_filter.split("/")
+        path = [self._root]
+        for level in levels:
+            path.append(path[-1].children[level])
+        try:
+            path[-1].values.remove(value)
+        except ValueError as ex:
+            raise KeyError(topic_filter) from ex
+        self._len -= 1
+        # Prune the levels that no longer lead to any values
+        for level, parent in zip(reversed(levels), reversed(path[:-1])):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def matches(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic.
+
+        Values of the same topic filter are returned in the order they
+        were added.
+        """
+        levels = topic.split("/")
+        last = len(levels)
+        wildcards_on_first_level = not topic.startswith("$")
+        matched: list[_T] = []
+
+        def _match(node: _TopicTrieNode[_T], index: int) -> None:
+            children = node.children
+            if index == last:
+                matched.extend(node.values)
+            else:
+                if (child := children.get(levels[index])) is not None:
+                    _match(child, index + 1)
+                if (child := children.get(SINGLE_LEVEL_WILDCARD)) is not None and (
+                    index or wildcards_on_first_level
+                ):
+                    _match(child, index + 1)
+            if (child := children.get(MULTI_LEVEL_WILDCARD)) is not None and (
+                index or wildcards_on_first_level
+            ):
+                matched.extend(child.values)
+
+        _match(self._root, 0)
+        return matched
+
+    def matched_by(self, topic_filter: str) -> list[_T]:
+        """Return the values of all topics matched by a topic filter.
+
+        The reverse of matches, for a trie of topics instead of topic
+        filters.
+        """
+        levels = topic_filter.split("/")
+        last = len(levels)
+        matched: list[_T] = []
+
+        def _subtree(node: _TopicTrieNode[_T], index: int) -> None:
+            matched.extend(node.values)
+            for level, child in node.children.items():
+                if index or not level.startswith("$"):
+                    _subtree(child, index + 1)
+
+        def _match(node: _TopicTrieNode[_T], index: int) -> None:
+            if index == last:
+                matched.extend(node.values)
+                return
+            level = levels[index]
+            if level == MULTI_LEVEL_WILDCARD:
+                # "#" also matches the parent level
+                if index:
+                    matched.extend(node.values)
+                for child_level, child in node.children.items():
+                    if index or not child_level.startswith("$"):
+                        _subtree(child, index + 1)
+            elif level == SINGLE_LEVEL_WILDCARD:
+                for child_level, child in node.children.items():
+                    if index or not child_level.startswith("$"):
+                        _match(child, index + 1)
+            elif (child := node.children.get(level)) is not None:
+                _match(child, index + 1)
+
+        _match(self._root, 0)
+        return matched
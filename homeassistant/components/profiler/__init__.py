@@ -250,6 +250,15 @@ async def async_setup_entry(  # noqa: C901
             for handle in getattr(hass.loop, "_scheduled"):
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
+            if (timer_wheel := hass.timer_wheel) is not None:
+                for owner, count in sorted(
+                    timer_wheel.pending_timers().items(),
+                    key=lambda item: item[1],
+                    reverse=True,
+                ):
+                    _LOGGER.critical(
+                        "Timer wheel: %s pending timers of %s", count, owner
+                    )
         finally:
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
@@ -0,0 +1,215 @@
+"""Write pending recorder rows with bulk inserts instead of the ORM unit of work."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, cast
+
+from sqlalchemy import Column, CursorResult, Table, insert, text
+from sqlalchemy.orm.session import Session
+
+from .const import SQLITE_MAX_BIND_VARS, SupportedDialect
+from .db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .util import chunked
+
+# Tables that other rows reference by id, in the order they must be written
+_LOOKUP_TABLES: tuple[type[Base], ...] = (
+    EventTypes,
+    EventData,
+    StatesMeta,
+    StateAttributes,
+)
+
+# Tables that get the ids of their new rows assigned
+_TABLES_WITH_IDS: tuple[type[Base], ...] = (*_LOOKUP_TABLES, States)
+_TABLES: tuple[type[Base], ...] = (*_TABLES_WITH_IDS, Events)
+
+# The foreign key column, the relationship that may hold a pending
+# object instead, and the primary key of the object the relationship holds
+_FOREIGN_KEYS: dict[type[Base], tuple[tuple[str, str, str], ...]] = {
+    Events: (
+        ("event_type_id", "event_type_rel", "event_type_id"),
+        ("data_id", "event_data_rel", "data_id"),
+    ),
+    States: (
+        ("metadata_id", "states_meta_rel", "metadata_id"),
+        ("attributes_id", "state_attributes", "attributes_id"),
+        ("old_state_id", "old_state", "state_id"),
+    ),
+}
+
+
+def _primary_key(table: Table) -> Column:
+    """Return the single primary key column of a table."""
+    return next(iter(table.primary_key.columns))
+
+
+def _insert_columns(table: Table) -> list[str]:
+    """Return the names of the columns to insert into a table."""
+    return [column.key for column in table.columns if not column.primary_key]
+
+
+class BulkWriter:
+    """Collect the rows of an event session and insert them in bulk.
+
+    The recorder builds the same objects as it does for the ORM, but
+    they are never added to the session. When the session is committed
+    the rows are written with executemany, one statement per table,
+    which avoids the unit of work overhead of flushing each object.
+
+    The ids of the lookup table rows and of the states are read back with
+    RETURNING when the database supports it, or derived from the first id
+    of a multi row INSERT on MySQL and MariaDB, and assigned to the
+    objects, so the table managers can move them from pending to their id
+    maps after the commit as usual.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk writer."""
+        self._pending: dict[type[Base], list[Base]] = {cls: [] for cls in _TABLES}
+        self._columns: dict[type[Base], list[str]] = {
+            cls: _insert_columns(cast(Table, cls.__table__)) for cls in self._pending
+        }
+
+    def add(self, obj: Base) -> None:
+        """Add an object to be written at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (pending := self._pending.get(type(obj))) is None:
+            # The writer only knows the order and foreign keys of its tables
+            raise TypeError(
+                f"Rows of {type(obj).__name__} cannot be written in bulk, only"
+                f" rows of {', '.join(cls.__name__ for cls in _TABLES)}"
+            )
+        pending.append(obj)
+
+    def reset(self) -> None:
+        """Drop all pending rows after the session was rolled back.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for pending in self._pending.values():
+            pending.clear()
+
+    def commit(self, session: Session) -> None:
+        """Write all pending rows and commit the session.
+
+        If writing or committing fails the session is rolled back and the
+        rows are kept so the commit can be retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        try:
+            self._write(session)
+            session.commit()
+        except Exception:
+            # Forget the ids of the rolled back rows
+            # so they are written again on retry
+            session.rollback()
+            for cls in _TABLES_WITH_IDS:
+                primary_key = _primary_key(cast(Table, cls.__table__)).key
+                for obj in self._pending[cls]:
+                    setattr(obj, primary_key, None)
+            raise
+        self.reset()
+
+    def _write(self, session: Session) -> None:
+        """Write all pending rows."""
+        pending = self._pending
+        for cls in _LOOKUP_TABLES:
+            if objs := pending[cls]:
+                self._insert_returning_ids(session, cls, objs)
+
+        if events := pending[Events]:
+            self._insert(session, Events, events)
+
+        if states := pending[States]:
+            # A state can only be linked to its old state once the old state
+            # has an id, so states are written in generations where each
+            # generation only references states of the previous ones.
+            generation_by_state: dict[int, int] = {}
+            generations: list[list[Base]] = []
+            for dbstate in cast(list[States], states):
+                old_state = dbstate.old_state
+                generation = (
+                    generation_by_state[id(old_state)] + 1
+                    if old_state is not None and old_state.state_id is None
+                    else 0
+                )
+                generation_by_state[id(dbstate)] = generation
+                if generation == len(generations):
+                    generations.append([])
+                generations[generation].append(dbstate)
+            for generation_states in generations:
+                self._insert_returning_ids(session, States, generation_states)
+
+    def _params(self, cls: type[Base], objs: Sequence[Base]) -> list[dict[str, Any]]:
+        """Build the insert parameters for objects, resolving pending relationships."""
+        columns = self._columns[cls]
+        foreign_keys = _FOREIGN_KEYS.get(cls, ())
+        params: list[dict[str, Any]] = []
+        for obj in objs:
+            # The objects are never attached to a session so everything
+            # that was set on them is in their __dict__, which is much
+            # faster to read than going through the instrumented attributes
+            values = obj.__dict__
+            row = {column: values.get(column) for column in columns}
+            for fk_column, relationship, related_pk in foreign_keys:
+                if (related := values.get(relationship)) is not None:
+                    row[fk_column] = related.__dict__.get(related_pk)
+            params.append(row)
+        return params
+
+    def _insert(self, session: Session, cls: type[Base], objs: Sequence[Base]) -> None:
+        """Insert objects with executemany without reading back their ids."""
+        session.execute(insert(cast(Table, cls.__table__)), self._params(cls, objs))
+
+    def _insert_returning_ids(
+        self, session: Session, cls: type[Base], objs: Sequence[Base]
+    ) -> None:
+        """Insert objects and assign the generated primary keys to them."""
+        table = cast(Table, cls.__table__)
+        primary_key = _primary_key(table)
+        params = self._params(cls, objs)
+        dialect = session.get_bind().dialect
+        # Multi row VALUES are limited by the number of bind variables
+        rows_per_chunk = max(1, SQLITE_MAX_BIND_VARS // len(self._columns[cls]))
+        ids: list[int] = []
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            stmt = insert(table).returning(primary_key, sort_by_parameter_order=True)
+            for params_chunk in chunked(params, rows_per_chunk):
+                ids.extend(session.execute(stmt, params_chunk).scalars())
+        elif dialect.name == SupportedDialect.MYSQL:
+            # InnoDB gives the rows of a multi row INSERT consecutive ids,
+            # apart from the increment, in every auto increment lock mode.
+            # The id of the first row is reported as the last row id.
+            increment: int = session.execute(
+                text("SELECT @@auto_increment_increment")
+            ).scalar_one()
+            for params_chunk in chunked(params, rows_per_chunk):
+                result = cast(
+                    CursorResult, session.execute(insert(table).values(params_chunk))
+                )
+                first_id: int = result.lastrowid
+                ids.extend(
+                    range(first_id, first_id + len(params_chunk) * increment, increment)
+                )
+        else:
+            # Without RETURNING support each row reports its own id
+            for row in params:
+                result = cast(CursorResult, session.execute(insert(table), row))
+                assert result.inserted_primary_key is not None
+                ids.append(result.inserted_primary_key[0])
+        for obj, id_ in zip(objs, ids, strict=True):
+            setattr(obj, primary_key.key, id_)
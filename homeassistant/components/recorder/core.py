@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
@@ -15,7 +15,7 @@ from typing import Any, TypeVar, cast
 
 import psutil_home_assistant as ha_psutil
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, Row
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -41,6 +41,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .bulk_writer import BulkWriter
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
@@ -57,6 +58,7 @@ from .const import (
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
     SupportedDialect,
 )
@@ -76,14 +78,17 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history_cache import HistoryCache
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import (
+    find_statistics_rollup_time_zone,
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .reader import ReaderStats
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -103,6 +108,7 @@ from .tasks import (
     EntityIDPostMigrationTask,
     EventIdMigrationTask,
     EventsContextIDMigrationTask,
+    EventsTask,
     EventTask,
     EventTypeIDMigrationTask,
     ImportStatisticsTask,
@@ -111,6 +117,7 @@ from .tasks import (
     PurgeTask,
     RecorderTask,
     StatesContextIDMigrationTask,
+    StatisticsRollupTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -122,6 +129,7 @@ from .util import (
     build_mysqldb_conv,
     dburl_to_path,
     end_incomplete_runs,
+    execute_on_connection,
     execute_stmt_lambda_element,
     get_index_by_name,
     is_second_sunday,
@@ -178,6 +186,9 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
         exclude_attributes_by_domain: dict[str, set[str]],
+        bulk_writes: bool = False,
+        read_uri: str | None = None,
+        read_pool_size: int | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -190,7 +201,13 @@ class Recorder(threading.Thread):
         self._hass_started: asyncio.Future[object] = asyncio.Future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
+        # The events of queued batches beyond the one task each batch is,
+        # each counter is only written by one thread
+        self._batched_events_queued = 0
+        self._batched_events_processed = 0
         self.db_url = uri
+        self.db_read_url = read_uri
+        self.db_read_pool_size = read_pool_size
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -203,6 +220,9 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        # Engine for the reads of the database executor, None if they use engine
+        self.read_engine: Engine | None = None
+        self.reader_stats = ReaderStats()
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -215,6 +235,7 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_writer = BulkWriter() if bulk_writes else None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -225,9 +246,15 @@ class Recorder(threading.Thread):
             self, exclude_attributes_by_domain
         )
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.history_cache = HistoryCache(hass, self)
+        # The time zone the statistics rollups are kept up to date in, and
+        # if they have been completely built in it
+        self.statistics_rollup_time_zone: str | None = None
+        self.statistics_rollups_built = False
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
@@ -247,8 +274,16 @@ class Recorder(threading.Thread):
 
     @property
     def backlog(self) -> int:
-        """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        """Return the number of items in the recorder backlog.
+
+        The events of a batch that is queued as one task are counted one by
+        one, so the backlog limit also bounds the memory of large batches.
+        """
+        return (
+            self._queue.qsize()
+            + self._batched_events_queued
+            - self._batched_events_processed
+        )
 
     @property
     def dialect_name(self) -> SupportedDialect | None:
@@ -262,6 +297,24 @@ class Recorder(threading.Thread):
             SQLITE_URL_PREFIX
         )
 
+    @property
+    def _read_url(self) -> str | None:
+        """Return the url of the read engine or None if reads use the engine."""
+        if self.db_read_url:
+            return self.db_read_url
+        if (
+            self.db_read_pool_size
+            and self.db_url != SQLITE_URL_PREFIX
+            and ":memory:" not in self.db_url
+        ):
+            return self.db_url
+        return None
+
+    @property
+    def db_executor_backlog(self) -> int:
+        """Return the number of jobs waiting for the database executor."""
+        return self._db_executor.backlog if self._db_executor else 0
+
     @property
     def recording(self) -> bool:
         """Return if the recorder is recording."""
@@ -273,6 +326,16 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for reading.
+
+        Uses the read engine when there is one. Reads from the recorder
+        thread always use the engine so they see what the recorder wrote.
+        """
+        if self._get_read_session is None or threading.get_ident() == self.thread_id:
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -284,16 +347,21 @@ class Recorder(threading.Thread):
     @callback
     def async_start_executor(self) -> None:
         """Start the executor."""
+        max_workers = MAX_DB_EXECUTOR_WORKERS
+        if (read_url := self._read_url) and not read_url.startswith(SQLITE_URL_PREFIX):
+            # The reads have their own pool, so more of them can run at once
+            max_workers = max(max_workers, self.db_read_pool_size or 0)
         self._db_executor = DBInterruptibleThreadPoolExecutor(
             thread_name_prefix=DB_WORKER_PREFIX,
-            max_workers=MAX_DB_EXECUTOR_WORKERS,
+            max_workers=max_workers,
             shutdown_hook=self._shutdown_pool,
         )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
-        if self.engine and hasattr(self.engine.pool, "shutdown"):
-            self.engine.pool.shutdown()
+        for engine in (self.engine, self.read_engine):
+            if engine and hasattr(engine.pool, "shutdown"):
+                engine.pool.shutdown()
 
     @callback
     def async_initialize(self) -> None:
@@ -303,35 +371,38 @@ class Recorder(threading.Thread):
         queue_put = self._queue.put_nowait
         event_task = EventTask
 
-        @callback
-        def _event_listener(event: Event) -> None:
-            """Listen for new events and put them in the process queue."""
+        def _should_record(event: Event) -> bool:
+            """Return if an event should be recorded."""
             if event.event_type in exclude_event_types:
-                return
+                return False
 
             if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
-                queue_put(event_task(event))
-                return
+                return True
 
             if isinstance(entity_id, str):
-                if entity_filter(entity_id):
-                    queue_put(event_task(event))
-                return
+                return entity_filter(entity_id)
 
             if isinstance(entity_id, list):
-                for eid in entity_id:
-                    if entity_filter(eid):
-                        queue_put(event_task(event))
-                        return
-                return
+                return any(entity_filter(eid) for eid in entity_id)
 
             # Unknown what it is.
-            queue_put(event_task(event))
+            return True
+
+        @callback
+        def _event_listener(events: list[Event]) -> None:
+            """Listen for new events and put them in the process queue."""
+            if len(events) == 1:
+                if _should_record(event := events[0]):
+                    queue_put(event_task(event))
+                return
 
-        self._event_listener = self.hass.bus.async_listen(
-            MATCH_ALL,
-            _event_listener,
-            run_immediately=True,
+            # Events fired together are queued as one task
+            if recorded := [event for event in events if _should_record(event)]:
+                self._batched_events_queued += len(recorded) - 1
+                queue_put(EventsTask(recorded))
+
+        self._event_listener = self.hass.bus.async_listen_batch(
+            MATCH_ALL, _event_listener
         )
         self._queue_watcher = async_track_time_interval(
             self.hass,
@@ -704,7 +775,10 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if self._bulk_writer:
+            self._bulk_writer.add(obj)  # type: ignore[arg-type]
+        else:
+            session.add(obj)
 
     def _run(self) -> None:
         """Start processing events to save."""
@@ -839,6 +913,25 @@ class Recorder(threading.Thread):
                         self.queue_task(EventIdMigrationTask())
                         self.use_legacy_events_index = True
 
+            time_zone = str(dt_util.DEFAULT_TIME_ZONE)
+            if (
+                self.schema_version >= STATISTICS_ROLLUPS_SCHEMA_VERSION
+                and (
+                    rollup_runs := cast(
+                        Sequence[Row],
+                        execute_stmt_lambda_element(
+                            session, find_statistics_rollup_time_zone()
+                        ),
+                    )
+                )
+                and rollup_runs[0].time_zone == time_zone
+            ):
+                _LOGGER.debug("Statistics rollups are built in %s", time_zone)
+                self.statistics_rollup_time_zone = time_zone
+                self.statistics_rollups_built = True
+            else:
+                self.queue_statistics_rollup_rebuild(time_zone)
+
         # We must only set the db ready after we have set the table managers
         # to active if there is no data to migrate.
         #
@@ -876,7 +969,12 @@ class Recorder(threading.Thread):
 
         for task in startup_tasks:
             if isinstance(task, EventTask):
-                event_ = task.event
+                events = [task.event]
+            elif isinstance(task, EventsTask):
+                events = task.events
+            else:
+                continue
+            for event_ in events:
                 if event_.event_type == EVENT_STATE_CHANGED:
                     state_change_events.append(event_)
                 else:
@@ -1175,7 +1273,10 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
-        session.commit()
+        if self._bulk_writer:
+            self._bulk_writer.commit(session)
+        else:
+            session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1213,6 +1314,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self._bulk_writer:
+            self._bulk_writer.reset()
 
         if not self.event_session:
             return
@@ -1356,19 +1459,29 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
         self._completed_first_database_setup = True
 
-    def _setup_connection(self) -> None:
-        """Ensure database is ready to fly."""
+    def _setup_read_connection_settings(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific settings for read connections."""
+        assert self.read_engine is not None
+        dialect_name = self.read_engine.dialect.name
+        setup_connection_for_dialect(self, dialect_name, dbapi_connection, False)
+        if dialect_name == SupportedDialect.SQLITE:
+            # Never let a reader take the write lock of the database
+            execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+
+    def _engine_kwargs(self, db_url: str) -> dict[str, Any]:
+        """Return the create_engine arguments for db_url."""
         kwargs: dict[str, Any] = {}
-        self._completed_first_database_setup = False
 
-        if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
+        if db_url == SQLITE_URL_PREFIX or ":memory:" in db_url:
             kwargs["connect_args"] = {"check_same_thread": False}
             kwargs["poolclass"] = MutexPool
             MutexPool.pool_lock = threading.RLock()
             kwargs["pool_reset_on_return"] = None
-        elif self.db_url.startswith(SQLITE_URL_PREFIX):
+        elif db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
-        elif self.db_url.startswith(
+        elif db_url.startswith(
             (
                 MARIADB_URL_PREFIX,
                 MARIADB_PYMYSQL_URL_PREFIX,
@@ -1377,7 +1490,7 @@ class Recorder(threading.Thread):
             )
         ):
             kwargs["connect_args"] = {"charset": "utf8mb4"}
-            if self.db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+            if db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
                 # If they have configured MySQLDB but don't have
                 # the MySQLDB module installed this will throw
                 # an ImportError which we suppress here since
@@ -1387,9 +1500,16 @@ class Recorder(threading.Thread):
                     kwargs["connect_args"]["conv"] = build_mysqldb_conv()
 
         # Disable extended logging for non SQLite databases
-        if not self.db_url.startswith(SQLITE_URL_PREFIX):
+        if not db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
 
+        return kwargs
+
+    def _setup_connection(self) -> None:
+        """Ensure database is ready to fly."""
+        kwargs = self._engine_kwargs(self.db_url)
+        self._completed_first_database_setup = False
+
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
 
@@ -1401,12 +1521,31 @@ class Recorder(threading.Thread):
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+        if (read_url := self._read_url) is None:
+            return
+        kwargs = self._engine_kwargs(read_url)
+        if not read_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["pool_size"] = self.db_read_pool_size or POOL_SIZE
+        self.read_engine = create_engine(read_url, **kwargs, future=True)
+        sqlalchemy_event.listen(
+            self.read_engine, "connect", self._setup_read_connection_settings
+        )
+        self.reader_stats.attach(self.read_engine)
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read database")
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
         self._get_session = None
+        self._get_read_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1416,6 +1555,12 @@ class Recorder(threading.Thread):
 
         self._open_event_session()
 
+    def queue_statistics_rollup_rebuild(self, time_zone: str) -> None:
+        """Rebuild the daily and monthly statistics in time_zone."""
+        self.statistics_rollup_time_zone = time_zone
+        self.statistics_rollups_built = False
+        self.queue_task(StatisticsRollupTask(time_zone))
+
     def _schedule_compile_missing_statistics(self) -> None:
         """Add tasks for missing statistics runs."""
         self.queue_task(CompileMissingStatisticsTask())
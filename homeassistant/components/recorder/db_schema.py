@@ -67,7 +67,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 41
+SCHEMA_VERSION = 42
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +83,9 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
+TABLE_STATISTICS_ROLLUP_RUNS = "statistics_rollup_runs"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -104,6 +107,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
+    TABLE_STATISTICS_ROLLUP_RUNS,
 ]
 
 TABLES_TO_CHECK = [
@@ -350,7 +356,9 @@ class EventData(Base):
         """Create shared_data from an event."""
         if dialect == SupportedDialect.POSTGRESQL:
             bytes_result = json_bytes_strip_null(event.data)
-        bytes_result = json_bytes(event.data)
+        else:
+            # Encoded once for the recorder and the other consumers of the event
+            bytes_result = event.data_json_bytes()
         if len(bytes_result) > MAX_EVENT_DATA_BYTES:
             _LOGGER.warning(
                 "Event data for %s exceed maximum size of %s bytes. "
@@ -575,10 +583,15 @@ class StateAttributes(Base):
             integration_attrs := exclude_attrs_by_domain.get(entity_info["domain"])
         ):
             exclude_attrs |= integration_attrs
-        encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
-        bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
-        )
+        if dialect != PSQL_DIALECT and exclude_attrs.isdisjoint(state.attributes):
+            # Nothing to exclude, the attributes are encoded once for all states
+            # that share them
+            bytes_result = state.attributes_json_bytes()
+        else:
+            encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
+            bytes_result = encoder(
+                {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+            )
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
                 "State attributes for %s exceed maximum size of %s bytes. "
@@ -720,6 +733,50 @@ class StatisticsShortTerm(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsRollupBase(StatisticsBase):
+    """Statistics rollup base class.
+
+    Rollups summarize the hourly statistics of a period in local time, mean is
+    the average of the hourly means and mean_count the number of hourly means.
+    """
+
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDaily(Base, StatisticsRollupBase):
+    """Long term statistics rolled up per day."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsRollupBase):
+    """Long term statistics rolled up per month."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticsMeta(Base):
     """Statistics meta data."""
 
@@ -802,6 +859,22 @@ class StatisticsRuns(Base):
         )
 
 
+class StatisticsRollupRuns(Base):
+    """Representation of a completed build of the statistics rollups."""
+
+    __tablename__ = TABLE_STATISTICS_ROLLUP_RUNS
+    run_id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
+    time_zone: Mapped[str | None] = mapped_column(String(64))
+    created_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, default=time.time)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatisticsRollupRuns(id={self.run_id},"
+            f" time_zone='{self.time_zone}')>"
+        )
+
+
 EVENT_DATA_JSON = type_coerce(
     EventData.shared_data.cast(JSONB_VARIANT_CAST), JSONLiteral(none_as_null=True)
 )
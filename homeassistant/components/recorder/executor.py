@@ -26,6 +26,11 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
         self._shutdown_hook: Callable[[], None] = kwargs.pop("shutdown_hook")
         super().__init__(*args, **kwargs)
 
+    @property
+    def backlog(self) -> int:
+        """Return the number of jobs waiting for a worker."""
+        return self._work_queue.qsize()
+
     def _adjust_thread_count(self) -> None:
         """Overridden to add support for shutdown hook.
 
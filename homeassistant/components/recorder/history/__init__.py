@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import MutableMapping
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -11,22 +11,30 @@ from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
 from ..filters import Filters
+from .columnar import ColumnarHistory
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    SignificantStatesCursor,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_chunk as _modern_get_significant_states_chunk,
+    get_significant_states_columnar as _modern_get_significant_states_columnar,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
 # These are the APIs of this package
 __all__ = [
+    "ColumnarHistory",
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "SignificantStatesCursor",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_chunk",
+    "get_significant_states_columnar",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +123,79 @@ def get_significant_states(
     )
 
 
+def get_significant_states_chunk(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    chunk_size: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    after: SignificantStatesCursor | None = None,
+) -> tuple[dict[str, list[dict[str, Any]]], SignificantStatesCursor | None]:
+    """Return a chunk of the significant states during a time period.
+
+    If the database schema is not migrated far enough yet, all
+    states are returned in a single chunk.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        states = get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+        return cast(dict[str, list[dict[str, Any]]], states), None
+    return _modern_get_significant_states_chunk(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        chunk_size,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        after,
+    )
+
+
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> ColumnarHistory | None:
+    """Return the significant states during a time period in columns.
+
+    Returns None if the database schema is not migrated far enough yet.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        return None
+    return _modern_get_significant_states_columnar(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -0,0 +1,210 @@
+"""Columnar results for history queries."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.helpers.json import JSON_DUMP
+
+from ..models.state_attributes import decode_attributes_from_source
+
+_STATE_KEY = JSON_DUMP(COMPRESSED_STATE_STATE)
+_ATTRIBUTES_KEY = JSON_DUMP(COMPRESSED_STATE_ATTRIBUTES)
+_LAST_UPDATED_KEY = JSON_DUMP(COMPRESSED_STATE_LAST_UPDATED)
+_LAST_CHANGED_KEY = JSON_DUMP(COMPRESSED_STATE_LAST_CHANGED)
+# A row with a state and last updated, formatted with the
+# templates of the values before it is used for the values
+_ROW_TEMPLATE = f"{{{_STATE_KEY}:%s,{_LAST_UPDATED_KEY}:%s}},"
+# Numeric states are JSON numbers that only need to be quoted
+_NUMERIC_STATE_TEMPLATE = '"%s"'
+
+
+def _json_numbers(values: array[float]) -> list[str]:
+    """Serialize numbers the same way the JSON encoder does."""
+    if not values:
+        return []
+    return JSON_DUMP(values.tolist())[1:-1].split(",")
+
+
+class EntityHistoryColumns:
+    """The history of a single entity with one array per column.
+
+    States are stored as float64 as long as every state of the entity
+    converts back to the exact same string. Otherwise they are stored as
+    indexes into the interned states of the ColumnarHistory.
+
+    Only the leading rows that were added as full states have a last
+    changed timestamp, which is 0 if it is the same as last updated,
+    and the leading rows that were added with attributes have an index
+    into the interned attributes of the ColumnarHistory.
+    """
+
+    __slots__ = (
+        "numeric",
+        "states",
+        "last_updated_ts",
+        "last_changed_ts",
+        "attributes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.numeric = True
+        self.states: array[Any] = array("d")
+        self.last_updated_ts: array[float] = array("d")
+        self.last_changed_ts: array[float] = array("d")
+        self.attributes: array[int] = array("I")
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.last_updated_ts)
+
+
+class ColumnarHistory:
+    """The history of multiple entities stored in columns.
+
+    Rows are added in bulk per entity and serialized straight to the
+    compressed state format, so no State or dict is created per row.
+    Unique states and attributes are interned and serialized once.
+    """
+
+    __slots__ = (
+        "entities",
+        "_states",
+        "_state_indexes",
+        "_attributes",
+        "_attribute_indexes",
+    )
+
+    def __init__(self, entity_ids: list[str]) -> None:
+        """Initialize the columns of the entities in the order they are returned."""
+        self.entities: dict[str, EntityHistoryColumns] = {
+            entity_id: EntityHistoryColumns() for entity_id in entity_ids
+        }
+        self._states: list[str | None] = []
+        self._state_indexes: dict[str | None, int] = {}
+        self._attributes: list[str] = []
+        self._attribute_indexes: dict[Any, int] = {}
+
+    def extend(
+        self,
+        columns: EntityHistoryColumns,
+        states: Sequence[str | None],
+        last_updated_ts: Sequence[float],
+    ) -> None:
+        """Add rows that only have a state and a last updated timestamp."""
+        if columns.numeric:
+            try:
+                values = array("d", map(float, states))  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                pass
+            else:
+                # Only keep numbers that serialize back to the same state
+                if _json_numbers(values) == list(states):
+                    columns.states.extend(values)
+                    columns.last_updated_ts.extend(last_updated_ts)
+                    return
+            columns.numeric = False
+            columns.states = self._intern_states(_json_numbers(columns.states))
+        columns.states.extend(self._intern_states(states))
+        columns.last_updated_ts.extend(last_updated_ts)
+
+    def extend_full(
+        self,
+        columns: EntityHistoryColumns,
+        states: Sequence[str | None],
+        last_updated_ts: Sequence[float],
+        last_changed_ts: Sequence[float | None],
+        attributes_sources: Sequence[Any] | None,
+    ) -> None:
+        """Add rows with all the fields of a compressed state.
+
+        Full rows must be added before any other rows of the entity.
+        """
+        self.extend(columns, states, last_updated_ts)
+        columns.last_changed_ts.extend(
+            changed_ts if changed_ts and changed_ts != updated_ts else 0.0
+            for updated_ts, changed_ts in zip(
+                last_updated_ts, last_changed_ts, strict=True
+            )
+        )
+        if attributes_sources is not None:
+            columns.attributes.extend(
+                self._intern_attributes(source) for source in attributes_sources
+            )
+
+    def _intern_states(self, states: Any) -> array[int]:
+        """Return the indexes of interned states."""
+        state_indexes = self._state_indexes
+        states = list(states)
+        for state in set(states).difference(state_indexes):
+            state_indexes[state] = len(self._states)
+            self._states.append(state)
+        return array("I", map(state_indexes.__getitem__, states))
+
+    def _intern_attributes(self, source: Any) -> int:
+        """Return the index of interned attributes."""
+        if (index := self._attribute_indexes.get(source)) is None:
+            index = self._attribute_indexes[source] = len(self._attributes)
+            self._attributes.append(
+                JSON_DUMP(decode_attributes_from_source(source, {}))
+            )
+        return index
+
+    def to_json(self) -> str:
+        """Serialize to the compressed state format of the history websocket API.
+
+        Entities without any rows are left out.
+        """
+        state_fragments = [JSON_DUMP(state) for state in self._states]
+        return (
+            "{"
+            + ",".join(
+                f"{JSON_DUMP(entity_id)}:[{self._entity_json(columns, state_fragments)}]"
+                for entity_id, columns in self.entities.items()
+                if columns
+            )
+            + "}"
+        )
+
+    def _entity_json(
+        self, columns: EntityHistoryColumns, state_fragments: list[str]
+    ) -> str:
+        """Serialize the rows of an entity."""
+        states: list[str]
+        if columns.numeric:
+            states = _json_numbers(columns.states)
+            state_template = _NUMERIC_STATE_TEMPLATE
+        else:
+            states = list(map(state_fragments.__getitem__, columns.states))
+            state_template = "%s"
+        last_updated_ts = _json_numbers(columns.last_updated_ts)
+        last_changed_ts = _json_numbers(columns.last_changed_ts)
+        attributes = columns.attributes
+        attribute_fragments = self._attributes
+        rows: list[str] = []
+        for idx, changed_ts in enumerate(columns.last_changed_ts):
+            row = f"{{{_STATE_KEY}:{state_template % states[idx]}"
+            if idx < len(attributes):
+                row += f",{_ATTRIBUTES_KEY}:{attribute_fragments[attributes[idx]]}"
+            row += f",{_LAST_UPDATED_KEY}:{last_updated_ts[idx]}"
+            if changed_ts:
+                row += f",{_LAST_CHANGED_KEY}:{last_changed_ts[idx]}"
+            rows.append(f"{row}}}")
+        full_rows = len(rows)
+        if tail_rows := len(states) - full_rows:
+            # Format all the remaining rows at once, which is
+            # much faster than building and serializing dicts
+            values: list[str] = [""] * (tail_rows * 2)
+            values[0::2] = states[full_rows:]
+            values[1::2] = last_updated_ts[full_rows:]
+            row_template = _ROW_TEMPLATE % (state_template, "%s")
+            rows.append((row_template * tail_rows)[:-1] % tuple(values))
+        return ",".join(rows)
@@ -1,10 +1,12 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from collections.abc import Callable, Iterable, Iterator, MutableMapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
-from itertools import groupby
-from operator import itemgetter
+from heapq import merge
+from itertools import compress, groupby
+from operator import itemgetter, ne
 from typing import Any, cast
 
 from sqlalchemy import (
@@ -36,6 +38,7 @@ from ..models import (
     row_to_compressed_state,
 )
 from ..util import execute_stmt_lambda_element, session_scope
+from .columnar import ColumnarHistory
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -49,6 +52,10 @@ _FIELD_MAP = {
     "last_updated_ts": 2,
 }
 
+# The order of the rows of significant states, states at the start time
+# have a last_updated_ts of 0 so they come first
+_row_key = itemgetter(_FIELD_MAP["metadata_id"], _FIELD_MAP["last_updated_ts"])
+
 
 def _stmt_and_join_attributes(
     no_attributes: bool, include_last_changed: bool
@@ -211,6 +218,119 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> ColumnarHistory:
+    """Return states changes during UTC period start_time - end_time in columns.
+
+    The result serializes to the same compressed state format as
+    get_significant_states with compressed_state_format set.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                stream=True,
+            )
+        ):
+            return ColumnarHistory([])
+        rows, start_time_ts, entity_id_to_metadata_id = query
+        return _sorted_states_to_columns(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            no_attributes,
+        )
+
+
+def _significant_states_chunk_stmt(
+    stmt: Select | CompoundSelect,
+    chunk_size: int,
+    after: SignificantStatesCursor | None,
+) -> Select | CompoundSelect:
+    """Limit the significant states statement to the rows of a chunk."""
+    if after is not None:
+        columns = stmt.selected_columns
+        stmt = cast(Select, stmt).where(
+            (columns.metadata_id > after.metadata_id)
+            | (
+                (columns.metadata_id == after.metadata_id)
+                & (columns.last_updated_ts > after.last_updated_ts)
+            )
+        )
+    return stmt.limit(chunk_size)
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream: bool = False,
+    chunk_size: int | None = None,
+    after: SignificantStatesCursor | None = None,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Query the significant states of entities.
+
+    Returns the rows, the start time if the rows include the states at
+    the start time and the metadata ids of the entities or None if none
+    of the entities have been recorded.
+
+    If stream is set, rows of time windows longer than a day are fetched
+    in batches while they are iterated, so they must be consumed before
+    the session is closed.
+
+    If chunk_size is set, only the first chunk_size rows after the
+    cursor are selected and the states at the start time are not, see
+    _get_start_time_state_rows.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +339,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -236,6 +356,30 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    if chunk_size is not None:
+        return (
+            session.connection()
+            .execute(
+                _significant_states_chunk_stmt(
+                    _significant_states_stmt(
+                        start_time_ts,
+                        end_time_ts,
+                        single_metadata_id,
+                        metadata_ids,
+                        metadata_ids_in_significant_domains,
+                        significant_changes_only,
+                        no_attributes,
+                        False,
+                        None,
+                    ),
+                    chunk_size,
+                    after,
+                )
+            )
+            .all(),
+            start_time_ts if include_start_time_state else None,
+            entity_id_to_metadata_id,
+        )
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -257,14 +401,12 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        execute_stmt_lambda_element(
+            session, stmt, start_time if stream else None, end_time, orm_rows=False
+        ),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -426,7 +568,7 @@ def state_changes_during_period(
 
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
-        _stmt_and_join_attributes(False, False)
+        _stmt_and_join_attributes(False, True)
         .join(
             (
                 lastest_state_for_metadata_id := (
@@ -456,7 +598,7 @@ def _get_last_state_changes_multiple_stmt(
     number_of_states: int, metadata_id: int
 ) -> Select:
     return (
-        _stmt_and_join_attributes(False, False)
+        _stmt_and_join_attributes(False, True)
         .where(
             States.state_id
             == (
@@ -560,6 +702,32 @@ def _get_start_time_state_for_entities_stmt(
     )
 
 
+def _get_start_time_state_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    entity_id_to_metadata_id: dict[str, int | None],
+    no_attributes: bool,
+    include_last_changed: bool,
+) -> list[Row]:
+    """Return the states of the entities at the start time, by metadata_id."""
+    if not (run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)):
+        return []
+    metadata_ids = extract_metadata_ids(entity_id_to_metadata_id)
+    stmt = _get_start_time_state_stmt(
+        run_start_ts,
+        dt_util.utc_to_timestamp(start_time),
+        metadata_ids[0] if len(metadata_ids) == 1 else None,
+        metadata_ids,
+        no_attributes,
+        include_last_changed,
+    )
+    return sorted(
+        session.connection().execute(stmt).all(),
+        key=itemgetter(_FIELD_MAP["metadata_id"]),
+    )
+
+
 def _get_run_start_ts_for_utc_point_in_time(
     hass: HomeAssistant, utc_point_in_time: datetime
 ) -> float | None:
@@ -627,6 +795,124 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+@dataclass(slots=True, frozen=True)
+class SignificantStatesCursor:
+    """The position after the last row of a chunk of significant states."""
+
+    metadata_id: int
+    last_updated_ts: float
+    # The last state of the entity, minimal responses skip repeats of it
+    state: str | None
+    # The states at the start time of the entities after the cursor, they
+    # are only selected with the first chunk
+    start_time_rows: tuple[Row, ...] = ()
+
+
+def get_significant_states_chunk(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    chunk_size: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    after: SignificantStatesCursor | None = None,
+) -> tuple[dict[str, list[dict[str, Any]]], SignificantStatesCursor | None]:
+    """Return a chunk of the states changes during UTC period start_time - end_time.
+
+    A chunk has the compressed states of at most chunk_size rows, unless
+    more rows belong to the same update of an entity, and the next chunk
+    continues after the returned cursor, which is None after the last
+    chunk. Joining the chunks gives the same result as
+    get_significant_states with compressed_state_format set.
+
+    Every chunk is selected in a session of its own, so nothing is kept
+    open in the database between the chunks.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    limit = chunk_size
+    with session_scope(hass=hass, read_only=True) as session:
+        while True:
+            if not (
+                query := _significant_states_query(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    no_attributes,
+                    # One more row tells if the next chunk has rows of the
+                    # same update
+                    chunk_size=limit + 1,
+                    after=after,
+                )
+            ):
+                return {}, None
+            rows, start_time_ts, entity_id_to_metadata_id = query
+            rows = list(rows)
+            if len(rows) <= limit or _row_key(rows[0]) != _row_key(rows[-1]):
+                break
+            # The rows of an update cannot be split between chunks
+            limit *= 2
+        start_time_rows: Sequence[Row] = ()
+        if after is not None:
+            start_time_rows = after.start_time_rows
+        elif start_time_ts is not None:
+            start_time_rows = _get_start_time_state_rows(
+                hass,
+                session,
+                start_time,
+                entity_id_to_metadata_id,
+                no_attributes,
+                not significant_changes_only,
+            )
+
+    metadata_id_idx = _FIELD_MAP["metadata_id"]
+    chunk_start_time_rows = start_time_rows
+    if len(rows) > limit:
+        # The states at the start time of entities after the selected rows
+        # are left for the next chunks
+        last_metadata_id = rows[-1][metadata_id_idx]
+        chunk_start_time_rows = [
+            row for row in start_time_rows if row[metadata_id_idx] <= last_metadata_id
+        ]
+    rows = list(merge(chunk_start_time_rows, rows, key=_row_key))
+
+    cursor: SignificantStatesCursor | None = None
+    if len(rows) > limit:
+        # The next chunk continues after the last update of the entity
+        # of the last row, leave out the rows of the same update so they
+        # are selected again with the next chunk
+        next_key = _row_key(rows[limit])
+        end = limit
+        while end and _row_key(rows[end - 1]) == next_key:
+            end -= 1
+        del rows[end:]
+        last_key = _row_key(rows[-1])
+        cursor = SignificantStatesCursor(
+            last_key[0],
+            last_key[1],
+            rows[-1][_FIELD_MAP["state"]],
+            tuple(row for row in start_time_rows if row[metadata_id_idx] > last_key[0]),
+        )
+    return (
+        _sorted_states_to_compressed_chunk(
+            rows,
+            start_time_ts,
+            entity_id_to_metadata_id,
+            minimal_response,
+            no_attributes,
+            after,
+        ),
+        cursor,
+    )
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
@@ -764,3 +1050,152 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    no_attributes: bool,
+) -> ColumnarHistory:
+    """Convert SQL results into columns.
+
+    This is the columnar equivalent of _sorted_states_to_dict with
+    compressed_state_format set.
+
+    States must be sorted by entity_id and last_updated
+    """
+    history = ColumnarHistory(entity_ids)
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    if len(entity_ids) == 1:
+        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+        assert metadata_id is not None  # should not be possible if we got here
+        states_iter: Iterable[tuple[int, Iterator[Row]]] = (
+            (metadata_id, iter(states)),
+        )
+    else:
+        states_iter = groupby(states, itemgetter(_FIELD_MAP["metadata_id"]))
+
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    get_state = itemgetter(state_idx)
+    get_last_updated_ts = itemgetter(last_updated_ts_idx)
+
+    for metadata_id, group in states_iter:
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        columns = history.entities[entity_id]
+        if (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        ):
+            rows = list(group)
+            history.extend_full(
+                columns,
+                list(map(get_state, rows)),
+                [row[last_updated_ts_idx] or start_time_ts for row in rows],  # type: ignore[misc]
+                [getattr(row, "last_changed_ts", None) for row in rows],
+                [getattr(row, "attributes", None) for row in rows],
+            )
+            continue
+
+        prev_state: str | None = None
+        # With minimal response only the first state is a full state,
+        # the others only have the state and last updated and are
+        # filtered for duplicate states.
+        if not columns:
+            if (first_state := next(group, None)) is None:
+                continue
+            prev_state = first_state[state_idx]
+            history.extend_full(
+                columns,
+                [prev_state],
+                [first_state[last_updated_ts_idx] or start_time_ts],  # type: ignore[list-item]
+                [getattr(first_state, "last_changed_ts", None)],
+                None if no_attributes else [getattr(first_state, "attributes", None)],
+            )
+
+        rows = list(group)
+        entity_states = list(map(get_state, rows))
+        # Only keep the rows where the state changed
+        changed = list(map(ne, entity_states, [prev_state, *entity_states[:-1]]))
+        history.extend(
+            columns,
+            list(compress(entity_states, changed)),
+            list(compress(map(get_last_updated_ts, rows), changed)),
+        )
+
+    return history
+
+
+def _sorted_states_to_compressed_chunk(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    no_attributes: bool,
+    after: SignificantStatesCursor | None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Convert SQL results into a chunk of compressed states.
+
+    This is the chunked equivalent of _sorted_states_to_dict with
+    compressed_state_format set, the states of the entity of the cursor
+    continue the ones of the previous chunk.
+
+    States must be sorted by entity_id and last_updated
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    chunk: dict[str, list[dict[str, Any]]] = {}
+
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        full_states = (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        )
+        # With minimal response only the first state is a full state,
+        # the others only have the state and last updated and are
+        # filtered for duplicate states.
+        first_state = True
+        prev_state: str | None = None
+        if after is not None and after.metadata_id == metadata_id:
+            first_state = False
+            prev_state = after.state
+        ent_results: list[dict[str, Any]] = []
+        for row in group:
+            state = row[state_idx]
+            if full_states or first_state:
+                ent_results.append(
+                    row_to_compressed_state(
+                        row,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        state,
+                        row[last_updated_ts_idx],
+                        False if full_states else no_attributes,
+                    )
+                )
+                first_state = False
+            elif state == prev_state:
+                continue
+            else:
+                ent_results.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: row[last_updated_ts_idx],
+                    }
+                )
+            prev_state = state
+        if ent_results:
+            chunk[entity_id] = ent_results
+
+    return chunk
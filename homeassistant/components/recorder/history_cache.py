@@ -0,0 +1,433 @@
+"""Cache of the recent state changes of entities, backed by the recorder.
+
+Sensors which derive their state from the history of another entity, like
+the history_stats, statistics and filter sensors, load that history when
+they are added. The cache coalesces the requests for the same entity which
+arrive together into one load, keeps the state changes it loaded in a
+bounded ring per entity and keeps the ring up to date from state changed
+events, so later requests for a window the ring covers do not query the
+database. The ring of an entity is only kept while a sensor tracks the
+entity with async_track_entity or a request for it is running.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING, cast
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.typing import EventType
+import homeassistant.util.dt as dt_util
+
+from . import history
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# The maximum number of state changes kept in the ring of an entity
+MAX_STATES_PER_ENTITY = 2048
+
+_MIN_TIME_UTC = datetime.min.replace(tzinfo=dt_util.UTC)
+
+
+@dataclass(slots=True, frozen=True)
+class _HistoryRequest:
+    """A request for the state changes of an entity."""
+
+    start_time: datetime
+    end_time: datetime | None
+    limit: int | None
+    include_start_time_state: bool
+    no_attributes: bool
+
+
+def _state_changes(states: Iterable[State]) -> list[State]:
+    """Return the states which changed the state and not only the attributes."""
+    return [state for state in states if state.last_changed == state.last_updated]
+
+
+class _HistoryWindow:
+    """State changes of an entity which are complete after a point in time.
+
+    All state changes of the entity which changed after start_time, and
+    before end_time if it is set, are in states, start_state is the state
+    the entity had at start_time. As state changes change the state when
+    they update it, their last_changed is used to order them.
+    """
+
+    __slots__ = ("start_time", "end_time", "start_state", "states", "no_attributes")
+
+    def __init__(
+        self,
+        start_time: datetime,
+        end_time: datetime | None,
+        start_state: State | None,
+        states: Iterable[State],
+        no_attributes: bool = False,
+    ) -> None:
+        """Initialize the window."""
+        self.start_time = start_time
+        self.end_time = end_time
+        # The loaded states have no attributes, only answer requests
+        # which do not need them
+        self.no_attributes = no_attributes
+        self.start_state = start_state
+        self.states: deque[State] = deque(states)
+
+    def append(self, state: State) -> None:
+        """Add a state change which happened after the ones in the window."""
+        if self.states:
+            if state.last_changed <= self.states[-1].last_changed:
+                return
+        elif state.last_changed <= self.start_time:
+            return
+        self.states.append(state)
+
+    def trim(self, max_states: int) -> None:
+        """Drop the oldest state changes until at most max_states are left."""
+        while len(self.states) > max_states:
+            state = self.states.popleft()
+            self.start_time = state.last_changed
+            self.start_state = state
+
+    def resolve(self, request: _HistoryRequest) -> list[State] | None:
+        """Return the state changes of a request, None if not covered."""
+        if self.no_attributes and not request.no_attributes:
+            return None
+        start_time = request.start_time
+        end_time = request.end_time
+        if self.end_time is not None and (end_time is None or end_time > self.end_time):
+            return None
+        states = [
+            state
+            for state in self.states
+            if state.last_changed > start_time
+            and (end_time is None or state.last_changed < end_time)
+        ]
+        covered = self.start_time <= start_time
+        if request.limit is not None:
+            if not covered and len(states) < request.limit:
+                return None
+            states = states[-request.limit :]
+        elif not covered:
+            return None
+        if not request.include_start_time_state:
+            return states
+        if not covered:
+            return None
+
+        start_state = self.start_state
+        for state in self.states:
+            if state.last_changed >= start_time:
+                break
+            start_state = state
+        if start_state is None:
+            return states
+        # Like the database, return the state at the start time as if it
+        # changed at the start time
+        return [
+            State(
+                start_state.entity_id,
+                start_state.state,
+                start_state.attributes,
+                last_changed=start_time,
+                last_updated=start_time,
+                validate_entity_id=False,
+            ),
+            *states,
+        ]
+
+
+class _EntityHistory:
+    """Cached history of one entity."""
+
+    __slots__ = (
+        "users",
+        "recorded",
+        "unsubscribe",
+        "window",
+        "pending",
+        "loading",
+        "live",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the entity history."""
+        # The sensors and running requests which use the history
+        self.users = 0
+        self.recorded = False
+        self.unsubscribe: CALLBACK_TYPE | None = None
+        self.window: _HistoryWindow | None = None
+        self.pending: list[tuple[_HistoryRequest, asyncio.Future[list[State]]]] = []
+        self.loading: asyncio.Future[None] | None = None
+        # State changes which happened while loading
+        self.live: list[State] | None = None
+
+
+class HistoryCache:
+    """Shared cache of the recent state changes of entities."""
+
+    def __init__(self, hass: HomeAssistant, instance: Recorder) -> None:
+        """Initialize the history cache."""
+        self.hass = hass
+        self._instance = instance
+        self._entities: dict[str, _EntityHistory] = {}
+        self._flush_scheduled = False
+
+    async def async_state_changes(
+        self,
+        entity_id: str,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        *,
+        limit: int | None = None,
+        include_start_time_state: bool = False,
+        no_attributes: bool = False,
+    ) -> list[State]:
+        """Return the state changes of an entity after start_time.
+
+        The states are in ascending order and are the same as the ones
+        history.state_changes_during_period returns. With a limit only the
+        most recent state changes are returned. With no_attributes the
+        states may be returned without their attributes.
+        """
+        entity_id = entity_id.lower()
+        request = _HistoryRequest(
+            start_time, end_time, limit, include_start_time_state, no_attributes
+        )
+        release = self.async_track_entity(entity_id)
+        try:
+            return await self._async_state_changes(self._entities[entity_id], request)
+        finally:
+            release()
+
+    async def _async_state_changes(
+        self, entity: _EntityHistory, request: _HistoryRequest
+    ) -> list[State]:
+        """Return the state changes of a request from the cache or database."""
+        # Wait for a load which is already running, it may cover the request
+        while entity.loading is not None:
+            await asyncio.shield(entity.loading)
+        if (
+            entity.window is not None
+            and (states := entity.window.resolve(request)) is not None
+        ):
+            return states
+
+        future: asyncio.Future[list[State]] = self.hass.loop.create_future()
+        entity.pending.append((request, future))
+        if not self._flush_scheduled:
+            # Requests which arrive in the same loop iteration share a load
+            self._flush_scheduled = True
+            self.hass.loop.call_soon(self._async_flush)
+        return await future
+
+    @callback
+    def async_track_entity(self, entity_id: str) -> CALLBACK_TYPE:
+        """Keep the history of an entity cached until the callback is called.
+
+        Sensors which request the history of an entity again while they
+        are added track it, the history of entities nothing tracks is
+        dropped when their last request is answered.
+        """
+        entity_id = entity_id.lower()
+        entity = self._async_get_entity(entity_id)
+        entity.users += 1
+        released = False
+
+        @callback
+        def _async_release() -> None:
+            """Drop the cached history when it has no users left."""
+            nonlocal released
+            if released:
+                return
+            released = True
+            entity.users -= 1
+            if entity.users:
+                return
+            if entity.unsubscribe is not None:
+                entity.unsubscribe()
+                entity.unsubscribe = None
+            entity.window = None
+            if self._entities.get(entity_id) is entity:
+                del self._entities[entity_id]
+
+        return _async_release
+
+    @callback
+    def _async_get_entity(self, entity_id: str) -> _EntityHistory:
+        """Return the cached history of an entity."""
+        if (cached := self._entities.get(entity_id)) is not None:
+            return cached
+        entity = self._entities[entity_id] = _EntityHistory()
+        if not self._instance.entity_filter(entity_id):
+            # State changes of entities which are not recorded would not be
+            # in the database, so they are loaded but not cached
+            return entity
+
+        @callback
+        def _async_state_changed(event: EventType[EventStateChangedData]) -> None:
+            """Add a state change to the cached history."""
+            if (new_state := event.data["new_state"]) is None:
+                return
+            if new_state.last_changed != new_state.last_updated:
+                return
+            if entity.live is not None:
+                entity.live.append(new_state)
+            if entity.window is not None:
+                entity.window.append(new_state)
+                entity.window.trim(MAX_STATES_PER_ENTITY)
+
+        entity.recorded = True
+        entity.unsubscribe = async_track_state_change_event(
+            self.hass, [entity_id], _async_state_changed
+        )
+        return entity
+
+    @callback
+    def _async_flush(self) -> None:
+        """Load the history of the entities with pending requests."""
+        self._flush_scheduled = False
+        for entity_id, entity in self._entities.items():
+            if not entity.pending or entity.loading is not None:
+                continue
+            requests = entity.pending
+            entity.pending = []
+            entity.loading = self.hass.loop.create_future()
+            self.hass.async_create_task(
+                self._async_load(entity_id, entity, requests),
+                f"recorder history cache load {entity_id}",
+            )
+
+    async def _async_load(
+        self,
+        entity_id: str,
+        entity: _EntityHistory,
+        requests: list[tuple[_HistoryRequest, asyncio.Future[list[State]]]],
+    ) -> None:
+        """Load the history of an entity for the pending requests."""
+        assert entity.loading is not None
+        recorded = entity.recorded
+        # The current state may not have been committed to the database yet
+        current_state = self.hass.states.get(entity_id) if recorded else None
+        entity.live = []
+        try:
+            windows = await self._instance.async_add_executor_job(
+                self._load_windows, entity_id, [request for request, _ in requests]
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(err)
+        else:
+            now = dt_util.utcnow()
+            live_windows: list[_HistoryWindow] = []
+            for window in windows:
+                if window.end_time is not None and window.end_time <= now:
+                    # Changes after the end may be missing
+                    continue
+                # No state changed after the end yet, the changes which were
+                # not loaded happened while loading
+                window.end_time = None
+                if (
+                    current_state
+                    and current_state.last_changed == current_state.last_updated
+                ):
+                    window.append(current_state)
+                for state in entity.live:
+                    window.append(state)
+                live_windows.append(window)
+            for request, future in requests:
+                if future.done():
+                    continue
+                for window in windows:
+                    if (states := window.resolve(request)) is not None:
+                        future.set_result(states)
+                        break
+                else:
+                    future.set_result([])
+            if recorded and live_windows:
+                window = min(live_windows, key=lambda window: window.start_time)
+                if (
+                    entity.window is None
+                    or (entity.window.no_attributes and not window.no_attributes)
+                    or (
+                        window.start_time < entity.window.start_time
+                        and window.no_attributes <= entity.window.no_attributes
+                    )
+                ):
+                    window.trim(MAX_STATES_PER_ENTITY)
+                    entity.window = window
+        finally:
+            entity.live = None
+            loading = entity.loading
+            entity.loading = None
+            loading.set_result(None)
+
+    def _load_windows(
+        self, entity_id: str, requests: list[_HistoryRequest]
+    ) -> list[_HistoryWindow]:
+        """Load the windows of state changes which cover the requests."""
+        windows: list[_HistoryWindow] = []
+        if timed := [request for request in requests if request.limit is None]:
+            start_time = min(request.start_time for request in timed)
+            end_time: datetime | None = None
+            if all(request.end_time is not None for request in timed):
+                end_time = max(cast(datetime, request.end_time) for request in timed)
+            no_attributes = all(request.no_attributes for request in timed)
+            states = history.state_changes_during_period(
+                self.hass,
+                start_time,
+                end_time,
+                entity_id,
+                no_attributes=no_attributes,
+                include_start_time_state=True,
+            ).get(entity_id, [])
+            start_state: State | None = None
+            if states and states[0].last_changed <= start_time:
+                start_state = states[0]
+                states = states[1:]
+            windows.append(
+                _HistoryWindow(start_time, end_time, start_state, states, no_attributes)
+            )
+
+        limited = [
+            request
+            for request in requests
+            if request.limit is not None
+            and not any(window.resolve(request) is not None for window in windows)
+        ]
+        if not limited:
+            return windows
+
+        # The last state changes may include changes of only the attributes,
+        # load more of them until the limited requests are covered
+        number_of_states = max(request.limit or 0 for request in limited)
+        while True:
+            states = history.get_last_state_changes(
+                self.hass, number_of_states, entity_id
+            ).get(entity_id, [])
+            if len(states) < number_of_states:
+                limit_window = _HistoryWindow(
+                    _MIN_TIME_UTC, None, None, _state_changes(states)
+                )
+                break
+            limit_window = _HistoryWindow(
+                states[0].last_updated, None, states[0], _state_changes(states[1:])
+            )
+            if all(limit_window.resolve(request) is not None for request in limited):
+                break
+            number_of_states *= 2
+        _LOGGER.debug("Loaded the last %s states of %s", number_of_states, entity_id)
+        windows.append(limit_window)
+        return windows
@@ -63,7 +63,10 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsRollupRuns,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -1060,6 +1063,12 @@ def _apply_update(  # noqa: C901
     elif new_version == 41:
         _create_index(session_maker, "event_types", "ix_event_types_event_type")
         _create_index(session_maker, "states_meta", "ix_states_meta_entity_id")
+    elif new_version == 42:
+        # The rollups are backfilled by the StatisticsRollupTask
+        # once the database is ready
+        cast(Table, StatisticsDaily.__table__).create(engine, checkfirst=True)
+        cast(Table, StatisticsMonthly.__table__).create(engine, checkfirst=True)
+        cast(Table, StatisticsRollupRuns.__table__).create(engine, checkfirst=True)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -17,6 +17,7 @@ from .db_schema import (
     StateAttributes,
     States,
     StatesMeta,
+    StatisticsRollupRuns,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -792,6 +793,15 @@ def has_entity_ids_to_migrate() -> StatementLambdaElement:
     )
 
 
+def find_statistics_rollup_time_zone() -> StatementLambdaElement:
+    """Find the time zone of the last completed build of the statistics rollups."""
+    return lambda_stmt(
+        lambda: select(StatisticsRollupRuns.time_zone)
+        .order_by(StatisticsRollupRuns.run_id.desc())
+        .limit(1)
+    )
+
+
 def find_states_context_ids_to_migrate() -> StatementLambdaElement:
     """Find events context_ids to migrate."""
     return lambda_stmt(
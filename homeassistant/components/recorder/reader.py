@@ -0,0 +1,66 @@
+"""Read engine of the recorder."""
+from __future__ import annotations
+
+import threading
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.engine import Connection, Engine
+
+_QUERY_START = "recorder_query_start"
+
+
+class ReaderStats:
+    """Track how long the queries of the read engine take."""
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self._lock = threading.Lock()
+        self.queries = 0
+        self.active = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def attach(self, engine: Engine) -> None:
+        """Start timing the queries of engine."""
+        sqlalchemy_event.listen(engine, "before_cursor_execute", self._before_execute)
+        sqlalchemy_event.listen(engine, "after_cursor_execute", self._after_execute)
+        sqlalchemy_event.listen(engine, "handle_error", self._handle_error)
+
+    def _before_execute(self, conn: Connection, *args: Any) -> None:
+        """Remember when the query started."""
+        conn.info[_QUERY_START] = perf_counter()
+        with self._lock:
+            self.active += 1
+
+    def _after_execute(self, conn: Connection, *args: Any) -> None:
+        """Record how long the query took."""
+        self._finish(conn)
+
+    def _handle_error(self, context: Any) -> None:
+        """Record a failed query."""
+        if (conn := context.connection) is not None:
+            self._finish(conn)
+
+    def _finish(self, conn: Connection) -> None:
+        """Record a finished query."""
+        if (start := conn.info.pop(_QUERY_START, None)) is None:
+            return
+        elapsed = perf_counter() - start
+        with self._lock:
+            self.active -= 1
+            self.queries += 1
+            self.total_time += elapsed
+            self.max_time = max(self.max_time, elapsed)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dict."""
+        with self._lock:
+            queries = self.queries
+            return {
+                "queries": queries,
+                "active_queries": self.active,
+                "average_query_time": self.total_time / queries if queries else 0.0,
+                "max_query_time": self.max_time,
+            }
@@ -9,12 +9,13 @@ from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
+import math
 from operator import itemgetter
 import re
 from statistics import mean
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, func, insert, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.orm.session import Session
@@ -50,12 +51,17 @@ from .const import (
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    SQLITE_MAX_BIND_VARS,
     SupportedDialect,
 )
 from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsRollupBase,
+    StatisticsRollupRuns,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -68,6 +74,7 @@ from .models import (
     process_timestamp,
 )
 from .util import (
+    chunked,
     execute,
     execute_stmt_lambda_element,
     get_instance,
@@ -339,12 +346,14 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(session: Session, start: datetime) -> set[int]:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    Returns the metadata_ids of the compiled statistics.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -394,6 +403,229 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    return set(summary)
+
+
+def _compile_daily_statistics_summary_mean_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for daily statistics."""
+    return lambda_stmt(
+        lambda: select(
+            Statistics.metadata_id,
+            func.sum(Statistics.mean),
+            func.count(Statistics.mean),
+            func.min(Statistics.min),
+            func.max(Statistics.max),
+        )
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+        .filter(Statistics.metadata_id.in_(metadata_ids))
+        .group_by(Statistics.metadata_id)
+    )
+
+
+def _compile_monthly_statistics_summary_mean_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for monthly statistics."""
+    return lambda_stmt(
+        lambda: select(
+            StatisticsDaily.metadata_id,
+            func.sum(StatisticsDaily.mean * StatisticsDaily.mean_count),
+            func.sum(StatisticsDaily.mean_count),
+            func.min(StatisticsDaily.min),
+            func.max(StatisticsDaily.max),
+        )
+        .filter(StatisticsDaily.start_ts >= start_time_ts)
+        .filter(StatisticsDaily.start_ts < end_time_ts)
+        .filter(StatisticsDaily.metadata_id.in_(metadata_ids))
+        .group_by(StatisticsDaily.metadata_id)
+    )
+
+
+def _compile_statistics_rollup_last_sum_stmt(
+    table: type[StatisticsBase],
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int],
+) -> StatementLambdaElement:
+    """Generate the last sum statement for daily or monthly statistics."""
+    return lambda_stmt(
+        lambda: select(
+            subquery := (
+                select(
+                    table.metadata_id,
+                    table.last_reset_ts,
+                    table.state,
+                    table.sum,
+                    func.row_number()
+                    .over(  # type: ignore[no-untyped-call]
+                        partition_by=table.metadata_id,
+                        order_by=table.start_ts.desc(),
+                    )
+                    .label("rownum"),
+                )
+                .filter(table.start_ts >= start_time_ts)
+                .filter(table.start_ts < end_time_ts)
+                .filter(table.metadata_id.in_(metadata_ids))
+                .subquery()
+            )
+        ).filter(subquery.c.rownum == 1)
+    )
+
+
+def _compile_statistics_rollup(
+    session: Session,
+    table: type[StatisticsRollupBase],
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int],
+) -> None:
+    """Compile daily or monthly statistics for one period.
+
+    Daily statistics summarize the hourly statistics of the day and monthly
+    statistics the daily statistics of the month:
+    - mean is the average of the hourly means, min and max are the extremes
+    - last_reset, state and sum are taken from the last statistic of the period
+    """
+    source: type[StatisticsBase]
+    if table is StatisticsDaily:
+        source = Statistics
+        stmt = _compile_daily_statistics_summary_mean_stmt(
+            start_time_ts, end_time_ts, metadata_ids
+        )
+    else:
+        source = StatisticsDaily
+        stmt = _compile_monthly_statistics_summary_mean_stmt(
+            start_time_ts, end_time_ts, metadata_ids
+        )
+
+    summary: dict[int, dict[str, Any]] = {}
+    for metadata_id, mean_sum, mean_count, _min, _max in execute_stmt_lambda_element(
+        session, stmt
+    ):
+        # MySQL returns the sum of an integer column as a decimal
+        mean_count = int(mean_count or 0)
+        summary[metadata_id] = {
+            "metadata_id": metadata_id,
+            "start_ts": start_time_ts,
+            "mean": mean_sum / mean_count if mean_count else None,
+            "mean_count": mean_count,
+            "min": _min,
+            "max": _max,
+            "last_reset_ts": None,
+            "state": None,
+            "sum": None,
+        }
+
+    stmt = _compile_statistics_rollup_last_sum_stmt(
+        source, start_time_ts, end_time_ts, metadata_ids
+    )
+    for metadata_id, last_reset_ts, state, _sum, _ in execute_stmt_lambda_element(
+        session, stmt
+    ):
+        summary[metadata_id].update(
+            {"last_reset_ts": last_reset_ts, "state": state, "sum": _sum}
+        )
+
+    session.query(table).filter(table.start_ts == start_time_ts).filter(
+        table.metadata_id.in_(metadata_ids)
+    ).delete(synchronize_session=False)
+    if summary:
+        session.execute(insert(table), list(summary.values()))
+
+
+def _compile_statistics_rollups(
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: Iterable[int],
+) -> None:
+    """Compile daily and monthly statistics for the periods overlapping start-end."""
+    # Flush the hourly statistics first, a failed flush would otherwise be
+    # retried by the queries and hide the original error from the caller
+    session.flush()
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    for metadata_ids_chunk in chunked(metadata_ids, SQLITE_MAX_BIND_VARS):
+        day_start, day_end = day_start_end(start_time_ts)
+        month_start, month_end = month_start_end(start_time_ts)
+        while day_start < end_time_ts:
+            _compile_statistics_rollup(
+                session, StatisticsDaily, day_start, day_end, metadata_ids_chunk
+            )
+            if day_end >= month_end or day_end >= end_time_ts:
+                # The month is complete, or this is the last day to compile
+                _compile_statistics_rollup(
+                    session,
+                    StatisticsMonthly,
+                    month_start,
+                    month_end,
+                    metadata_ids_chunk,
+                )
+                month_start, month_end = month_start_end(day_end)
+            day_start, day_end = day_start_end(day_end)
+
+
+def _statistics_rollup_time_zone() -> str:
+    """Return the time zone the statistics rollups are compiled in."""
+    return str(dt_util.DEFAULT_TIME_ZONE)
+
+
+def _statistics_rollups_maintained(instance: Recorder) -> bool:
+    """Return if the statistics rollups are kept up to date."""
+    return instance.statistics_rollup_time_zone == _statistics_rollup_time_zone()
+
+
+def _statistics_rollups_ready(instance: Recorder) -> bool:
+    """Return if the statistics rollups are complete and can be queried."""
+    return instance.statistics_rollups_built and _statistics_rollups_maintained(
+        instance
+    )
+
+
+def rebuild_statistics_rollups(
+    instance: Recorder, time_zone: str, start_time_ts: float | None
+) -> float | None:
+    """Rebuild the daily and monthly statistics one month at a time.
+
+    Returns the start of the next month to rebuild, or None when done.
+    """
+    if time_zone != instance.statistics_rollup_time_zone:
+        # The time zone changed again, and a new rebuild has been queued
+        return None
+
+    with session_scope(session=instance.get_session()) as session:
+        if start_time_ts is None:
+            _LOGGER.debug("Rebuilding statistics rollups in %s", time_zone)
+            for table in (StatisticsDaily, StatisticsMonthly, StatisticsRollupRuns):
+                session.query(table).delete(synchronize_session=False)
+            start_time_ts = session.query(func.min(Statistics.start_ts)).scalar()
+        if start_time_ts is not None:
+            _, month_start_end = reduce_month_ts_factory()
+            month_start, month_end = month_start_end(start_time_ts)
+            metadata_ids = [
+                metadata_id
+                for (metadata_id,) in session.query(Statistics.metadata_id)
+                .filter(Statistics.start_ts >= month_start)
+                .filter(Statistics.start_ts < month_end)
+                .distinct()
+            ]
+            _compile_statistics_rollups(session, month_start, month_end, metadata_ids)
+            # Skip months without statistics
+            if (
+                next_start_ts := session.query(func.min(Statistics.start_ts))
+                .filter(Statistics.start_ts >= month_end)
+                .scalar()
+            ) is not None:
+                return cast(float, next_start_ts)
+
+        session.add(StatisticsRollupRuns(time_zone=time_zone))
+
+    _LOGGER.debug("Rebuilt statistics rollups in %s", time_zone)
+    instance.statistics_rollups_built = True
+    return None
 
 
 @retryable_database_job("compile missing statistics")
@@ -522,9 +754,24 @@ def _compile_statistics(
             stats["stat"],
         )
 
+    if instance.statistics_rollup_time_zone not in (
+        None,
+        time_zone := _statistics_rollup_time_zone(),
+    ):
+        # The rollups are in local time, rebuild them in the new time zone
+        instance.queue_statistics_rollup_rebuild(time_zone)
+
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        metadata_ids = _compile_hourly_statistics(session, start)
+        if _statistics_rollups_maintained(instance):
+            hour_start_ts = start.replace(minute=0).timestamp()
+            _compile_statistics_rollups(
+                session,
+                hour_start_ts,
+                hour_start_ts + Statistics.duration.total_seconds(),
+                metadata_ids,
+            )
 
     session.add(StatisticsRuns(start=start))
 
@@ -809,7 +1056,28 @@ def _reduce_statistics(
     period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
+    """Reduce hourly statistics to daily or monthly statistics.
+
+    numpy is not a requirement of the recorder. The statistics are reduced
+    with it when it is installed, and row by row otherwise.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return _reduce_statistics_rows(
+            stats, same_period, period_start_end, period, types
+        )
+    return _reduce_statistics_numpy(numpy, stats, period_start_end, types)
+
+
+def _reduce_statistics_rows(
+    stats: dict[str, list[StatisticsRow]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily or monthly statistics row by row."""
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
     period_seconds = period.total_seconds()
     _want_mean = "mean" in types
@@ -861,6 +1129,110 @@ def _reduce_statistics(
     return result
 
 
+def _period_boundaries(
+    period_start_end: Callable[[float], tuple[float, float]],
+    first: float,
+    last: float,
+) -> list[float]:
+    """Return the boundaries of the periods from the one of first to the one of last."""
+    start, end = period_start_end(first)
+    boundaries = [start, end]
+    while end <= last:
+        end = period_start_end(end)[1]
+        boundaries.append(end)
+    return boundaries
+
+
+def _nan_to_none(values: list[float]) -> list[float | None]:
+    """Replace NaN with None."""
+    return [None if math.isnan(value) else value for value in values]
+
+
+def _reduce_statistics_numpy(
+    np: Any,
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily or monthly statistics with numpy.
+
+    The hourly rows are bucketed into periods with a binary search of their
+    start times in the period boundaries, and mean, min and max are reduced
+    per period instead of row by row.
+    """
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    if not stats:
+        return result
+    boundaries = np.array(
+        _period_boundaries(
+            period_start_end,
+            min(stat_list[0]["start"] for stat_list in stats.values()),
+            max(stat_list[-1]["start"] for stat_list in stats.values()),
+        )
+    )
+    _want_mean = "mean" in types
+    _want_min = "min" in types
+    _want_max = "max" in types
+    _want_last_reset = "last_reset" in types
+    _want_state = "state" in types
+    _want_sum = "sum" in types
+
+    def _values(
+        stat_list: list[StatisticsRow], key: Literal["max", "mean", "min"]
+    ) -> Any:
+        """Return the values of key in stat_list with NaN for missing values."""
+        return np.array([statistic.get(key) for statistic in stat_list], dtype=float)
+
+    for statistic_id, stat_list in stats.items():
+        starts = np.fromiter(
+            (statistic["start"] for statistic in stat_list), float, len(stat_list)
+        )
+        periods = np.searchsorted(boundaries, starts, side="right") - 1
+        # Index of the first and the last statistic of each period
+        firsts = np.flatnonzero(np.diff(periods, prepend=-1))
+        lasts = np.append(firsts[1:], len(stat_list)) - 1
+        period_indices = periods[firsts]
+        rows: list[StatisticsRow] = [
+            {"start": start, "end": end}
+            for start, end in zip(
+                boundaries[period_indices].tolist(),
+                boundaries[period_indices + 1].tolist(),
+            )
+        ]
+
+        if _want_mean:
+            values = _values(stat_list, "mean")
+            valid = ~np.isnan(values)
+            totals = np.add.reduceat(np.where(valid, values, 0.0), firsts)
+            counts = np.add.reduceat(valid.astype(float), firsts)
+            means = np.divide(
+                totals, counts, out=np.full_like(totals, np.nan), where=counts > 0
+            )
+            for row, value in zip(rows, _nan_to_none(means.tolist())):
+                row["mean"] = value
+        if _want_min:
+            mins = np.fmin.reduceat(_values(stat_list, "min"), firsts)
+            for row, value in zip(rows, _nan_to_none(mins.tolist())):
+                row["min"] = value
+        if _want_max:
+            maxes = np.fmax.reduceat(_values(stat_list, "max"), firsts)
+            for row, value in zip(rows, _nan_to_none(maxes.tolist())):
+                row["max"] = value
+        # The last statistic of each period holds the state at its end
+        if _want_last_reset or _want_state or _want_sum:
+            for row, last in zip(rows, lasts.tolist()):
+                last_stat = stat_list[last]
+                if _want_last_reset:
+                    row["last_reset"] = last_stat.get("last_reset")
+                if _want_state:
+                    row["state"] = last_stat.get("state")
+                if _want_sum:
+                    row["sum"] = last_stat["sum"]
+        result[statistic_id] = rows
+
+    return result
+
+
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1016,6 +1388,19 @@ def _reduce_statistics_per_month(
     )
 
 
+def _set_period_end(
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> None:
+    """Set the end of daily or monthly statistics, which vary in length."""
+    period_ends: dict[float, float] = {}
+    for stat_list in stats.values():
+        for statistic in stat_list:
+            if (end := period_ends.get(start := statistic["start"])) is None:
+                end = period_ends[start] = period_start_end(start)[1]
+            statistic["end"] = end
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1070,10 +1455,16 @@ def _get_max_mean_min_statistic_in_sub_period(
 ) -> None:
     """Return max, mean and min during the period."""
     # Calculate max, mean, min
+    rollup = issubclass(table, StatisticsRollupBase)
     columns = select()
     if "max" in types:
         columns = columns.add_columns(func.max(table.max))
-    if "mean" in types:
+    if "mean" in types and issubclass(table, StatisticsRollupBase):
+        columns = columns.add_columns(
+            func.sum(table.mean * table.mean_count).label("mean_sum"),
+            func.sum(table.mean_count).label("mean_count"),
+        )
+    elif "mean" in types:
         columns = columns.add_columns(func.avg(table.mean))
         columns = columns.add_columns(func.count(table.mean))
     if "min" in types:
@@ -1087,7 +1478,14 @@ def _get_max_mean_min_statistic_in_sub_period(
     if "max" in types and (new_max := stats[0].max) is not None:
         old_max = result.get("max")
         result["max"] = max(new_max, old_max) if old_max is not None else new_max
-    if "mean" in types and stats[0].avg is not None:
+    if "mean" in types and rollup and stats[0].mean_count:
+        # Rollups are weighted by the number of hourly means they summarize
+        hour = Statistics.duration.total_seconds()
+        result["duration"] = result.get("duration", 0.0) + float(
+            stats[0].mean_count * hour
+        )
+        result["mean_acc"] = result.get("mean_acc", 0.0) + stats[0].mean_sum * hour
+    elif "mean" in types and not rollup and stats[0].avg is not None:
         # https://github.com/sqlalchemy/sqlalchemy/issues/9127
         duration = stats[0].count * table.duration.total_seconds()  # type: ignore[operator]
         result["duration"] = result.get("duration", 0.0) + duration
@@ -1097,6 +1495,61 @@ def _get_max_mean_min_statistic_in_sub_period(
         result["min"] = min(new_min, old_min) if old_min is not None else new_min
 
 
+def _long_term_sub_periods(
+    start_time: datetime | None, end_time: datetime | None, rollups: bool
+) -> list[tuple[type[StatisticsBase], datetime | None, datetime | None]]:
+    """Split a period of full hours into the coarsest statistics covering it.
+
+    Full months are read from the monthly statistics, the remaining full days
+    from the daily statistics and the remaining hours from the hourly statistics.
+    """
+    if not rollups or end_time is None:
+        return [(Statistics, start_time, end_time)]
+
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    end_ts = end_time.timestamp()
+    last_day_ts = day_start_end(end_ts)[0]
+    last_month_ts = month_start_end(end_ts)[0]
+    start_ts: float | None = None
+    first_day_ts: float | None = None
+    first_month_ts: float | None = None
+    if start_time is not None:
+        start_ts = start_time.timestamp()
+        day_start, day_end = day_start_end(start_ts)
+        first_day_ts = day_start if day_start == start_ts else day_end
+        month_start, month_end = month_start_end(start_ts)
+        first_month_ts = month_start if month_start == start_ts else month_end
+        if first_day_ts >= last_day_ts:
+            return [(Statistics, start_time, end_time)]
+
+    sub_periods: list[tuple[type[StatisticsBase], float | None, float | None]]
+    if first_month_ts is not None and first_month_ts >= last_month_ts:
+        sub_periods = [
+            (Statistics, start_ts, first_day_ts),
+            (StatisticsDaily, first_day_ts, last_day_ts),
+            (Statistics, last_day_ts, end_ts),
+        ]
+    else:
+        sub_periods = [
+            (Statistics, start_ts, first_day_ts),
+            (StatisticsDaily, first_day_ts, first_month_ts),
+            (StatisticsMonthly, first_month_ts, last_month_ts),
+            (StatisticsDaily, last_month_ts, last_day_ts),
+            (Statistics, last_day_ts, end_ts),
+        ]
+    return [
+        (
+            table,
+            None if sub_start_ts is None else dt_util.utc_from_timestamp(sub_start_ts),
+            dt_util.utc_from_timestamp(sub_end_ts),
+        )
+        for table, sub_start_ts, sub_end_ts in sub_periods
+        if sub_end_ts is not None
+        and (sub_start_ts is None or sub_start_ts < sub_end_ts)
+    ]
+
+
 def _get_max_mean_min_statistic(
     session: Session,
     head_start_time: datetime | None,
@@ -1108,11 +1561,12 @@ def _get_max_mean_min_statistic(
     tail_only: bool,
     metadata_id: int,
     types: set[Literal["max", "mean", "min", "change"]],
+    rollups: bool,
 ) -> dict[str, float | None]:
     """Return max, mean and min during the period.
 
-    The mean is a time weighted average, combining hourly and 5-minute statistics if
-    necessary.
+    The mean is a time weighted average, combining monthly, daily, hourly and
+    5-minute statistics if necessary.
     """
     max_mean_min: dict[str, float] = {}
     result: dict[str, float | None] = {}
@@ -1130,15 +1584,18 @@ def _get_max_mean_min_statistic(
         )
 
     if not tail_only:
-        _get_max_mean_min_statistic_in_sub_period(
-            session,
-            max_mean_min,
-            main_start_time,
-            main_end_time,
-            Statistics,
-            types,
-            metadata_id,
-        )
+        for table, start_time, end_time in _long_term_sub_periods(
+            main_start_time, main_end_time, rollups
+        ):
+            _get_max_mean_min_statistic_in_sub_period(
+                session,
+                max_mean_min,
+                start_time,
+                end_time,
+                table,
+                types,
+                metadata_id,
+            )
 
     if head_start_time is not None:
         _get_max_mean_min_statistic_in_sub_period(
@@ -1341,12 +1798,11 @@ def statistic_during_period(
 
     result: dict[str, Any] = {}
 
+    instance = get_instance(hass)
     with session_scope(hass=hass, read_only=True) as session:
         # Fetch metadata for the given statistic_id
         if not (
-            metadata := get_instance(hass).statistics_meta_manager.get(
-                session, statistic_id
-            )
+            metadata := instance.statistics_meta_manager.get(session, statistic_id)
         ):
             return result
 
@@ -1363,7 +1819,8 @@ def statistic_during_period(
         # short_term_statistics (5 minute) tables is combined
         # - The short term statistics table is used for the head and tail of the period,
         #   if the period it doesn't start or end on a full hour
-        # - The statistics table is used for the remainder of the time
+        # - The statistics table is used for the remainder of the time, except
+        #   for full days and months covered by the daily and monthly statistics
         now = dt_util.utcnow()
         if end_time is not None and end_time > now:
             end_time = now
@@ -1428,6 +1885,7 @@ def statistic_during_period(
                 tail_only,
                 metadata_id,
                 types,
+                _statistics_rollups_ready(instance),
             )
 
         if "change" in types:
@@ -1526,7 +1984,7 @@ def _augment_result_with_change(
     start_time: datetime,
     units: dict[str, str] | None,
     _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[StatisticsBase],
     metadata: dict[str, tuple[int, StatisticMetaData]],
     result: dict[str, list[StatisticsRow]],
 ) -> None:
@@ -1638,9 +2096,20 @@ def _statistics_during_period_with_session(
         if end_time is not None:
             end_time = _find_month_end_time(dt_util.as_local(end_time))
 
-    table: type[Statistics | StatisticsShortTerm] = (
-        Statistics if period != "5minute" else StatisticsShortTerm
-    )
+    table: type[StatisticsBase] = Statistics
+    if period == "5minute":
+        table = StatisticsShortTerm
+    elif period in ("day", "week", "month") and _statistics_rollups_ready(
+        get_instance(hass)
+    ):
+        # Read the coarsest rollup covering the periods, weeks are reduced
+        # from days unless the mean is requested since the daily means
+        # would have to be weighted by the number of hourly means
+        if period == "month":
+            table = StatisticsMonthly
+        elif period == "day" or "mean" not in types:
+            table = StatisticsDaily
+
     stmt = _generate_statistics_during_period_stmt(
         start_time, end_time, metadata_ids, table, types
     )
@@ -1665,13 +2134,19 @@ def _statistics_during_period_with_session(
     )
 
     if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if table is StatisticsDaily:
+            _set_period_end(result, reduce_day_ts_factory()[1])
+        else:
+            result = _reduce_statistics_per_day(result, types)
 
     if period == "week":
         result = _reduce_statistics_per_week(result, types)
 
     if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if table is StatisticsMonthly:
+            _set_period_end(result, reduce_month_ts_factory()[1])
+        else:
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2215,11 +2690,21 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_times: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        start_times.append(stat["start"].timestamp())
+
+    if table is Statistics and start_times and _statistics_rollups_maintained(instance):
+        _compile_statistics_rollups(
+            session,
+            min(start_times),
+            max(start_times) + Statistics.duration.total_seconds(),
+            (metadata_id,),
+        )
 
     return True
 
@@ -2281,6 +2766,29 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        if _statistics_rollups_maintained(instance):
+            # Adjust the periods after the adjusted hour and compile the
+            # periods which contain it again
+            tables: tuple[type[StatisticsBase], ...] = (
+                StatisticsDaily,
+                StatisticsMonthly,
+            )
+            for table in tables:
+                _adjust_sum_statistics(
+                    session,
+                    table,
+                    metadata[statistic_id][0],
+                    start_time.replace(minute=0),
+                    sum_adjustment,
+                )
+            start_time_ts = start_time.replace(minute=0).timestamp()
+            _compile_statistics_rollups(
+                session,
+                start_time_ts,
+                start_time_ts + Statistics.duration.total_seconds(),
+                (metadata[statistic_id][0],),
+            )
+
     return True
 
 
@@ -2341,6 +2849,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -180,6 +180,24 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class StatisticsRollupTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild the statistics rollups."""
+
+    time_zone: str
+    start_time_ts: float | None = None
+
+    def run(self, instance: Recorder) -> None:
+        """Rebuild the daily and monthly statistics of a month."""
+        if (
+            start_time_ts := statistics.rebuild_statistics_rollups(
+                instance, self.time_zone, self.start_time_ts
+            )
+        ) is not None:
+            # Schedule a new task for the next month
+            instance.queue_task(StatisticsRollupTask(self.time_zone, start_time_ts))
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
@@ -281,6 +299,22 @@ class EventTask(RecorderTask):
         instance._process_one_event(self.event)
 
 
+@dataclass(slots=True)
+class EventsTask(RecorderTask):
+    """Events that were fired together to be processed."""
+
+    events: list[Event]
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._batched_events_processed += len(self.events) - 1
+        for event in self.events:
+            # pylint: disable-next=[protected-access]
+            instance._process_one_event(event)
+
+
 @dataclass(slots=True)
 class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
@@ -501,7 +501,7 @@ def ws_info(
     recording = instance.recording if instance else False
     thread_alive = instance.is_alive() if instance else False
 
-    recorder_info = {
+    recorder_info: dict[str, Any] = {
         "backlog": backlog,
         "max_backlog": instance.max_backlog,
         "migration_in_progress": migration_in_progress,
@@ -509,6 +509,11 @@ def ws_info(
         "recording": recording,
         "thread_running": thread_alive,
     }
+    if instance and instance.read_engine is not None:
+        recorder_info["reader"] = {
+            "queue_depth": instance.db_executor_backlog,
+            **instance.reader_stats.as_dict(),
+        }
     connection.send_result(msg["id"], recorder_info)
 
 
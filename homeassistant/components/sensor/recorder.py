@@ -7,7 +7,8 @@ import datetime
 import itertools
 import logging
 import math
-from typing import Any
+import threading
+from typing import Any, NamedTuple
 
 from sqlalchemy.orm.session import Session
 
@@ -18,6 +19,7 @@ from homeassistant.components.recorder import (
     statistics,
     util as recorder_util,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -25,12 +27,13 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import Event, HomeAssistant, State, callback, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.util import dt as dt_util
@@ -70,6 +73,13 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Folds the state changes of sensors into short term statistics periods
+STATISTICS_ACCUMULATOR = "sensor_statistics_accumulator"
+
+PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+# Number of periods kept for a sensor before its older periods are compiled
+# from the database again
+MAX_PERIODS = 12
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -231,23 +241,7 @@ def _normalize_states(
         state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         # Exclude states with unsupported unit from statistics
         if state_unit not in converter.VALID_UNITS:
-            if WARN_UNSUPPORTED_UNIT not in hass.data:
-                hass.data[WARN_UNSUPPORTED_UNIT] = set()
-            if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
-                hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
-                _LOGGER.warning(
-                    (
-                        "The unit of %s (%s) cannot be converted to the unit of"
-                        " previously compiled statistics (%s). Generation of long term"
-                        " statistics will be suppressed unless the unit changes back to"
-                        " %s or a compatible unit. Go to %s to fix this"
-                    ),
-                    entity_id,
-                    state_unit,
-                    statistics_unit,
-                    statistics_unit,
-                    LINK_DEV_STATISTICS,
-                )
+            _warn_unsupported_unit(hass, entity_id, state_unit, statistics_unit)
             continue
         if state_unit != last_unit:
             # The unit of measurement has changed since the last state change
@@ -260,6 +254,64 @@ def _normalize_states(
     return statistics_unit, valid_fstates
 
 
+def _normalize_measurement(
+    hass: HomeAssistant,
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]],
+    measurement: _Measurement,
+    entity_id: str,
+) -> tuple[str | None, _Measurement | None]:
+    """Normalize the unit of a measurement folded by the accumulator."""
+    old_metadata = old_metadatas[entity_id][1] if entity_id in old_metadatas else None
+    if not old_metadata:
+        statistics_unit = measurement.unit
+    else:
+        statistics_unit = old_metadata["unit_of_measurement"]
+
+    if statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
+        # The accumulator does not fold periods during which the unit changed
+        return measurement.unit, measurement
+
+    converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
+    if measurement.unit not in converter.VALID_UNITS:
+        _warn_unsupported_unit(hass, entity_id, measurement.unit, statistics_unit)
+        return None, None
+    # The unit converters are linear, so converting the folded values gives
+    # the same result as folding the converted values
+    convert = converter.converter_factory(measurement.unit, statistics_unit)
+    return statistics_unit, _Measurement(
+        statistics_unit,
+        convert(measurement.min),
+        convert(measurement.max),
+        convert(measurement.mean),
+    )
+
+
+def _warn_unsupported_unit(
+    hass: HomeAssistant,
+    entity_id: str,
+    state_unit: str | None,
+    statistics_unit: str | None,
+) -> None:
+    """Log a warning once if the unit of a sensor can't be converted."""
+    if WARN_UNSUPPORTED_UNIT not in hass.data:
+        hass.data[WARN_UNSUPPORTED_UNIT] = set()
+    if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
+        hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
+        _LOGGER.warning(
+            (
+                "The unit of %s (%s) cannot be converted to the unit of"
+                " previously compiled statistics (%s). Generation of long term"
+                " statistics will be suppressed unless the unit changes back to"
+                " %s or a compatible unit. Go to %s to fix this"
+            ),
+            entity_id,
+            state_unit,
+            statistics_unit,
+            statistics_unit,
+            LINK_DEV_STATISTICS,
+        )
+
+
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
     """Suggest to report an issue."""
     domain = entity_sources(hass).get(entity_id, {}).get("domain")
@@ -386,6 +438,243 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+class _Measurement(NamedTuple):
+    """Statistics of a measurement sensor folded by the accumulator."""
+
+    unit: str | None
+    min: float
+    max: float
+    mean: float
+
+
+class _StatisticsPeriod:
+    """The state changes of a sensor during a short term statistics period.
+
+    Sensors with a sum keep their states since the sum depends on their
+    order. The numeric states of other sensors are folded into the min, max
+    and time weighted sum as they arrive.
+    """
+
+    __slots__ = (
+        "start",
+        "seed",
+        "states",
+        "unit",
+        "units_changed",
+        "first_time",
+        "last_value",
+        "last_time",
+        "min",
+        "max",
+        "accumulated",
+    )
+
+    def __init__(self, start: float, seed: State | None, keep_states: bool) -> None:
+        """Initialize the period with the state at its start."""
+        self.start = start
+        self.seed = seed
+        self.states: list[State] | None = [] if keep_states else None
+        self.unit: str | None = None
+        self.units_changed = False
+        self.first_time: float | None = None
+        self.last_value = 0.0
+        self.last_time = start
+        self.min = math.inf
+        self.max = -math.inf
+        self.accumulated = 0.0
+        if seed is not None:
+            self.add(seed, start, True)
+
+    def add(self, state: State, time: float, significant: bool) -> None:
+        """Add a state change to the period."""
+        if self.states is not None:
+            self.states.append(state)
+            return
+        # The database path only uses significant changes of measurements
+        if not significant or (value := _float_or_none(state.state)) is None:
+            return
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if self.first_time is None:
+            self.first_time = time
+            self.unit = unit
+        else:
+            self.accumulated += self.last_value * (time - self.last_time)
+            if unit != self.unit:
+                self.units_changed = True
+        self.last_value = value
+        self.last_time = time
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def result(self, end: float) -> list[State] | _Measurement | None:
+        """Return the states or the measurement of the period.
+
+        Returns an empty list if the measurement had no numeric state and
+        None if its unit changed.
+        """
+        if self.states is not None:
+            return list(self.states)
+        if self.first_time is None:
+            return []
+        if self.units_changed:
+            return None
+        # Same as _time_weighted_average
+        accumulated = self.accumulated + self.last_value * (end - self.last_time)
+        if (period_seconds := end - self.first_time) == 0:
+            mean = 0.0
+        else:
+            mean = accumulated / period_seconds
+        return _Measurement(self.unit, self.min, self.max, mean)
+
+
+class _SensorTracker:
+    """Track the statistics periods of a sensor."""
+
+    __slots__ = ("since", "keep_states", "state", "time", "period", "closed")
+
+    def __init__(
+        self, since: float, keep_states: bool, state: State, time: float
+    ) -> None:
+        """Initialize the tracker with the current state of the sensor."""
+        # Periods which start before since are compiled from the database
+        self.since = since
+        self.keep_states = keep_states
+        self.state = state
+        self.time = time
+        self.period: _StatisticsPeriod | None = None
+        self.closed: list[_StatisticsPeriod] = []
+
+    def add(self, state: State, time: float) -> None:
+        """Add a state change."""
+        start = time - time % PERIOD_SECONDS
+        if (period := self.period) is None or period.start != start:
+            if period is not None:
+                self.closed.append(period)
+                if len(self.closed) > MAX_PERIODS:
+                    dropped = self.closed.pop(0)
+                    self.since = max(self.since, dropped.start + PERIOD_SECONDS)
+            period = self.period = _StatisticsPeriod(
+                start, self.state, self.keep_states
+            )
+        period.add(state, time, state.last_changed == state.last_updated)
+        self.state = state
+        self.time = time
+
+    def result(self, start: float, end: float) -> list[State] | _Measurement | None:
+        """Return the states or the measurement of the period starting at start."""
+        if start < self.since:
+            return None
+        periods = self.closed
+        if self.period is not None:
+            periods = [*periods, self.period]
+        # Periods before this one won't be compiled again
+        self.since = start
+        seed: State | None = self.state
+        for index, period in enumerate(periods):
+            if period.start == start:
+                del self.closed[:index]
+                return period.result(end)
+            if period.start > start:
+                # The state did not change during the period
+                seed = period.seed
+                del self.closed[:index]
+                break
+        else:
+            self.closed.clear()
+        return _StatisticsPeriod(start, seed, self.keep_states).result(end)
+
+
+class SensorStatisticsAccumulator:
+    """Fold the state changes of sensors into short term statistics periods.
+
+    Compiling the statistics of a period from the accumulator avoids reading
+    the states of all sensors back from the database. Periods which started
+    before the accumulator or a sensor was tracked, or which are older than
+    MAX_PERIODS, are compiled from the database instead.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        # Periods are folded in the event loop and compiled in the recorder thread
+        self._lock = threading.Lock()
+        self._trackers: dict[str, _SensorTracker] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking the sensors."""
+        now = dt_util.utcnow().timestamp()
+        with self._lock:
+            for state in self.hass.states.async_all(DOMAIN):
+                self._track(state.entity_id, state, now)
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a state change of a sensor."""
+        entity_id: str = event.data["entity_id"]
+        if split_entity_id(entity_id)[0] != DOMAIN:
+            return
+        new_state: State | None = event.data["new_state"]
+        with self._lock:
+            if new_state is None:
+                self._trackers.pop(entity_id, None)
+                return
+            self._track(entity_id, new_state, new_state.last_updated.timestamp())
+
+    def _track(self, entity_id: str, state: State, since: float) -> None:
+        """Add a state to the tracker of a sensor."""
+        state_class = try_parse_enum(
+            SensorStateClass, state.attributes.get(ATTR_STATE_CLASS)
+        )
+        if state_class is None:
+            self._trackers.pop(entity_id, None)
+            return
+        keep_states = "sum" in DEFAULT_STATISTICS[state_class]
+        time = state.last_updated.timestamp()
+        tracker = self._trackers.get(entity_id)
+        if tracker is None or tracker.keep_states != keep_states:
+            self._trackers[entity_id] = _SensorTracker(since, keep_states, state, time)
+            return
+        if time < tracker.time:
+            # The database orders the states by last_updated, so the period
+            # of this state and the ones until the latest state are compiled
+            # from the database
+            self._trackers[entity_id] = _SensorTracker(
+                tracker.time - tracker.time % PERIOD_SECONDS + PERIOD_SECONDS,
+                keep_states,
+                tracker.state,
+                tracker.time,
+            )
+            return
+        tracker.add(state, time)
+
+    def get_periods(
+        self,
+        entity_ids: Iterable[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+    ) -> dict[str, list[State] | _Measurement]:
+        """Return the states or the measurement of sensors during start-end.
+
+        Sensors which need to be compiled from the database are left out.
+        """
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        if start_ts % PERIOD_SECONDS or end_ts - start_ts != PERIOD_SECONDS:
+            return {}
+        periods: dict[str, list[State] | _Measurement] = {}
+        with self._lock:
+            for entity_id in entity_ids:
+                if (tracker := self._trackers.get(entity_id)) is None:
+                    continue
+                if (result := tracker.result(start_ts, end_ts)) is not None:
+                    periods[entity_id] = result
+        return periods
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> statistics.PlatformCompiledStatistics:
@@ -401,8 +690,15 @@ def compile_statistics(
     # If we ever need to write to the database from this function we
     # will need to refactor the recorder statistics to use a single
     # session.
+    if (accumulator := hass.data.get(STATISTICS_ACCUMULATOR)) is None:
+        # Periods are compiled from the database until the accumulator has
+        # tracked the sensors for a whole period
+        accumulator = hass.data[STATISTICS_ACCUMULATOR] = SensorStatisticsAccumulator(
+            hass
+        )
+        hass.add_job(accumulator.async_start)
     with recorder_util.session_scope(hass=hass, read_only=True) as session:
-        compiled = _compile_statistics(hass, session, start, end)
+        compiled = _compile_statistics(hass, session, start, end, accumulator)
     return compiled
 
 
@@ -411,15 +707,23 @@ def _compile_statistics(  # noqa: C901
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
+    accumulator: SensorStatisticsAccumulator | None = None,
 ) -> statistics.PlatformCompiledStatistics:
     """Compile statistics for all entities during start-end."""
     result: list[StatisticResult] = []
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    accumulated: dict[str, list[State] | _Measurement] = {}
+    if accumulator:
+        accumulated = accumulator.get_periods(
+            (i.entity_id for i in sensor_states), start, end
+        )
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in accumulated
     ]
     history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
@@ -435,6 +739,7 @@ def _compile_statistics(  # noqa: C901
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in accumulated
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -446,12 +751,17 @@ def _compile_statistics(  # noqa: C901
         )
         history_list = {**history_list, **_history_list}
 
-    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    entities_with_float_states: dict[str, list[tuple[float, State]] | _Measurement] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if isinstance(period := accumulated.get(entity_id), _Measurement):
+            entities_with_float_states[entity_id] = period
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
+        if period is not None:
+            entity_history = period
+        elif not (entity_history := history_list.get(entity_id, [_state])):
             continue
         if not (float_states := _entity_history_to_float_and_state(entity_history)):
             continue
@@ -464,18 +774,26 @@ def _compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[
+        tuple[str, str | None, str, list[tuple[float, State]] | _Measurement]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
-        statistics_unit, valid_float_states = _normalize_states(
-            hass,
-            old_metadatas,
-            maybe_float_states,
-            entity_id,
-        )
+        valid_float_states: list[tuple[float, State]] | _Measurement | None
+        if isinstance(maybe_float_states, _Measurement):
+            statistics_unit, valid_float_states = _normalize_measurement(
+                hass, old_metadatas, maybe_float_states, entity_id
+            )
+        else:
+            statistics_unit, valid_float_states = _normalize_states(
+                hass,
+                old_metadatas,
+                maybe_float_states,
+                entity_id,
+            )
         if not valid_float_states:
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
@@ -529,6 +847,14 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if isinstance(valid_float_states, _Measurement):
+            # The accumulator folded the states of the period as they changed
+            stat["max"] = valid_float_states.max
+            stat["min"] = valid_float_states.min
+            stat["mean"] = valid_float_states.mean
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(
@@ -0,0 +1,281 @@
+"""Sliding window of samples with incrementally updated statistics.
+
+Recomputing a characteristic over the whole buffer on every new sample and
+every purge is linear in the buffer size. The window keeps running sums
+(Welford for the mean and variance), monotonic deques for the sliding
+minimum and maximum and a bucketed sorted list for the median and
+percentiles, so that each sample added or removed costs amortized constant
+or sublinear time.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+
+class _SortedValues:
+    """Sorted multiset of floats split over buckets of bounded size.
+
+    Adding and removing a value is a bisect and an insert into a single
+    bucket, looking up a value by rank walks the bucket lengths.
+    """
+
+    _LOAD = 256
+
+    def __init__(self) -> None:
+        """Initialize the sorted values."""
+        self._buckets: list[list[float]] = []
+        self._maxes: list[float] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return self._len
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        self._len += 1
+        if not self._buckets:
+            self._buckets.append([value])
+            self._maxes.append(value)
+            return
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._buckets):
+            pos -= 1
+            self._buckets[pos].append(value)
+            self._maxes[pos] = value
+        else:
+            insort(self._buckets[pos], value)
+        if len(self._buckets[pos]) > 2 * self._LOAD:
+            self._split(pos)
+
+    def remove(self, value: float) -> None:
+        """Remove a value which was added before."""
+        pos = bisect_left(self._maxes, value)
+        bucket = self._buckets[pos]
+        del bucket[bisect_left(bucket, value)]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[pos]
+            del self._maxes[pos]
+            return
+        self._maxes[pos] = bucket[-1]
+        if len(bucket) < self._LOAD // 4 and len(self._buckets) > 1:
+            # Merge small buckets into a neighbour to keep the number of
+            # buckets proportional to the number of values.
+            if pos == len(self._buckets) - 1:
+                pos -= 1
+            self._buckets[pos].extend(self._buckets.pop(pos + 1))
+            self._maxes[pos] = self._maxes.pop(pos + 1)
+            if len(self._buckets[pos]) > 2 * self._LOAD:
+                self._split(pos)
+
+    def _split(self, pos: int) -> None:
+        """Split a bucket which grew too large in two."""
+        bucket = self._buckets[pos]
+        half = bucket[self._LOAD :]
+        del bucket[self._LOAD :]
+        self._maxes[pos] = bucket[-1]
+        self._buckets.insert(pos + 1, half)
+        self._maxes.insert(pos + 1, half[-1])
+
+    def __getitem__(self, index: int) -> float:
+        """Return the value at the given rank."""
+        for bucket in self._buckets:
+            if index < len(bucket):
+                return bucket[index]
+            index -= len(bucket)
+        raise IndexError(index)
+
+
+class SampleWindow:
+    """Window of samples and their ages, with statistics kept up to date.
+
+    The running sums drift from rounding errors as samples are removed, so
+    they are recomputed from the samples after as many removals as there are
+    samples in the window, which keeps the amortized cost constant.
+    """
+
+    def __init__(
+        self,
+        maxlen: int | None,
+        *,
+        order_statistics: bool = False,
+        extrema: bool = False,
+    ) -> None:
+        """Initialize the window.
+
+        The sorted values for order statistics and the monotonic deques for
+        the extrema are only kept when requested.
+        """
+        self.maxlen = maxlen
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self._sorted = _SortedValues() if order_statistics else None
+        self._extrema = extrema
+        # Monotonic deques of (sequence, value, age), the front of the deque
+        # is the earliest sample with the maximum or minimum value
+        self._max: deque[tuple[int, float, datetime]] = deque()
+        self._min: deque[tuple[int, float, datetime]] = deque()
+        self._first_seq = 0
+        self._next_seq = 0
+        self._nan_count = 0
+        self._removed = 0
+        self._reset_sums()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def _reset_sums(self) -> None:
+        """Reset the running sums."""
+        self.sum: float = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.sum_differences: float = 0
+        self.sum_differences_nonnegative: float = 0
+        self.area_step: float = 0
+        self.area_linear: float = 0
+
+    def _add_pair(self, first: float, second: float, seconds: float) -> None:
+        """Add the running sums of two consecutive samples."""
+        self.sum_differences += abs(second - first)
+        self.sum_differences_nonnegative += (
+            second - first if second >= first else second
+        )
+        self.area_step += first * seconds
+        self.area_linear += 0.5 * (first + second) * seconds
+
+    def _remove_pair(self, first: float, second: float, seconds: float) -> None:
+        """Remove the running sums of two consecutive samples."""
+        self.sum_differences -= abs(second - first)
+        self.sum_differences_nonnegative -= (
+            second - first if second >= first else second
+        )
+        self.area_step -= first * seconds
+        self.area_linear -= 0.5 * (first + second) * seconds
+
+    def _add_value(self, value: float, count: int) -> None:
+        """Add the value of the count-th sample to the sum, mean and variance."""
+        self.sum += value
+        delta = value - self._mean
+        self._mean += delta / count
+        self._m2 += delta * (value - self._mean)
+
+    def _rebuild_sums(self) -> None:
+        """Recompute the running sums from the samples."""
+        self._reset_sums()
+        self._removed = 0
+        previous: tuple[float, datetime] | None = None
+        for count, (value, age) in enumerate(zip(self.states, self.ages), 1):
+            self._add_value(value, count)
+            if previous is not None:
+                self._add_pair(previous[0], value, (age - previous[1]).total_seconds())
+            previous = (value, age)
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, removing the oldest one if the window is full."""
+        if self.maxlen is not None and len(self.states) >= self.maxlen:
+            self.popleft()
+        if self.states:
+            self._add_pair(
+                self.states[-1], value, (age - self.ages[-1]).total_seconds()
+            )
+        self.states.append(value)
+        self.ages.append(age)
+        self._add_value(value, len(self.states))
+
+        seq = self._next_seq
+        self._next_seq += 1
+        if math.isnan(value):
+            self._nan_count += 1
+        elif self._sorted is not None:
+            self._sorted.add(value)
+        if self._extrema:
+            while self._max and self._max[-1][1] < value:
+                self._max.pop()
+            self._max.append((seq, value, age))
+            while self._min and self._min[-1][1] > value:
+                self._min.pop()
+            self._min.append((seq, value, age))
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        seq = self._first_seq
+        self._first_seq += 1
+        if math.isnan(value):
+            self._nan_count -= 1
+        elif self._sorted is not None:
+            self._sorted.remove(value)
+        if self._max and self._max[0][0] == seq:
+            self._max.popleft()
+        if self._min and self._min[0][0] == seq:
+            self._min.popleft()
+
+        if not self.states:
+            self._reset_sums()
+            self._removed = 0
+            return
+        self._removed += 1
+        if not math.isfinite(value) or self._removed > len(self.states):
+            self._rebuild_sums()
+            return
+        self._remove_pair(value, self.states[0], (self.ages[0] - age).total_seconds())
+        self.sum -= value
+        count = len(self.states)
+        mean = self._mean
+        self._mean = (mean * (count + 1) - value) / count
+        self._m2 -= (value - mean) * (value - self._mean)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return max(self._m2, 0.0) / (len(self.states) - 1)
+
+    @property
+    def max(self) -> tuple[float, datetime]:
+        """Return the maximum value and the age of its first occurrence."""
+        _, value, age = self._max[0]
+        return value, age
+
+    @property
+    def min(self) -> tuple[float, datetime]:
+        """Return the minimum value and the age of its first occurrence."""
+        _, value, age = self._min[0]
+        return value, age
+
+    def median(self) -> float:
+        """Return the median of the samples."""
+        assert self._sorted is not None
+        if self._nan_count:
+            return math.nan
+        count = len(self._sorted)
+        half = count // 2
+        if count % 2:
+            return self._sorted[half]
+        return (self._sorted[half - 1] + self._sorted[half]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile like statistics.quantiles with n=100.
+
+        Uses the exclusive method and requires at least two samples.
+        """
+        assert self._sorted is not None
+        if self._nan_count:
+            return math.nan
+        count = len(self._sorted)
+        rank = percentile * (count + 1)
+        index = min(max(rank // 100, 1), count - 1)
+        delta = rank - index * 100
+        return (
+            self._sorted[index - 1] * (100 - delta) + self._sorted[index] * delta
+        ) / 100
@@ -1,7 +1,7 @@
 """Handle the auth of a connection."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Final
 
 from aiohttp.web import Request
@@ -60,6 +60,8 @@ class AuthPhase:
         send_message: Callable[[str | dict[str, Any]], None],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
+        wait_pending_messages: Callable[[int], Awaitable[None]] | None = None,
+        pending_messages: Callable[[], int] | None = None,
     ) -> None:
         """Initialize the authentiated connection."""
         self._hass = hass
@@ -67,6 +69,8 @@ class AuthPhase:
         self._cancel_ws = cancel_ws
         self._logger = logger
         self._request = request
+        self._wait_pending_messages = wait_pending_messages
+        self._pending_messages = pending_messages
 
     async def async_handle(self, msg: JsonValueType) -> ActiveConnection:
         """Handle authentication."""
@@ -106,5 +110,11 @@ class AuthPhase:
         await process_success_login(self._request)
         self._send_message(auth_ok_message())
         return ActiveConnection(
-            self._logger, self._hass, self._send_message, user, refresh_token
+            self._logger,
+            self._hass,
+            self._send_message,
+            user,
+            refresh_token,
+            self._wait_pending_messages,
+            self._pending_messages,
         )
@@ -1,6 +1,7 @@
 """Commands part of Websocket API."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 import datetime as dt
 from functools import lru_cache, partial
@@ -301,25 +302,101 @@ def _send_handle_get_states_response(
     connection.send_message(construct_result_message(msg_id, f"[{joined_states}]"))
 
 
+class _EntityChanges:
+    """Send the entity changes of a subscribe_entities subscription.
+
+    Changes are sent right away while the client keeps up. Once messages
+    pile up for the client, the changes are merged per entity and sent as
+    one message when the client has caught up, so the window adapts to
+    how fast the client reads.
+    """
+
+    __slots__ = ("_connection", "_msg_id", "_pending", "_flush_task")
+
+    def __init__(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Initialize the entity changes."""
+        self._connection = connection
+        self._msg_id = msg_id
+        # The first and the latest event of every entity that changed
+        self._pending: dict[str, list[Event]] | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_send(self, events: list[Event]) -> None:
+        """Send or merge the state changed events."""
+        if (pending := self._pending) is None:
+            if self._connection.pending_messages() <= const.PENDING_MSG_COALESCE:
+                self._async_send_events(events)
+                return
+            pending = self._pending = {}
+            self._flush_task = self._connection.hass.async_create_background_task(
+                self._async_flush(), "websocket_api subscribe_entities flush"
+            )
+        for event in events:
+            entity_id: str = event.data["entity_id"]
+            if (entity_events := pending.get(entity_id)) is None:
+                pending[entity_id] = [event]
+            elif len(entity_events) == 1:
+                entity_events.append(event)
+            else:
+                entity_events[1] = event
+
+    async def _async_flush(self) -> None:
+        """Send the merged changes once the client has caught up."""
+        await self._connection.async_wait_pending_messages(const.PENDING_MSG_RESUME)
+        pending = self._pending
+        self._pending = None
+        self._flush_task = None
+        if pending:
+            self._async_send_events(
+                [event for entity_events in pending.values() for event in entity_events]
+            )
+
+    @callback
+    def _async_send_events(self, events: list[Event]) -> None:
+        """Send the state changed events in one message."""
+        if len(events) == 1:
+            message = messages.cached_state_diff_message(self._msg_id, events[0])
+        else:
+            message = messages.cached_state_diff_batch_message(
+                self._msg_id, tuple(events)
+            )
+        self._connection.send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the merged changes that were not sent yet."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending = None
+
+
 def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+    send_changes: Callable[[list[Event]], None],
     entity_ids: set[str],
     user: User,
-    msg_id: int,
-    event: Event,
+    events: list[Event],
 ) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
+    """Forward entity state changed events to websocket.
+
+    State changes that were fired together are sent in one message.
+    """
+    if entity_ids:
+        events = [event for event in events if event.data["entity_id"] in entity_ids]
+        if not events:
+            return
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    if not permissions.access_all_entities(POLICY_READ):
+        events = [
+            event
+            for event in events
+            if permissions.check_entity(event.data["entity_id"], POLICY_READ)
+        ]
+    if events:
+        send_changes(events)
 
 
 @callback
@@ -334,23 +411,30 @@ def handle_subscribe_entities(
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
+    entity_changes = _EntityChanges(connection, msg["id"])
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+    unsub_state_changed = hass.bus.async_listen_batch(
         EVENT_STATE_CHANGED,
         callback(
             partial(
                 _forward_entity_changes,
-                connection.send_message,
+                entity_changes.async_send,
                 entity_ids,
                 connection.user,
-                msg["id"],
             )
         ),
-        run_immediately=True,
     )
+
+    @callback
+    def _unsubscribe() -> None:
+        """Stop forwarding entity changes."""
+        unsub_state_changed()
+        entity_changes.async_cancel()
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
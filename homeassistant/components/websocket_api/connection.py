@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -45,6 +45,8 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_wait_pending_messages",
+        "_pending_messages",
     )
 
     def __init__(
@@ -54,6 +56,8 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_pending_messages: Callable[[int], Awaitable[None]] | None = None,
+        pending_messages: Callable[[], int] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -69,6 +73,8 @@ class ActiveConnection:
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._wait_pending_messages = wait_pending_messages
+        self._pending_messages = pending_messages
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -123,6 +129,43 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    async def async_wait_pending_messages(
+        self, max_pending: int = const.PENDING_MSG_RESUME
+    ) -> None:
+        """Wait until no more than max_pending messages are waiting to be sent.
+
+        Commands that send a large result in multiple messages wait
+        between the messages so the connection is not closed for
+        exceeding the maximum number of pending messages.
+        """
+        if self._wait_pending_messages is not None:
+            await self._wait_pending_messages(max_pending)
+
+    @callback
+    def pending_messages(self) -> int:
+        """Return the number of messages waiting to be sent to the client."""
+        if self._pending_messages is None:
+            return 0
+        return self._pending_messages()
+
+    async def async_send_message_and_wait(self, msg_id: int, message: str) -> None:
+        """Send a message of a subscription and wait until the client has caught up.
+
+        Commands that send a large result in chunks call this before they
+        fetch the next chunk, so the chunks are generated at the pace the
+        client reads them. If the client does not catch up within
+        PENDING_MSG_RESUME_TIMEOUT seconds, the subscription is ended and
+        TimeoutError is raised.
+        """
+        self.send_message(message)
+        try:
+            async with asyncio.timeout(const.PENDING_MSG_RESUME_TIMEOUT):
+                await self.async_wait_pending_messages()
+        except TimeoutError:
+            if (unsub := self.subscriptions.pop(msg_id, None)) is not None:
+                unsub()
+            raise
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -25,6 +25,16 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Commands that stream large results in multiple messages wait
+# until no more than this number of messages are pending before
+# they send the next one.
+PENDING_MSG_RESUME: Final = 16
+# Commands that stream large results give up when the client does
+# not catch up within this number of seconds.
+PENDING_MSG_RESUME_TIMEOUT: Final = 60
+# Entity changes for clients with more than this number of pending
+# messages are merged until the client is down to PENDING_MSG_RESUME.
+PENDING_MSG_COALESCE: Final = 32
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -75,6 +75,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_drained_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -96,6 +97,9 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[str | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # Resolved after messages were written, so commands that
+        # send large results can wait for the client to catch up.
+        self._drained_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -149,6 +153,8 @@ class WebSocketHandler:
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
                     await send_str(message)
+                    if self._drained_future is not None:
+                        self._release_drained_future()
                     continue
 
                 messages: list[str] = [message]
@@ -164,6 +170,8 @@ class WebSocketHandler:
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_str(coalesced_messages)
+                if self._drained_future is not None:
+                    self._release_drained_future()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -173,6 +181,37 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            # Nothing will be written anymore, so stop waiting for it
+            self._release_drained_future()
+
+    @callback
+    def _release_drained_future(self) -> None:
+        """Wake up the tasks waiting for pending messages to be written."""
+        if (drained_future := self._drained_future) is not None:
+            self._drained_future = None
+            if not drained_future.done():
+                drained_future.set_result(None)
+
+    async def _async_wait_pending_messages(self, max_pending: int) -> None:
+        """Wait until no more than max_pending messages are waiting to be written.
+
+        Returns right away if the connection is closing.
+        """
+        while (
+            not self._closing
+            and (writer_task := self._writer_task) is not None
+            and not writer_task.done()
+            and len(self._message_queue) > max_pending
+        ):
+            if (drained_future := self._drained_future) is None:
+                drained_future = self._drained_future = self._hass.loop.create_future()
+            # Shielded since multiple tasks may wait for the same future
+            await asyncio.shield(drained_future)
+
+    @callback
+    def _pending_messages(self) -> int:
+        """Return the number of messages waiting to be written."""
+        return len(self._message_queue)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -292,7 +331,15 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(logger, hass, self._send_message, self._cancel, request)
+        auth = AuthPhase(
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            self._async_wait_pending_messages,
+            self._pending_messages,
+        )
         connection = None
         disconnect_warn = None
 
@@ -424,6 +471,7 @@ class WebSocketHandler:
                 connection.async_handle_close()
 
             self._closing = True
+            self._release_drained_future()
 
             self._message_queue.append(None)
             if self._ready_future and not self._ready_future.done():
@@ -461,5 +509,6 @@ class WebSocketHandler:
                     self._handle_task = None
                     self._writer_task = None
                     self._ready_future = None
+                    self._drained_future = None
 
         return wsock
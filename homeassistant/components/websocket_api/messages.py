@@ -94,7 +94,13 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
-    return message_to_json({"id": IDEN_TEMPLATE, "type": "event", "event": event})
+    try:
+        # The event JSON is shared with the other consumers of the event
+        event_json = event.as_dict_json()
+    except (ValueError, TypeError):
+        # Let message_to_json log the data that could not be serialized
+        return message_to_json({"id": IDEN_TEMPLATE, "type": "event", "event": event})
+    return f'{{"id":{IDEN_JSON_TEMPLATE},"type":"event","event":{event_json}}}'
 
 
 def cached_state_diff_message(iden: int, event: Event) -> str:
@@ -121,6 +127,57 @@ def _cached_state_diff_message(event: Event) -> str:
     )
 
 
+def cached_state_diff_batch_message(iden: int, events: tuple[Event, ...]) -> str:
+    """Return an event message with the state changes of a batch of events.
+
+    Serialize to json once per batch.
+    """
+    return _cached_state_diff_batch_message(events).replace(
+        IDEN_JSON_TEMPLATE, str(iden), 1
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_batch_message(events: tuple[Event, ...]) -> str:
+    """Cache and serialize the events to json.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_state_diff_batch_message
+    """
+    return message_to_json(
+        {"id": IDEN_TEMPLATE, "type": "event", "event": _state_diff_events(events)}
+    )
+
+
+def _state_diff_events(events: tuple[Event, ...]) -> dict:
+    """Convert state_changed events to one minimal version.
+
+    An entity that changed more than once is diffed from its state before
+    the first event to its state after the last one.
+    """
+    old_states: dict[str, State | None] = {}
+    new_states: dict[str, State | None] = {}
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if entity_id not in old_states:
+            old_states[entity_id] = event.data["old_state"]
+        new_states[entity_id] = event.data["new_state"]
+
+    merged: dict[str, Any] = {}
+    for entity_id, new_state in new_states.items():
+        if new_state is None:
+            merged.setdefault(ENTITY_EVENT_REMOVE, []).append(entity_id)
+        elif (old_state := old_states[entity_id]) is None:
+            merged.setdefault(ENTITY_EVENT_ADD, {})[
+                entity_id
+            ] = new_state.as_compressed_state()
+        else:
+            merged.setdefault(ENTITY_EVENT_CHANGE, {}).update(
+                _state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE]
+            )
+    return merged
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -173,9 +230,9 @@ def _state_diff(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
+    if (old_attributes := old_state.attributes) is not (
         new_attributes := new_state.attributes
-    ):
+    ) and old_attributes != new_attributes:
         for key, value in new_attributes.items():
             if old_attributes.get(key) != value:
                 additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
@@ -10,7 +10,7 @@ from pathlib import Path
 import re
 import shutil
 from types import ModuleType
-from typing import Any
+from typing import Any, cast
 from urllib.parse import urlparse
 
 from awesomeversion import AwesomeVersion
@@ -60,16 +60,21 @@ from .helpers import (
     issue_registry as ir,
 )
 from .helpers.entity_values import EntityValues
+from .helpers.storage import Store
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, load_yaml
+from .util.yaml import SECRET_YAML, Secrets, YamlSnapshot, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
+DATA_YAML_SNAPSHOT = "yaml_snapshot"
+YAML_SNAPSHOT_STORAGE_KEY = "core.yaml_snapshot"
+YAML_SNAPSHOT_STORAGE_VERSION = 1
+YAML_SNAPSHOT_SAVE_DELAY = 10
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
@@ -382,6 +387,28 @@ def _write_default_config(config_dir: str) -> bool:
         return False
 
 
+async def _async_get_yaml_snapshot(
+    hass: HomeAssistant,
+) -> tuple[YamlSnapshot, Store[dict[str, Any]]]:
+    """Return the snapshot of the configuration YAML files and its store."""
+    if (snapshot_and_store := hass.data.get(DATA_YAML_SNAPSHOT)) is not None:
+        return cast(tuple[YamlSnapshot, Store[dict[str, Any]]], snapshot_and_store)
+
+    # The snapshot contains the whole configuration
+    store: Store[dict[str, Any]] = Store(
+        hass, YAML_SNAPSHOT_STORAGE_VERSION, YAML_SNAPSHOT_STORAGE_KEY, private=True
+    )
+    try:
+        data = await store.async_load()
+    except HomeAssistantError as err:
+        _LOGGER.warning("Unable to load the configuration snapshot: %s", err)
+        data = None
+    return cast(
+        tuple[YamlSnapshot, Store[dict[str, Any]]],
+        hass.data.setdefault(DATA_YAML_SNAPSHOT, (YamlSnapshot(data), store)),
+    )
+
+
 async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     """Load YAML from a Home Assistant configuration file.
 
@@ -389,6 +416,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    snapshot, store = await _async_get_yaml_snapshot(hass)
 
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
@@ -396,22 +424,33 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         load_yaml_config_file,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        snapshot,
     )
+    if snapshot.dirty:
+        snapshot.dirty = False
+        store.async_delay_save(snapshot.as_dict, YAML_SNAPSHOT_SAVE_DELAY)
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    snapshot: YamlSnapshot | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
+    Files that did not change are loaded from the snapshot if one is given.
+
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    if snapshot is None:
+        conf_dict = load_yaml(config_path, secrets)
+    else:
+        conf_dict = snapshot.load_yaml(config_path, secrets)
 
     if not isinstance(conf_dict, dict):
         msg = (
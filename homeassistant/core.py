@@ -11,14 +11,17 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     Mapping,
+    MutableMapping,
 )
 import concurrent.futures
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 import datetime
 import enum
 import functools
+from itertools import chain
 import logging
 import os
 import pathlib
@@ -29,6 +32,7 @@ from time import monotonic
 from typing import TYPE_CHECKING, Any, Generic, ParamSpec, Self, TypeVar, cast, overload
 from urllib.parse import urlparse
 
+from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 import yarl
 
@@ -68,7 +72,7 @@ from .exceptions import (
     Unauthorized,
 )
 from .helpers.aiohttp_compat import restore_original_aiohttp_cancel_behavior
-from .helpers.json import json_dumps
+from .helpers.json import json_bytes, json_dumps, json_fragment
 from .util import dt as dt_util, location
 from .util.async_ import (
     cancelling,
@@ -78,6 +82,7 @@ from .util.async_ import (
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
+from .util.timer_wheel import TimerWheel
 from .util.ulid import ulid, ulid_at_time
 from .util.unit_system import (
     _CONF_UNIT_SYSTEM_IMPERIAL,
@@ -141,6 +146,9 @@ TIMEOUT_EVENT_START = 15
 
 MAX_EXPECTED_ENTITY_IDS = 16384
 
+# How many recently set attribute sets the state machine keeps for sharing
+SHARED_ATTRIBUTES_CACHE_SIZE = 1024
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -330,8 +338,20 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Groups the timers of the event helpers when enabled
+        self.timer_wheel: TimerWheel | None = None
         self._stop_future: concurrent.futures.Future[None] | None = None
 
+    @callback
+    def async_enable_timer_wheel(self, resolution: float) -> TimerWheel:
+        """Group the timers of the event helpers into slots of resolution seconds.
+
+        Timers that were scheduled before are not moved to the timer wheel.
+        """
+        if self.timer_wheel is None:
+            self.timer_wheel = TimerWheel(self.loop, resolution)
+        return self.timer_wheel
+
     @property
     def is_running(self) -> bool:
         """Return if Home Assistant is running."""
@@ -924,7 +944,16 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ("event_type", "data", "origin", "time_fired", "context", "_as_dict")
+    __slots__ = (
+        "event_type",
+        "data",
+        "origin",
+        "time_fired",
+        "context",
+        "_as_dict",
+        "_as_dict_json",
+        "_data_json_bytes",
+    )
 
     def __init__(
         self,
@@ -945,6 +974,8 @@ class Event:
             )
         self.context = context
         self._as_dict: ReadOnlyDict[str, Any] | None = None
+        self._as_dict_json: str | None = None
+        self._data_json_bytes: bytes | None = None
         if not context.origin_event:
             context.origin_event = self
 
@@ -965,6 +996,41 @@ class Event:
             )
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return a JSON string of the Event.
+
+        Encoded once for all the consumers of the event.
+        """
+        if not self._as_dict_json:
+            self._as_dict_json = json_dumps(
+                {
+                    "event_type": self.event_type,
+                    "data": json_fragment(self.data_json_bytes()),
+                    "origin": str(self.origin.value),
+                    "time_fired": self.time_fired.isoformat(),
+                    "context": self.context.as_dict(),
+                }
+            )
+        return self._as_dict_json
+
+    def data_json_bytes(self) -> bytes:
+        """Return the event data encoded as JSON.
+
+        States in the data embed the JSON they already encoded, so a
+        state is encoded once as the new state of one state changed
+        event and reused as the old state of the next one.
+        """
+        if self._data_json_bytes is None:
+            self._data_json_bytes = json_bytes(
+                {
+                    key: json_fragment(value.as_dict_json())
+                    if isinstance(value, State)
+                    else value
+                    for key, value in self.data.items()
+                }
+            )
+        return self._data_json_bytes
+
     def __repr__(self) -> str:
         """Return the representation."""
         if self.data:
@@ -983,25 +1049,68 @@ _FilterableJobType = tuple[
 ]
 
 
+class _KeyedListeners:
+    """Listeners of one event type indexed by a key derived from the event data.
+
+    The per key tuples are replaced when listeners change so they can be
+    iterated while firing without making a copy for every event.
+    """
+
+    __slots__ = ("key_getter", "listeners", "subscriptions")
+
+    def __init__(self, key_getter: Callable[[Mapping[str, Any]], str | None]) -> None:
+        """Initialize the keyed listeners."""
+        self.key_getter = key_getter
+        self.listeners: dict[
+            str, tuple[HassJob[[Event], Coroutine[Any, Any, None] | None], ...]
+        ] = {}
+        self.subscriptions = 0
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_keyed_listeners",
+        "_batch_listeners",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: dict[str, list[_FilterableJobType]] = {}
-        self._match_all_listeners: list[_FilterableJobType] = []
-        self._listeners[MATCH_ALL] = self._match_all_listeners
+        # The listeners are replaced instead of mutated when they change
+        # so they can be iterated while firing without making a copy
+        self._listeners: dict[str, tuple[_FilterableJobType, ...]] = {MATCH_ALL: ()}
+        self._keyed_listeners: dict[str, _KeyedListeners] = {}
+        self._batch_listeners: dict[str, list[Callable[[list[Event]], None]]] = {}
         self._hass = hass
 
     @callback
     def async_listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners.
 
+        Keyed listeners are counted once per subscription. Batch listeners
+        are counted with the other listeners of their event type.
+
+        This method must be run in the event loop.
+        """
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + keyed.subscriptions
+        for event_type, batch_listeners in self._batch_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(batch_listeners)
+        return listeners
+
+    @callback
+    def async_keyed_listeners(self, event_type: str) -> dict[str, int]:
+        """Return dictionary with keys and the number of keyed listeners.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        if not (keyed := self._keyed_listeners.get(event_type)):
+            return {}
+        return {key: len(listeners) for key, listeners in keyed.listeners.items()}
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1038,22 +1147,68 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-        match_all_listeners = self._match_all_listeners
-
         event = Event(event_type, event_data, origin, time_fired, context)
+        self._async_dispatch(event)
+        if self._batch_listeners:
+            self._async_run_batch_listeners(event_type, [event])
+
+    @callback
+    def async_fire_batch(self, event_type: str, events: list[Event]) -> None:
+        """Fire events of one type that were created together.
+
+        Listeners receive the events one by one, batch listeners receive
+        all of them in a single call.
+
+        This method must be run in the event loop.
+        """
+        for event in events:
+            self._async_dispatch(event)
+        if self._batch_listeners and events:
+            self._async_run_batch_listeners(event_type, events)
+
+    @callback
+    def _async_run_batch_listeners(self, event_type: str, events: list[Event]) -> None:
+        """Run the batch listeners of an event type."""
+        batch_listeners = self._batch_listeners
+        for listeners in (
+            batch_listeners.get(event_type),
+            None
+            if event_type == EVENT_HOMEASSISTANT_CLOSE
+            else batch_listeners.get(MATCH_ALL),
+        ):
+            for listener in listeners or ():
+                try:
+                    listener(events)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error running batch listener: %s", listener)
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Dispatch an event to the listeners and keyed listeners."""
+        event_type = event.event_type
+        event_data = event.data
+        listeners = self._listeners.get(event_type, ())
+        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+        match_all_listeners = (
+            ()
+            if event_type == EVENT_HOMEASSISTANT_CLOSE
+            else self._listeners[MATCH_ALL]
+        )
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
-            return
+        key: str | None = None
+        if event_data and (keyed := self._keyed_listeners.get(event_type)):
+            if (key := keyed.key_getter(event_data)) not in keyed.listeners:
+                key = None
 
-        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if not listeners and not match_all_listeners and key is None:
+            return
 
-        for job, event_filter, run_immediately in listeners:
+        for job, event_filter, run_immediately in chain(
+            match_all_listeners, listeners
+        ):
             if event_filter is not None:
                 try:
                     if not event_filter(event):
@@ -1069,6 +1224,26 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+        if key is not None:
+            self._hass.loop.call_soon(self._async_run_keyed_listeners, event, key)
+
+    @callback
+    def _async_run_keyed_listeners(self, event: Event, key: str) -> None:
+        """Run the keyed listeners that match the key of an event.
+
+        The tuples are replaced instead of mutated when listeners are
+        added or removed so they are safe to iterate here.
+        """
+        if not (keyed := self._keyed_listeners.get(event.event_type)) or not (
+            keyed_listeners := keyed.listeners.get(key)
+        ):
+            return
+        for job in keyed_listeners:
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: str,
@@ -1125,7 +1300,8 @@ class EventBus:
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
     ) -> CALLBACK_TYPE:
-        self._listeners.setdefault(event_type, []).append(filterable_job)
+        listeners = self._listeners
+        listeners[event_type] = (*listeners.get(event_type, ()), filterable_job)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -1133,6 +1309,110 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_batch(
+        self, event_type: str, listener: Callable[[list[Event]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for batches of events of a specific type.
+
+        Events that are fired together with async_fire_batch are passed to
+        the listener in a single call, other events are passed as a batch of
+        one. The listener must be a callback, it is run right away. To listen
+        to all events specify the constant ``MATCH_ALL`` as event_type.
+
+        This method must be run in the event loop.
+        """
+        if not is_callback(listener):
+            raise HomeAssistantError(f"Batch listener {listener} is not a callback")
+        batch_listeners = self._batch_listeners
+        # Lists are replaced instead of mutated so firing can iterate them
+        batch_listeners[event_type] = [*batch_listeners.get(event_type, ()), listener]
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            listeners = batch_listeners.get(event_type, [])
+            if listener not in listeners:
+                _LOGGER.error("Unable to remove unknown batch listener %s", listener)
+                return
+            if remaining := [item for item in listeners if item is not listener]:
+                batch_listeners[event_type] = remaining
+            else:
+                del batch_listeners[event_type]
+
+        return remove_listener
+
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        key_getter: Callable[[Mapping[str, Any]], str | None],
+        keys: Iterable[str],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type that match one of the keys.
+
+        The key_getter is called with the event data and must return the
+        key of the event without raising. All keyed listeners of an event
+        type must use the same key_getter. Matching listeners are found with
+        a single dict lookup, which avoids running a filter per listener.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners can not listen to all events")
+        if not (keyed := self._keyed_listeners.get(event_type)):
+            keyed = self._keyed_listeners[event_type] = _KeyedListeners(key_getter)
+        elif keyed.key_getter is not key_getter:
+            raise HomeAssistantError(
+                f"Keyed listeners for {event_type} already use key getter"
+                f" {keyed.key_getter}"
+            )
+
+        keys = list(dict.fromkeys(keys))
+        job = HassJob(listener, f"listen {event_type} {keys}")
+        keyed_listeners = keyed.listeners
+        for key in keys:
+            keyed_listeners[key] = (*keyed_listeners.get(key, ()), job)
+        keyed.subscriptions += 1
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, keys, job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: str,
+        keys: list[str],
+        job: HassJob[[Event], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        keyed = self._keyed_listeners.get(event_type)
+        if keyed is None or not all(
+            job in keyed.listeners.get(key, ()) for key in keys
+        ):
+            _LOGGER.error("Unable to remove unknown keyed job listener %s", job)
+            return
+
+        keyed_listeners = keyed.listeners
+        for key in keys:
+            if remaining := tuple(
+                keyed_job for keyed_job in keyed_listeners[key] if keyed_job is not job
+            ):
+                keyed_listeners[key] = remaining
+            else:
+                del keyed_listeners[key]
+        keyed.subscriptions -= 1
+        if not keyed.subscriptions:
+            del self._keyed_listeners[event_type]
+
     def listen_once(
         self,
         event_type: str,
@@ -1209,10 +1489,14 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(filterable_job)
+            listeners = self._listeners[event_type]
+            index = listeners.index(filterable_job)
+            remaining = listeners[:index] + listeners[index + 1 :]
 
-            # delete event_type list if empty
-            if not self._listeners[event_type] and event_type != MATCH_ALL:
+            # delete event_type listeners if empty
+            if remaining or event_type == MATCH_ALL:
+                self._listeners[event_type] = remaining
+            else:
                 self._listeners.pop(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
@@ -1222,6 +1506,48 @@ class EventBus:
             )
 
 
+class _SharedAttributes:
+    """Read only attributes shared by the states that have the same attributes.
+
+    The JSON of the attributes is encoded once for every state that
+    shares them.
+    """
+
+    __slots__ = ("attributes", "_json_bytes")
+
+    def __init__(self, attributes: Mapping[str, Any]) -> None:
+        """Initialize the shared attributes."""
+        self.attributes: ReadOnlyDict[str, Any] = ReadOnlyDict(attributes)
+        self._json_bytes: bytes | None = None
+
+    def as_json_bytes(self) -> bytes:
+        """Return the attributes encoded as JSON."""
+        if self._json_bytes is None:
+            self._json_bytes = json_bytes(self.attributes)
+        return self._json_bytes
+
+
+def _same_types(shared: Any, value: Any) -> bool:
+    """Return if two equal values have the same types, also in containers."""
+    if type(shared) is not type(value):  # noqa: E721
+        return False
+    if isinstance(shared, (list, tuple)):
+        return all(map(_same_types, shared, value))
+    if isinstance(shared, Mapping):
+        return all(_same_types(item, value[key]) for key, item in shared.items())
+    return True
+
+
+def _same_attributes(shared: Mapping[str, Any], attributes: Mapping[str, Any]) -> bool:
+    """Return if attributes can use attributes shared by another state.
+
+    The types of the values are compared as well since 1 == 1.0 == True.
+    """
+    return shared == attributes and all(
+        _same_types(value, attributes[key]) for key, value in shared.items()
+    )
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -1247,6 +1573,7 @@ class State:
         "_as_dict",
         "_as_dict_json",
         "_as_compressed_state_json",
+        "_shared_attributes",
     )
 
     def __init__(
@@ -1272,7 +1599,11 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        if isinstance(attributes, ReadOnlyDict):
+            # Read only attributes are shared instead of copied
+            self.attributes = attributes
+        else:
+            self.attributes = ReadOnlyDict(attributes or {})
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1280,6 +1611,8 @@ class State:
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
         self._as_dict_json: str | None = None
         self._as_compressed_state_json: str | None = None
+        # Set by the state machine when the attributes are shared
+        self._shared_attributes: _SharedAttributes | None = None
 
     @property
     def name(self) -> str:
@@ -1317,7 +1650,12 @@ class State:
     def as_dict_json(self) -> str:
         """Return a JSON string of the State."""
         if not self._as_dict_json:
-            self._as_dict_json = json_dumps(self.as_dict())
+            self._as_dict_json = json_dumps(
+                {
+                    **self.as_dict(),
+                    "attributes": json_fragment(self.attributes_json_bytes()),
+                }
+            )
         return self._as_dict_json
 
     def as_compressed_state(self) -> dict[str, Any]:
@@ -1352,11 +1690,24 @@ class State:
         It is used for sending multiple states in a single message.
         """
         if not self._as_compressed_state_json:
+            compressed_state = self.as_compressed_state()
+            compressed_state[COMPRESSED_STATE_ATTRIBUTES] = json_fragment(
+                self.attributes_json_bytes()
+            )
             self._as_compressed_state_json = json_dumps(
-                {self.entity_id: self.as_compressed_state()}
+                {self.entity_id: compressed_state}
             )[1:-1]
         return self._as_compressed_state_json
 
+    def attributes_json_bytes(self) -> bytes:
+        """Return the attributes encoded as JSON.
+
+        Attributes shared by several states are encoded once.
+        """
+        if (shared := self._shared_attributes) is not None:
+            return shared.as_json_bytes()
+        return json_bytes(self.attributes)
+
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
         """Initialize a state from a dict.
@@ -1421,7 +1772,15 @@ class State:
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_domain_index", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_domain_index",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_batch",
+        "_shared_attributes",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -1430,6 +1789,81 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._batch: list[Event] | None = None
+        self._shared_attributes: MutableMapping[int, _SharedAttributes] = LRU(
+            SHARED_ATTRIBUTES_CACHE_SIZE
+        )
+
+    @contextmanager
+    def async_batch(self) -> Generator[None, None, None]:
+        """Fire the state changed events of the states set in the block as a batch.
+
+        States are updated right away, the state changed events are fired
+        with EventBus.async_fire_batch when the outermost block exits. The
+        block must not await, all state changes made meanwhile would end up
+        in the batch.
+
+        All listeners of the state changed events, including the ones that
+        were registered with run_immediately, are only called when the
+        outermost block exits, not while the states are set.
+
+        This method must be run in the event loop.
+        """
+        if self._batch is not None:
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+        finally:
+            events = self._batch
+            self._batch = None
+            if events:
+                self._bus.async_fire_batch(EVENT_STATE_CHANGED, events)
+
+    @callback
+    def _async_fire_state_changed(
+        self,
+        event_data: dict[str, Any],
+        context: Context | None,
+        time_fired: datetime.datetime | None = None,
+    ) -> None:
+        """Fire a state changed event, or add it to the current batch."""
+        if self._batch is None:
+            self._bus.async_fire(
+                EVENT_STATE_CHANGED,
+                event_data,
+                EventOrigin.local,
+                context,
+                time_fired=time_fired,
+            )
+        else:
+            self._batch.append(
+                Event(
+                    EVENT_STATE_CHANGED,
+                    event_data,
+                    EventOrigin.local,
+                    time_fired,
+                    context,
+                )
+            )
+
+    @callback
+    def _async_share_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> _SharedAttributes:
+        """Return read only attributes, shared with states that have the same."""
+        try:
+            key = hash(tuple(attributes.items()))
+        except TypeError:
+            # Attributes with unhashable values, like lists, are not looked up
+            return _SharedAttributes(attributes)
+        if (shared := self._shared_attributes.get(key)) is None or not (
+            _same_attributes(shared.attributes, attributes)
+        ):
+            shared = _SharedAttributes(attributes)
+            self._shared_attributes[key] = shared
+        return shared
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -1541,11 +1975,9 @@ class StateMachine:
 
         self._domain_index[old_state.domain].pop(entity_id)
         old_state.expire()
-        self._bus.async_fire(
-            EVENT_STATE_CHANGED,
+        self._async_fire_state_changed(
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
-            EventOrigin.local,
-            context=context,
+            context,
         )
         return True
 
@@ -1631,6 +2063,18 @@ class StateMachine:
         if same_state and same_attr:
             return
 
+        shared: _SharedAttributes | None
+        if (
+            old_state is not None
+            and same_attr
+            and _same_attributes(old_state.attributes, attributes)
+        ):
+            attributes = old_state.attributes
+            shared = old_state._shared_attributes  # pylint: disable=protected-access
+        else:
+            shared = self._async_share_attributes(attributes)
+            attributes = shared.attributes
+
         if context is None:
             # It is much faster to convert a timestamp to a utc datetime object
             # than converting a utc datetime object to a timestamp since cpython
@@ -1658,6 +2102,7 @@ class StateMachine:
             context,
             old_state is None,
         )
+        state._shared_attributes = shared  # pylint: disable=protected-access
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
@@ -1665,12 +2110,10 @@ class StateMachine:
             domain_index = {}
             self._domain_index[state.domain] = domain_index
         domain_index[entity_id] = state
-        self._bus.async_fire(
-            EVENT_STATE_CHANGED,
+        self._async_fire_state_changed(
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
-            EventOrigin.local,
             context,
-            time_fired=now,
+            now,
         )
 
 
@@ -33,6 +33,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.timer_wheel import TimerWheelHandle
 
 from .device_registry import (
     EVENT_DEVICE_REGISTRY_UPDATED,
@@ -44,23 +45,22 @@ from .entity_registry import (
 )
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import (
+    RenderInfo,
+    Template,
+    TemplateAggregate,
+    async_create_template_aggregate,
+    result_as_boolean,
+)
 from .typing import EventType, TemplateVarsType
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
 TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
 TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 
-TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
-TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
-
-TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
-TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
+TRACK_TIME_PATTERN_LISTENERS = "track_time_pattern_listeners"
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -270,43 +270,18 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    for each one, the event bus keeps a dict of entity
+    ids that care about the state change events so it
+    can do a fast dict lookup to route events.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
         return _remove_empty_listener
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["entity_id"] in callbacks
+def _async_state_change_key(event_data: Mapping[str, Any]) -> str | None:
+    """Return the key of a state change event."""
+    return event_data.get("entity_id")
 
 
 @bind_hass
@@ -316,15 +291,8 @@ def _async_track_state_change_event(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        hass,
-        entity_ids,
-        TRACK_STATE_CHANGE_CALLBACKS,
-        TRACK_STATE_CHANGE_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_entity_id_event,
-        _async_state_change_filter,
-        action,
+    return _async_track_keyed_event(
+        hass, entity_ids, EVENT_STATE_CHANGED, _async_state_change_key, action
     )
 
 
@@ -333,6 +301,25 @@ def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
 
 
+def _async_track_keyed_event(
+    hass: HomeAssistant,
+    keys: str | Iterable[str],
+    event_type: str,
+    key_getter: Callable[[Mapping[str, Any]], str | None],
+    action: Callable[[EventType[_TypedDictT]], Any],
+) -> CALLBACK_TYPE:
+    """Track an event by a specific key using the keyed listeners of the bus."""
+    if not keys:
+        return _remove_empty_listener
+
+    if isinstance(keys, str):
+        keys = [keys]
+
+    return hass.bus.async_listen_keyed(
+        event_type, key_getter, keys, action  # type: ignore[arg-type]
+    )
+
+
 @callback  # type: ignore[arg-type]  # mypy bug?
 def _remove_listener(
     hass: HomeAssistant,
@@ -410,42 +397,9 @@ def _async_track_event(
     return ft.partial(_remove_listener, hass, listeners_key, keys, job, callbacks)
 
 
-@callback
-def _async_dispatch_old_entity_id_or_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventEntityRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventEntityRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
-
-
-@callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventEntityRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventEntityRegistryUpdatedData],
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event.data.get("old_entity_id", event.data["entity_id"]) in callbacks
+def _async_entity_registry_updated_key(event_data: Mapping[str, Any]) -> str | None:
+    """Return the key of an entity registry updated event."""
+    return event_data.get("old_entity_id", event_data.get("entity_id"))
 
 
 @bind_hass
@@ -461,50 +415,18 @@ def async_track_entity_registry_updated_event(
 
     Similar to async_track_state_change_event.
     """
-    return _async_track_event(
+    return _async_track_keyed_event(
         hass,
         entity_ids,
-        TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
-        TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
         EVENT_ENTITY_REGISTRY_UPDATED,
-        _async_dispatch_old_entity_id_or_entity_id_event,
-        _async_entity_registry_updated_filter,
+        _async_entity_registry_updated_key,
         action,
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventDeviceRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventDeviceRegistryUpdatedData],
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event.data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventDeviceRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
+def _async_device_registry_updated_key(event_data: Mapping[str, Any]) -> str | None:
+    """Return the key of a device registry updated event."""
+    return event_data.get("device_id")
 
 
 @callback
@@ -517,14 +439,11 @@ def async_track_device_registry_updated_event(
 
     Similar to async_track_entity_registry_updated_event.
     """
-    return _async_track_event(
+    return _async_track_keyed_event(
         hass,
         device_ids,
-        TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS,
-        TRACK_DEVICE_REGISTRY_UPDATED_LISTENER,
         EVENT_DEVICE_REGISTRY_UPDATED,
-        _async_dispatch_device_id_event,
-        _async_device_registry_updated_filter,
+        _async_device_registry_updated_key,
         action,
     )
 
@@ -910,6 +829,8 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._aggregates: dict[Template, TemplateAggregate] = {}
+        self._track_aggregate_changes: _TrackStateChangeFiltered | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -958,6 +879,7 @@ class TrackTemplateResultInfo:
                     exc_info=info.exception,
                 )
 
+        self._setup_aggregates()
         self._track_state_changes = async_track_state_change_filtered(
             self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
         )
@@ -972,6 +894,52 @@ class TrackTemplateResultInfo:
             block_render,
         )
 
+    @callback
+    def _setup_aggregates(self) -> None:
+        """Set up incremental rendering of templates that aggregate states.
+
+        The aggregates follow every state change of their states, even
+        when rendering is rate limited or blocked by the super template.
+        """
+        for track_template_ in self._track_templates:
+            template = track_template_.template
+            if (
+                template not in self._info
+                or (
+                    aggregate := async_create_template_aggregate(
+                        template, track_template_.variables
+                    )
+                )
+                is None
+            ):
+                continue
+            self._aggregates[template] = aggregate
+
+        if not self._aggregates:
+            return
+
+        aggregates = self._aggregates.values()
+        self._track_aggregate_changes = async_track_state_change_filtered(
+            self.hass,
+            TrackStates(
+                any(aggregate.domain is None for aggregate in aggregates),
+                set(),
+                {
+                    aggregate.domain
+                    for aggregate in aggregates
+                    if aggregate.domain is not None
+                },
+            ),
+            self._update_aggregates,
+        )
+
+    @callback
+    def _update_aggregates(self, event: EventType[EventStateChangedData]) -> None:
+        """Update the aggregates with a state change."""
+        entity_id = event.data["entity_id"]
+        for aggregate in self._aggregates.values():
+            aggregate.async_update(entity_id)
+
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
         """State changes that will cause a re-render."""
@@ -1016,6 +984,8 @@ class TrackTemplateResultInfo:
         """Cancel the listener."""
         assert self._track_state_changes
         self._track_state_changes.async_remove()
+        if self._track_aggregate_changes is not None:
+            self._track_aggregate_changes.async_remove()
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -1069,9 +1039,13 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if (
+            event is None
+            or (aggregate := self._aggregates.get(template)) is None
+            or (new_info := self._async_render_aggregate(aggregate, event)) is None
+        ):
+            new_info = template.async_render_to_info(track_template_.variables)
+        self._info[template] = info = new_info
 
         try:
             result: str | TemplateError = info.result()
@@ -1089,6 +1063,16 @@ class TrackTemplateResultInfo:
 
         return TrackTemplateResult(template, last_result, result)
 
+    def _async_render_aggregate(
+        self,
+        aggregate: TemplateAggregate,
+        event: EventType[EventStateChangedData],
+    ) -> RenderInfo | None:
+        """Render a template from its aggregate instead of all states."""
+        # The listener of the aggregate may not have seen the event yet
+        aggregate.async_update(event.data["entity_id"])
+        return aggregate.async_render_to_info(self._info[aggregate.template])
+
     @staticmethod
     def _super_template_as_boolean(result: bool | str | TemplateError) -> bool:
         """Return True if the result is truthy or a TemplateError."""
@@ -1327,7 +1311,9 @@ def async_track_same_state(
         if not async_check_same_func(entity, from_state, to_state):
             clear_listener()
 
-    async_remove_state_for_listener = async_call_later(hass, period, state_for_listener)
+    async_remove_state_for_listener = _async_call_later(
+        hass, period, state_for_listener, action
+    )
 
     if entity_ids == MATCH_ALL:
         async_remove_state_for_cancel = hass.bus.async_listen(
@@ -1371,7 +1357,7 @@ def async_track_point_in_time(
         name=f"{job.name} UTC converter",
         cancel_on_shutdown=job.cancel_on_shutdown,
     )
-    return async_track_point_in_utc_time(hass, track_job, point_in_time)
+    return _async_track_point_in_utc_time(hass, track_job, point_in_time, job)
 
 
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
@@ -1384,6 +1370,43 @@ def async_track_point_in_utc_time(
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
     point_in_time: datetime,
+) -> CALLBACK_TYPE:
+    """Add a listener that fires once after a specific point in UTC time."""
+    return _async_track_point_in_utc_time(hass, action, point_in_time, action)
+
+
+def _timer_owner(owner: HassJob[..., Any] | Callable[..., Any]) -> str:
+    """Return the module that scheduled a timer."""
+    target = owner.target if isinstance(owner, HassJob) else owner
+    while isinstance(target, ft.partial):
+        target = target.func
+    return getattr(target, "__module__", None) or "unknown"
+
+
+@callback
+def _async_call_at_loop_time(
+    hass: HomeAssistant,
+    loop_time: float,
+    owner: HassJob[..., Any] | Callable[..., Any],
+    func: Callable[..., Any],
+    *args: Any,
+) -> asyncio.TimerHandle | TimerWheelHandle:
+    """Schedule func on the timer wheel if enabled or else on the event loop.
+
+    The owner is only used to count the pending timers of the timer wheel.
+    """
+    if (timer_wheel := hass.timer_wheel) is None:
+        return hass.loop.call_at(loop_time, func, *args)
+    return timer_wheel.call_at(loop_time, _timer_owner(owner), func, *args)
+
+
+@callback
+def _async_track_point_in_utc_time(
+    hass: HomeAssistant,
+    action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    point_in_time: datetime,
+    owner: HassJob[..., Any] | Callable[..., Any],
 ) -> CALLBACK_TYPE:
     """Add a listener that fires once after a specific point in UTC time."""
     # Ensure point_in_time is UTC
@@ -1392,7 +1415,7 @@ def async_track_point_in_utc_time(
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    cancel_callback: asyncio.TimerHandle | TimerWheelHandle | None = None
     loop = hass.loop
 
     @callback
@@ -1407,7 +1430,9 @@ def async_track_point_in_utc_time(
         if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
-            cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+            cancel_callback = _async_call_at_loop_time(
+                hass, loop.time() + delta, owner, run_action, job
+            )
             return
 
         hass.async_run_hass_job(job, utc_point_in_time)
@@ -1418,7 +1443,9 @@ def async_track_point_in_utc_time(
         else HassJob(action, f"track point in utc time {utc_point_in_time}")
     )
     delta = expected_fire_timestamp - time.time()
-    cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+    cancel_callback = _async_call_at_loop_time(
+        hass, loop.time() + delta, owner, run_action, job
+    )
 
     @callback
     def unsub_point_in_time_listener() -> None:
@@ -1453,7 +1480,9 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
+    return _async_call_at_loop_time(
+        hass, loop_time, action, _run_async_call_action, hass, job
+    ).cancel
 
 
 @callback
@@ -1463,6 +1492,18 @@ def async_call_later(
     delay: float | timedelta,
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
+) -> CALLBACK_TYPE:
+    """Add a listener that is called in <delay>."""
+    return _async_call_later(hass, delay, action, action)
+
+
+@callback
+def _async_call_later(
+    hass: HomeAssistant,
+    delay: float | timedelta,
+    action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    owner: HassJob[..., Any] | Callable[..., Any],
 ) -> CALLBACK_TYPE:
     """Add a listener that is called in <delay>."""
     if isinstance(delay, timedelta):
@@ -1472,8 +1513,9 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    loop = hass.loop
-    return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
+    return _async_call_at_loop_time(
+        hass, hass.loop.time() + delay, owner, _run_async_call_action, hass, job
+    ).cancel
 
 
 call_later = threaded_listener_factory(async_call_later)
@@ -1504,7 +1546,9 @@ def async_track_time_interval(
         nonlocal remove
         nonlocal interval_listener_job
 
-        remove = async_call_later(hass, interval_seconds, interval_listener_job)
+        remove = _async_call_later(
+            hass, interval_seconds, interval_listener_job, action
+        )
         hass.async_run_hass_job(job, now)
 
     if name:
@@ -1515,7 +1559,7 @@ def async_track_time_interval(
     interval_listener_job = HassJob(
         interval_listener, job_name, cancel_on_shutdown=cancel_on_shutdown
     )
-    remove = async_call_later(hass, interval_seconds, interval_listener_job)
+    remove = _async_call_later(hass, interval_seconds, interval_listener_job, action)
 
     def remove_listener() -> None:
         """Remove interval listener."""
@@ -1623,6 +1667,112 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+_TimePatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
+
+class _TimePatternListener:
+    """Fire the listeners of the same time pattern from a single timer.
+
+    All async_track_utc_time_change listeners with the same matching
+    seconds, minutes, hours and local flag share one instance, so the next
+    time is looked up in the table of the pattern once per fire for all of
+    them.
+    """
+
+    __slots__ = (
+        "hass",
+        "_key",
+        "_seconds",
+        "_minutes",
+        "_hours",
+        "_table",
+        "_microsecond",
+        "_jobs",
+        "_fire_job",
+        "_cancel_timer",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: _TimePatternKey,
+        seconds: list[int],
+        minutes: list[int],
+        hours: list[int],
+        description: str,
+    ) -> None:
+        """Initialize the time pattern listener."""
+        self.hass = hass
+        self._key = key
+        self._seconds = seconds
+        self._minutes = minutes
+        self._hours = hours
+        self._table = dt_util.time_expression_table(seconds, minutes, hours)
+        # Avoid aligning all time patterns to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        self._microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        self._jobs: list[HassJob[[datetime], Coroutine[Any, Any, None] | None]] = []
+        self._fire_job = HassJob(
+            self._async_fire, f"time change listener {description}"
+        )
+        self._cancel_timer: CALLBACK_TYPE | None = None
+
+    def _calculate_next(self, now: datetime) -> datetime:
+        """Calculate the next time the pattern matches."""
+        localized_now = dt_util.as_local(now) if self._key[3] else now
+        return dt_util.find_next_time_expression_table_time(
+            localized_now, self._table, self._seconds, self._minutes, self._hours
+        ).replace(microsecond=self._microsecond)
+
+    @callback
+    def _async_schedule(self, now: datetime) -> None:
+        """Schedule the next fire."""
+        self._cancel_timer = _async_track_point_in_utc_time(
+            self.hass, self._fire_job, self._calculate_next(now), self._jobs[0]
+        )
+
+    @callback
+    def async_add_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> None:
+        """Add a listener."""
+        self._jobs.append(job)
+        if self._cancel_timer is None:
+            self._async_schedule(dt_util.utcnow())
+
+    @callback
+    def async_remove_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> None:
+        """Remove a listener."""
+        try:
+            self._jobs.remove(job)
+        except ValueError:
+            # Already removed
+            return
+        if self._jobs:
+            return
+        assert self._cancel_timer is not None
+        self._cancel_timer()
+        self._cancel_timer = None
+        del self.hass.data[TRACK_TIME_PATTERN_LISTENERS][self._key]
+
+    @callback
+    def _async_fire(self, _: datetime) -> None:
+        """Run all listeners and schedule the next fire."""
+        now = time_tracker_utcnow()
+        # Schedule before running the listeners so a listener that removes
+        # the last job cancels the next fire
+        self._async_schedule(now + timedelta(seconds=1))
+        localized_now = dt_util.as_local(now) if self._key[3] else now
+        for job in list(self._jobs):
+            try:
+                self.hass.async_run_hass_job(job, localized_now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while running %s at %s", job, localized_now)
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1644,56 +1794,37 @@ def async_track_utc_time_change(
         # misalignment we use async_track_time_interval here
         return async_track_time_interval(hass, action, timedelta(seconds=1))
 
-    job = HassJob(action, f"track time change {hour}:{minute}:{second} local={local}")
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-
-    def calculate_next(now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
-        ).replace(microsecond=microsecond)
-
-    time_listener: CALLBACK_TYPE | None = None
-    pattern_time_change_listener_job: HassJob[[datetime], Any] | None = None
-
-    @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
-        nonlocal pattern_time_change_listener_job
-
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
-        assert pattern_time_change_listener_job is not None
-
-        time_listener = async_track_point_in_utc_time(
+    key: _TimePatternKey = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
+        local,
+    )
+    time_patterns: dict[_TimePatternKey, _TimePatternListener] = hass.data.setdefault(
+        TRACK_TIME_PATTERN_LISTENERS, {}
+    )
+    if (time_pattern := time_patterns.get(key)) is None:
+        time_pattern = time_patterns[key] = _TimePatternListener(
             hass,
-            pattern_time_change_listener_job,
-            calculate_next(now + timedelta(seconds=1)),
+            key,
+            matching_seconds,
+            matching_minutes,
+            matching_hours,
+            f"{hour}:{minute}:{second} local={local}",
         )
 
-    pattern_time_change_listener_job = HassJob(
-        pattern_time_change_listener,
-        f"time change listener {hour}:{minute}:{second} {action}",
-    )
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener_job, calculate_next(dt_util.utcnow())
-    )
+    job = HassJob(action, f"track time change {hour}:{minute}:{second} local={local}")
+    time_pattern.async_add_job(job)
 
     @callback
-    def unsub_pattern_time_change_listener() -> None:
-        """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
+    def unsub_pattern_listener() -> None:
+        """Remove the listener from its time pattern."""
+        time_pattern.async_remove_job(job)
 
-    return unsub_pattern_time_change_listener
+    return unsub_pattern_listener
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -70,6 +70,10 @@ else:
     """Dump json bytes."""
 
 
+json_fragment = orjson.Fragment
+"""Wrap encoded JSON so it is embedded as is when dumping an object."""
+
+
 class ExtendedJSONEncoder(JSONEncoder):
     """JSONEncoder that supports Home Assistant objects and falls back to repr(o)."""
 
@@ -160,6 +164,20 @@ def save_json(
     atomic_writes: bool = False,
 ) -> None:
     """Save JSON data to a file."""
+    json_data = encode_json_for_file(filename, data, encoder=encoder)
+    if atomic_writes:
+        write_utf8_file_atomic(filename, json_data, private)
+    else:
+        write_utf8_file(filename, json_data, private)
+
+
+def encode_json_for_file(
+    filename: str,
+    data: list | dict,
+    *,
+    encoder: type[json.JSONEncoder] | None = None,
+) -> str:
+    """Encode JSON data the way save_json writes it to a file."""
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -180,11 +198,7 @@ def save_json(
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {formatted_data}"
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
-
-    if atomic_writes:
-        write_utf8_file_atomic(filename, json_data, private)
-    else:
-        write_utf8_file(filename, json_data, private)
+    return json_data
 
 
 def find_paths_unserializable_data(
@@ -0,0 +1,25 @@
+"""Provide indexes shared by the registries."""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Literal
+
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def update_index(
+    index: RegistryIndexType, key: str, old_value: str | None, new_value: str | None
+) -> None:
+    """Move a registry key to another bucket of an index if its value changed.
+
+    Buckets keep the order in which keys were added and empty buckets are removed.
+    """
+    if old_value == new_value:
+        return
+    if old_value is not None:
+        bucket = index[old_value]
+        del bucket[key]
+        if not bucket:
+            del index[old_value]
+    if new_value is not None:
+        index[new_value][key] = True
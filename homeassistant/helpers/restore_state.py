@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
-from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
+from homeassistant.const import (
+    ATTR_RESTORED,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
@@ -25,9 +30,17 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
 
+# The states that changed since the states were last saved to STORAGE_KEY
+CHANGES_STORAGE_KEY = "core.restore_state_changes"
+CHANGES_STORAGE_VERSION = 1
+
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How many periodic saves of the changed states happen before all states are
+# saved again and the changes are discarded
+DUMPS_BETWEEN_COMPACTIONS = 4
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -93,6 +106,14 @@ class StoredState:
         )
 
 
+def _last_seen(json_dict: dict[str, Any]) -> datetime:
+    """Return when the entity of a stored state dict was last seen."""
+    last_seen = json_dict["last_seen"]
+    if isinstance(last_seen, str):
+        last_seen = dt_util.parse_datetime(last_seen)
+    return cast(datetime, last_seen)
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     restore_state = RestoreStateData(hass)
@@ -135,8 +156,20 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.changes_store = Store[list[dict[str, Any]]](
+            hass, CHANGES_STORAGE_VERSION, CHANGES_STORAGE_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Loaded states are only turned into StoredState objects once an
+        # entity asks for them
+        self._unparsed_states: dict[str, dict[str, Any]] = {}
+        self._changed_entity_ids: set[str] = set()
+        self._changes: dict[str, dict[str, Any]] = {}
+        # The extra data of the restore entities as it was last saved
+        self._saved_extra_data: dict[str, dict[str, Any] | None] = {}
+        self._changes_saved = False
+        self._dumps_since_compaction = 0
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -150,22 +183,44 @@ class RestoreStateData:
 
     async def async_load(self) -> None:
         """Load the instance of this data helper."""
+        self.last_states = {}
         try:
             stored_states = await self.store.async_load()
+            changed_states = await self.changes_store.async_load()
         except HomeAssistantError as exc:
             _LOGGER.error("Error loading last states", exc_info=exc)
-            stored_states = None
+            stored_states = changed_states = None
 
-        if stored_states is None:
+        if stored_states is None and changed_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
-            self.last_states = {}
-        else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
-            }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            self._unparsed_states = {}
+            return
+
+        unparsed_states = {
+            item["state"]["entity_id"]: item for item in stored_states or ()
+        }
+        for item in changed_states or ():
+            entity_id = item["state"]["entity_id"]
+            # The changes are outdated if saving all states was interrupted
+            # before the changes could be discarded.
+            stored_item = unparsed_states.get(entity_id)
+            if stored_item is None or _last_seen(item) >= _last_seen(stored_item):
+                unparsed_states[entity_id] = item
+        self._unparsed_states = {
+            entity_id: item
+            for entity_id, item in unparsed_states.items()
+            if valid_entity_id(entity_id)
+        }
+        _LOGGER.debug("Created cache with %s", list(self._unparsed_states))
+
+    @callback
+    def async_get_stored_state(self, entity_id: str) -> StoredState | None:
+        """Return the stored state of an entity from the previous run."""
+        if (stored_state := self.last_states.get(entity_id)) is None and (
+            item := self._unparsed_states.pop(entity_id, None)
+        ) is not None:
+            stored_state = self.last_states[entity_id] = StoredState.from_dict(item)
+        return stored_state
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -175,6 +230,12 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
+        self._async_parse_unparsed_states()
+        return self._async_get_parsed_stored_states()
+
+    @callback
+    def _async_get_parsed_stored_states(self) -> list[StoredState]:
+        """Get the states which should be stored, except unparsed ones."""
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
@@ -211,19 +272,130 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_parse_unparsed_states(self) -> None:
+        """Turn all states loaded from storage into StoredState objects."""
+        for entity_id in list(self._unparsed_states):
+            self.async_get_stored_state(entity_id)
+
+    @callback
+    def _async_get_stored_state_dicts(self) -> list[dict[str, Any]]:
+        """Get the dict representations of the states which should be stored.
+
+        Loaded states of entities which were not created on this run are
+        stored as they were loaded, without being parsed.
+        """
+        stored_states = [
+            stored_state.as_dict()
+            for stored_state in self._async_get_parsed_stored_states()
+        ]
+        expiration_time = dt_util.utcnow() - STATE_EXPIRATION
+        for entity_id, item in self._unparsed_states.items():
+            if entity_id in self.last_states or (
+                (state := self.hass.states.get(entity_id)) is not None
+                and not state.attributes.get(ATTR_RESTORED)
+            ):
+                continue
+            if _last_seen(item) < expiration_time:
+                continue
+            stored_states.append(item)
+        return stored_states
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        self._changed_entity_ids.clear()
+        self._changes.clear()
+        self._dumps_since_compaction = 0
+        stored_states = self._async_get_stored_state_dicts()
+        previous_extra_data = self._saved_extra_data
+        saved_extra_data: dict[str, dict[str, Any] | None] = {}
+        for item in stored_states:
+            if (entity_id := item["state"]["entity_id"]) not in self.entities:
+                continue
+            # Only copy the extra data that changed since it was last saved
+            extra_data = item["extra_data"]
+            if entity_id in previous_extra_data and (
+                extra_data == (previous := previous_extra_data[entity_id])
+            ):
+                saved_extra_data[entity_id] = previous
+            else:
+                saved_extra_data[entity_id] = deepcopy(extra_data)
+        self._saved_extra_data = saved_extra_data
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(stored_states)
+            # The changes are now part of the saved states
+            if self._changes_saved:
+                await self.changes_store.async_save([])
+                self._changes_saved = False
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since all states were last saved.
+
+        The states of entities which wrote a state change, or of which the
+        extra data differs from the extra data that was last saved, are
+        saved. All states are saved again every DUMPS_BETWEEN_COMPACTIONS
+        dumps, or once most of the entities changed.
+        """
+        if self._dumps_since_compaction >= DUMPS_BETWEEN_COMPACTIONS:
+            await self.async_dump_states()
+            return
+
+        now = dt_util.utcnow()
+        changed_entity_ids = self._changed_entity_ids
+        saved_extra_data = self._saved_extra_data
+        changes: dict[str, dict[str, Any]] = {}
+        for entity_id, entity in self.entities.items():
+            extra_data = entity.extra_restore_state_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            extra_data_changed = extra_data_dict != saved_extra_data.get(entity_id)
+            if (
+                entity_id not in changed_entity_ids and not extra_data_changed
+            ) or (state := self.hass.states.get(entity_id)) is None:
+                continue
+            changes[entity_id] = {
+                "state": state.as_dict(),
+                "extra_data": extra_data_dict,
+                "last_seen": now,
+            }
+            if extra_data_changed:
+                saved_extra_data[entity_id] = deepcopy(extra_data_dict)
+        for entity_id in changed_entity_ids:
+            if entity_id not in self.entities and (
+                (stored_state := self.last_states.get(entity_id)) is not None
+            ):
+                changes[entity_id] = stored_state.as_dict()
+        changed_entity_ids.clear()
+
+        if not changes:
+            return
+
+        _LOGGER.debug("Dumping changed states")
+        self._changes.update(changes)
+
+        if len(self._changes) * 2 > len(self.entities):
+            await self.async_dump_states()
+            return
+
+        self._dumps_since_compaction += 1
+        try:
+            await self.changes_store.async_save(list(self._changes.values()))
+            self._changes_saved = True
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+
+    @callback
+    def _async_state_changed_filter(self, event: Event) -> bool:
+        """Filter state changes of restore entities."""
+        return event.data["entity_id"] in self.entities
+
+    @callback
+    def _async_state_changed_listener(self, event: Event) -> None:
+        """Mark the state of an entity as changed."""
+        self._changed_entity_ids.add(event.data["entity_id"])
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -231,21 +403,33 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
         self.hass.async_create_task(_async_dump_states(), "RestoreStateData dump")
 
-        # Dump states periodically
+        # Track which states need to be saved by the periodic dumps
+        cancel_state_listener = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed_listener,
+            event_filter=self._async_state_changed_filter,
+            run_immediately=True,
+        )
+
+        # Dump changed states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
+            cancel_state_listener()
             await self.async_dump_states()
 
         # Dump states when stopping hass
@@ -272,11 +456,14 @@ class RestoreStateData:
         if state is not None:
             state = State.from_dict(_encode_complex(state.as_dict()))
         if state is not None:
+            self._unparsed_states.pop(entity_id, None)
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
+            self._changed_entity_ids.add(entity_id)
 
         self.entities.pop(entity_id)
+        self._saved_extra_data.pop(entity_id, None)
 
 
 def _encode(value: Any) -> Any:
@@ -329,7 +516,7 @@ class RestoreEntity(Entity):
                 "Cannot get last state. Entity not added to hass"
             )
             return None
-        return async_get(self.hass).last_states.get(self.entity_id)
+        return async_get(self.hass).async_get_stored_state(self.entity_id)
 
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
@@ -480,32 +480,39 @@ def async_extract_referenced_entity_ids(
 
     # Find devices for targeted areas
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    for area_id in selector.area_ids:
+        selected.referenced_devices.update(
+            device_entry.id
+            for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
+        )
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
+    entities = ent_reg.entities
+    # The entity's area matches a targeted area
+    candidates = [
+        ent_entry
+        for area_id in selector.area_ids
+        for ent_entry in entities.get_entries_for_area_id(area_id)
+    ]
+    for device_id in selected.referenced_devices:
+        candidates.extend(
+            ent_entry
+            for ent_entry in entities.get_entries_for_device_id(
+                device_id, include_disabled_entities=True
+            )
+            # The entity's device matches a targeted device, or a device referenced
+            # by an area and the entity has no explicitly set area
+            if not ent_entry.area_id or device_id in selector.device_ids
+        )
+
+    for ent_entry in candidates:
         # Do not add entities which are hidden or which are config
         # or diagnostic entities.
         if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
             continue
-
-        if (
-            # The entity's area matches a targeted area
-            ent_entry.area_id in selector.area_ids
-            # The entity's device matches a device referenced by an area and the entity
-            # has no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # The entity's device matches a targeted device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+        selected.indirectly_referenced.add(ent_entry.entity_id)
 
     return selected
 
@@ -5,11 +5,13 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import Any, Generic, TypeVar
+import time
+from typing import Any, Generic, TypeVar, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
@@ -24,7 +26,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_files
 
 from . import json as json_helper
 
@@ -35,6 +37,7 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITE_SCHEDULER = "storage_write_scheduler"
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +82,192 @@ async def async_migrator(
     return config
 
 
+@dataclass(slots=True)
+class StoreWriteStats:
+    """Statistics of the writes of a store."""
+
+    writes: int = 0
+    bytes_written: int = 0
+    last_latency: float = 0.0
+    total_latency: float = 0.0
+
+
+class _StoreWriteScheduler:
+    """Schedule the writes of all stores.
+
+    Delayed writes share a single timer. When it fires, every store of which
+    the delay has passed is written. Writes that are handed over in the same
+    event loop iteration are serialized and written to disk in one executor
+    job.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the write scheduler."""
+        self.hass = hass
+        self.stats: dict[str, StoreWriteStats] = {}
+        self._delayed: dict[Store, float] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_when = 0.0
+        self._pending: list[tuple[Store, str, dict, asyncio.Future[None]]] = []
+
+    @callback
+    def async_schedule_delayed_write(self, store: Store, delay: float) -> CALLBACK_TYPE:
+        """Schedule a delayed write of a store."""
+        when = self.hass.loop.time() + delay
+        self._delayed[store] = when
+        if self._timer is None or when < self._timer_when:
+            self._async_schedule_timer(when)
+
+        @callback
+        def _async_cancel() -> None:
+            self._delayed.pop(store, None)
+            if not self._delayed and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        return _async_cancel
+
+    @callback
+    def _async_schedule_timer(self, when: float) -> None:
+        """Schedule the timer of the delayed writes."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_when = when
+        self._timer = self.hass.loop.call_at(when, self._async_write_delayed)
+
+    @callback
+    def _async_write_delayed(self) -> None:
+        """Write the stores of which the delay has passed."""
+        self._timer = None
+        # The timer is scheduled for the earliest delay, the delays of other
+        # stores may have passed while it was waiting to run
+        now = max(self._timer_when, self.hass.loop.time())
+        due = [store for store, when in self._delayed.items() if when <= now]
+        for store in due:
+            del self._delayed[store]
+        if self._delayed:
+            self._async_schedule_timer(min(self._delayed.values()))
+        for store in due:
+            self.hass.async_create_task(
+                store._async_callback_delayed_write(),  # pylint: disable=protected-access
+                f"Storage delayed write {store.key}",
+            )
+
+    async def async_write(self, store: Store, path: str, data: dict) -> None:
+        """Write the data of a store together with other pending writes."""
+        if not self._pending:
+            self.hass.loop.call_soon(self._async_flush)
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending.append((store, path, data, future))
+        await future
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write the pending writes in the executor."""
+        pending = self._pending
+        self._pending = []
+        self.hass.async_create_task(self._async_write_pending(pending), "Storage write")
+
+    async def _async_write_pending(
+        self, pending: list[tuple[Store, str, dict, asyncio.Future[None]]]
+    ) -> None:
+        """Write pending writes and report the results."""
+        results: list[tuple[Exception | None, float, int]] | None = None
+        try:
+            results = await self.hass.async_add_executor_job(
+                self._write_pending, pending
+            )
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _LOGGER.error(
+                "Error writing %s: %s",
+                ", ".join(store.key for store, *_ in pending),
+                err,
+            )
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        finally:
+            if results is None:
+                # Do not leave the writers waiting if the write was cancelled
+                for *_, future in pending:
+                    if not future.done():
+                        future.cancel()
+
+        for (store, _, _, future), (error, latency, size) in zip(pending, results):
+            if error is None:
+                stats = self.stats.setdefault(store.key, StoreWriteStats())
+                stats.writes += 1
+                stats.bytes_written += size
+                stats.last_latency = latency
+                stats.total_latency += latency
+                _LOGGER.debug(
+                    "Wrote %s bytes for %s in %.1f ms",
+                    size,
+                    store.key,
+                    latency * 1000,
+                )
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    @staticmethod
+    def _write_pending(
+        pending: list[tuple[Store, str, dict, asyncio.Future[None]]]
+    ) -> list[tuple[Exception | None, float, int]]:
+        """Serialize the data of the stores and write it to disk together.
+
+        The files of the stores with atomic writes are synced to disk in
+        one pass after all files were written, see write_utf8_files, so the
+        latency of a store is the time until the whole batch was written.
+        """
+        start = time.monotonic()
+        errors: list[Exception | None] = []
+        files: list[tuple[str, str, bool, bool]] = []
+        encoded: list[int] = []
+        for idx, (store, path, data, _) in enumerate(pending):
+            try:
+                # pylint: disable-next=protected-access
+                files.append(store._encode_data(path, data))
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                errors.append(err)
+            else:
+                errors.append(None)
+                encoded.append(idx)
+        for idx, write_error in zip(encoded, write_utf8_files(files)):
+            errors[idx] = write_error
+        latency = time.monotonic() - start
+
+        results: list[tuple[Exception | None, float, int]] = []
+        for (_, path, _, _), error in zip(pending, errors):
+            if error is not None:
+                results.append((error, 0.0, 0))
+                continue
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = 0
+            results.append((None, latency, size))
+        return results
+
+
+@callback
+def _async_get_write_scheduler(hass: HomeAssistant) -> _StoreWriteScheduler:
+    """Return the write scheduler of the stores."""
+    if (scheduler := hass.data.get(STORAGE_WRITE_SCHEDULER)) is None:
+        scheduler = hass.data[STORAGE_WRITE_SCHEDULER] = _StoreWriteScheduler(hass)
+    return cast(_StoreWriteScheduler, scheduler)
+
+
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> dict[str, StoreWriteStats]:
+    """Return the write statistics of the stores by storage key."""
+    return _async_get_write_scheduler(hass).stats
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -273,9 +462,6 @@ class Store(Generic[_T]):
         delay: float = 0,
     ) -> None:
         """Save data with an optional delay."""
-        # pylint: disable-next=import-outside-toplevel
-        from .event import async_call_later
-
         self._data = {
             "version": self.version,
             "minor_version": self.minor_version,
@@ -289,9 +475,9 @@ class Store(Generic[_T]):
         if self.hass.state == CoreState.stopping:
             return
 
-        self._unsub_delay_listener = async_call_later(
-            self.hass, delay, self._async_callback_delayed_write
-        )
+        self._unsub_delay_listener = _async_get_write_scheduler(
+            self.hass
+        ).async_schedule_delayed_write(self, delay)
 
     @callback
     def _async_ensure_final_write_listener(self) -> None:
@@ -315,7 +501,7 @@ class Store(Generic[_T]):
             self._unsub_delay_listener()
             self._unsub_delay_listener = None
 
-    async def _async_callback_delayed_write(self, _now):
+    async def _async_callback_delayed_write(self) -> None:
         """Handle a delayed write callback."""
         # catch the case where a call is scheduled and then we stop Home Assistant
         if self.hass.state == CoreState.stopping:
@@ -354,19 +540,23 @@ class Store(Generic[_T]):
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        await _async_get_write_scheduler(self.hass).async_write(self, path, data)
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
+        if (error := write_utf8_files([self._encode_data(path, data)])[0]) is not None:
+            raise error
+
+    def _encode_data(self, path: str, data: dict) -> tuple[str, str, bool, bool]:
+        """Encode the data and return the file to write for write_utf8_files."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
+        return (
             path,
-            data,
+            json_helper.encode_json_for_file(path, data, encoder=self._encoder),
             self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+            self._atomic_writes,
         )
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
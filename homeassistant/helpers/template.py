@@ -5,11 +5,19 @@ from ast import literal_eval
 import asyncio
 import base64
 import collections.abc
-from collections.abc import Callable, Collection, Generator, Iterable, MutableMapping
+from collections.abc import (
+    Callable,
+    Collection,
+    Generator,
+    Iterable,
+    Mapping,
+    MutableMapping,
+)
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+from itertools import chain
 import json
 import logging
 import math
@@ -25,6 +33,7 @@ from typing import (
     Any,
     Concatenate,
     Literal,
+    NamedTuple,
     NoReturn,
     ParamSpec,
     TypeVar,
@@ -32,7 +41,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -145,12 +153,26 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+#
+# CACHED_COMPILED_TEMPLATES is the number of compiled templates kept in
+# the LRU cache shared by all template environments of the process.
+#
+# Integrations like MQTT discovery create the same template for many
+# entities and templates are created again when they are reloaded or
+# subscribed to, so the code is kept after the templates are gone.
+#
+CACHED_COMPILED_TEMPLATES = 4096
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
 CACHED_TEMPLATE_LRU: MutableMapping[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
     CACHED_TEMPLATE_STATES
 )
+# Compiled code by template source and the kind of environment
+CACHED_COMPILED_TEMPLATE_LRU: MutableMapping[
+    tuple[str, tuple[bool, bool, bool]], CodeType
+] = LRU(CACHED_COMPILED_TEMPLATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -176,6 +198,25 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+class CompiledTemplateCacheInfo(NamedTuple):
+    """Statistics of the compiled template cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def compiled_template_cache_info() -> CompiledTemplateCacheInfo:
+    """Return statistics of the compiled template cache."""
+    # There is no typing for LRU
+    lru = CACHED_COMPILED_TEMPLATE_LRU
+    hits, misses = lru.get_stats()  # type: ignore[attr-defined]
+    return CompiledTemplateCacheInfo(
+        hits, misses, lru.get_size(), len(lru)  # type: ignore[attr-defined]
+    )
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
 
@@ -324,6 +365,20 @@ def _false(arg: str) -> bool:
 
 _cached_literal_eval = lru_cache(maxsize=EVAL_CACHE_SIZE)(literal_eval)
 
+# Filters that handle one state at a time in a TemplateAggregate
+_AGGREGATE_ITEM_FILTERS = frozenset(
+    {"map", "reject", "rejectattr", "select", "selectattr"}
+)
+# Filters that can reduce the output of the per state filters,
+# which returns the same as a list as it returns as a generator
+_AGGREGATE_REDUCE_FILTERS = frozenset(
+    {"first", "join", "list", "max", "min", "sort", "sum", "unique"}
+)
+# Filters that do not depend on hass but are not deterministic
+_IMPURE_FILTERS = frozenset({"random"})
+_AGGREGATE_ITEMS = "aggregate_items"
+_AGGREGATE_VALUES = "aggregate_values"
+
 
 class RenderInfo:
     """Holds information about a template render."""
@@ -785,6 +840,264 @@ class Template:
         return f"Template<template=({self.template}) renders={self._renders}>"
 
 
+class TemplateAggregate:
+    """Keep the result of a template that aggregates states up to date.
+
+    Supported templates consist of a single expression that iterates
+    `states` or `states.<domain>` through a chain of filters, like
+    `states.light | selectattr('state', 'eq', 'on') | list | count` or
+    `states.sensor | map(attribute='state') | map('float', 0) | sum`.
+
+    The filters that handle one state at a time (selectattr, rejectattr,
+    select, reject and map) are applied to each state when it changes and
+    their output is kept per entity, so a state change no longer iterates
+    and filters every state. The remaining filters reduce the output of
+    all entities to the result, exactly as rendering the template would.
+    """
+
+    __slots__ = (
+        "hass",
+        "template",
+        "domain",
+        "_item_template",
+        "_reduce_template",
+        "_items",
+        "_errors",
+    )
+
+    def __init__(
+        self,
+        template: Template,
+        domain: str | None,
+        item_template: jinja2.Template,
+        reduce_template: jinja2.Template,
+    ) -> None:
+        """Initialize the aggregate with the current states."""
+        assert template.hass is not None
+        self.hass = template.hass
+        self.template = template
+        # The domain of the states or None for all states
+        self.domain = domain
+        self._item_template = item_template
+        self._reduce_template = reduce_template
+        self._items: dict[str, list[Any]] = {}
+        # Entities for which the filters raised
+        self._errors: set[str] = set()
+        states = self.hass.states
+        container: Iterable[State]
+        if domain is None:
+            container = states._states.values()  # pylint: disable=protected-access
+        else:
+            container = states.async_all(domain)
+        for state in container:
+            self._async_set_items(state)
+
+    @callback
+    def async_update(self, entity_id: str) -> None:
+        """Update the output of the per state filters for an entity."""
+        if (state := self.hass.states.get(entity_id)) is None:
+            self._items.pop(entity_id, None)
+            self._errors.discard(entity_id)
+            return
+        if self.domain is not None and state.domain != self.domain:
+            return
+        self._async_set_items(state)
+
+    @callback
+    def _async_set_items(self, state: State) -> None:
+        """Apply the per state filters to a state."""
+        entity_id = state.entity_id
+        try:
+            items = self._item_template.make_module(
+                {_AGGREGATE_ITEMS: [_template_state_no_collect(self.hass, state)]}
+            ).aggregate_result  # type: ignore[attr-defined]
+        except Exception:  # pylint: disable=broad-except
+            # The template has to be rendered to raise the same error
+            self._errors.add(entity_id)
+            self._items[entity_id] = []
+            return
+        self._errors.discard(entity_id)
+        self._items[entity_id] = items
+
+    @callback
+    def async_render_to_info(self, last_info: RenderInfo) -> RenderInfo | None:
+        """Render the template from the aggregated states.
+
+        The states that are collected are the same as in the last render
+        of the template. Returns None if the template must be rendered
+        because the per state filters raised or the last render failed.
+        """
+        # pylint: disable=protected-access
+        if self._errors or last_info.exception:
+            return None
+        template = self.template
+        template._renders += 1
+        render_info = RenderInfo(template)
+        try:
+            render_result = _render_with_context(
+                template.template,
+                self._reduce_template,
+                **{_AGGREGATE_VALUES: [*chain.from_iterable(self._items.values())]},
+            ).strip()
+        except Exception as err:  # pylint: disable=broad-except
+            render_info.exception = TemplateError(err)
+        else:
+            if self.hass.config.legacy_templates:
+                render_info._result = render_result
+            else:
+                render_info._result = template._parse_result(render_result)
+        render_info.all_states = last_info.all_states
+        render_info.all_states_lifecycle = last_info.all_states_lifecycle
+        render_info.domains = last_info.domains
+        render_info.domains_lifecycle = last_info.domains_lifecycle
+        render_info.entities = last_info.entities
+        render_info.rate_limit = last_info.rate_limit
+        render_info.filter = last_info.filter
+        render_info.filter_lifecycle = last_info.filter_lifecycle
+        return render_info
+
+
+@callback
+def async_create_template_aggregate(
+    template: Template, variables: TemplateVarsType = None
+) -> TemplateAggregate | None:
+    """Return a TemplateAggregate if the template aggregates states.
+
+    The template must have been rendered before. Returns None if the
+    template does not have a supported form.
+    """
+    if (
+        template.is_static
+        or template.hass is None
+        or template._compiled is None  # pylint: disable=protected-access
+        or template._limited  # pylint: disable=protected-access
+        or (variables and "states" in variables)
+    ):
+        return None
+    env = template._env  # pylint: disable=protected-access
+    if (parsed := _parse_aggregate_template(env, template.template)) is None:
+        return None
+    domain, item_node, reduce_node = parsed
+    item_tree = jinja2.nodes.Template(
+        [
+            jinja2.nodes.Assign(
+                jinja2.nodes.Name("aggregate_result", "store"),
+                jinja2.nodes.Filter(item_node, "list", [], [], None, None),
+            )
+        ]
+    )
+    reduce_tree = jinja2.nodes.Template([jinja2.nodes.Output([reduce_node])])
+    compiled: list[jinja2.Template] = []
+    for tree in (item_tree, reduce_tree):
+        tree.set_environment(env)
+        tree.set_lineno(1)
+        try:
+            code = env.compile(tree)
+        except jinja2.TemplateError:
+            return None
+        # Without globals a render does not copy them to a new context
+        compiled.append(jinja2.Template.from_code(env, code, {}, None))
+    return TemplateAggregate(template, domain, *compiled)
+
+
+def _parse_aggregate_template(
+    env: TemplateEnvironment, source: str
+) -> tuple[str | None, jinja2.nodes.Expr, jinja2.nodes.Expr] | None:
+    """Split a template that aggregates states.
+
+    Returns the domain of the states, the per state filters applied to
+    the variable with the items and the remaining filters applied to the
+    variable with the values, or None if the template is not supported.
+    """
+    nodes = jinja2.nodes
+    try:
+        tree = env.parse(source)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if (
+        len(tree.body) != 1
+        or not isinstance(output := tree.body[0], nodes.Output)
+        or len(output.nodes) != 1
+    ):
+        return None
+    filters: list[jinja2.nodes.Filter] = []
+    node: jinja2.nodes.Node | None = output.nodes[0]
+    while isinstance(node, nodes.Filter):
+        filters.append(node)
+        node = node.node
+    filters.reverse()
+
+    domain: str | None
+    match node:
+        case nodes.Name(name="states"):
+            domain = None
+        case nodes.Getattr(node=nodes.Name(name="states"), attr=str(domain)):
+            pass
+        case nodes.Getitem(
+            node=nodes.Name(name="states"), arg=nodes.Const(value=str(domain))
+        ):
+            pass
+        case _:
+            return None
+    if domain is not None and ("." in domain or not valid_domain(domain)):
+        return None
+
+    item_filters = 0
+    for filter_ in filters:
+        if filter_.name not in _AGGREGATE_ITEM_FILTERS:
+            break
+        item_filters += 1
+    if (
+        not item_filters
+        or item_filters == len(filters)
+        or filters[item_filters].name not in _AGGREGATE_REDUCE_FILTERS
+        or not all(_is_pure_filter(filter_) for filter_ in filters)
+    ):
+        return None
+    filters[0].node = nodes.Name(_AGGREGATE_ITEMS, "load")
+    filters[item_filters].node = nodes.Name(_AGGREGATE_VALUES, "load")
+    return domain, filters[item_filters - 1], filters[-1]
+
+
+def _is_pure_filter(filter_: jinja2.nodes.Filter) -> bool:
+    """Return if a filter only depends on its input and constant arguments."""
+    if (
+        filter_.dyn_args is not None
+        or filter_.dyn_kwargs is not None
+        or not all(_is_literal(arg) for arg in filter_.args)
+        or not all(_is_literal(kwarg.value) for kwarg in filter_.kwargs)
+    ):
+        return False
+    args = [
+        arg.value if isinstance(arg, jinja2.nodes.Const) else None
+        for arg in filter_.args
+    ]
+    name = filter_.name
+    if name not in _AGGREGATE_ITEM_FILTERS:
+        return name in _NO_HASS_ENV.filters and name not in _IMPURE_FILTERS
+    # The filter or test applied to each state
+    if name == "map":
+        if any(kwarg.key == "attribute" for kwarg in filter_.kwargs):
+            return True
+        return bool(args) and _is_pure_function(_NO_HASS_ENV.filters, args[0])
+    test_args = args[1:] if name in ("selectattr", "rejectattr") else args
+    return not test_args or _is_pure_function(_NO_HASS_ENV.tests, test_args[0])
+
+
+def _is_pure_function(functions: Mapping[str, Any], name: Any) -> bool:
+    """Return if a filter or test does not depend on hass."""
+    return isinstance(name, str) and name in functions and name not in _IMPURE_FILTERS
+
+
+def _is_literal(node: jinja2.nodes.Node) -> bool:
+    """Return if a node is a constant."""
+    if isinstance(node, jinja2.nodes.Const):
+        return True
+    if isinstance(node, (jinja2.nodes.List, jinja2.nodes.Tuple)):
+        return all(_is_literal(item) for item in node.items)
+    return False
+
+
 @cache
 def _domain_states(hass: HomeAssistant, name: str) -> DomainStates:
     return DomainStates(hass, name)
@@ -2290,9 +2603,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        # Environments of the same kind compile templates to the same code
+        self._compile_kind = (hass is None, bool(limited), bool(strict))
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2564,10 +2876,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             or filename is not None
             or raw is not False
             or defer_init is not False
+            or not isinstance(source, str)
         ):
-            # If there are any non-default keywords args, we do
-            # not cache.  In prodution we currently do not have
-            # any instance of this.
+            # If there are any non-default keywords args or the source
+            # is already parsed, we do not cache.  In production we
+            # currently only compile parsed templates for aggregates.
             return super().compile(  # type: ignore[no-any-return,call-overload]
                 source,
                 name,
@@ -2576,8 +2889,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (source, self._compile_kind)
+        if (cached := CACHED_COMPILED_TEMPLATE_LRU.get(key)) is None:
+            cached = CACHED_COMPILED_TEMPLATE_LRU[key] = super().compile(source)
 
         return cached
 
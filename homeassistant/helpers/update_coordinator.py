@@ -59,6 +59,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`batch_state_writes` to ``True`` will cause the state changes
+    written by the listeners of an update to be fired as one batch. Listeners
+    of ``state_changed`` are then only called once all listeners have run.
     """
 
     def __init__(
@@ -71,6 +75,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        batch_state_writes: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -81,6 +86,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.batch_state_writes = batch_state_writes
         self._next_refresh: float | None = None
 
         # It's None before the first successful update.
@@ -169,6 +175,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
+        if not self.batch_state_writes:
+            self._async_call_listeners()
+            return
+        with self.hass.states.async_batch():
+            self._async_call_listeners()
+
+    @callback
+    def _async_call_listeners(self) -> None:
+        """Call all registered listeners."""
         for update_callback, _ in list(self._listeners.values()):
             update_callback()
 
@@ -12,7 +12,9 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
+from stat import S_ISREG
 import sys
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
@@ -25,7 +27,9 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .core import HomeAssistant, callback
+from .exceptions import HomeAssistantError
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -39,6 +43,7 @@ from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 if TYPE_CHECKING:
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
@@ -48,6 +53,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "manifest_cache"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -61,6 +67,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 10
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
 
@@ -184,6 +194,113 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class ManifestCache:
+    """Cache of parsed manifest files and directory listings.
+
+    The cache is stored between restarts, so a warm start does not have to
+    list the custom integrations or parse their manifests again. Entries are
+    only used while the modification time and size of the file or directory
+    did not change, and the cache is discarded when Home Assistant is updated.
+
+    Lookups happen in the executor, the cache is saved from the event loop.
+    """
+
+    def __init__(
+        self, store: Store[dict[str, Any]], data: dict[str, Any] | None
+    ) -> None:
+        """Initialize the cache with the stored data."""
+        self._store = store
+        if data is None or data.get("ha_version") != __version__:
+            data = {}
+        self._manifests: dict[str, list[Any]] = data.get("manifests", {})
+        self._directories: dict[str, list[Any]] = data.get("directories", {})
+        self._dirty = False
+
+    def get_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest of a file, or None if there is no such file.
+
+        Raises one of JSON_DECODE_EXCEPTIONS if the manifest is invalid.
+        """
+        key = str(manifest_path)
+        try:
+            stat_result = manifest_path.stat()
+        except OSError:
+            stat_result = None
+        if stat_result is None or not S_ISREG(stat_result.st_mode):
+            if self._manifests.pop(key, None) is not None:
+                self._dirty = True
+            return None
+        signature = [stat_result.st_mtime_ns, stat_result.st_size]
+        if (cached := self._manifests.get(key)) is None or cached[:2] != signature:
+            manifest = json_loads(manifest_path.read_text())
+            self._manifests[key] = cached = [*signature, manifest]
+            self._dirty = True
+        # The integration adds keys to its manifest
+        return cast(Manifest, dict(cached[2]))
+
+    def get_sub_directories(self, path: str) -> list[str]:
+        """Return the names of the sub directories of a directory."""
+        stat_result = os.stat(path)
+        if (cached := self._directories.get(path)) is None or cached[
+            0
+        ] != stat_result.st_mtime_ns:
+            names = [entry.name for entry in os.scandir(path) if entry.is_dir()]
+            self._directories[path] = cached = [stat_result.st_mtime_ns, names]
+            self._dirty = True
+        return list(cached[1])
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the cache if entries were added or removed."""
+        if self._dirty:
+            self._dirty = False
+            self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache to store."""
+        return {
+            "ha_version": __version__,
+            "manifests": dict(self._manifests),
+            "directories": dict(self._directories),
+        }
+
+
+async def async_get_manifest_cache(hass: HomeAssistant) -> ManifestCache:
+    """Return the manifest cache, loading it from storage if needed."""
+    if (cache_or_evt := hass.data.get(DATA_MANIFEST_CACHE)) is None:
+        evt = hass.data[DATA_MANIFEST_CACHE] = asyncio.Event()
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        store: Store[dict[str, Any]] = Store(
+            hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+        )
+        try:
+            data = await store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load the manifest cache: %s", err)
+            data = None
+        cache = hass.data[DATA_MANIFEST_CACHE] = ManifestCache(store, data)
+        evt.set()
+        return cache
+
+    if isinstance(cache_or_evt, asyncio.Event):
+        await cache_or_evt.wait()
+        return cast(ManifestCache, hass.data[DATA_MANIFEST_CACHE])
+
+    return cast(ManifestCache, cache_or_evt)
+
+
+def _load_manifest(hass: HomeAssistant, manifest_path: pathlib.Path) -> Manifest | None:
+    """Return the manifest of a file, or None if there is no such file."""
+    if isinstance(manifest_cache := hass.data.get(DATA_MANIFEST_CACHE), ManifestCache):
+        return manifest_cache.get_manifest(manifest_path)
+    if not manifest_path.is_file():
+        return None
+    return cast(Manifest, json_loads(manifest_path.read_text()))
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -196,13 +313,12 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    manifest_cache = await async_get_manifest_cache(hass)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
         return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
+            name for path in paths for name in manifest_cache.get_sub_directories(path)
         ]
 
     dirs = await hass.async_add_executor_job(
@@ -213,8 +329,9 @@ async def _async_get_custom_components(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        dirs,
     )
+    manifest_cache.async_schedule_save()
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -559,17 +676,17 @@ class Integration:
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                manifest = _load_manifest(hass, manifest_path)
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
+            if manifest is None:
+                continue
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -953,9 +1070,11 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_cache = await async_get_manifest_cache(hass)
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, list(needed)
         )
+        manifest_cache.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
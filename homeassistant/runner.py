@@ -53,6 +53,8 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    startup_trace: bool = False
+    timer_wheel_resolution: float | None = None
 
 
 def can_use_pidfd() -> bool:
@@ -6,19 +6,37 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import functools
 import json
 import logging
+import math
+import os
+import pathlib
+import sys
+import tempfile
+import time
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
+    MATCH_ALL,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_utc_time_change,
 )
-from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.json import JSON_DUMP, JSONEncoder, json_bytes
+from homeassistant.helpers.restore_state import RestoreEntity, RestoreStateData
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -27,6 +45,9 @@ _CallableT = TypeVar("_CallableT", bound=Callable)
 
 BENCHMARKS: dict[str, Callable] = {}
 
+# hass.data key for the database URL of the recorder benchmarks
+DATA_DB_URL = "benchmark_db_url"
+
 
 def run(args):
     """Handle benchmark commandline script."""
@@ -36,6 +57,11 @@ def run(args):
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
     parser.add_argument("name", choices=BENCHMARKS)
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--db-url",
+        default="sqlite://",
+        help="Database the recorder benchmarks write to. Its tables are dropped.",
+    )
 
     args = parser.parse_args()
 
@@ -44,12 +70,13 @@ def run(args):
 
     with suppress(KeyboardInterrupt):
         while True:
-            asyncio.run(run_benchmark(bench))
+            asyncio.run(run_benchmark(bench, args.db_url))
 
 
-async def run_benchmark(bench):
+async def run_benchmark(bench, db_url="sqlite://"):
     """Run a benchmark."""
     hass = core.HomeAssistant("")
+    hass.data[DATA_DB_URL] = db_url
     runtime = await bench(hass)
     print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
@@ -314,6 +341,1027 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _recorder_write_benchmark(db_url: str, bulk_writes: bool) -> float:
+    """Write 100k states of 1000 entities like the recorder does and time it."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_writer import BulkWriter
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    entity_count = 1000
+    states_to_write = 10**5
+    states_per_commit = 1000
+
+    engine = create_engine(db_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = Session(engine, expire_on_commit=False)
+    bulk_writer = BulkWriter() if bulk_writes else None
+
+    def add(obj):
+        """Add an object to be written."""
+        if bulk_writer:
+            bulk_writer.add(obj)
+        else:
+            session.add(obj)
+
+    attributes = StateAttributes(shared_attrs='{"unit_of_measurement":"W"}', hash=1)
+    add(attributes)
+    states_meta = [
+        StatesMeta(entity_id=f"sensor.power_{idx}") for idx in range(entity_count)
+    ]
+    for meta in states_meta:
+        add(meta)
+    old_states: dict[int, States] = {}
+    context = core.Context()
+
+    start = timer()
+    for count in range(states_to_write):
+        idx = count % entity_count
+        state = States.from_event(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": f"sensor.power_{idx}",
+                    "new_state": core.State(f"sensor.power_{idx}", str(count)),
+                },
+                context=context,
+            )
+        )
+        state.entity_id = None
+        state.states_meta_rel = states_meta[idx]
+        state.state_attributes = attributes
+        state.old_state = old_states.get(idx)
+        old_states[idx] = state
+        add(state)
+        if count % states_per_commit == states_per_commit - 1:
+            if bulk_writer:
+                bulk_writer.commit(session)
+            else:
+                session.commit()
+    runtime = timer() - start
+    session.close()
+    engine.dispose()
+    print(f"Wrote {states_to_write / runtime:.0f} states/s")
+    return runtime
+
+
+@benchmark
+async def recorder_orm_writes(hass):
+    """Write 100k states through the ORM unit of work."""
+    return await hass.async_add_executor_job(
+        _recorder_write_benchmark, hass.data[DATA_DB_URL], False
+    )
+
+
+@benchmark
+async def recorder_bulk_writes(hass):
+    """Write 100k states through the recorder bulk writer."""
+    return await hass.async_add_executor_job(
+        _recorder_write_benchmark, hass.data[DATA_DB_URL], True
+    )
+
+
+def _mqtt_wildcard_filters() -> list[str]:
+    """Return 10k wildcard topic filters like integrations subscribe to."""
+    return [
+        topic_filter
+        for idx in range(5000)
+        for topic_filter in (f"devices/{idx}/+/state", f"nodes/node_{idx}/#")
+    ]
+
+
+@benchmark
+async def mqtt_wildcard_matching(hass):
+    """Match 100k messages against 10k wildcard subscriptions with a trie."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in _mqtt_wildcard_filters():
+        trie.add(topic_filter, topic_filter)
+    messages = 10**5
+    topics = [f"devices/{idx % 5000}/sensor_{idx}/state" for idx in range(messages)]
+
+    start = timer()
+    for topic in topics:
+        trie.matches(topic)
+    runtime = timer() - start
+    print(f"Matched {messages / runtime:.0f} messages/s")
+    return runtime
+
+
+@benchmark
+async def mqtt_wildcard_matching_linear(hass):
+    """Match 100 messages against 10k wildcard subscriptions one by one."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    matchers = []
+    for topic_filter in _mqtt_wildcard_filters():
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        matchers.append(matcher)
+    messages = 100
+    topics = [f"devices/{idx % 5000}/sensor_{idx}/state" for idx in range(messages)]
+
+    start = timer()
+    for topic in topics:
+        [matcher for matcher in matchers if next(matcher.iter_match(topic), False)]
+    runtime = timer() - start
+    print(f"Matched {messages / runtime:.0f} messages/s")
+    return runtime
+
+
+_HEAVY_TEMPLATES = [
+    "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+    "{{ states.sensor | map(attribute='state') | map('float', 0) | sum }}",
+    "{{ states.sensor | map(attribute='state') | map('float', 0) | max }}",
+    (
+        "{{ states.binary_sensor | selectattr('attributes.device_class', 'eq',"
+        " 'motion') | selectattr('state', 'eq', 'on') | map(attribute='entity_id')"
+        " | list }}"
+    ),
+]
+
+
+async def _track_heavy_templates(hass: core.HomeAssistant, aggregates: bool) -> float:
+    """Track heavy templates over 1500 entities through 10k state changes."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template as template_helper
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+
+    for idx in range(500):
+        hass.states.async_set(f"light.light_{idx}", "off")
+        hass.states.async_set(f"sensor.power_{idx}", str(idx))
+        hass.states.async_set(
+            f"binary_sensor.sensor_{idx}",
+            "off",
+            {"device_class": "motion" if idx % 2 else "door"},
+        )
+    # Passing states as a variable renders the same, but
+    # disables the incremental rendering of aggregates
+    variables = None if aggregates else {"states": template_helper.AllStates(hass)}
+    for template in _HEAVY_TEMPLATES:
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    template_helper.Template(template, hass),
+                    variables,
+                    timedelta(0),
+                )
+            ],
+            lambda event, updates: None,
+        )
+    await hass.async_block_till_done()
+
+    changes = 10**4
+    start = timer()
+    for idx in range(changes):
+        entity = idx % 500
+        hass.states.async_set(f"light.light_{entity}", "on" if idx % 3 else "off")
+        hass.states.async_set(f"sensor.power_{entity}", str(idx))
+        hass.states.async_set(
+            f"binary_sensor.sensor_{entity}",
+            "on" if idx % 3 else "off",
+            {"device_class": "motion" if entity % 2 else "door"},
+        )
+        await hass.async_block_till_done()
+    runtime = timer() - start
+    print(f"Handled {changes * 3 / runtime:.0f} state changes/s")
+    return runtime
+
+
+@benchmark
+async def template_aggregates(hass):
+    """Track heavy templates that aggregate states incrementally."""
+    return await _track_heavy_templates(hass, True)
+
+
+@benchmark
+async def template_aggregates_full_render(hass):
+    """Track heavy templates that aggregate states by rendering them."""
+    return await _track_heavy_templates(hass, False)
+
+
+def _discovery_templates(hass: core.HomeAssistant, shared: bool) -> float:
+    """Create the value templates of 5000 discovered entities twice."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template as template_helper
+
+    # Discovered devices of the same model share their value templates
+    sources = [
+        f"{{{{ value_json.sensor_{idx}.value | float(0) | round(1) }}}}"
+        for idx in range(50)
+    ]
+    variables = {"value_json": {f"sensor_{idx}": {"value": idx} for idx in range(50)}}
+    template_helper.CACHED_COMPILED_TEMPLATE_LRU.clear()
+
+    start = timer()
+    # Templates are created again when the entities are reloaded
+    for _ in range(2):
+        for idx in range(5000):
+            if not shared:
+                template_helper.CACHED_COMPILED_TEMPLATE_LRU.clear()
+            template = template_helper.Template(sources[idx % 50], hass)
+            template.async_render(variables)
+    runtime = timer() - start
+    print(f"Created {10000 / runtime:.0f} templates/s")
+    if shared:
+        info = template_helper.compiled_template_cache_info()
+        print(f"Compiled {info.misses} templates, {info.hits} cache hits")
+    return runtime
+
+
+@benchmark
+async def template_compile_cache(hass):
+    """Create the templates of discovered entities with the compile cache."""
+    return _discovery_templates(hass, True)
+
+
+@benchmark
+async def template_compile_no_cache(hass):
+    """Create the templates of discovered entities compiling each of them."""
+    return _discovery_templates(hass, False)
+
+
+async def _resolve_integrations(hass: core.HomeAssistant, warm: bool) -> float:
+    """Resolve all built-in integrations with a cold or warm manifest cache."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import components, loader
+
+    domains = [
+        path.name
+        for path in pathlib.Path(components.__path__[0]).iterdir()
+        if (path / "manifest.json").is_file()
+    ]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        loader.async_setup(hass)
+        if warm:
+            # A previous run stores the cache when Home Assistant stops
+            await loader.async_get_integrations(hass, domains)
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+            await hass.async_block_till_done()
+            for key in (loader.DATA_MANIFEST_CACHE, loader.DATA_CUSTOM_COMPONENTS):
+                hass.data.pop(key)
+            loader.async_setup(hass)
+
+        start = timer()
+        await loader.async_get_integrations(hass, domains)
+        runtime = timer() - start
+
+    print(f"Resolved {len(domains)} integrations in {runtime * 1000:.0f} ms")
+    return runtime
+
+
+@benchmark
+async def resolve_integrations_cold(hass):
+    """Resolve all built-in integrations without a manifest cache."""
+    return await _resolve_integrations(hass, False)
+
+
+@benchmark
+async def resolve_integrations_warm(hass):
+    """Resolve all built-in integrations with the stored manifest cache."""
+    return await _resolve_integrations(hass, True)
+
+
+def _load_packages_config(snapshot: bool) -> float:
+    """Load a configuration with 200 packages from a stored snapshot or not."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.config import load_yaml_config_file
+    from homeassistant.util.yaml import Secrets, YamlSnapshot
+
+    # pylint: enable=import-outside-toplevel
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        packages_dir = pathlib.Path(config_dir, "packages")
+        packages_dir.mkdir()
+        for idx in range(200):
+            packages_dir.joinpath(f"package_{idx}.yaml").write_text(
+                f"package_{idx}:\n  template:\n    - sensor:\n"
+                + "".join(
+                    f"        - name: Sensor {idx} {sensor}\n"
+                    f"          unique_id: sensor_{idx}_{sensor}\n"
+                    f"          state: \"{{{{ states('sensor.source_{sensor}') }}}}\"\n"
+                    "          attributes:\n"
+                    f"            index: {sensor}\n"
+                    for sensor in range(50)
+                )
+            )
+        config_path = pathlib.Path(config_dir, "configuration.yaml")
+        config_path.write_text(
+            "homeassistant:\n  packages: !include_dir_merge_named packages\n"
+        )
+        # Age the files so the snapshot can trust their modification time
+        for path in (config_path, *packages_dir.iterdir()):
+            os.utime(path, ns=(0, 0))
+
+        yaml_snapshot = None
+        if snapshot:
+            yaml_snapshot = YamlSnapshot()
+            load_yaml_config_file(
+                str(config_path), Secrets(pathlib.Path(config_dir)), yaml_snapshot
+            )
+            # Restarting restores the stored snapshot
+            yaml_snapshot = YamlSnapshot(
+                json.loads(json.dumps(yaml_snapshot.as_dict()))
+            )
+
+        start = timer()
+        load_yaml_config_file(
+            str(config_path), Secrets(pathlib.Path(config_dir)), yaml_snapshot
+        )
+        runtime = timer() - start
+
+    print(f"Loaded 201 files in {runtime * 1000:.0f} ms")
+    return runtime
+
+
+@benchmark
+async def yaml_config_snapshot(hass):
+    """Load a configuration with many packages from the stored snapshot."""
+    return await hass.async_add_executor_job(_load_packages_config, True)
+
+
+@benchmark
+async def yaml_config_parse(hass):
+    """Load a configuration with many packages by parsing it."""
+    return await hass.async_add_executor_job(_load_packages_config, False)
+
+
+def _populate_registries(hass: core.HomeAssistant, entity_count: int) -> None:
+    """Register entities, 4 per device, with devices spread over 50 areas."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    area_reg = hass.data[ar.DATA_REGISTRY] = ar.AreaRegistry(hass)
+    dev_reg = hass.data[dr.DATA_REGISTRY] = dr.DeviceRegistry(hass)
+    ent_reg = hass.data[er.DATA_REGISTRY] = er.EntityRegistry(hass)
+    area_reg.areas = {
+        f"area_{idx}": ar.AreaEntry(
+            name=f"Area {idx}",
+            normalized_name=f"area {idx}",
+            aliases=set(),
+            id=f"area_{idx}",
+        )
+        for idx in range(50)
+    }
+    dev_reg.devices = dr.ActiveDeviceRegistryItems()
+    dev_reg.deleted_devices = dr.DeviceRegistryItems()
+    ent_reg.entities = er.EntityRegistryItems()
+    for idx in range(entity_count // 4):
+        dev_reg.devices[f"device_{idx}"] = dr.DeviceEntry(
+            id=f"device_{idx}", area_id=f"area_{idx % 50}"
+        )
+    for idx in range(entity_count):
+        entity_id = f"light.light_{idx}"
+        ent_reg.entities[entity_id] = er.RegistryEntry(
+            entity_id=entity_id,
+            unique_id=str(idx),
+            platform="hue",
+            device_id=f"device_{idx // 4}",
+            # Some entities are moved to another area than their device
+            area_id=f"area_{idx % 50}" if idx % 10 == 0 else None,
+        )
+
+
+def _linear_referenced_entity_ids(
+    hass: core.HomeAssistant, area_ids: set[str]
+) -> set[str]:
+    """Find the entities of areas by scanning the registries."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    referenced_devices = {
+        device.id
+        for device in dr.async_get(hass).devices.values()
+        if device.area_id in area_ids
+    }
+    return {
+        entry.entity_id
+        for entry in er.async_get(hass).entities.values()
+        if entry.entity_category is None
+        and entry.hidden_by is None
+        and (
+            entry.area_id in area_ids
+            or (not entry.area_id and entry.device_id in referenced_devices)
+        )
+    }
+
+
+async def _target_areas(hass: core.HomeAssistant, indexed: bool) -> float:
+    """Resolve service calls targeting an area with registries of growing size."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+    calls = 100
+    runtime = 0.0
+    for entity_count in (1000, 10000, 50000):
+        _populate_registries(hass, entity_count)
+        service_calls = [
+            core.ServiceCall("light", "turn_on", {"area_id": f"area_{idx % 50}"})
+            for idx in range(calls)
+        ]
+        start = timer()
+        for call in service_calls:
+            if indexed:
+                async_extract_referenced_entity_ids(hass, call, expand_group=False)
+            else:
+                _linear_referenced_entity_ids(hass, {call.data["area_id"]})
+        size_runtime = timer() - start
+        runtime += size_runtime
+        print(f"{entity_count} entities: {calls / size_runtime:.0f} calls/s")
+    return runtime
+
+
+@benchmark
+async def registry_area_targeting(hass):
+    """Find the entities targeted by area with the registry indexes."""
+    return await _target_areas(hass, True)
+
+
+@benchmark
+async def registry_area_targeting_linear(hass):
+    """Find the entities targeted by area by scanning the registries."""
+    return await _target_areas(hass, False)
+
+
+def _restore_state_data(hass: core.HomeAssistant, count: int) -> RestoreStateData:
+    """Create restore state data with entities that have a state."""
+    data = RestoreStateData(hass)
+    for idx in range(count):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"sensor.sensor_{idx}"
+        data.async_restore_entity_added(entity)
+        hass.states.async_set(
+            entity.entity_id,
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": f"Sensor {idx}"},
+        )
+    return data
+
+
+@benchmark
+async def restore_state_dump_changes(hass):
+    """Save the restore states of 10000 entities of which 100 changed."""
+    count = 10000
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        data = _restore_state_data(hass, count)
+        data.async_setup_dump()
+        await hass.async_block_till_done()
+
+        start = timer()
+        await data.async_dump_states()
+        full_runtime = timer() - start
+
+        start = timer()
+        for idx in range(100):
+            hass.states.async_set(f"sensor.sensor_{idx}", "changed")
+        await data.async_dump_changed_states()
+        runtime = timer() - start
+
+        for key in (data.store.key, data.changes_store.key):
+            size = os.path.getsize(os.path.join(config_dir, ".storage", key))
+            print(f"{key}: {size} bytes")
+    print(f"Saved all states in {full_runtime * 1000:.1f} ms")
+    print(f"Saved changed states in {runtime * 1000:.1f} ms")
+    return runtime
+
+
+@benchmark
+async def restore_state_load(hass):
+    """Load the restore states of 10000 entities, restoring 10% of them."""
+    count = 10000
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        data = _restore_state_data(hass, count)
+        await data.async_dump_states()
+
+        data = _restore_state_data(hass, 0)
+        start = timer()
+        await data.async_load()
+        for idx in range(0, count, 10):
+            data.async_get_stored_state(f"sensor.sensor_{idx}")
+        runtime = timer() - start
+
+        start = timer()
+        await data.async_load()
+        data.async_get_stored_states()
+        full_runtime = timer() - start
+    print(f"Loaded and restored 10% of the states in {runtime * 1000:.1f} ms")
+    print(f"Loaded and parsed all states in {full_runtime * 1000:.1f} ms")
+    return runtime
+
+
+async def _write_stores(hass: core.HomeAssistant, batched: bool) -> float:
+    """Write 100 atomic stores at once, in one or in separate executor jobs."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import storage
+
+    data = {
+        "devices": [
+            {"id": f"device_{idx}", "name": f"Device {idx}", "area_id": None}
+            for idx in range(500)
+        ]
+    }
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        stores = [
+            storage.Store[dict](hass, 1, f"store_{idx}", atomic_writes=True)
+            for idx in range(100)
+        ]
+        start = timer()
+        if batched:
+            await asyncio.gather(*(store.async_save(data) for store in stores))
+        else:
+            await asyncio.gather(
+                *(
+                    # pylint: disable-next=protected-access
+                    hass.async_add_executor_job(store._write_data, store.path, data)
+                    for store in stores
+                )
+            )
+        runtime = timer() - start
+    print(f"Wrote {len(stores)} stores in {runtime * 1000:.1f} ms")
+    return runtime
+
+
+@benchmark
+async def storage_batched_writes(hass):
+    """Write 100 stores in one executor job."""
+    return await _write_stores(hass, True)
+
+
+@benchmark
+async def storage_separate_writes(hass):
+    """Write 100 stores in an executor job per store."""
+    return await _write_stores(hass, False)
+
+
+async def _refresh_coordinator_states(hass: core.HomeAssistant, batched: bool) -> float:
+    """Write 200 states per refresh with a recorder and a websocket listener."""
+    queue: collections.deque = collections.deque()
+    messages = 0
+
+    @core.callback
+    def recorder_listener(events):
+        """Queue the events as one task."""
+        queue.append(events)
+
+    @core.callback
+    def websocket_listener(events):
+        """Serialize the changed states into one message."""
+        nonlocal messages
+        JSON_DUMP([event.data["new_state"].as_dict() for event in events])
+        messages += 1
+
+    hass.bus.async_listen_batch(MATCH_ALL, recorder_listener)
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, websocket_listener)
+    entity_ids = [f"sensor.coordinator_{idx}" for idx in range(200)]
+    refreshes = 500
+
+    start = timer()
+    for refresh in range(refreshes):
+        if batched:
+            with hass.states.async_batch():
+                for entity_id in entity_ids:
+                    hass.states.async_set(entity_id, str(refresh))
+        else:
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(refresh))
+    runtime = timer() - start
+
+    states = refreshes * len(entity_ids)
+    print(f"Wrote {states / runtime:.0f} states/s")
+    print(f"Queued {len(queue)} recorder tasks and sent {messages} messages")
+    return runtime
+
+
+@benchmark
+async def state_writes_batched(hass):
+    """Write coordinator states as one batch per refresh."""
+    return await _refresh_coordinator_states(hass, True)
+
+
+@benchmark
+async def state_writes_unbatched(hass):
+    """Write coordinator states one event at a time."""
+    return await _refresh_coordinator_states(hass, False)
+
+
+def _measure_states(entity_count: int, shared: bool) -> None:
+    """Print the memory used by states and what each update keeps allocated."""
+    attributes = [
+        {
+            "state_class": "measurement",
+            "unit_of_measurement": "°C",
+            "device_class": "temperature",
+            "icon": "mdi:thermometer",
+            "friendly_name": f"Temperature {idx}",
+        }
+        for idx in range(entity_count)
+    ]
+    # Keep the states of every update, like a recorder backlog does
+    states: list[core.State] = []
+
+    def set_states(update: int) -> None:
+        """Create the next state of every entity."""
+        for idx in range(entity_count):
+            # The state machine shares the attributes if they did not change
+            states.append(
+                core.State(
+                    f"sensor.temperature_{idx}",
+                    str(update),
+                    states[idx].attributes if shared and update else attributes[idx],
+                )
+            )
+
+    # Warm up the entity id caches
+    set_states(0)
+    states.clear()
+
+    tracemalloc.start()
+    set_states(0)
+    size = tracemalloc.get_traced_memory()[0]
+    start_blocks = sys.getallocatedblocks()
+    # Updates only change the state, like most sensor updates
+    for update in range(1, 11):
+        set_states(update)
+    blocks = sys.getallocatedblocks() - start_blocks
+    update_size = tracemalloc.get_traced_memory()[0] - size
+    tracemalloc.stop()
+    updates = entity_count * 10
+    print(
+        f"  {entity_count} entities: {size / 2**20:.1f} MiB of states,"
+        f" {(size + update_size) / 2**20:.1f} MiB after 10 updates,"
+        f" {blocks / updates:.1f} blocks and {update_size / updates:.0f} bytes"
+        " kept per update"
+    )
+
+
+@benchmark
+async def state_attributes_memory(hass):
+    """Measure the memory of states with shared and with copied attributes."""
+    start = timer()
+    for entity_count in (10000, 50000):
+        print("Shared attributes:")
+        _measure_states(entity_count, True)
+        print("Copied attributes:")
+        _measure_states(entity_count, False)
+    return timer() - start
+
+
+async def _forward_state_changes(hass: core.HomeAssistant, shared: bool) -> float:
+    """Forward state changes to 20 websocket clients and the recorder."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.const import ALL_DOMAIN_EXCLUDE_ATTRS
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import StateAttributes
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import messages
+
+    sent = 0
+
+    @functools.lru_cache(maxsize=128)
+    def _encoded_event_message(event):
+        """Encode the event again, like every consumer used to."""
+        return JSON_DUMP(
+            {"id": messages.IDEN_TEMPLATE, "type": "event", "event": event}
+        )
+
+    def forward_event(msg_id, event):
+        """Send the event to a websocket client."""
+        nonlocal sent
+        if shared:
+            messages.cached_event_message(msg_id, event)
+        else:
+            _encoded_event_message(event).replace(
+                messages.IDEN_JSON_TEMPLATE, str(msg_id), 1
+            )
+        sent += 1
+
+    def record_event(event):
+        """Encode the attributes like the recorder does."""
+        if shared:
+            StateAttributes.shared_attrs_bytes_from_event(event, {}, {}, "sqlite")
+        else:
+            exclude_attrs = set(ALL_DOMAIN_EXCLUDE_ATTRS)
+            json_bytes(
+                {
+                    key: value
+                    for key, value in event.data["new_state"].attributes.items()
+                    if key not in exclude_attrs
+                }
+            )
+
+    for msg_id in range(20):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            core.callback(functools.partial(forward_event, msg_id)),
+            run_immediately=True,
+        )
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, core.callback(record_event), run_immediately=True
+    )
+    sensor_attributes = {
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "icon": "mdi:thermometer",
+    }
+    climate_attributes = {
+        "hvac_modes": ["off", "heat", "cool", "heat_cool", "auto", "dry", "fan_only"],
+        "min_temp": 7,
+        "max_temp": 35,
+        "target_temp_step": 0.5,
+        "fan_modes": ["auto", "low", "medium", "high"],
+        "preset_modes": ["none", "eco", "away", "boost", "comfort", "home", "sleep"],
+        "swing_modes": ["off", "vertical", "horizontal", "both"],
+        "current_temperature": 21.5,
+        "temperature": 22,
+        "fan_mode": "auto",
+        "hvac_action": "heating",
+        "preset_mode": "comfort",
+        "swing_mode": "off",
+    }
+    entities = [
+        (f"sensor.temperature_{idx}", sensor_attributes) for idx in range(500)
+    ] + [(f"climate.room_{idx}", climate_attributes) for idx in range(500)]
+
+    start = timer()
+    for update in range(50):
+        for entity_id, attributes in entities:
+            hass.states.async_set(
+                entity_id, str(update), {**attributes, "friendly_name": entity_id}
+            )
+    runtime = timer() - start
+
+    print(f"Sent {sent / runtime:.0f} messages/s to 20 clients")
+    return runtime
+
+
+@benchmark
+async def state_changed_shared_json(hass):
+    """Forward state changes with the JSON shared between consumers."""
+    return await _forward_state_changes(hass, True)
+
+
+@benchmark
+async def state_changed_separate_json(hass):
+    """Forward state changes with each consumer encoding the event."""
+    return await _forward_state_changes(hass, False)
+
+
+async def _subscribe_entities_slow_client(
+    hass: core.HomeAssistant, coalesce: bool
+) -> float:
+    """Send a burst of entity changes to a client that reads slowly."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth import models as auth_models
+    from homeassistant.auth.permissions import PermissionLookup
+    from homeassistant.components import websocket_api
+    from homeassistant.components.websocket_api.commands import (
+        handle_subscribe_entities,
+    )
+    from homeassistant.components.websocket_api.http import WebSocketAdapter
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    # pylint: enable=import-outside-toplevel
+
+    queue: collections.deque = collections.deque()
+    sent = 0
+    peak = 0
+
+    def send_message(message):
+        """Queue the message for the client."""
+        nonlocal peak
+        queue.append(message)
+        peak = max(peak, len(queue))
+
+    async def wait_pending_messages(max_pending):
+        """Wait until the client has read enough messages."""
+        while len(queue) > max_pending:
+            await asyncio.sleep(0)
+
+    async def read_messages():
+        """Read a few messages every loop iteration."""
+        nonlocal sent
+        while True:
+            for _ in range(min(5, len(queue))):
+                message = queue.popleft()
+                if callable(message):
+                    message()
+                sent += 1
+            await asyncio.sleep(0)
+
+    user = auth_models.User(
+        name="Benchmark",
+        perm_lookup=PermissionLookup(er.EntityRegistry(hass), dr.DeviceRegistry(hass)),
+        is_owner=True,
+    )
+    hass.data[websocket_api.DOMAIN] = {}
+    connection = websocket_api.ActiveConnection(
+        WebSocketAdapter(logging.getLogger(__name__), {"connid": "benchmark"}),
+        hass,
+        send_message,
+        user,
+        auth_models.RefreshToken(user, None, timedelta(minutes=30)),
+        wait_pending_messages,
+        (lambda: len(queue)) if coalesce else (lambda: 0),
+    )
+    entity_ids = [f"sensor.power_{idx}" for idx in range(200)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0")
+    handle_subscribe_entities(hass, connection, {"id": 1, "type": "subscribe_entities"})
+    queue.clear()
+
+    reader = asyncio.create_task(read_messages())
+    start = timer()
+    for update in range(100):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(update), {"unit_of_measurement": "W"})
+        await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    while queue:
+        await asyncio.sleep(0)
+    runtime = timer() - start
+    reader.cancel()
+
+    print(f"Sent {sent} messages, at most {peak} waiting for the client")
+    return runtime
+
+
+@benchmark
+async def subscribe_entities_coalesced(hass):
+    """Send entity changes to a slow client, merged while it is behind."""
+    return await _subscribe_entities_slow_client(hass, True)
+
+
+@benchmark
+async def subscribe_entities_immediate(hass):
+    """Send every entity change to a slow client right away."""
+    return await _subscribe_entities_slow_client(hass, False)
+
+
+async def _schedule_timers(hass: core.HomeAssistant, timer_wheel: bool) -> float:
+    """Schedule 50k timers spread over a second and reschedule half of them."""
+    if timer_wheel:
+        hass.async_enable_timer_wheel(0.05)
+    fired = 0
+    all_fired = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle a timer."""
+        nonlocal fired
+        fired += 1
+        if fired == 50000:
+            all_fired.set()
+
+    start_cpu = time.process_time()
+    start = timer()
+    unsubs = [
+        async_call_later(hass, 0.5 + idx % 1000 / 1000, listener)
+        for idx in range(50000)
+    ]
+    # Entities changing state restart their "for:" timers
+    for idx in range(0, 50000, 2):
+        unsubs[idx]()
+        unsubs[idx] = async_call_later(hass, 1 + idx % 1000 / 1000, listener)
+    scheduled = timer() - start
+    await all_fired.wait()
+    runtime = time.process_time() - start_cpu
+
+    print(
+        f"Scheduled 50000 timers in {scheduled:.3f}s, all fired after"
+        f" {timer() - start:.3f}s using {runtime:.3f}s of CPU time"
+    )
+    return runtime
+
+
+@benchmark
+async def timer_wheel_timers(hass):
+    """Fire 50k timers from the timer wheel."""
+    return await _schedule_timers(hass, True)
+
+
+@benchmark
+async def event_loop_timers(hass):
+    """Fire 50k timers from the event loop."""
+    return await _schedule_timers(hass, False)
+
+
+async def _fire_time_patterns(hass: core.HomeAssistant, shared: bool) -> float:
+    """Fire 1500 '/5 minute' time pattern listeners for 100 matches."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import event as event_helper
+
+    runs = 0
+
+    @core.callback
+    def listener(_):
+        """Handle a matching time."""
+        nonlocal runs
+        runs += 1
+
+    def track_unshared(action):
+        """Track the pattern with a timer per listener, like before."""
+        seconds = dt_util.parse_time_expression(0, 0, 59)
+        minutes = dt_util.parse_time_expression("/5", 0, 59)
+        hours = dt_util.parse_time_expression(None, 0, 23)
+
+        @core.callback
+        def pattern_listener(_):
+            """Run the action and schedule the next match."""
+            now = event_helper.time_tracker_utcnow()
+            hass.async_run_hass_job(job, now)
+            async_track_point_in_utc_time(
+                hass,
+                pattern_job,
+                dt_util.find_next_time_expression_time(
+                    now + timedelta(seconds=1), seconds, minutes, hours
+                ).replace(microsecond=100000),
+            )
+
+        job = core.HassJob(action)
+        pattern_job = core.HassJob(pattern_listener)
+        async_track_point_in_utc_time(
+            hass,
+            pattern_job,
+            dt_util.find_next_time_expression_time(
+                dt_util.utcnow(), seconds, minutes, hours
+            ).replace(microsecond=100000),
+        )
+
+    start = timer()
+    for _ in range(1500):
+        if shared:
+            async_track_utc_time_change(hass, listener, minute="/5", second=0)
+        else:
+            track_unshared(listener)
+    timers = sum(not handle.cancelled() for handle in getattr(hass.loop, "_scheduled"))
+
+    fire_time = dt_util.utcnow().replace(second=0, microsecond=0)
+    original_utcnow = event_helper.time_tracker_utcnow
+    original_timestamp = event_helper.time_tracker_timestamp
+    try:
+        for _ in range(100):
+            fire_time += timedelta(minutes=5, seconds=1)
+            event_helper.time_tracker_utcnow = functools.partial(
+                dt_util.as_utc, fire_time
+            )
+            event_helper.time_tracker_timestamp = fire_time.timestamp
+            for handle in list(getattr(hass.loop, "_scheduled")):
+                if not handle.cancelled():
+                    handle._run()  # pylint: disable=protected-access
+                    handle.cancel()
+            await hass.async_block_till_done()
+    finally:
+        event_helper.time_tracker_utcnow = original_utcnow
+        event_helper.time_tracker_timestamp = original_timestamp
+    runtime = timer() - start
+
+    print(f"{runs} listener runs from {timers} event loop timers")
+    return runtime
+
+
+@benchmark
+async def time_patterns_shared(hass):
+    """Fire listeners of the same time pattern from a shared timer."""
+    return await _fire_time_patterns(hass, True)
+
+
+@benchmark
+async def time_patterns_unshared(hass):
+    """Fire listeners of the same time pattern from a timer each."""
+    return await _fire_time_patterns(hass, False)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -357,3 +1405,116 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+@benchmark
+async def statistics_reduce(hass):
+    """Reduce 5 years of hourly statistics of 20 sensors to days, weeks and months."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+    first = dt_util.as_utc(dt_util.start_of_local_day()) - timedelta(days=5 * 365)
+    hours = 5 * 365 * 24
+    stats = {}
+    for sensor in range(20):
+        stat_list = []
+        for hour in range(hours):
+            start = first.timestamp() + hour * 3600
+            stat_list.append(
+                {
+                    "start": start,
+                    "end": start + 3600,
+                    "mean": float(hour % 24 + sensor),
+                    "min": float(hour % 24),
+                    "max": float(hour % 24 + 2 * sensor),
+                    "last_reset": None,
+                    "state": float(hour),
+                    "sum": float(hour * sensor),
+                }
+            )
+        stats[f"sensor.test_{sensor}"] = stat_list
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    start = timer()
+    periods = {
+        "days": statistics._reduce_statistics_per_day(stats, types),
+        "weeks": statistics._reduce_statistics_per_week(stats, types),
+        "months": statistics._reduce_statistics_per_month(stats, types),
+    }
+    runtime = timer() - start
+
+    rows = 3 * hours * len(stats)
+    print(
+        f"Reduced {rows} hourly rows to",
+        ", ".join(
+            f"{len(reduced['sensor.test_0'])} {period}"
+            for period, reduced in periods.items()
+        ),
+        f"per sensor, {rows / runtime:.0f} rows/s",
+    )
+    return runtime
+
+
+def _update_statistics_sensor_window(incremental: bool) -> float:
+    """Slide a full statistics sensor window and read its characteristics."""
+    # pylint: disable-next=import-outside-toplevel
+    import statistics
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.window import SampleWindow
+
+    sampling_size = 10000
+    updates = 500
+    age = dt_util.utcnow()
+    window = SampleWindow(sampling_size, order_statistics=True, extrema=True)
+    states: collections.deque[float] = collections.deque(maxlen=sampling_size)
+    for sample in range(sampling_size):
+        value = float((sample * 7919) % 1000)
+        window.append(value, age + timedelta(seconds=sample))
+        states.append(value)
+
+    start = timer()
+    for sample in range(sampling_size, sampling_size + updates):
+        value = float((sample * 7919) % 1000)
+        if incremental:
+            window.append(value, age + timedelta(seconds=sample))
+            characteristics = (
+                window.mean,
+                window.median(),
+                window.percentile(95),
+                math.sqrt(window.variance),
+                window.variance,
+                window.max[0],
+                window.min[0],
+            )
+        else:
+            states.append(value)
+            characteristics = (
+                statistics.mean(states),
+                statistics.median(states),
+                statistics.quantiles(states, n=100, method="exclusive")[94],
+                statistics.stdev(states),
+                statistics.variance(states),
+                max(states),
+                min(states),
+            )
+    runtime = timer() - start
+
+    print(
+        f"Updated a window of {sampling_size} samples {updates} times,",
+        f"{updates / runtime:.0f} updates/s, last mean {characteristics[0]:.2f}",
+    )
+    return runtime
+
+
+@benchmark
+async def statistics_sensor_incremental(hass):
+    """Update statistics sensor characteristics incrementally."""
+    return _update_statistics_sensor_window(True)
+
+
+@benchmark
+async def statistics_sensor_recompute(hass):
+    """Recompute statistics sensor characteristics over the whole window."""
+    return _update_statistics_sensor_window(False)
@@ -463,6 +463,53 @@ def find_next_time_expression_time(
         return result
 
 
+def time_expression_table(
+    seconds: list[int], minutes: list[int], hours: list[int]
+) -> list[int]:
+    """Return the sorted seconds of the day at which a time expression matches."""
+    return [
+        hour * 3600 + minute * 60 + second
+        for hour in hours
+        for minute in minutes
+        for second in seconds
+    ]
+
+
+def find_next_time_expression_table_time(
+    now: dt.datetime,  # pylint: disable=redefined-outer-name
+    table: list[int],
+    seconds: list[int],
+    minutes: list[int],
+    hours: list[int],
+) -> dt.datetime:
+    """Find the next datetime from now for which the time expression matches.
+
+    Same as find_next_time_expression_time, but looks the next match up in
+    the table of the time expression from time_expression_table. Falls back
+    to find_next_time_expression_time around daylight saving time changes.
+    """
+    if not table:
+        raise ValueError("Cannot find a next time: Time expression never matches!")
+
+    result = now.replace(microsecond=0, fold=0)
+    second_of_day = result.hour * 3600 + result.minute * 60 + result.second
+    if (idx := bisect.bisect_left(table, second_of_day)) == len(table):
+        # No match left today. Roll-over to the first match of the next day.
+        idx = 0
+        result += dt.timedelta(days=1)
+    match = table[idx]
+    result = result.replace(
+        hour=match // 3600, minute=match // 60 % 60, second=match % 60
+    )
+
+    if result.tzinfo in (None, UTC) or (
+        _datetime_exists(result) and not _datetime_ambiguous(now)
+    ):
+        return result
+
+    return find_next_time_expression_time(now, seconds, minutes, hours)
+
+
 def _datetime_exists(dattim: dt.datetime) -> bool:
     """Check if a datetime exists."""
     assert dattim.tzinfo is not None
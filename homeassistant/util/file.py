@@ -1,6 +1,7 @@
 """File utility functions."""
 from __future__ import annotations
 
+from collections.abc import Sequence
 import logging
 import os
 import tempfile
@@ -80,3 +81,94 @@ def write_utf8_file(
                     filename,
                     err,
                 )
+
+
+def _fsync_path(path: str) -> None:
+    """Flush a file or a directory to disk."""
+    fdesc = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fdesc)
+    finally:
+        os.close(fdesc)
+
+
+def write_utf8_files(
+    files: Sequence[tuple[str, str, bool, bool]],
+) -> list[WriteError | None]:
+    """Write files and rename them into place, syncing them to disk together.
+
+    Each file is given as its filename, its data, if it is private and if
+    it must be durable. Every file is written all or nothing like
+    write_utf8_file. Durable files are synced to disk like with
+    write_utf8_file_atomic, but only after all files were written, and
+    their directories are synced once after all renames instead of once
+    per file.
+
+    Returns the error of each file, None if it was written.
+    """
+    errors: list[WriteError | None] = [None] * len(files)
+    tmp_filenames = [""] * len(files)
+
+    def _failed(idx: int, error: OSError) -> None:
+        _LOGGER.error("Saving file failed: %s: %s", files[idx][0], error)
+        errors[idx] = WriteError(error)
+
+    try:
+        for idx, (filename, utf8_data, private, _) in enumerate(files):
+            try:
+                # Modern versions of Python tempfile create this file with mode 0o600
+                with tempfile.NamedTemporaryFile(
+                    mode="w",
+                    encoding="utf-8",
+                    dir=os.path.dirname(filename),
+                    delete=False,
+                ) as fdesc:
+                    tmp_filenames[idx] = fdesc.name
+                    fdesc.write(utf8_data)
+                    if not private:
+                        os.fchmod(fdesc.fileno(), 0o644)
+            except OSError as error:
+                _failed(idx, error)
+
+        for idx, (_, _, _, durable) in enumerate(files):
+            if durable and errors[idx] is None:
+                try:
+                    _fsync_path(tmp_filenames[idx])
+                except OSError as error:
+                    _failed(idx, error)
+
+        directories: dict[str, list[int]] = {}
+        for idx, (filename, _, _, durable) in enumerate(files):
+            if errors[idx] is not None:
+                continue
+            try:
+                os.replace(tmp_filenames[idx], filename)
+            except OSError as error:
+                _failed(idx, error)
+                continue
+            tmp_filenames[idx] = ""
+            if durable:
+                directory = os.path.dirname(filename) or os.curdir
+                directories.setdefault(directory, []).append(idx)
+
+        for directory, indexes in directories.items():
+            try:
+                _fsync_path(directory)
+            except OSError as error:
+                for idx in indexes:
+                    _failed(idx, error)
+    finally:
+        for tmp_filename in tmp_filenames:
+            if tmp_filename and os.path.exists(tmp_filename):
+                try:
+                    os.remove(tmp_filename)
+                except OSError as err:
+                    # If we are cleaning up then something else went wrong, so
+                    # we should suppress likely follow-on errors in the cleanup
+                    _LOGGER.error(
+                        "File replacement cleanup failed for %s: %s",
+                        tmp_filename,
+                        err,
+                    )
+
+    return errors
@@ -0,0 +1,174 @@
+"""Timer wheel that groups timers into slots.
+
+Each pending timer scheduled with loop.call_at sits in the event loop heap
+and wakes the loop up on its own. The timer wheel rounds the fire time of
+its timers up to the next slot of a configurable resolution and keeps a
+single loop timer for the earliest slot, so timers that are due at about
+the same time are fired together in one wakeup.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+import heapq
+import logging
+import math
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TimerWheelHandle:
+    """Handle for a timer scheduled on a timer wheel."""
+
+    __slots__ = ("_wheel", "_when", "_owner", "_callback", "_args", "_cancelled")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        when: float,
+        owner: str,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the handle."""
+        self._wheel = wheel
+        self._when = when
+        self._owner = owner
+        self._callback = callback
+        self._args = args
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        state = " cancelled" if self._cancelled else ""
+        return (
+            f"<TimerWheelHandle{state} when={self._when} owner={self._owner}"
+            f" {self._callback}>"
+        )
+
+    def when(self) -> float:
+        """Return the loop time the timer was scheduled for."""
+        return self._when
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+        self._wheel._async_timer_done(self._owner)  # pylint: disable=protected-access
+        self._callback = None  # type: ignore[assignment]
+        self._args = ()
+
+    def _run(self) -> None:
+        """Run the timer."""
+        self._cancelled = True
+        self._wheel._async_timer_done(self._owner)  # pylint: disable=protected-access
+        try:
+            self._callback(*self._args)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error running timer %s", self._callback)
+
+
+class TimerWheel:
+    """Schedule timers in slots of a fixed resolution.
+
+    Timers fire at the end of their slot, so never early and at most
+    resolution seconds late.
+    """
+
+    __slots__ = (
+        "_loop",
+        "resolution",
+        "_slots",
+        "_slot_heap",
+        "_handle",
+        "_handle_slot",
+        "_pending",
+    )
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, resolution: float) -> None:
+        """Initialize the timer wheel."""
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self._loop = loop
+        self.resolution = resolution
+        self._slots: dict[int, list[TimerWheelHandle]] = {}
+        self._slot_heap: list[int] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_slot: int | None = None
+        self._pending: Counter[str] = Counter()
+
+    def call_at(
+        self, when: float, owner: str, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Call callback with args in the first slot at or after loop time when."""
+        handle = TimerWheelHandle(self, when, owner, callback, args)
+        slot = math.ceil(when / self.resolution)
+        if (timers := self._slots.get(slot)) is None:
+            self._slots[slot] = [handle]
+            heapq.heappush(self._slot_heap, slot)
+            if self._handle_slot is None or slot < self._handle_slot:
+                self._async_schedule(slot)
+        else:
+            timers.append(handle)
+        self._pending[owner] += 1
+        return handle
+
+    def call_later(
+        self, delay: float, owner: str, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Call callback with args in the first slot at least delay seconds away."""
+        return self.call_at(self._loop.time() + delay, owner, callback, *args)
+
+    def pending_timers(self) -> dict[str, int]:
+        """Return the number of pending timers per owner."""
+        return dict(self._pending)
+
+    def _async_timer_done(self, owner: str) -> None:
+        """Forget a timer that fired or was cancelled."""
+        pending = self._pending
+        if pending[owner] > 1:
+            pending[owner] -= 1
+            return
+        del pending[owner]
+        if not pending:
+            # Only cancelled timers are left in the slots
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+                self._handle_slot = None
+            self._slots.clear()
+            self._slot_heap.clear()
+
+    def _async_schedule(self, slot: int) -> None:
+        """Wake up the loop at the end of slot."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_slot = slot
+        self._handle = self._loop.call_at(
+            slot * self.resolution, self._async_fire_slots, slot
+        )
+
+    def _async_fire_slots(self, slot: int) -> None:
+        """Fire the timers of slot and of any slot before it."""
+        self._handle = None
+        self._handle_slot = None
+        slots = self._slots
+        slot_heap = self._slot_heap
+        # Take the due slots out first so timers scheduled by the callbacks
+        # are fired on the next wakeup instead of in this one
+        due: list[list[TimerWheelHandle]] = []
+        while slot_heap and slot_heap[0] <= slot:
+            due.append(slots.pop(heapq.heappop(slot_heap)))
+        for timers in due:
+            for handle in timers:
+                if not handle._cancelled:  # pylint: disable=protected-access
+                    handle._run()  # pylint: disable=protected-access
+        if slot_heap and self._handle_slot is None:
+            self._async_schedule(slot_heap[0])
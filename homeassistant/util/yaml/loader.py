@@ -2,11 +2,17 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
+import math
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, TypeVar, overload
 
 import yaml
@@ -21,6 +27,7 @@ except ImportError:
         SafeLoader as FastestAvailableSafeLoader,
     )
 
+from homeassistant.const import __version__
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -33,6 +40,10 @@ _DictT = TypeVar("_DictT", bound=dict)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Files changed this recently can change again without a new mtime,
+# so their contents are compared until they are older
+_RACY_MTIME_NS = 2_000_000_000
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -104,7 +115,12 @@ class Secrets:
 class SafeLoader(FastestAvailableSafeLoader):
     """The fastest available safe loader."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        dependencies: _FileDependencies | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         self.stream = stream
         if isinstance(stream, str):
@@ -115,6 +131,7 @@ class SafeLoader(FastestAvailableSafeLoader):
             self.name = getattr(stream, "name", "<file>")
         super().__init__(stream)
         self.secrets = secrets
+        self.dependencies = dependencies
 
     def get_name(self) -> str:
         """Get the name of the loader."""
@@ -128,10 +145,16 @@ class SafeLoader(FastestAvailableSafeLoader):
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        dependencies: _FileDependencies | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.dependencies = dependencies
 
     def compose_node(  # type: ignore[override]
         self, parent: yaml.nodes.Node, index: int
@@ -156,6 +179,333 @@ class SafeLineLoader(yaml.SafeLoader):
 LoaderType = SafeLineLoader | SafeLoader
 
 
+class _FileDependencies:
+    """Collect the files and directories a YAML file includes while it is parsed."""
+
+    __slots__ = ("snapshot", "items")
+
+    def __init__(self, snapshot: YamlSnapshot) -> None:
+        """Initialize the dependencies."""
+        self.snapshot = snapshot
+        self.items: list[tuple[Any, ...]] = []
+
+
+@dataclass(slots=True, frozen=True)
+class _SecretReference:
+    """A secret used by a file parsed for the snapshot, resolved when loaded."""
+
+    name: str
+    fname: str
+
+
+@dataclass(slots=True, frozen=True)
+class _EnvVarReference:
+    """An environment variable used by a file parsed for the snapshot."""
+
+    value: str
+
+
+class _UnsupportedValueError(Exception):
+    """Raised when a parsed value can not be kept in the snapshot."""
+
+
+@dataclass(slots=True)
+class _SnapshotEntry:
+    """A parsed YAML file in the snapshot."""
+
+    mtime_ns: int | None
+    size: int
+    digest: str
+    dependencies: list[Any]
+    # The names of the files in the line references of the tree
+    files: list[str]
+    tree: Any
+
+
+class YamlSnapshot:
+    """Snapshot of parsed YAML files.
+
+    A file is parsed again only if its contents changed or if a file or
+    directory listing that it includes changed. Included files are
+    loaded from the snapshot when they did not change.
+
+    The parsed trees are kept as JSON with the types of the nodes and
+    their line references. Secrets and environment variables are only
+    kept by name and are resolved every time the file is loaded.
+    """
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        """Initialize the snapshot from the data returned by as_dict."""
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self._entries: dict[str, _SnapshotEntry] = {}
+        self._lock = threading.RLock()
+        if data is None or data.get("ha_version") != __version__:
+            return
+        try:
+            for fname, entry in data["files"].items():
+                self._entries[fname] = _SnapshotEntry(
+                    entry["mtime_ns"],
+                    entry["size"],
+                    entry["digest"],
+                    entry["dependencies"],
+                    entry["files"],
+                    entry["tree"],
+                )
+        except (KeyError, TypeError, AttributeError):
+            _LOGGER.debug("Ignoring a snapshot of YAML files in an unknown format")
+            self._entries.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as a JSON serializable dictionary."""
+        return {
+            "ha_version": __version__,
+            "files": {
+                fname: {
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "digest": entry.digest,
+                    "dependencies": entry.dependencies,
+                    "files": entry.files,
+                    "tree": entry.tree,
+                }
+                for fname, entry in dict(self._entries).items()
+            },
+        }
+
+    def load_yaml(self, fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
+        """Load a YAML file, parsing it only if it changed."""
+        return self._load(fname, secrets, True)
+
+    def _load(self, fname: str, secrets: Secrets | None, resolve: bool) -> Any:
+        """Load a YAML file from the snapshot or parse it.
+
+        Secrets and environment variables are only resolved if resolve
+        is set, files which include the file keep them as references.
+        """
+        with self._lock:
+            try:
+                stat_result = os.stat(fname)
+            except OSError:
+                # Let the loader report missing files
+                return load_yaml(fname, secrets)
+            if (entry := self._entries.get(fname)) is not None and self._is_valid(
+                fname, entry, stat_result
+            ):
+                try:
+                    tree = _decode_tree(entry.tree, entry.files, secrets, resolve)
+                except (KeyError, TypeError, IndexError, ValueError):
+                    _LOGGER.debug("Ignoring the snapshot of %s", fname)
+                else:
+                    self.hits += 1
+                    return tree
+            self.misses += 1
+            tree = self._parse(fname, secrets, stat_result)
+            if resolve:
+                tree = _resolve_references(tree, secrets)
+            return tree
+
+    def _parse(
+        self, fname: str, secrets: Secrets | None, stat_result: os.stat_result
+    ) -> Any:
+        """Parse a YAML file and add it to the snapshot."""
+        try:
+            with open(fname, encoding="utf-8") as conf_file:
+                content = conf_file.read()
+        except UnicodeDecodeError as exc:
+            _LOGGER.error("Unable to read file %s: %s", fname, exc)
+            raise HomeAssistantError(exc) from exc
+        stream = StringIO(content)
+        stream.name = fname
+        dependencies = _FileDependencies(self)
+        obj = parse_yaml(stream, secrets, dependencies)
+        files: dict[str, int] = {}
+        try:
+            tree = _encode_tree(obj, files)
+        except _UnsupportedValueError as exc:
+            _LOGGER.debug("Not keeping %s in the snapshot: %s", fname, exc)
+            self._entries.pop(fname, None)
+            return obj
+        mtime_ns: int | None = stat_result.st_mtime_ns
+        if time.time_ns() - stat_result.st_mtime_ns < _RACY_MTIME_NS:
+            mtime_ns = None
+        self._entries[fname] = _SnapshotEntry(
+            mtime_ns,
+            stat_result.st_size,
+            hashlib.sha256(content.encode()).hexdigest(),
+            dependencies.items,
+            list(files),
+            tree,
+        )
+        self.dirty = True
+        return obj
+
+    def _is_valid(
+        self,
+        fname: str,
+        entry: _SnapshotEntry,
+        stat_result: os.stat_result | None = None,
+    ) -> bool:
+        """Return if a file and everything it includes did not change."""
+        if stat_result is None:
+            try:
+                stat_result = os.stat(fname)
+            except OSError:
+                return False
+        if stat_result.st_size != entry.size:
+            return False
+        if stat_result.st_mtime_ns != entry.mtime_ns:
+            try:
+                with open(fname, encoding="utf-8") as conf_file:
+                    content = conf_file.read()
+            except (OSError, UnicodeDecodeError):
+                return False
+            if hashlib.sha256(content.encode()).hexdigest() != entry.digest:
+                return False
+            if time.time_ns() - stat_result.st_mtime_ns >= _RACY_MTIME_NS:
+                entry.mtime_ns = stat_result.st_mtime_ns
+                self.dirty = True
+
+        for kind, name, *value in entry.dependencies:
+            if kind == "file":
+                if (child := self._entries.get(name)) is None or not self._is_valid(
+                    name, child
+                ):
+                    return False
+            elif kind == "dir":
+                if list(_find_files(name, "*.yaml")) != value[0]:
+                    return False
+            else:
+                return False
+        return True
+
+
+def _encode_tree(obj: Any, files: dict[str, int]) -> Any:
+    """Encode a parsed YAML tree as JSON.
+
+    Strings, numbers, booleans and None are kept as they are, all other
+    nodes are objects with their type, value and line reference.
+    """
+    if obj is None or obj is True or obj is False:
+        return obj
+    obj_type = type(obj)
+    if obj_type is str:
+        return obj
+    if obj_type is int:
+        if -(2**63) <= obj < 2**63:
+            return obj
+        return {"t": "int", "v": str(obj)}
+    if obj_type is float:
+        if math.isfinite(obj):
+            return obj
+        return {"t": "float", "v": str(obj)}
+    node: dict[str, Any]
+    if obj_type is NodeDictClass or obj_type is dict:
+        node = {
+            "t": "node_dict" if obj_type is NodeDictClass else "dict",
+            "v": [
+                [_encode_tree(key, files), _encode_tree(value, files)]
+                for key, value in obj.items()
+            ],
+        }
+    elif obj_type is NodeListClass or obj_type is list:
+        node = {
+            "t": "node_list" if obj_type is NodeListClass else "list",
+            "v": [_encode_tree(value, files) for value in obj],
+        }
+    elif obj_type is NodeStrClass:
+        node = {"t": "node_str", "v": str(obj)}
+    elif obj_type is _SecretReference:
+        return {
+            "t": "secret",
+            "v": obj.name,
+            "f": files.setdefault(obj.fname, len(files)),
+        }
+    elif obj_type is _EnvVarReference:
+        return {"t": "env_var", "v": obj.value}
+    elif obj_type is Input:
+        return {"t": "input", "v": obj.name}
+    elif obj_type is datetime:
+        return {"t": "datetime", "v": obj.isoformat()}
+    elif obj_type is date:
+        return {"t": "date", "v": obj.isoformat()}
+    else:
+        raise _UnsupportedValueError(f"Values of {obj_type.__name__} are not supported")
+    if (config_file := getattr(obj, "__config_file__", None)) is not None:
+        node["f"] = files.setdefault(config_file, len(files))
+        node["l"] = getattr(obj, "__line__", None)
+    return node
+
+
+def _decode_tree(
+    data: Any, files: list[str], secrets: Secrets | None, resolve: bool
+) -> Any:
+    """Decode a parsed YAML tree encoded by _encode_tree."""
+    if type(data) is not dict:  # noqa: E721
+        return data
+    kind = data["t"]
+    value = data["v"]
+    obj: Any
+    if kind in ("node_dict", "dict"):
+        obj = (NodeDictClass if kind == "node_dict" else dict)(
+            (
+                _decode_tree(key, files, secrets, resolve),
+                _decode_tree(item, files, secrets, resolve),
+            )
+            for key, item in value
+        )
+    elif kind in ("node_list", "list"):
+        obj = (NodeListClass if kind == "node_list" else list)(
+            _decode_tree(item, files, secrets, resolve) for item in value
+        )
+    elif kind == "node_str":
+        obj = NodeStrClass(value)
+    elif kind == "secret":
+        if not resolve:
+            return _SecretReference(value, files[data["f"]])
+        return _resolve_secret(secrets, value, files[data["f"]])
+    elif kind == "env_var":
+        if not resolve:
+            return _EnvVarReference(value)
+        return _resolve_env_var(value)
+    elif kind == "input":
+        return Input(value)
+    elif kind == "int":
+        return int(value)
+    elif kind == "float":
+        return float(value)
+    elif kind == "datetime":
+        return datetime.fromisoformat(value)
+    elif kind == "date":
+        return date.fromisoformat(value)
+    else:
+        raise ValueError(f"Unknown node type {kind}")
+    if "f" in data:
+        setattr(obj, "__config_file__", files[data["f"]])
+        setattr(obj, "__line__", data["l"])
+    return obj
+
+
+def _resolve_references(obj: Any, secrets: Secrets | None) -> Any:
+    """Replace the references to secrets and environment variables in a tree."""
+    obj_type = type(obj)
+    if obj_type is _SecretReference:
+        return _resolve_secret(secrets, obj.name, obj.fname)
+    if obj_type is _EnvVarReference:
+        return _resolve_env_var(obj.value)
+    if isinstance(obj, dict):
+        items = [
+            (_resolve_references(key, secrets), _resolve_references(value, secrets))
+            for key, value in obj.items()
+        ]
+        obj.clear()
+        obj.update(items)
+    elif isinstance(obj, list):
+        obj[:] = [_resolve_references(value, secrets) for value in obj]
+    return obj
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
     try:
@@ -167,28 +517,34 @@ def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
 
 
 def parse_yaml(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    dependencies: _FileDependencies | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
     if not HAS_C_LOADER:
-        return _parse_yaml_pure_python(content, secrets)
+        return _parse_yaml_pure_python(content, secrets, dependencies)
     try:
-        return _parse_yaml(SafeLoader, content, secrets)
+        return _parse_yaml(SafeLoader, content, secrets, dependencies)
     except yaml.YAMLError:
         # Loading failed, so we now load with the slow line loader
         # since the C one will not give us line numbers
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_pure_python(content, secrets)
+        if dependencies is not None:
+            dependencies.items.clear()
+        return _parse_yaml_pure_python(content, secrets, dependencies)
 
 
 def _parse_yaml_pure_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    dependencies: _FileDependencies | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the pure python loader (this is very slow)."""
     try:
-        return _parse_yaml(SafeLineLoader, content, secrets)
+        return _parse_yaml(SafeLineLoader, content, secrets, dependencies)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -198,12 +554,13 @@ def _parse_yaml(
     loader: type[SafeLoader] | type[SafeLineLoader],
     content: str | TextIO,
     secrets: Secrets | None = None,
+    dependencies: _FileDependencies | None = None,
 ) -> JSON_TYPE:
     """Load a YAML file."""
     # If configuration file is empty YAML returns None
     # We convert that to an empty dict
     return (
-        yaml.load(content, Loader=lambda stream: loader(stream, secrets))
+        yaml.load(content, Loader=lambda stream: loader(stream, secrets, dependencies))
         or NodeDictClass()
     )
 
@@ -244,6 +601,15 @@ def _add_reference(  # type: ignore[no-untyped-def]
     return obj
 
 
+def _load_included_yaml(loader: LoaderType, fname: str) -> JSON_TYPE:
+    """Load an included YAML file."""
+    if (dependencies := loader.dependencies) is None:
+        return load_yaml(fname, loader.secrets)
+    dependencies.items.append(("file", fname))
+    # pylint: disable-next=protected-access
+    return dependencies.snapshot._load(fname, loader.secrets, False)
+
+
 def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
@@ -253,7 +619,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.get_name()), node.value)
     try:
-        return _add_reference(load_yaml(fname, loader.secrets), loader, node)
+        return _add_reference(_load_included_yaml(loader, fname), loader, node)
     except FileNotFoundError as exc:
         raise HomeAssistantError(
             f"{node.start_mark}: Unable to read file {fname}."
@@ -275,15 +641,23 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_included_files(loader: LoaderType, directory: str) -> list[str]:
+    """Find the YAML files of an included directory."""
+    files = list(_find_files(directory, "*.yaml"))
+    if loader.dependencies is not None:
+        loader.dependencies.items.append(("dir", directory, files))
+    return files
+
+
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loader, loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        mapping[filename] = load_yaml(fname, loader.secrets)
+        mapping[filename] = _load_included_yaml(loader, fname)
     return _add_reference(mapping, loader, node)
 
 
@@ -293,10 +667,10 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loader, loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = _load_included_yaml(loader, fname)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
@@ -308,8 +682,8 @@ def _include_dir_list_yaml(
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
     return [
-        load_yaml(f, loader.secrets)
-        for f in _find_files(loc, "*.yaml")
+        _load_included_yaml(loader, f)
+        for f in _find_included_files(loader, loc)
         if os.path.basename(f) != SECRET_YAML
     ]
 
@@ -320,10 +694,10 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name()), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loader, loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = _load_included_yaml(loader, fname)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -371,25 +745,49 @@ def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
-    """Load environment variables and embed it into the configuration YAML."""
-    args = node.value.split()
+def _env_var_value(value: str) -> str | None:
+    """Return the value of an environment variable or its default."""
+    args = value.split()
 
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], " ".join(args[1:]))
-    if args[0] in os.environ:
-        return os.environ[args[0]]
-    _LOGGER.error("Environment variable %s not defined", node.value)
-    raise HomeAssistantError(node.value)
+    return os.environ.get(args[0])
 
 
-def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
-    """Load secrets and embed it into the configuration YAML."""
-    if loader.secrets is None:
+def _resolve_env_var(value: str) -> str:
+    """Return the value of an environment variable of the configuration YAML."""
+    if (resolved := _env_var_value(value)) is None:
+        _LOGGER.error("Environment variable %s not defined", value)
+        raise HomeAssistantError(value)
+    return resolved
+
+
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
+    """Load environment variables and embed it into the configuration YAML."""
+    if loader.dependencies is not None:
+        return _EnvVarReference(node.value)  # type: ignore[return-value]
+    return _resolve_env_var(node.value)
+
+
+def _resolve_secret(secrets: Secrets | None, name: str, fname: str) -> JSON_TYPE:
+    """Return the value of a secret of a YAML file."""
+    if secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
-    return loader.secrets.get(loader.get_name(), node.value)
+    return secrets.get(fname, name)
+
+
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
+    """Load secrets and embed it into the configuration YAML."""
+    if loader.dependencies is not None:
+        if loader.secrets is None:
+            raise HomeAssistantError("Secrets not supported in this YAML file")
+        # The value is resolved when the file is loaded from the snapshot
+        return _SecretReference(  # type: ignore[return-value]
+            node.value, loader.get_name()
+        )
+    return _resolve_secret(loader.secrets, node.value, loader.get_name())
 
 
 def add_constructor(tag: Any, constructor: Any) -> None:
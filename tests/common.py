@@ -147,6 +147,9 @@ def get_test_home_assistant():
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     hass = loop.run_until_complete(async_test_home_assistant(loop))
+    # Keep the manifest cache in memory, storage is not mocked here and the
+    # cache would be saved to the shared test config directory
+    hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(Mock(), None)
 
     loop_stop_event = threading.Event()
 
@@ -577,7 +580,7 @@ def mock_device_registry(
     fixture instead.
     """
     registry = dr.DeviceRegistry(hass)
-    registry.devices = dr.DeviceRegistryItems()
+    registry.devices = dr.ActiveDeviceRegistryItems()
     registry._device_data = registry.devices.data
     if mock_entries is None:
         mock_entries = {}
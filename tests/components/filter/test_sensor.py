@@ -122,10 +122,21 @@ async def test_chain_history(
     else:
         fake_states = {
             "sensor.test_monitored": [
-                State("sensor.test_monitored", "18.0", last_changed=t_0),
-                State("sensor.test_monitored", "unknown", last_changed=t_1),
-                State("sensor.test_monitored", "19.0", last_changed=t_2),
-                State("sensor.test_monitored", "18.2", last_changed=t_3),
+                State(
+                    "sensor.test_monitored", "18.2", last_changed=t_3, last_updated=t_3
+                ),
+                State(
+                    "sensor.test_monitored", "19.0", last_changed=t_2, last_updated=t_2
+                ),
+                State(
+                    "sensor.test_monitored",
+                    "unknown",
+                    last_changed=t_1,
+                    last_updated=t_1,
+                ),
+                State(
+                    "sensor.test_monitored", "18.0", last_changed=t_0, last_updated=t_0
+                ),
             ]
         }
 
@@ -148,7 +159,7 @@ async def test_chain_history(
         if missing:
             assert state.state == "18.05"
         else:
-            assert state.state == "17.05"
+            assert state.state == "17.13"
 
 
 async def test_source_state_none(recorder_mock: Recorder, hass: HomeAssistant) -> None:
@@ -228,9 +239,9 @@ async def test_history_time(recorder_mock: Recorder, hass: HomeAssistant) -> Non
 
     fake_states = {
         "sensor.test_monitored": [
-            State("sensor.test_monitored", "18.0", last_changed=t_0),
-            State("sensor.test_monitored", "19.0", last_changed=t_1),
-            State("sensor.test_monitored", "18.2", last_changed=t_2),
+            State("sensor.test_monitored", "18.2", last_changed=t_2, last_updated=t_2),
+            State("sensor.test_monitored", "19.0", last_changed=t_1, last_updated=t_1),
+            State("sensor.test_monitored", "18.0", last_changed=t_0, last_updated=t_0),
         ]
     }
     with patch(
@@ -249,6 +260,50 @@ async def test_history_time(recorder_mock: Recorder, hass: HomeAssistant) -> Non
         assert state.state == "18.0"
 
 
+async def test_history_items_with_attribute_changes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test loading the last states also replays changes of only the attributes."""
+    config = {
+        "sensor": {
+            "platform": "filter",
+            "name": "test",
+            "entity_id": "sensor.test_monitored",
+            "filters": [
+                {
+                    "filter": "lowpass",
+                    "window_size": 3,
+                    "time_constant": 10,
+                    "precision": 2,
+                }
+            ],
+        },
+    }
+
+    t_0 = dt_util.utcnow() - timedelta(minutes=1)
+    t_1 = dt_util.utcnow() - timedelta(minutes=2)
+    t_2 = dt_util.utcnow() - timedelta(minutes=3)
+
+    fake_states = {
+        "sensor.test_monitored": [
+            State("sensor.test_monitored", "10.0", last_changed=t_2, last_updated=t_2),
+            State("sensor.test_monitored", "20.0", last_changed=t_1, last_updated=t_1),
+            # Only the attributes changed
+            State("sensor.test_monitored", "20.0", last_changed=t_1, last_updated=t_0),
+        ]
+    }
+    with patch(
+        "homeassistant.components.recorder.history.get_last_state_changes",
+        return_value=fake_states,
+    ):
+        with assert_setup_component(1, "sensor"):
+            assert await async_setup_component(hass, "sensor", config)
+            await hass.async_block_till_done()
+
+        state = hass.states.get("sensor.test")
+        assert state.state == "11.9"
+
+
 async def test_setup(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Test if filter attributes are inherited."""
     config = {
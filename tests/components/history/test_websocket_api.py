@@ -401,6 +401,43 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period returns the same result when columnar."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "1", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "2.5", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    results = []
+    for msg_id, columnar in enumerate((False, True), 1):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "significant_changes_only": False,
+                "columnar": columnar,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        results.append(response["result"])
+
+    assert [state["s"] for state in results[0]["sensor.test"]] == ["1", "2.5", "off"]
+    assert results[1] == results[0]
+
+
 async def test_history_during_period_bad_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -523,6 +560,64 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_client_does_not_catch_up(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test history stream ends quietly when the client does not catch up."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on")
+    await async_recorder_block_till_done(hass)
+    await asyncio.sleep(0.00001)
+    hass.states.async_set("sensor.two", "off")
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    async def _async_send_message_and_time_out(connection, msg_id, message):
+        connection.send_message(message)
+        connection.subscriptions.pop(msg_id)()
+        raise TimeoutError
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "MAX_HISTORY_STATES_PER_MESSAGE", 1), patch(
+        "homeassistant.components.websocket_api.connection.ActiveConnection.async_send_message_and_wait",
+        autospec=True,
+        side_effect=_async_send_message_and_time_out,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        await hass.async_block_till_done()
+
+    # No error is sent for the stream
+    await client.send_json({"id": 2, "type": "ping"})
+    response = await client.receive_json()
+    assert response == {"id": 2, "type": "pong"}
+    assert "Client did not catch up with the history of 1 in time" in caplog.text
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -340,6 +340,46 @@ async def test_measure_multiple(recorder_mock: Recorder, hass: HomeAssistant) ->
     assert hass.states.get("sensor.sensor4").state == "50.0"
 
 
+async def test_history_loaded_without_attributes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the history is loaded without the attributes it does not use."""
+    start_time = dt_util.utcnow() - timedelta(minutes=60)
+
+    def _fake_states(*args, **kwargs):
+        return {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=start_time),
+            ]
+        }
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        side_effect=_fake_states,
+    ) as state_changes_during_period:
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "test",
+                    "state": "on",
+                    "start": "{{ as_timestamp(utcnow()) - 3600 }}",
+                    "end": "{{ utcnow() }}",
+                    "type": "time",
+                }
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert state_changes_during_period.call_args_list
+    for call in state_changes_during_period.call_args_list:
+        assert call.kwargs["no_attributes"] is True
+    assert float(hass.states.get("sensor.test").state) == pytest.approx(1.0, abs=0.01)
+
+
 async def test_measure(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Test the history statistics sensor measure."""
     start_time = dt_util.utcnow() - timedelta(minutes=60)
@@ -1255,7 +1295,7 @@ async def test_measure_from_end_going_backwards(
     with patch(
         "homeassistant.components.recorder.history.state_changes_during_period",
         _fake_states,
-    ), freeze_time(start_time):
+    ), freeze_time(t2 + timedelta(minutes=40)):
         await async_setup_component(
             hass,
             "sensor",
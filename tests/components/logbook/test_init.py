@@ -154,6 +154,32 @@ async def test_service_call_create_logbook_entry_invalid_entity_id(
     assert events[0][logbook.ATTR_MESSAGE] == "is triggered"
 
 
+async def test_get_events_chunk(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test getting events in chunks gives the same events."""
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_block_till_done()
+    for idx in range(5):
+        hass.bus.async_fire(
+            logbook.EVENT_LOGBOOK_ENTRY,
+            {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: f"is triggered {idx}"},
+        )
+    await async_wait_recording_done(hass)
+    event_processor = EventProcessor(hass, (EVENT_LOGBOOK_ENTRY,))
+    start = dt_util.utcnow() - timedelta(hours=1)
+    end = dt_util.utcnow() + timedelta(hours=1)
+
+    chunks = []
+    chunk_start: datetime | None = start
+    while chunk_start is not None:
+        chunk, chunk_start = await hass.async_add_executor_job(
+            event_processor.get_events_chunk, chunk_start, end, 2
+        )
+        chunks.append(chunk)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    events = await hass.async_add_executor_job(event_processor.get_events, start, end)
+    assert [event for chunk in chunks for event in chunk] == events
+
+
 async def test_service_call_create_log_book_entry_no_message(hass_) -> None:
     """Test if service call create log book entry without message."""
     calls = async_capture_events(hass_, logbook.EVENT_LOGBOOK_ENTRY)
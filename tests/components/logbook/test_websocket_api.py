@@ -1740,6 +1740,67 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_logbook_stream_client_does_not_catch_up(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test logbook stream ends quietly when the client does not catch up."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    hass.states.async_set("light.small", STATE_ON)
+    await asyncio.sleep(0.00001)
+    hass.states.async_set("light.small", STATE_OFF)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    async def _async_send_message_and_time_out(connection, msg_id, message):
+        connection.send_message(message)
+        connection.subscriptions.pop(msg_id)()
+        raise TimeoutError
+
+    websocket_client = await hass_ws_client()
+    with patch.object(websocket_api, "MAX_LOGBOOK_EVENTS_PER_MESSAGE", 1), patch(
+        "homeassistant.components.websocket_api.connection.ActiveConnection.async_send_message_and_wait",
+        autospec=True,
+        side_effect=_async_send_message_and_time_out,
+    ):
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+                "entity_ids": ["light.small"],
+            }
+        )
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == TYPE_RESULT
+        assert msg["success"]
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        await hass.async_block_till_done()
+
+    # No error is sent for the stream
+    await websocket_client.send_json({"id": 8, "type": "ping"})
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg == {"id": 8, "type": "pong"}
+    assert "Client did not catch up with the logbook events of 7 in time" in caplog.text
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
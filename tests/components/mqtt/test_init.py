@@ -1071,6 +1071,38 @@ async def test_subscribe_topic_level_wildcard(
     assert calls[0].payload == "test-payload"
 
 
+async def test_subscribe_wildcard_after_message_received(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test subscribing and unsubscribing wildcards after a topic was matched."""
+    await mqtt_mock_entry()
+    calls_a: list[ReceiveMessage] = []
+    calls_b: list[ReceiveMessage] = []
+
+    unsub_a = await mqtt.async_subscribe(hass, "test-topic/#", calls_a.append)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls_a) == 1
+
+    unsub_b = await mqtt.async_subscribe(hass, "test-topic/+/on", calls_b.append)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls_a) == 2
+    assert len(calls_b) == 1
+
+    unsub_a()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls_a) == 2
+    assert len(calls_b) == 2
+
+    unsub_b()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls_b) == 2
+
+
 async def test_subscribe_topic_level_wildcard_no_subtree_match(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
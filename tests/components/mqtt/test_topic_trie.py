@@ -0,0 +1,116 @@
+"""The tests for the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("a/b", "a/b", True),
+        ("a/b", "a/b/c", False),
+        ("a/+", "a/b", True),
+        ("a/+", "a", False),
+        ("a/+", "a/b/c", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("+/+", "/b", True),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "b/c", False),
+        ("#", "a/b", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_topic_matches_filter(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching a topic against a single topic filter and the reverse."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.matches(topic) == (["value"] if matches else [])
+    topics: TopicTrie[str] = TopicTrie()
+    topics.add(topic, "value")
+    assert topics.matched_by(topic_filter) == (["value"] if matches else [])
+
+
+def test_topic_trie_matches() -> None:
+    """Test matching a topic against multiple topic filters."""
+    trie: TopicTrie[int] = TopicTrie()
+    trie.add("#", 1)
+    trie.add("home/+/state", 2)
+    trie.add("home/kitchen/state", 3)
+    trie.add("home/+/state", 4)
+    trie.add("home/#", 5)
+    trie.add("office/#", 6)
+
+    assert sorted(trie.matches("home/kitchen/state")) == [1, 2, 3, 4, 5]
+    assert trie.matches("home") == [5, 1]
+    assert trie.matches("office/desk") == [6, 1]
+    assert trie.matches("garden") == [1]
+    # Values of the same topic filter keep the order they were added in
+    matched = trie.matches("home/hall/state")
+    assert matched.index(2) < matched.index(4)
+
+
+def test_topic_trie_add_remove() -> None:
+    """Test adding and removing values."""
+    trie: TopicTrie[int] = TopicTrie()
+    trie.add("home/+/state", 1)
+    trie.add("home/+/state", 2)
+    trie.add("home/#", 3)
+    assert len(trie) == 3
+    assert sorted(trie) == [1, 2, 3]
+    assert "home/+/state" in trie
+    assert "home/+" not in trie
+    assert "home/+/state/other" not in trie
+
+    trie.remove("home/+/state", 1)
+    assert trie.matches("home/kitchen/state") == [2, 3]
+    trie.remove("home/+/state", 2)
+    assert "home/+/state" not in trie
+    assert trie.matches("home/kitchen/state") == [3]
+
+    with pytest.raises(KeyError):
+        trie.remove("home/+/state", 2)
+    with pytest.raises(KeyError):
+        trie.remove("home/#", 1)
+
+    trie.remove("home/#", 3)
+    assert len(trie) == 0
+    assert list(trie) == []
+    assert trie.matches("home/kitchen/state") == []
+    # Levels without values are pruned
+    assert not trie._root.children
+
+
+def test_topic_trie_matched_by() -> None:
+    """Test finding the topics matched by a topic filter."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic in (
+        "home",
+        "home/kitchen/state",
+        "home/hall/state",
+        "home/hall/state/extra",
+        "office/desk",
+        "$SYS/broker",
+    ):
+        trie.add(topic, topic)
+
+    assert sorted(trie.matched_by("home/+/state")) == [
+        "home/hall/state",
+        "home/kitchen/state",
+    ]
+    assert sorted(trie.matched_by("home/#")) == [
+        "home",
+        "home/hall/state",
+        "home/hall/state/extra",
+        "home/kitchen/state",
+    ]
+    assert trie.matched_by("home/kitchen/state") == ["home/kitchen/state"]
+    assert trie.matched_by("home/kitchen") == []
+    assert sorted(trie.matched_by("#")) == sorted(
+        topic for topic in trie if topic != "$SYS/broker"
+    )
+    assert trie.matched_by("$SYS/#") == ["$SYS/broker"]
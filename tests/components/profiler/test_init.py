@@ -225,12 +225,14 @@ async def test_log_scheduled(
     assert hass.services.has_service(DOMAIN, SERVICE_LOG_EVENT_LOOP_SCHEDULED)
 
     hass.loop.call_later(0.1, lambda: None)
+    hass.async_enable_timer_wheel(1).call_later(10, "tests.profiler", lambda: None)
 
     await hass.services.async_call(
         DOMAIN, SERVICE_LOG_EVENT_LOOP_SCHEDULED, {}, blocking=True
     )
 
     assert "Scheduled" in caplog.text
+    assert "Timer wheel: 1 pending timers of tests.profiler" in caplog.text
     caplog.clear()
 
     assert await hass.config_entries.async_unload(entry.entry_id)
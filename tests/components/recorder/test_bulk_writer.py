@@ -0,0 +1,174 @@
+"""The tests for the recorder bulk writer."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.bulk_writer import BulkWriter
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def bulk_recorder(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> Recorder:
+    """Set up a recorder that writes in bulk."""
+    return await async_setup_recorder_instance(hass, {recorder.CONF_BULK_WRITES: True})
+
+
+async def test_bulk_write_states(bulk_recorder: Recorder, hass: HomeAssistant) -> None:
+    """Test states are linked to their old states and shared attributes."""
+    attributes = {"unit_of_measurement": "W"}
+    for value in range(3):
+        hass.states.async_set("sensor.one", str(value), attributes)
+        hass.states.async_set("sensor.two", str(value), attributes)
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.one", "3", attributes)
+    hass.states.async_remove("sensor.two")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_ids = {
+            states_meta.entity_id: states_meta.metadata_id
+            for states_meta in session.query(StatesMeta)
+        }
+        assert set(metadata_ids) == {"sensor.one", "sensor.two"}
+        attributes_ids = set()
+
+        for entity_id, expected in (
+            ("sensor.one", ["0", "1", "2", "3"]),
+            ("sensor.two", ["0", "1", "2", None]),
+        ):
+            db_states = (
+                session.query(States)
+                .filter(States.metadata_id == metadata_ids[entity_id])
+                .order_by(States.state_id)
+                .all()
+            )
+            assert [db_state.state for db_state in db_states] == expected
+            assert [db_state.old_state_id for db_state in db_states] == [
+                None,
+                *(db_state.state_id for db_state in db_states[:-1]),
+            ]
+            attributes_ids.update(db_state.attributes_id for db_state in db_states[:3])
+
+        assert len(attributes_ids) == 1
+        assert (
+            session.query(StateAttributes.shared_attrs)
+            .filter(StateAttributes.attributes_id.in_(attributes_ids))
+            .scalar()
+            == '{"unit_of_measurement":"W"}'
+        )
+
+
+async def test_bulk_write_events(bulk_recorder: Recorder, hass: HomeAssistant) -> None:
+    """Test events are linked to their event types and shared data."""
+    for _ in range(3):
+        hass.bus.async_fire("bulk_event", {"some": "data"})
+    hass.bus.async_fire("bulk_event")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        event_type_id = (
+            session.query(EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "bulk_event")
+            .scalar()
+        )
+        data_ids = [
+            db_event.data_id
+            for db_event in session.query(Events)
+            .filter(Events.event_type_id == event_type_id)
+            .order_by(Events.event_id)
+        ]
+        assert len(data_ids) == 4
+        assert data_ids[0] == data_ids[1] == data_ids[2]
+        assert data_ids[3] is None
+        assert (
+            session.query(EventData.shared_data)
+            .filter(EventData.data_id == data_ids[0])
+            .scalar()
+            == '{"some":"data"}'
+        )
+
+
+async def test_bulk_write_retry_after_error(
+    bulk_recorder: Recorder, hass: HomeAssistant
+) -> None:
+    """Test rows are written once when a commit is retried."""
+    await async_wait_recording_done(hass)
+    session = bulk_recorder.event_session
+    assert session is not None
+    original_commit = session.commit
+    fail = True
+
+    def _commit_or_fail():
+        nonlocal fail
+        if fail:
+            fail = False
+            raise OperationalError("insert", {}, Exception("database is locked"))
+        original_commit()
+
+    with patch.object(session, "commit", side_effect=_commit_or_fail), patch.object(
+        recorder.core.time, "sleep"
+    ):
+        hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+        await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.one", "2", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesMeta).count() == 1
+        assert session.query(StateAttributes).count() == 1
+        db_states = session.query(States).order_by(States.state_id).all()
+        assert [db_state.state for db_state in db_states] == ["1", "2"]
+        assert db_states[1].old_state_id == db_states[0].state_id
+
+
+def test_bulk_writer_rejects_unknown_tables() -> None:
+    """Test rows of tables the writer does not know are refused."""
+    writer = BulkWriter()
+    with pytest.raises(TypeError, match="RecorderRuns cannot be written in bulk"):
+        writer.add(RecorderRuns())
+
+
+def test_bulk_writer_mysql_ids() -> None:
+    """Test the ids of a multi row INSERT are derived from the first id on MySQL."""
+    session = MagicMock()
+    dialect = session.get_bind.return_value.dialect
+    dialect.name = "mysql"
+    dialect.insert_executemany_returning_sort_by_parameter_order = False
+    increment_result = MagicMock()
+    increment_result.scalar_one.return_value = 2
+    insert_result = MagicMock(lastrowid=10)
+    session.execute.side_effect = [increment_result, insert_result]
+
+    writer = BulkWriter()
+    states_meta = [StatesMeta(entity_id=f"sensor.{idx}") for idx in range(3)]
+    for meta in states_meta:
+        writer.add(meta)
+    writer.commit(session)
+
+    assert [meta.metadata_id for meta in states_meta] == [10, 12, 14]
+    # All rows are written with one statement
+    assert session.execute.call_count == 2
+    session.commit.assert_called_once()
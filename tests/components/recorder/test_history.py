@@ -5,6 +5,7 @@ from collections.abc import Callable
 from copy import copy
 from datetime import datetime, timedelta
 import json
+from typing import Any
 from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
@@ -30,7 +31,7 @@ from homeassistant.components.recorder.models.legacy import (
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
 import homeassistant.util.dt as dt_util
 
 from .common import (
@@ -735,6 +736,165 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.parametrize("include_start_time_state", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+def test_get_significant_states_columnar(
+    hass_recorder: Callable[..., HomeAssistant],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test columnar history serializes the same as the compressed state format."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    numeric_states = {
+        "sensor.numeric": ["1.5", "-2.25", "1.5", "3.0"],
+        "sensor.mixed": ["1.5", "unavailable", "20", "1.5"],
+    }
+    with freeze_time(four) as freezer:
+        for values in zip(*numeric_states.values()):
+            freezer.tick()
+            for entity_id, value in zip(numeric_states, values):
+                hass.states.set(entity_id, value, {"unit_of_measurement": "W"})
+            wait_recording_done(hass)
+
+    entity_ids = [*states, *numeric_states, "sensor.unknown"]
+    start = zero + timedelta(seconds=2)
+    end = four + timedelta(seconds=10)
+    columns = history.get_significant_states_columnar(
+        hass,
+        start,
+        end,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+    assert columns is not None
+    assert columns.entities["sensor.numeric"].numeric
+    assert not columns.entities["sensor.mixed"].numeric
+    assert columns.to_json() == JSON_DUMP(
+        history.get_significant_states(
+            hass,
+            start,
+            end,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+@pytest.mark.parametrize("include_start_time_state", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+def test_get_significant_states_chunk(
+    hass_recorder: Callable[..., HomeAssistant],
+    chunk_size: int,
+    include_start_time_state: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test joining the chunks gives the same states as the compressed state format."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    entity_ids = [*states, "sensor.unknown"]
+    start = zero + timedelta(seconds=2)
+    end = four + timedelta(seconds=10)
+    joined: dict[str, list[dict[str, Any]]] = {}
+    cursor: history.SignificantStatesCursor | None = None
+    while True:
+        chunk, cursor = history.get_significant_states_chunk(
+            hass,
+            start,
+            end,
+            entity_ids,
+            chunk_size,
+            include_start_time_state,
+            True,
+            minimal_response,
+            no_attributes,
+            cursor,
+        )
+        states_in_chunk = sum(len(entity_states) for entity_states in chunk.values())
+        assert states_in_chunk <= chunk_size
+        for entity_id, entity_states in chunk.items():
+            joined.setdefault(entity_id, []).extend(entity_states)
+        if cursor is None:
+            break
+
+    assert joined == history.get_significant_states(
+        hass,
+        start,
+        end,
+        entity_ids,
+        None,
+        include_start_time_state,
+        True,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_get_significant_states_chunk_same_update(
+    hass_recorder: Callable[..., HomeAssistant], chunk_size: int
+) -> None:
+    """Test rows of the same update are neither split nor skipped between chunks."""
+    hass = hass_recorder()
+    entity_ids = ["sensor.first", "sensor.second"]
+    zero = dt_util.utcnow()
+    with freeze_time(zero):
+        for entity_id in entity_ids:
+            hass.states.set(entity_id, "0")
+        wait_recording_done(hass)
+    with freeze_time(zero + timedelta(seconds=2)):
+        # Several rows with the same last_updated
+        for value in ("1", "2", "3"):
+            hass.states.set("sensor.first", value)
+        wait_recording_done(hass)
+    with freeze_time(zero + timedelta(seconds=3)):
+        for entity_id in entity_ids:
+            hass.states.set(entity_id, "4")
+        wait_recording_done(hass)
+
+    start = zero + timedelta(seconds=1)
+    end = zero + timedelta(seconds=10)
+    joined: dict[str, list[dict[str, Any]]] = {}
+    cursor: history.SignificantStatesCursor | None = None
+    with patch.object(
+        history.modern,
+        "_get_start_time_state_stmt",
+        wraps=history.modern._get_start_time_state_stmt,
+    ) as start_time_state_stmt:
+        while True:
+            chunk, cursor = history.get_significant_states_chunk(
+                hass, start, end, entity_ids, chunk_size, after=cursor
+            )
+            for entity_id, entity_states in chunk.items():
+                joined.setdefault(entity_id, []).extend(entity_states)
+            if cursor is None:
+                break
+
+    # The states at the start time are only selected with the first chunk
+    assert start_time_state_stmt.call_count == 1
+    assert len(joined["sensor.first"]) == 5
+    assert len(joined["sensor.second"]) == 2
+    assert joined == history.get_significant_states(
+        hass, start, end, entity_ids, compressed_state_format=True
+    )
+
+
 def record_states(hass) -> tuple[datetime, datetime, dict[str, list[State]]]:
     """Record some test states.
 
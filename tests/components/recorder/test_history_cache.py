@@ -0,0 +1,264 @@
+"""The tests for the recorder history cache."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from functools import partial
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+ENTITY_ID = "binary_sensor.test"
+
+
+async def _async_record_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, start: datetime
+) -> None:
+    """Record state changes one minute apart and a change of only the attributes."""
+    for minute, state in enumerate(("on", "off", "on", "off"), 1):
+        freezer.move_to(start + timedelta(minutes=minute))
+        hass.states.async_set(ENTITY_ID, state)
+    freezer.move_to(start + timedelta(minutes=5))
+    hass.states.async_set(ENTITY_ID, "off", {"any": "attribute"})
+    await async_wait_recording_done(hass)
+
+
+def _states(states: list[State]) -> list[tuple[str, datetime]]:
+    """Return the state and last changed of states."""
+    return [(state.state, state.last_changed) for state in states]
+
+
+async def test_requests_share_a_load(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test requests which arrive together are answered from one query."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer, start)
+    history_cache = recorder_mock.history_cache
+    middle = start + timedelta(minutes=2, seconds=30)
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        wraps=history.state_changes_during_period,
+    ) as mock_query:
+        all_changes, from_middle, until_middle = await asyncio.gather(
+            history_cache.async_state_changes(ENTITY_ID, start),
+            history_cache.async_state_changes(
+                ENTITY_ID, middle, include_start_time_state=True
+            ),
+            history_cache.async_state_changes(ENTITY_ID, start, middle),
+        )
+    assert mock_query.call_count == 1
+
+    for states, start_time, end_time, include_start_time_state in (
+        (all_changes, start, None, False),
+        (from_middle, middle, None, True),
+        (until_middle, start, middle, False),
+    ):
+        expected = await recorder_mock.async_add_executor_job(
+            partial(
+                history.state_changes_during_period,
+                hass,
+                start_time,
+                end_time,
+                ENTITY_ID,
+                include_start_time_state=include_start_time_state,
+            )
+        )
+        assert _states(states) == _states(expected[ENTITY_ID])
+    assert _states(from_middle)[0] == ("off", middle)
+
+
+async def test_cache_is_fed_by_state_changes(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the cached history is kept up to date without querying again."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer, start)
+    history_cache = recorder_mock.history_cache
+    history_cache.async_track_entity(ENTITY_ID)
+    await history_cache.async_state_changes(ENTITY_ID, start)
+
+    freezer.move_to(start + timedelta(minutes=6))
+    hass.states.async_set(ENTITY_ID, "on")
+    await hass.async_block_till_done()
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+    ) as mock_query:
+        states = await history_cache.async_state_changes(
+            ENTITY_ID, start + timedelta(minutes=3)
+        )
+    assert mock_query.call_count == 0
+    assert _states(states) == [
+        ("off", start + timedelta(minutes=4)),
+        ("on", start + timedelta(minutes=6)),
+    ]
+
+
+async def test_limit_returns_the_last_state_changes(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a limit returns the most recent state changes."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer, start)
+    history_cache = recorder_mock.history_cache
+
+    states = await history_cache.async_state_changes(
+        ENTITY_ID, datetime.fromtimestamp(0, tz=dt_util.UTC), limit=2
+    )
+    assert _states(states) == [
+        ("on", start + timedelta(minutes=3)),
+        ("off", start + timedelta(minutes=4)),
+    ]
+    states = await history_cache.async_state_changes(
+        ENTITY_ID, start + timedelta(minutes=3, seconds=30), limit=2
+    )
+    assert _states(states) == [("off", start + timedelta(minutes=4))]
+
+
+async def test_ring_is_bounded(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test state changes which dropped out of the ring are loaded again."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer, start)
+    history_cache = recorder_mock.history_cache
+    history_cache.async_track_entity(ENTITY_ID)
+
+    with patch(
+        "homeassistant.components.recorder.history_cache.MAX_STATES_PER_ENTITY", 2
+    ), patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        wraps=history.state_changes_during_period,
+    ) as mock_query:
+        await history_cache.async_state_changes(ENTITY_ID, start)
+        middle = start + timedelta(minutes=3, seconds=30)
+        states = await history_cache.async_state_changes(
+            ENTITY_ID, middle, include_start_time_state=True
+        )
+        assert mock_query.call_count == 1
+        assert _states(states) == [
+            ("on", middle),
+            ("off", start + timedelta(minutes=4)),
+        ]
+
+        states = await history_cache.async_state_changes(ENTITY_ID, start)
+        assert mock_query.call_count == 2
+    assert len(states) == 4
+
+
+async def test_untracked_history_is_dropped(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the history is only cached while the entity is tracked."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer, start)
+    history_cache = recorder_mock.history_cache
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        wraps=history.state_changes_during_period,
+    ) as mock_query:
+        await history_cache.async_state_changes(ENTITY_ID, start)
+        await history_cache.async_state_changes(ENTITY_ID, start)
+        assert mock_query.call_count == 2
+        assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+        release = history_cache.async_track_entity(ENTITY_ID)
+        release_other = history_cache.async_track_entity(ENTITY_ID)
+        await history_cache.async_state_changes(ENTITY_ID, start)
+        await history_cache.async_state_changes(ENTITY_ID, start)
+        assert mock_query.call_count == 3
+        assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners + 1
+
+        release()
+        release()
+        await history_cache.async_state_changes(ENTITY_ID, start)
+        assert mock_query.call_count == 3
+
+        release_other()
+        assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+        await history_cache.async_state_changes(ENTITY_ID, start)
+        assert mock_query.call_count == 4
+
+
+async def test_no_attributes(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a window loaded without attributes only answers requests without."""
+    start = dt_util.utcnow()
+    freezer.move_to(start + timedelta(minutes=1))
+    hass.states.async_set(ENTITY_ID, "on", {"any": "attribute"})
+    await async_wait_recording_done(hass)
+    history_cache = recorder_mock.history_cache
+    history_cache.async_track_entity(ENTITY_ID)
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        wraps=history.state_changes_during_period,
+    ) as mock_query:
+        states = await history_cache.async_state_changes(
+            ENTITY_ID, start, no_attributes=True
+        )
+        assert mock_query.call_args.kwargs["no_attributes"] is True
+        assert [state.attributes for state in states] == [{}]
+
+        states = await history_cache.async_state_changes(ENTITY_ID, start)
+        assert mock_query.call_count == 2
+        assert mock_query.call_args.kwargs["no_attributes"] is False
+        assert [state.attributes for state in states] == [{"any": "attribute"}]
+
+        states = await history_cache.async_state_changes(
+            ENTITY_ID, start, no_attributes=True
+        )
+        assert mock_query.call_count == 2
+        assert [state.attributes for state in states] == [{"any": "attribute"}]
+
+
+async def test_past_window_is_not_cached(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a window which ended before now does not answer later requests."""
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer, start)
+    history_cache = recorder_mock.history_cache
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        wraps=history.state_changes_during_period,
+    ) as mock_query:
+        states = await history_cache.async_state_changes(
+            ENTITY_ID, start, start + timedelta(minutes=2, seconds=30)
+        )
+        assert _states(states) == [
+            ("on", start + timedelta(minutes=1)),
+            ("off", start + timedelta(minutes=2)),
+        ]
+        states = await history_cache.async_state_changes(ENTITY_ID, start)
+    assert mock_query.call_count == 2
+    assert len(states) == 4
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"exclude": {"entities": ["sensor.excluded"]}}]
+)
+async def test_entity_not_recorded(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test state changes of entities which are not recorded are not cached."""
+    start = dt_util.utcnow()
+    history_cache = recorder_mock.history_cache
+    assert await history_cache.async_state_changes("sensor.excluded", start) == []
+
+    hass.states.async_set("sensor.excluded", "1")
+    await async_wait_recording_done(hass)
+    assert await history_cache.async_state_changes("sensor.excluded", start) == []
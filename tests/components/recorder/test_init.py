@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -60,6 +61,7 @@ from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
 )
+from homeassistant.components.recorder.tasks import EventsTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
@@ -271,6 +273,49 @@ async def test_saving_state(recorder_mock: Recorder, hass: HomeAssistant) -> Non
     assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
 
 
+async def test_saving_state_batch(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test saving states that were fired as a batch."""
+    with patch(
+        "homeassistant.components.recorder.core.EventsTask", wraps=EventsTask
+    ) as mock_events_task, hass.states.async_batch():
+        for idx in range(3):
+            hass.states.async_set(f"test.recorder_{idx}", "on", {"idx": idx})
+        hass.states.async_set("test.recorder_0", "off", {"idx": 0})
+
+    assert len(mock_events_task.mock_calls) == 1
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = [
+            (states_meta.entity_id, db_state.state)
+            for db_state, states_meta in session.query(States, StatesMeta)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        ]
+    assert db_states == [
+        ("test.recorder_0", "on"),
+        ("test.recorder_1", "on"),
+        ("test.recorder_2", "on"),
+        ("test.recorder_0", "off"),
+    ]
+
+
+async def test_batch_counts_toward_backlog(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the events of a batch count one by one toward the backlog."""
+    await async_wait_recording_done(hass)
+    await async_block_recorder(hass, 0.2)
+    backlog = recorder_mock.backlog
+    with hass.states.async_batch():
+        for idx in range(5):
+            hass.states.async_set(f"test.recorder_{idx}", "on")
+    assert recorder_mock.backlog == backlog + 5
+
+    await async_wait_recording_done(hass)
+    assert recorder_mock.backlog == 0
+
+
 @pytest.mark.parametrize(
     ("dialect_name", "expected_attributes"),
     (
@@ -1779,6 +1824,59 @@ async def test_database_lock_and_unlock(
     assert len(db_events) == 1
 
 
+async def test_read_engine(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test reads outside of the recorder thread use the read engine."""
+    if recorder_db_url == "sqlite://":
+        # The read engine needs a database it can open a second time
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    config = {
+        recorder.CONF_COMMIT_INTERVAL: 0,
+        recorder.CONF_DB_URL: recorder_db_url,
+        recorder.CONF_DB_READ_POOL_SIZE: 2,
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+    assert instance.read_engine is not None
+    assert instance.read_engine is not instance.engine
+
+    hass.bus.async_fire("EVENT_TEST", {"test_attr": 5})
+    await async_wait_recording_done(hass)
+
+    def _get_db_events() -> tuple[Engine | Connection | None, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                session.get_bind(),
+                session.query(Events)
+                .filter(
+                    Events.event_type_id.in_(select_event_type_ids(("EVENT_TEST",)))
+                )
+                .count(),
+            )
+
+    bind, events = await instance.async_add_executor_job(_get_db_events)
+    assert bind is instance.read_engine
+    assert events == 1
+    assert instance.reader_stats.as_dict()["queries"] > 0
+
+    with session_scope(hass=hass) as session:
+        assert session.get_bind() is instance.engine
+
+    binds: list[Engine | Connection | None] = []
+
+    class GetReadBind(recorder.tasks.RecorderTask):
+        def run(self, instance: Recorder) -> None:
+            with session_scope(hass=hass, read_only=True) as session:
+                binds.append(session.get_bind())
+
+    instance.queue_task(GetReadBind())
+    await async_wait_recording_done(hass)
+    assert binds == [instance.engine]
+
+
 async def test_database_lock_and_overflow(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
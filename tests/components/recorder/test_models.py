@@ -82,6 +82,33 @@ def test_from_event_to_db_state_attributes() -> None:
     assert db_attrs.to_native() == attrs
 
 
+async def test_shared_attrs_bytes_are_shared(hass: HomeAssistant) -> None:
+    """Test states with nothing to exclude reuse the JSON of their attributes."""
+    hass.states.async_set(
+        "sensor.temperature",
+        "18",
+        {"unit_of_measurement": "°C", "supported_features": 1},
+    )
+    hass.states.async_set("sensor.humidity", "50", {"unit_of_measurement": "%"})
+    dialect = SupportedDialect.MYSQL
+
+    def _shared_attrs_bytes(entity_id: str) -> bytes:
+        state = hass.states.get(entity_id)
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": None, "new_state": state},
+        )
+        return StateAttributes.shared_attrs_bytes_from_event(event, {}, {}, dialect)
+
+    humidity_bytes = _shared_attrs_bytes("sensor.humidity")
+    assert humidity_bytes == b'{"unit_of_measurement":"%"}'
+    assert humidity_bytes is hass.states.get("sensor.humidity").attributes_json_bytes()
+    assert (
+        _shared_attrs_bytes("sensor.temperature")
+        == '{"unit_of_measurement":"°C"}'.encode()
+    )
+
+
 def test_repr() -> None:
     """Test converting event to db state repr."""
     attrs = {"this_attr": True}
@@ -1,6 +1,8 @@
 """The tests for sensor recorder platform."""
 from collections.abc import Callable
 from datetime import timedelta
+import sys
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -1700,6 +1702,82 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("numpy_installed", [True, False])
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+def test_reduce_statistics_per_day(timezone: str, numpy_installed: bool) -> None:
+    """Test reducing hourly statistics to days across a DST change."""
+    if numpy_installed:
+        pytest.importorskip("numpy")
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+    day1 = dt_util.as_utc(dt_util.parse_datetime("2023-03-25 00:00:00"))
+    day2 = dt_util.as_utc(dt_util.parse_datetime("2023-03-26 00:00:00"))
+    day3 = dt_util.as_utc(dt_util.parse_datetime("2023-03-27 00:00:00"))
+    start = day2.timestamp() - 3600
+    stats: dict[str, list[statistics.StatisticsRow]] = {
+        "sensor.test": [
+            {
+                "start": start,
+                "end": start + 3600,
+                "mean": 1.0,
+                "min": None,
+                "max": 3.0,
+                "last_reset": None,
+                "state": 1.0,
+                "sum": 1.0,
+            },
+            {
+                "start": start + 3600,
+                "end": start + 7200,
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": 2.0,
+                "sum": 2.0,
+            },
+            {
+                "start": start + 4 * 3600,
+                "end": start + 5 * 3600,
+                "mean": 4.0,
+                "min": 2.0,
+                "max": 5.0,
+                "last_reset": None,
+                "state": 3.0,
+                "sum": 4.0,
+            },
+        ]
+    }
+    # The statistics are reduced row by row when numpy can't be imported
+    with patch.dict(sys.modules, {} if numpy_installed else {"numpy": None}):
+        reduced = statistics._reduce_statistics_per_day(
+            stats, {"last_reset", "max", "mean", "min", "state", "sum"}
+        )
+    assert reduced == {
+        "sensor.test": [
+            {
+                "start": day1.timestamp(),
+                "end": day2.timestamp(),
+                "mean": 1.0,
+                "min": None,
+                "max": 3.0,
+                "last_reset": None,
+                "state": 1.0,
+                "sum": 1.0,
+            },
+            {
+                "start": day2.timestamp(),
+                "end": day3.timestamp(),
+                "mean": 4.0,
+                "min": 2.0,
+                "max": 5.0,
+                "last_reset": None,
+                "state": 3.0,
+                "sum": 4.0,
+            },
+        ]
+    }
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -2350,3 +2428,138 @@ def test_change_with_none(
     assert stats == {}
 
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+def _approx_statistics(
+    stats: dict[str, list[dict[str, Any]]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Compare floats in statistics approximately."""
+    return {
+        statistic_id: [
+            {
+                key: pytest.approx(value) if isinstance(value, float) else value
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+        for statistic_id, rows in stats.items()
+    }
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+def test_statistics_rollups(
+    hass_recorder: Callable[..., HomeAssistant], timezone: str
+) -> None:
+    """Test daily and monthly statistics match the hourly statistics."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_built
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2023-02-20 00:00:00"))
+    hours = [start + timedelta(hours=hour) for hour in range(50 * 24)]
+    mean_statistics = [
+        {
+            "start": hour_start,
+            "mean": None if idx % 23 == 0 else (idx * 7) % 11 - 3.5,
+            "min": (idx * 7) % 11 - 5.0,
+            "max": (idx * 7) % 11 + 2.0,
+        }
+        for idx, hour_start in enumerate(hours)
+        if idx % 17
+    ]
+    sum_statistics = [
+        {"start": hour_start, "state": idx % 24, "sum": idx * 0.5}
+        for idx, hour_start in enumerate(hours)
+        if idx % 13
+    ]
+    metadata = {
+        "name": None,
+        "source": "recorder",
+        "unit_of_measurement": "°C",
+    }
+    async_import_statistics(
+        hass,
+        {**metadata, "has_mean": True, "has_sum": False, "statistic_id": "sensor.mean"},
+        mean_statistics,
+    )
+    async_import_statistics(
+        hass,
+        {**metadata, "has_mean": False, "has_sum": True, "statistic_id": "sensor.sum"},
+        sum_statistics,
+    )
+    wait_recording_done(hass)
+
+    end = hours[-1] + timedelta(hours=1)
+    periods = [
+        (None, end),
+        (start, end),
+        (start + timedelta(days=1, hours=13), end - timedelta(days=2, hours=5)),
+        (start + timedelta(days=3), start + timedelta(days=3, hours=20)),
+    ]
+
+    def _query() -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        stats = {
+            period: statistics_during_period(
+                hass, start, end, {"sensor.mean", "sensor.sum"}, period
+            )
+            for period in ("day", "week", "month")
+        }
+        stats["change"] = statistics_during_period(
+            hass, start, end, {"sensor.sum"}, "month", types={"change"}
+        )
+        stats["week_sum"] = statistics_during_period(
+            hass, start, end, {"sensor.sum"}, "week", types={"sum"}
+        )
+        summaries = [
+            statistics.statistic_during_period(
+                hass, period_start, period_end, statistic_id, None, None
+            )
+            for period_start, period_end in periods
+            for statistic_id in ("sensor.mean", "sensor.sum")
+        ]
+        return stats, summaries
+
+    def _assert_rollups_match_hourly() -> None:
+        with patch.object(
+            statistics, "_reduce_statistics", wraps=statistics._reduce_statistics
+        ) as reduce_statistics:
+            stats, summaries = _query()
+        # Only the weeks with a mean are reduced from hourly statistics
+        assert reduce_statistics.call_count == 2
+        instance.statistics_rollups_built = False
+        try:
+            hourly_stats, hourly_summaries = _query()
+        finally:
+            instance.statistics_rollups_built = True
+        assert len(stats["month"]["sensor.mean"]) == 3
+        assert stats == {
+            key: _approx_statistics(value) for key, value in hourly_stats.items()
+        }
+        assert summaries == [
+            {key: pytest.approx(value) for key, value in summary.items()}
+            for summary in hourly_summaries
+        ]
+
+    _assert_rollups_match_hourly()
+
+    # Adjusting the sum adjusts the rollups
+    recorder.get_instance(hass).async_adjust_statistics(
+        "sensor.sum", start + timedelta(days=20, hours=3), 100, "°C"
+    )
+    wait_recording_done(hass)
+    _assert_rollups_match_hourly()
+
+    # The rollups are rebuilt when the time zone changes
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Asia/Kolkata"))
+    do_adhoc_statistics(hass, start=dt_util.utcnow())
+    for _ in range(10):
+        wait_recording_done(hass)
+        if instance.statistics_rollups_built:
+            break
+    assert instance.statistics_rollup_time_zone == "Asia/Kolkata"
+    assert instance.statistics_rollups_built
+    _assert_rollups_match_hourly()
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
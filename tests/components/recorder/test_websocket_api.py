@@ -1,6 +1,7 @@
 """The tests for sensor recorder platform."""
 import datetime
 from datetime import timedelta
+from pathlib import Path
 from statistics import fmean
 import threading
 from unittest.mock import ANY, patch
@@ -34,7 +35,7 @@ from .common import (
 )
 
 from tests.common import async_fire_time_changed
-from tests.typing import WebSocketGenerator
+from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 DISTANCE_SENSOR_FT_ATTRIBUTES = {
     "device_class": "distance",
@@ -2138,6 +2139,33 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_info_read_engine(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    tmp_path: Path,
+) -> None:
+    """Test getting recorder status includes the read engine stats."""
+    config = {
+        recorder.CONF_DB_URL: "sqlite:///" + str(tmp_path / "pytest.db"),
+        recorder.CONF_DB_READ_POOL_SIZE: 2,
+    }
+    await async_setup_recorder_instance(hass, config)
+    await async_wait_recording_done(hass)
+    client = await hass_ws_client()
+
+    await client.send_json({"id": 1, "type": "recorder/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["reader"] == {
+        "queue_depth": 0,
+        "queries": ANY,
+        "active_queries": 0,
+        "average_query_time": ANY,
+        "max_query_time": ANY,
+    }
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -4006,6 +4006,103 @@ def test_compile_statistics_hourly_daily_monthly_summary(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_from_accumulator(
+    hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiling statistics from the state changes folded in memory."""
+    now = dt_util.utcnow()
+    zero = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    period0 = zero + timedelta(minutes=5)
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period1 + timedelta(minutes=5)
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    energy_attributes = {**ENERGY_SENSOR_ATTRIBUTES, "state_class": "total_increasing"}
+
+    def set_state(entity_id, state, **kwargs):
+        """Set the state."""
+        hass.states.set(entity_id, state, **kwargs)
+        wait_recording_done(hass)
+
+    with freeze_time(period0 - timedelta(seconds=10)) as freezer:
+        set_state("sensor.power", "10", attributes=POWER_SENSOR_ATTRIBUTES)
+        set_state("sensor.energy", "100", attributes=energy_attributes)
+        # The accumulator starts tracking the sensors with the first compile
+        do_adhoc_statistics(hass, start=zero)
+        wait_recording_done(hass)
+
+        freezer.move_to(period0 + timedelta(minutes=1))
+        set_state("sensor.power", "20", attributes=POWER_SENSOR_ATTRIBUTES)
+        set_state("sensor.energy", "110", attributes=energy_attributes)
+        freezer.move_to(period0 + timedelta(minutes=3))
+        set_state("sensor.power", "unavailable", attributes=POWER_SENSOR_ATTRIBUTES)
+        set_state("sensor.power", "5", attributes=POWER_SENSOR_ATTRIBUTES)
+        set_state("sensor.energy", "115", attributes=energy_attributes)
+
+        with patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_states:
+            freezer.move_to(period1 + timedelta(seconds=10))
+            do_adhoc_statistics(hass, start=period0)
+            wait_recording_done(hass)
+            freezer.move_to(period2 + timedelta(seconds=10))
+            do_adhoc_statistics(hass, start=period1)
+            wait_recording_done(hass)
+        assert get_states.call_count == 0
+
+    stats = statistics_during_period(hass, period0, period="5minute")
+    assert stats == {
+        "sensor.power": [
+            {
+                "start": period0.timestamp(),
+                "end": period1.timestamp(),
+                "mean": pytest.approx(12.0),
+                "min": pytest.approx(5.0),
+                "max": pytest.approx(20.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "start": period1.timestamp(),
+                "end": period2.timestamp(),
+                "mean": pytest.approx(5.0),
+                "min": pytest.approx(5.0),
+                "max": pytest.approx(5.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ],
+        "sensor.energy": [
+            {
+                "start": period0.timestamp(),
+                "end": period1.timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(115.0),
+                "sum": pytest.approx(15.0),
+            },
+            {
+                "start": period1.timestamp(),
+                "end": period2.timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(115.0),
+                "sum": pytest.approx(15.0),
+            },
+        ],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 def record_states(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -0,0 +1,110 @@
+"""Test the sample window of the statistics sensor."""
+from datetime import datetime, timedelta
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import SampleWindow
+from homeassistant.util import dt as dt_util
+
+
+@pytest.mark.parametrize("maxlen", [None, 1, 2, 5, 600])
+def test_window_matches_recomputation(maxlen: int | None) -> None:
+    """Test the incremental statistics match recomputing them from the samples."""
+    rand = random.Random(maxlen)
+    window = SampleWindow(maxlen, order_statistics=True, extrema=True)
+    samples: list[tuple[float, datetime]] = []
+    age = dt_util.utcnow()
+
+    for _ in range(3000):
+        if samples and rand.random() < 0.3:
+            window.popleft()
+            samples.pop(0)
+        else:
+            value = (
+                float(rand.randint(0, 20))
+                if rand.random() < 0.5
+                else rand.uniform(-100, 100)
+            )
+            age += timedelta(seconds=rand.randint(0, 10))
+            window.append(value, age)
+            samples.append((value, age))
+            if maxlen is not None and len(samples) > maxlen:
+                samples.pop(0)
+
+        states = [value for value, _ in samples]
+        ages = [age for _, age in samples]
+        assert list(window.states) == states
+        assert list(window.ages) == ages
+        if not states:
+            continue
+
+        assert window.sum == pytest.approx(sum(states), abs=1e-6)
+        assert window.mean == pytest.approx(statistics.mean(states), abs=1e-9)
+        assert window.median() == statistics.median(states)
+        assert window.max == (max(states), ages[states.index(max(states))])
+        assert window.min == (min(states), ages[states.index(min(states))])
+        if len(states) < 2:
+            continue
+
+        assert window.variance == pytest.approx(statistics.variance(states), abs=1e-6)
+        percentiles = statistics.quantiles(states, n=100, method="exclusive")
+        for percentile in (1, 25, 50, 99):
+            assert window.percentile(percentile) == percentiles[percentile - 1]
+        pairs = list(zip(states, states[1:]))
+        assert window.sum_differences == pytest.approx(
+            sum(abs(second - first) for first, second in pairs), abs=1e-6
+        )
+        assert window.sum_differences_nonnegative == pytest.approx(
+            sum(
+                second - first if second >= first else second for first, second in pairs
+            ),
+            abs=1e-6,
+        )
+        seconds = [
+            (ages[index] - ages[index - 1]).total_seconds()
+            for index in range(1, len(ages))
+        ]
+        assert window.area_step == pytest.approx(
+            sum(first * second for (first, _), second in zip(pairs, seconds)),
+            abs=1e-5,
+        )
+        assert window.area_linear == pytest.approx(
+            sum(
+                0.5 * (first + second) * duration
+                for (first, second), duration in zip(pairs, seconds)
+            ),
+            abs=1e-5,
+        )
+
+
+def test_window_non_finite_values() -> None:
+    """Test the statistics recover once non finite values left the window."""
+    window = SampleWindow(3, order_statistics=True, extrema=True)
+    age = dt_util.utcnow()
+    for value in (1.0, math.inf, math.nan):
+        window.append(value, age)
+    assert math.isnan(window.mean)
+    assert math.isnan(window.median())
+    assert math.isnan(window.percentile(50))
+
+    for value in (2.0, 3.0, 4.0):
+        window.append(value, age)
+    assert window.mean == 3.0
+    assert window.variance == 1.0
+    assert window.median() == 3.0
+    assert window.max == (4.0, age)
+    assert window.min == (2.0, age)
+
+
+def test_window_binary_states() -> None:
+    """Test the sum of binary states stays an exact count."""
+    window = SampleWindow(4)
+    age = dt_util.utcnow()
+    for index, state in enumerate((True, False, True, True, False, True)):
+        window.append(state, age + timedelta(seconds=index))
+    assert window.sum == 3
+    assert isinstance(window.sum, int)
+    assert window.area_step == 2.0
@@ -2,12 +2,15 @@
 import asyncio
 from copy import deepcopy
 import datetime
+import logging
+from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 import voluptuous as vol
 
 from homeassistant import config_entries, loader
+from homeassistant.components import websocket_api
 from homeassistant.components.device_automation import toggle_entity
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
@@ -15,6 +18,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import handle_subscribe_entities
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, callback
@@ -1031,6 +1035,133 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_batch(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test state changes fired as a batch are sent in one message."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "entity_ids": {
+                    "light.permitted": True,
+                    "light.removed": True,
+                    "light.added": True,
+                }
+            }
+        }
+    )
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    state_dict = {
+        "attributes": {"color": "red"},
+        "context": {"id": msg["event"]["a"]["light.permitted"]["c"]},
+        "entity_id": "light.permitted",
+        "last_changed": msg["event"]["a"]["light.permitted"]["lc"],
+        "last_updated": msg["event"]["a"]["light.permitted"]["lc"],
+        "state": "off",
+    }
+
+    with hass.states.async_batch():
+        hass.states.async_set("light.permitted", "on", {"color": "blue"})
+        hass.states.async_set("light.not_permitted", "on")
+        hass.states.async_set("light.permitted", "on", {"effect": "help"})
+        hass.states.async_remove("light.removed")
+        hass.states.async_set("light.added", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"effect": "help"}, "c": ANY, "lc": ANY, "s": "on"},
+                "-": {"a": ["color"]},
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    _apply_entities_changes(state_dict, msg["event"]["c"]["light.permitted"])
+    new_state = hass.states.get("light.permitted")
+    assert state_dict["attributes"] == {"effect": "help"}
+    assert state_dict["state"] == "on"
+    assert state_dict["context"]["id"] == new_state.context.id
+    assert state_dict["last_changed"] == new_state.last_changed.timestamp()
+
+
+async def test_subscribe_entities_coalesces_for_slow_clients(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test entity changes are merged while the client is behind."""
+    sent: list[Any] = []
+    pending_messages = 0
+    caught_up = asyncio.Event()
+
+    async def async_wait_pending_messages(max_pending: int) -> None:
+        await caught_up.wait()
+
+    hass.data[const.DOMAIN] = {}
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__),
+        hass,
+        sent.append,
+        hass_admin_user,
+        Mock(),
+        async_wait_pending_messages,
+        lambda: pending_messages,
+    )
+    hass.states.async_set("light.kitchen", "off")
+    handle_subscribe_entities(hass, connection, {"id": 5, "type": "subscribe_entities"})
+    assert len(sent) == 2
+    sent.clear()
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert len(sent) == 1
+    assert json_loads(sent.pop())["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+    pending_messages = const.PENDING_MSG_COALESCE + 1
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    await hass.async_block_till_done()
+    assert sent == []
+
+    pending_messages = 0
+    caught_up.set()
+    await hass.async_block_till_done()
+    assert len(sent) == 1
+    assert json_loads(sent.pop())["event"] == {
+        "a": {"light.bowl": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {"light.kitchen": {"+": {"a": {"brightness": 10}, "c": ANY, "lc": ANY}}},
+    }
+
+    caught_up.clear()
+    pending_messages = const.PENDING_MSG_COALESCE + 1
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    connection.subscriptions.pop(5)()
+    caught_up.set()
+    await hass.async_block_till_done()
+    assert sent == []
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
 ) -> None:
@@ -125,3 +125,63 @@ async def test_binary_handler_registration() -> None:
     # Verify we reuse an unsubscribed prefix
     prefix, unsub = connection.async_register_binary_handler(None)
     assert prefix == 15
+
+
+async def test_send_message_and_wait(hass: HomeAssistant) -> None:
+    """Test sending messages of a subscription waits for pending messages."""
+    send_messages = []
+    wait_pending_messages = AsyncMock()
+    hass.data[DOMAIN] = {}
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__),
+        hass,
+        send_messages.append,
+        MockUser(),
+        Mock(),
+        wait_pending_messages,
+    )
+
+    await connection.async_send_message_and_wait(1, "message")
+    assert send_messages == ["message"]
+    wait_pending_messages.assert_awaited_once_with(
+        websocket_api.const.PENDING_MSG_RESUME
+    )
+
+    await connection.async_wait_pending_messages(0)
+    wait_pending_messages.assert_awaited_with(0)
+
+    # Connections without a way to wait for pending messages send right away
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__), hass, send_messages.append, MockUser(), Mock()
+    )
+    await connection.async_send_message_and_wait(1, "other")
+    assert send_messages == ["message", "other"]
+
+
+async def test_send_message_and_wait_timeout(hass: HomeAssistant) -> None:
+    """Test a subscription is ended when the client does not catch up."""
+    send_messages = []
+    client_reads = asyncio.Event()
+
+    async def _wait_pending_messages(max_pending: int) -> None:
+        await client_reads.wait()
+
+    hass.data[DOMAIN] = {}
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__),
+        hass,
+        send_messages.append,
+        MockUser(),
+        Mock(),
+        _wait_pending_messages,
+    )
+    unsub = Mock()
+    connection.subscriptions[1] = unsub
+
+    with patch.object(
+        websocket_api.const, "PENDING_MSG_RESUME_TIMEOUT", 0
+    ), pytest.raises(TimeoutError):
+        await connection.async_send_message_and_wait(1, "message")
+    assert send_messages == ["message"]
+    assert 1 not in connection.subscriptions
+    unsub.assert_called_once_with()
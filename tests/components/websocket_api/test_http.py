@@ -5,6 +5,7 @@ from typing import Any, cast
 from unittest.mock import patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+from aiohttp.test_utils import make_mocked_request
 import pytest
 
 from homeassistant.components.websocket_api import (
@@ -503,3 +504,41 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_wait_pending_messages(hass: HomeAssistant) -> None:
+    """Test waiting until pending messages have been written."""
+    handler = http.WebSocketHandler(
+        hass, make_mocked_request("GET", const.URL, app={"hass": hass})
+    )
+    writer_task = asyncio.create_task(asyncio.Event().wait())
+    handler._writer_task = writer_task
+    handler._message_queue.extend(["1", "2", "3"])
+
+    await handler._async_wait_pending_messages(3)
+
+    waiters = [
+        asyncio.create_task(handler._async_wait_pending_messages(1)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    assert not any(waiter.done() for waiter in waiters)
+
+    handler._message_queue.popleft()
+    handler._release_drained_future()
+    await asyncio.sleep(0)
+    assert not any(waiter.done() for waiter in waiters)
+
+    # A cancelled waiter does not affect the others
+    waiters[0].cancel()
+    handler._message_queue.popleft()
+    handler._release_drained_future()
+    await waiters[1]
+
+    # Waiting stops when the writer is done
+    waiter = asyncio.create_task(handler._async_wait_pending_messages(0))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    writer_task.cancel()
+    await asyncio.sleep(0)
+    handler._release_drained_future()
+    await waiter
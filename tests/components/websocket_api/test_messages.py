@@ -4,6 +4,7 @@ import pytest
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     _state_diff_event,
+    _state_diff_events,
     cached_event_message,
     message_to_json,
 )
@@ -238,6 +239,35 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_state_diff_events(hass: HomeAssistant) -> None:
+    """Test building one state_diff_message from several events."""
+    hass.states.async_set("light.window", "on", {"color": "red"})
+    hass.states.async_set("light.removed", "on")
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "off", {"color": "red"})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.window", "off", {"color": "blue"})
+    hass.states.async_remove("light.removed")
+    await hass.async_block_till_done()
+
+    window = hass.states.get("light.window")
+    added = hass.states.get("light.added")
+    assert _state_diff_events(tuple(state_change_events)) == {
+        "a": {"light.added": added.as_compressed_state()},
+        "c": {
+            "light.window": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": window.context.id,
+                    "lc": window.last_changed.timestamp(),
+                    "s": "off",
+                }
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+
 async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
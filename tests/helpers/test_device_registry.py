@@ -709,6 +709,53 @@ async def test_removing_area_id(
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_area_and_config_entry(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test looking up devices by area and config entry."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+
+    device1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id, identifiers={("hue", "0123")}
+    )
+    device2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id, identifiers={("hue", "456")}
+    )
+    device1 = device_registry.async_update_device(device1.id, area_id="kitchen")
+    device2 = device_registry.async_update_device(
+        device2.id, add_config_entry_id=config_entry_1.entry_id, area_id="kitchen"
+    )
+
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [device1, device2]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [device1, device2]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [device2]
+
+    device2 = device_registry.async_update_device(
+        device2.id,
+        area_id="living_room",
+        remove_config_entry_id=config_entry_2.entry_id,
+    )
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [device1]
+    assert dr.async_entries_for_area(device_registry, "living_room") == [device2]
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_2.entry_id)
+        == []
+    )
+
+    device_registry.async_remove_device(device1.id)
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [device2]
+
+
 async def test_specifying_via_device_create(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
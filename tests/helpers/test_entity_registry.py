@@ -1475,6 +1475,48 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_indexes() -> None:
+    """Test the config entry, device and area indexes of EntityRegistryItems."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1", "1234", "hue", config_entry_id="entry", device_id="device"
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        area_id="kitchen",
+        device_id="device",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1]
+    assert entities.get_entries_for_device_id("device") == [entry1]
+    assert entities.get_entries_for_device_id(
+        "device", include_disabled_entities=True
+    ) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry2]
+
+    # Updating an entry keeps its position in the unchanged indexes
+    entry1 = attr.evolve(entry1, area_id="kitchen", config_entry_id=None)
+    entities["test.entity1"] = entry1
+    assert entities.get_entries_for_config_entry_id("entry") == []
+    assert entities.get_entries_for_device_id(
+        "device", include_disabled_entities=True
+    ) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry2, entry1]
+
+    del entities["test.entity2"]
+    entities.pop("test.entity1")
+    assert entities.get_entries_for_device_id("device") == []
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert not entities._device_id_index
+    assert not entities._area_id_index
+    assert not entities._config_entry_id_index
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
@@ -20,6 +20,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_TIME_PATTERN_LISTENERS,
     EventStateChangedData,
     TrackStates,
     TrackTemplate,
@@ -2457,6 +2458,57 @@ async def test_track_template_rate_limit(hass: HomeAssistant) -> None:
     info.async_remove()
 
 
+async def test_track_template_aggregate(hass: HomeAssistant) -> None:
+    """Test templates aggregating states only render the changed states."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    template_sum = Template(
+        "{{ states.sensor | map(attribute='state') | map('float') | sum }}", hass
+    )
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_sum, None, timedelta(seconds=0))],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    info.async_refresh()
+    assert refresh_runs == [3.0]
+
+    with patch.object(
+        Template, "async_render_to_info", side_effect=AssertionError
+    ) as mock_render:
+        hass.states.async_set("sensor.one", "5")
+        await hass.async_block_till_done()
+        hass.states.async_set("sensor.three", "3")
+        await hass.async_block_till_done()
+        hass.states.async_remove("sensor.two")
+        await hass.async_block_till_done()
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+    assert mock_render.call_count == 0
+    assert refresh_runs == [3.0, 7.0, 10.0, 8.0]
+
+    # A state the per state filters fail on renders the full template
+    hass.states.async_set("sensor.three", "unavailable")
+    await hass.async_block_till_done()
+    assert isinstance(refresh_runs[-1], TemplateError)
+    hass.states.async_set("sensor.three", "4")
+    await hass.async_block_till_done()
+    assert refresh_runs[-1] == 9.0
+
+    info.async_remove()
+
+
 async def test_track_template_rate_limit_super(hass: HomeAssistant) -> None:
     """Test template rate limit with super template."""
     template_availability = Template(
@@ -3916,6 +3968,112 @@ async def test_periodic_task_minute(hass: HomeAssistant) -> None:
     assert len(specific_runs) == 2
 
 
+async def test_periodic_tasks_share_time_pattern(hass: HomeAssistant) -> None:
+    """Test listeners of the same time pattern share a single timer."""
+    first_runs = []
+    second_runs = []
+    other_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    scheduled = set(hass.loop._scheduled)
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsub_first = async_track_utc_time_change(
+            hass, callback(lambda x: first_runs.append(x)), minute="/5", second=0
+        )
+        unsub_second = async_track_utc_time_change(
+            hass, callback(lambda x: second_runs.append(x)), minute="/5", second="0"
+        )
+        unsub_other = async_track_utc_time_change(
+            hass,
+            callback(lambda x: other_runs.append(x)),
+            minute="/5",
+            second=0,
+            local=True,
+        )
+
+    assert (
+        len([handle for handle in hass.loop._scheduled if handle not in scheduled]) == 2
+    )
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(first_runs) == 1
+    assert len(second_runs) == 1
+    assert len(other_runs) == 1
+
+    unsub_first()
+    unsub_first()
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(first_runs) == 1
+    assert len(second_runs) == 2
+    assert len(other_runs) == 2
+
+    unsub_second()
+    unsub_other()
+    assert hass.data[TRACK_TIME_PATTERN_LISTENERS] == {}
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(second_runs) == 2
+    assert len(other_runs) == 2
+
+
+async def test_periodic_task_shared_pattern_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing listener does not keep others of its pattern from running."""
+    runs = []
+
+    @callback
+    def _fail(now: datetime) -> None:
+        raise ValueError("Boom")
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsub_fail = async_track_utc_time_change(hass, _fail, minute="/5", second=0)
+        unsub = async_track_utc_time_change(
+            hass, callback(lambda x: runs.append(x)), minute="/5", second=0
+        )
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert "Boom" in caplog.text
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+    unsub_fail()
+    unsub()
+
+
 async def test_periodic_task_hour(hass: HomeAssistant) -> None:
     """Test periodic tasks per hour."""
     specific_runs = []
@@ -4433,6 +4591,43 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_time_listeners_use_timer_wheel(hass: HomeAssistant) -> None:
+    """Test the time listeners schedule their timers on the timer wheel."""
+    timer_wheel = hass.async_enable_timer_wheel(1)
+    scheduled = set(hass.loop._scheduled)
+    calls = []
+
+    @callback
+    def action(now: datetime) -> None:
+        calls.append(now)
+
+    unsub_interval = async_track_time_interval(hass, action, timedelta(seconds=10))
+    async_call_later(hass, 5, action)
+    async_track_point_in_utc_time(hass, action, dt_util.utcnow() + timedelta(seconds=5))
+    unsub_pattern = async_track_utc_time_change(
+        hass, action, second=(dt_util.utcnow().second + 30) % 60
+    )
+    assert timer_wheel.pending_timers() == {__name__: 4}
+    # All four timers share a single event loop timer
+    assert [
+        handle
+        for handle in hass.loop._scheduled
+        if handle not in scheduled and not handle.cancelled()
+    ] == [timer_wheel._handle]
+
+    # The two timers may be in neighbouring slots and the timer wheel only
+    # schedules the next slot once the first one has fired
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert timer_wheel.pending_timers() == {__name__: 2}
+
+    unsub_interval()
+    unsub_pattern()
+    assert timer_wheel.pending_timers() == {}
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
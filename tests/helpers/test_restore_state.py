@@ -1,9 +1,10 @@
 """The tests for the Restore component."""
 from collections.abc import Coroutine
+from copy import deepcopy
 from datetime import datetime, timedelta
 import logging
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -15,8 +16,11 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
+    CHANGES_STORAGE_KEY,
     DATA_RESTORE_STATE,
+    DUMPS_BETWEEN_COMPACTIONS,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -115,6 +119,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     entity = RestoreEntity()
     entity.hass = hass
     entity.entity_id = "input_boolean.b1"
+    data.async_restore_entity_added(entity)
 
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
@@ -124,6 +129,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -163,6 +169,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     entity = RestoreEntity()
     entity.hass = hass
     entity.entity_id = "input_boolean.b1"
+    data.async_restore_entity_added(entity)
 
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
@@ -190,6 +197,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -207,6 +215,186 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that periodic writes only save the changed states."""
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+    await hass.async_block_till_done()
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for idx in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entity._attr_should_poll = False
+        await platform.async_add_entities([entity])
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 4
+
+    # Nothing is written without changes
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(minutes=15))
+    await hass.async_block_till_done()
+    assert CHANGES_STORAGE_KEY not in hass_storage
+
+    for dump in range(DUMPS_BETWEEN_COMPACTIONS):
+        hass.states.async_set("input_boolean.b1", f"on_{dump}")
+        async_fire_time_changed(hass, now + timedelta(minutes=15 * (dump + 2)))
+        await hass.async_block_till_done()
+
+        changes = hass_storage[CHANGES_STORAGE_KEY]["data"]
+        assert len(changes) == 1
+        assert changes[0]["state"]["entity_id"] == "input_boolean.b1"
+        assert changes[0]["state"]["state"] == f"on_{dump}"
+        stored_states = {
+            item["state"]["entity_id"]: item["state"]["state"]
+            for item in hass_storage[STORAGE_KEY]["data"]
+        }
+        assert stored_states["input_boolean.b1"] == "unknown"
+
+    # The changed states are applied when loading
+    restored = RestoreStateData(hass)
+    await restored.async_load()
+    assert restored.async_get_stored_state("input_boolean.b0").state.state == (
+        "unknown"
+    )
+    assert restored.async_get_stored_state("input_boolean.b1").state.state == (
+        f"on_{DUMPS_BETWEEN_COMPACTIONS - 1}"
+    )
+
+    # All states are saved again after DUMPS_BETWEEN_COMPACTIONS
+    hass.states.async_set("input_boolean.b2", "on")
+    async_fire_time_changed(
+        hass, now + timedelta(minutes=15 * (DUMPS_BETWEEN_COMPACTIONS + 2))
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[CHANGES_STORAGE_KEY]["data"] == []
+    stored_states = {
+        item["state"]["entity_id"]: item["state"]["state"]
+        for item in hass_storage[STORAGE_KEY]["data"]
+    }
+    assert stored_states == {
+        "input_boolean.b0": "unknown",
+        "input_boolean.b1": f"on_{DUMPS_BETWEEN_COMPACTIONS - 1}",
+        "input_boolean.b2": "on",
+        "input_boolean.b3": "unknown",
+    }
+
+
+async def test_dump_changed_extra_data(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test periodic writes save extra data which changed without a state change."""
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+    await hass.async_block_till_done()
+
+    class ExtraDataEntity(RestoreEntity):
+        """Entity with extra restore data."""
+
+        extra: dict[str, Any] = {"count": 0}
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return the extra data."""
+            return RestoredExtraData(dict(self.extra))
+
+    platform = MockEntityPlatform(hass, domain="input_number")
+    entities = []
+    for idx in range(3):
+        entity = ExtraDataEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_number.n{idx}"
+        entity._attr_should_poll = False
+        entity.extra = {"count": 0}
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    await data.async_dump_states()
+
+    # Nothing is written while the extra data is the same
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(minutes=15))
+    await hass.async_block_till_done()
+    assert CHANGES_STORAGE_KEY not in hass_storage
+
+    entities[1].extra = {"count": 1}
+    with patch(
+        "homeassistant.helpers.restore_state.deepcopy", wraps=deepcopy
+    ) as mock_deepcopy:
+        async_fire_time_changed(hass, now + timedelta(minutes=30))
+        await hass.async_block_till_done()
+    changes = hass_storage[CHANGES_STORAGE_KEY]["data"]
+    assert [(item["state"]["entity_id"], item["extra_data"]) for item in changes] == [
+        ("input_number.n1", {"count": 1})
+    ]
+    # Only the extra data that changed is copied
+    assert mock_deepcopy.mock_calls == [call({"count": 1})]
+
+    # Saved extra data is not written again
+    async_fire_time_changed(hass, now + timedelta(minutes=45))
+    await hass.async_block_till_done()
+    assert hass_storage[CHANGES_STORAGE_KEY]["data"] == changes
+
+    # Saving all states does not copy extra data that was already saved
+    with patch(
+        "homeassistant.helpers.restore_state.deepcopy", wraps=deepcopy
+    ) as mock_deepcopy:
+        await data.async_dump_states()
+    assert mock_deepcopy.mock_calls == []
+
+    restored = RestoreStateData(hass)
+    await restored.async_load()
+    assert restored.async_get_stored_state("input_number.n1").extra_data.as_dict() == {
+        "count": 1
+    }
+
+
+async def test_load_outdated_changes(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test changed states older than the saved states are ignored."""
+    now = dt_util.utcnow()
+
+    def stored_state(entity_id: str, state: str, last_seen: datetime) -> dict:
+        return {
+            "state": {
+                "entity_id": entity_id,
+                "state": state,
+                "attributes": {},
+                "last_changed": last_seen.isoformat(),
+                "last_updated": last_seen.isoformat(),
+                "context": {"id": "01H5KMJ4ZP4H81ZH0G6YN6QTKQ", "user_id": None},
+            },
+            "last_seen": last_seen.isoformat(),
+        }
+
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [stored_state("input_boolean.b0", "on", now)],
+    }
+    hass_storage[CHANGES_STORAGE_KEY] = {
+        "version": 1,
+        "key": CHANGES_STORAGE_KEY,
+        "data": [
+            stored_state("input_boolean.b0", "off", now - timedelta(minutes=15)),
+            stored_state("input_boolean.b1", "off", now - timedelta(minutes=15)),
+        ],
+    }
+
+    data = RestoreStateData(hass)
+    await data.async_load()
+    assert data.async_get_stored_state("input_boolean.b0").state.state == "on"
+    assert data.async_get_stored_state("input_boolean.b1").state.state == "off"
+    assert data.async_get_stored_state("input_boolean.b2") is None
+
+
 async def test_hass_starting(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     hass.state = CoreState.starting
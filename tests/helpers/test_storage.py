@@ -131,6 +131,33 @@ async def test_saving_with_delay(
     }
 
 
+async def test_delayed_writes_are_not_written_early(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test delayed writes are only written once their delay has passed."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store_2 = storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}_2")
+    store_3 = storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}_3")
+    store.async_delay_save(lambda: MOCK_DATA, 1)
+    store_2.async_delay_save(lambda: MOCK_DATA2, 1.5)
+    store_3.async_delay_save(lambda: MOCK_DATA2, 5)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass_storage[store.key]["data"] == MOCK_DATA
+    assert store_2.key not in hass_storage
+    assert store_3.key not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1.5))
+    await hass.async_block_till_done()
+    assert hass_storage[store_2.key]["data"] == MOCK_DATA2
+    assert store_3.key not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert hass_storage[store_3.key]["data"] == MOCK_DATA2
+
+
 async def test_saving_on_final_write(
     hass: HomeAssistant, hass_storage: dict[str, Any]
 ) -> None:
@@ -558,6 +585,72 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
     await hass.async_stop(force=True)
 
 
+async def test_writes_are_batched(tmpdir: py.path.local) -> None:
+    """Test writes handed over together are written in one executor job."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store_2 = storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}_2")
+
+    with patch.object(
+        storage._StoreWriteScheduler,
+        "_write_pending",
+        wraps=storage._StoreWriteScheduler._write_pending,
+    ) as mock_write_pending:
+        await asyncio.gather(
+            store.async_save(MOCK_DATA), store_2.async_save(MOCK_DATA2)
+        )
+
+    assert len(mock_write_pending.mock_calls) == 1
+    assert await store.async_load() == MOCK_DATA
+    assert await store_2.async_load() == MOCK_DATA2
+
+    stats = storage.async_get_write_stats(hass)
+    for key in (store.key, store_2.key):
+        assert stats[key].writes == 1
+        assert stats[key].bytes_written == os.path.getsize(
+            hass.config.path(storage.STORAGE_DIR, key)
+        )
+
+    await hass.async_stop(force=True)
+
+
+async def test_failed_batch_write(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing batch write fails the writes without raising in the task."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    store_2 = storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}_2")
+
+    with patch.object(
+        storage._StoreWriteScheduler,
+        "_write_pending",
+        side_effect=RuntimeError("boom"),
+    ):
+        results = await asyncio.gather(
+            store.async_save(MOCK_DATA),
+            store_2.async_save(MOCK_DATA2),
+            return_exceptions=True,
+        )
+        await hass.async_block_till_done()
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert f"Error writing {MOCK_KEY}, {MOCK_KEY}_2: boom" in caplog.text
+    assert "Task exception was never retrieved" not in caplog.text
+
+    await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -11,6 +11,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from lru import LRU  # pylint: disable=no-name-in-module
 import orjson
 import pytest
 import voluptuous as vol
@@ -4073,27 +4074,55 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared between templates."""
+    template.CACHED_COMPILED_TEMPLATE_LRU.clear()
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
+    info = template.compiled_template_cache_info()
+    tpl = template.Template(template_string)
+    tpl.ensure_valid()
+    tpl2 = template.Template(template_string)
+    tpl2.ensure_valid()
+    assert tpl._compiled_code is tpl2._compiled_code
+    assert template.compiled_template_cache_info() == (
+        info.hits + 1,
+        info.misses + 1,
+        template.CACHED_COMPILED_TEMPLATES,
+        1,
     )
+
+    # The code is kept after the templates are gone
+    del tpl, tpl2
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.compiled_template_cache_info().hits == info.hits + 2
 
-    tpl2 = template.Template(
-        (template_string),
+    # Environments of another kind compile their own code
+    for hass_tpl in (
+        template.Template(template_string, hass),
+        template.Template(template_string, hass),
+    ):
+        assert hass_tpl.async_render(limited=True) == "foo=x%26y&bar=42"
+    assert template.compiled_template_cache_info() == (
+        info.hits + 3,
+        info.misses + 2,
+        template.CACHED_COMPILED_TEMPLATES,
+        2,
     )
-    tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+
+async def test_compiled_template_cache_eviction() -> None:
+    """Test the least recently used compiled templates are evicted."""
+    with patch.object(template, "CACHED_COMPILED_TEMPLATE_LRU", LRU(2)):
+        for template_string in ("{{ 1 }}", "{{ 2 }}", "{{ 1 }}", "{{ 3 }}"):
+            template.Template(template_string).ensure_valid()
+        assert [key[0] for key, _ in template.CACHED_COMPILED_TEMPLATE_LRU.items()] == [
+            "{{ 3 }}",
+            "{{ 1 }}",
+        ]
+        assert template.compiled_template_cache_info() == (1, 3, 2, 2)
 
 
 def test_is_template_string() -> None:
@@ -4578,3 +4607,111 @@ async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     assert template.CACHED_TEMPLATE_NO_COLLECT_LRU.get_size() == int(
         round(mock_entity_count * template.ENTITY_COUNT_GROWTH_FACTOR)
     )
+
+
+@pytest.mark.parametrize(
+    ("template_str", "domain"),
+    [
+        (
+            "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+            "light",
+        ),
+        ("{{ states['light'] | rejectattr('state', 'eq', 'on') | list }}", "light"),
+        (
+            "{{ states.sensor | map(attribute='state') | map('float', 0) | sum }}",
+            "sensor",
+        ),
+        ("{{ states | selectattr('state', 'in', ['on', 'off']) | first }}", None),
+        (
+            "{{ states.sensor | map(attribute='state') | reject('in', ['unknown'])"
+            " | map('float') | max | round(1) }}",
+            "sensor",
+        ),
+    ],
+)
+async def test_template_aggregate_supported(
+    hass: HomeAssistant, template_str: str, domain: str | None
+) -> None:
+    """Test templates that aggregate states are supported."""
+    tmp = template.Template(template_str, hass)
+    tmp.async_render_to_info()
+    aggregate = template.async_create_template_aggregate(tmp)
+    assert aggregate is not None
+    assert aggregate.domain == domain
+
+
+@pytest.mark.parametrize(
+    ("template_str", "variables"),
+    [
+        ("{{ states.light | count }}", None),
+        ("{{ states.light | list | count }}", None),
+        ("{{ states.light | selectattr('state', 'eq', 'on') | count }}", None),
+        ("{{ states.light | selectattr('entity_id', 'is_state', 'on') | list }}", None),
+        (
+            "{{ states.light | map(attribute='entity_id') | map('states') | list }}",
+            None,
+        ),
+        ("{{ states.light | selectattr('state', 'eq', on) | list }}", None),
+        ("Lights: {{ states.light | selectattr('state', 'eq', 'on') | list }}", None),
+        ("{{ expand('group.all') | selectattr('state', 'eq', 'on') | list }}", None),
+        ("{{ states.light | map(attribute='state') | map('random') | list }}", None),
+        (
+            "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+            {"states": []},
+        ),
+    ],
+)
+async def test_template_aggregate_not_supported(
+    hass: HomeAssistant, template_str: str, variables: TemplateVarsType
+) -> None:
+    """Test templates that can not be aggregated."""
+    tmp = template.Template(template_str, hass)
+    tmp.async_render_to_info(variables)
+    assert template.async_create_template_aggregate(tmp, variables) is None
+
+
+async def test_template_aggregate(hass: HomeAssistant) -> None:
+    """Test rendering from an aggregate gives the same results as rendering."""
+    for idx in range(4):
+        hass.states.async_set(f"sensor.power_{idx}", str(idx), {"unit": "W"})
+    hass.states.async_set("light.kitchen", "on")
+    template_str = (
+        "{{ states.sensor | selectattr('attributes.unit', 'eq', 'W')"
+        " | map(attribute='state') | map('float') | list }}"
+    )
+    tmp = template.Template(template_str, hass)
+    info = tmp.async_render_to_info()
+    aggregate = template.async_create_template_aggregate(tmp)
+    assert aggregate is not None
+
+    def assert_same_result() -> None:
+        aggregate_info = aggregate.async_render_to_info(info)
+        assert aggregate_info is not None
+        assert aggregate_info.result() == tmp.async_render_to_info().result()
+        assert aggregate_info.domains == {"sensor"}
+
+    assert_same_result()
+    hass.states.async_set("sensor.power_1", "1.5", {"unit": "W"})
+    aggregate.async_update("sensor.power_1")
+    hass.states.async_set("sensor.power_2", "2", {"unit": "kW"})
+    aggregate.async_update("sensor.power_2")
+    hass.states.async_set("light.kitchen", "off")
+    aggregate.async_update("light.kitchen")
+    assert_same_result()
+
+    # Removed and added states keep the order of the state machine
+    hass.states.async_remove("sensor.power_0")
+    aggregate.async_update("sensor.power_0")
+    hass.states.async_set("sensor.power_0", "5", {"unit": "W"})
+    aggregate.async_update("sensor.power_0")
+    hass.states.async_set("sensor.power_4", "4", {"unit": "W"})
+    aggregate.async_update("sensor.power_4")
+    assert_same_result()
+
+    # The template has to be rendered when a per state filter raises
+    hass.states.async_set("sensor.power_3", "unavailable", {"unit": "W"})
+    aggregate.async_update("sensor.power_3")
+    assert aggregate.async_render_to_info(info) is None
+    hass.states.async_set("sensor.power_3", "3", {"unit": "W"})
+    aggregate.async_update("sensor.power_3")
+    assert_same_result()
@@ -1,6 +1,7 @@
 """Tests for the update coordinator."""
 import asyncio
 from datetime import timedelta
+from functools import partial
 import logging
 from unittest.mock import AsyncMock, Mock, patch
 import urllib.error
@@ -11,8 +12,8 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import update_coordinator
 from homeassistant.util.dt import utcnow
@@ -450,6 +451,62 @@ async def test_coordinator_entity(
     assert len(crd._listeners) == 0
 
 
+@pytest.mark.parametrize("batch_state_writes", [False, True])
+async def test_listener_states_batching(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+    batch_state_writes: bool,
+) -> None:
+    """Test the states written by the listeners of an update are only batched on request."""
+    crd.batch_state_writes = batch_state_writes
+    calls = []
+
+    @callback
+    def batch_listener(events):
+        calls.append([event.data["entity_id"] for event in events])
+
+    @callback
+    def state_listener(event):
+        calls.append(event.data["entity_id"])
+
+    @callback
+    def update_listener(entity_id):
+        calls.append(f"update {entity_id}")
+        hass.states.async_set(entity_id, "on")
+
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batch_listener)
+    hass.bus.async_listen(EVENT_STATE_CHANGED, state_listener, run_immediately=True)
+    unsubs = [
+        crd.async_add_listener(partial(update_listener, f"sensor.test_{idx}"))
+        for idx in range(2)
+    ]
+
+    crd.async_update_listeners()
+    await hass.async_block_till_done()
+    if batch_state_writes:
+        # state_changed listeners are called after all update listeners ran
+        assert calls == [
+            "update sensor.test_0",
+            "update sensor.test_1",
+            "sensor.test_0",
+            "sensor.test_1",
+            ["sensor.test_0", "sensor.test_1"],
+        ]
+    else:
+        assert calls == [
+            "update sensor.test_0",
+            "sensor.test_0",
+            ["sensor.test_0"],
+            "update sensor.test_1",
+            "sensor.test_1",
+            ["sensor.test_1"],
+        ]
+
+    # Call remove callbacks to cleanup debouncer and avoid lingering timer
+    for unsub in unsubs:
+        unsub()
+
+
 async def test_async_set_updated_data(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
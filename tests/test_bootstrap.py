@@ -80,7 +80,7 @@ async def test_async_enable_logging(
         mock_async_activate_log_queue_handler.assert_called_once()
         for f in glob.glob("test.log*"):
             os.remove(f)
-        for f in glob.glob("testing_config/home-assistant.log*"):
+        for f in glob.glob(hass.config.path("home-assistant.log*")):
             os.remove(f)
 
     assert "Error rolling over log file" in caplog.text
@@ -296,6 +296,208 @@ async def test_setup_frontend_before_recorder(hass: HomeAssistant) -> None:
     ]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_after_deps_on_stage_1_before_stage_1(hass: HomeAssistant) -> None:
+    """Test integrations set up before stage 1 do not wait for stage 1."""
+    # This test relies on this
+    assert "hassio" in bootstrap.STAGE_1_INTEGRATIONS
+    order = []
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            order.append(domain)
+            return True
+
+        return async_setup
+
+    for domain, manifest in (
+        ("http", {}),
+        ("onboarding", {"after_dependencies": ["hassio"]}),
+        ("frontend", {"dependencies": ["http", "onboarding"]}),
+        ("hassio", {"dependencies": ["http"]}),
+    ):
+        mock_integration(
+            hass,
+            MockModule(
+                domain=domain,
+                async_setup=gen_domain_setup(domain),
+                partial_manifest=manifest,
+            ),
+        )
+
+    async with asyncio.timeout(10):
+        await bootstrap._async_set_up_integrations(
+            hass, {"frontend": {}, "hassio": {}}
+        )
+
+    assert order == ["http", "onboarding", "frontend", "hassio"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_graph_error_does_not_hang(hass: HomeAssistant) -> None:
+    """Test bootstrap does not wait for stage 1 if the setup graph fails."""
+    with patch.object(
+        bootstrap._SetupGraph, "async_run", side_effect=Exception("Boom")
+    ), pytest.raises(Exception, match="Boom"):
+        async with asyncio.timeout(10):
+            await bootstrap._async_set_up_integrations(
+                hass, {"normal_integration": {}}
+            )
+
+
+async def test_setup_graph_logs_failed_jobs(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test failed setup jobs are logged by what they are."""
+
+    async def _async_fail() -> None:
+        raise Exception("Boom")
+
+    graph = bootstrap._SetupGraph(hass, bootstrap.SetupTimeline())
+    graph.add("failing_integration", "setup", _async_fail, set())
+    graph.add("failing requirements", "requirements", _async_fail, set())
+    await graph.async_run()
+
+    assert "Error setting up integration failing_integration" in caplog.text
+    assert "Error running setup job failing requirements" in caplog.text
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_not_held_back_by_slow_integrations(hass: HomeAssistant) -> None:
+    """Test integrations are set up as soon as their dependencies are set up."""
+    order = []
+    slow_setup = asyncio.Event()
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            if domain == "slow_integration":
+                await slow_setup.wait()
+            order.append(domain)
+            return True
+
+        return async_setup
+
+    for domain, manifest in (
+        ("recorder", {}),
+        ("slow_integration", {}),
+        ("root", {}),
+        ("first_dep", {"dependencies": ["root"]}),
+        ("second_dep", {"after_dependencies": ["first_dep", "slow_integration"]}),
+    ):
+        mock_integration(
+            hass,
+            MockModule(
+                domain=domain,
+                async_setup=gen_domain_setup(domain),
+                partial_manifest=manifest,
+            ),
+        )
+
+    setup_task = hass.async_create_task(
+        bootstrap._async_set_up_integrations(
+            hass,
+            {
+                "recorder": {},
+                "slow_integration": {},
+                "first_dep": {},
+                "second_dep": {},
+            },
+        )
+    )
+    await asyncio.sleep(0.1)
+    assert order == ["recorder", "root", "first_dep"]
+
+    slow_setup.set()
+    await setup_task
+    assert order[3:] == ["slow_integration", "second_dep"]
+
+    timeline: bootstrap.SetupTimeline = hass.data[bootstrap.DATA_SETUP_TIMELINE]
+    assert timeline.entries.keys() >= {
+        "recorder",
+        "slow_integration",
+        "root",
+        "first_dep",
+        "second_dep",
+    }
+    assert timeline.entries["first_dep"].waited_for == "root"
+    assert timeline.entries["second_dep"].waited_for == "slow_integration"
+    assert [entry.name for entry in timeline.critical_path()][-2:] == [
+        "slow_integration",
+        "second_dep",
+    ]
+
+
+async def test_setup_timeline() -> None:
+    """Test the timeline of the setup jobs."""
+    timeline = bootstrap.SetupTimeline()
+    assert timeline.critical_path() == []
+    timeline.entries = {
+        "root": bootstrap.SetupTimelineEntry("root", "setup", 0.0, 1.0),
+        "other": bootstrap.SetupTimelineEntry("other", "setup", 0.0, 0.5),
+        "child": bootstrap.SetupTimelineEntry("child", "setup", 1.0, 3.0, "root"),
+        "pending": bootstrap.SetupTimelineEntry("pending", "setup", 0.5),
+    }
+
+    assert [entry.name for entry in timeline.critical_path()] == ["root", "child"]
+    assert timeline.as_chrome_trace() == {
+        "traceEvents": [
+            {
+                "name": "root",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 0,
+                "dur": 1000000,
+                "pid": 1,
+                "tid": 0,
+                "args": {"waited_for": None, "finished": True, "critical_path": True},
+            },
+            {
+                "name": "other",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 0,
+                "dur": 500000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"waited_for": None, "finished": True, "critical_path": False},
+            },
+            {
+                "name": "pending",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 500000,
+                "dur": 0,
+                "pid": 1,
+                "tid": 1,
+                "args": {
+                    "waited_for": None,
+                    "finished": False,
+                    "critical_path": False,
+                },
+            },
+            {
+                "name": "child",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 1000000,
+                "dur": 2000000,
+                "pid": 1,
+                "tid": 0,
+                "args": {"waited_for": "root", "finished": True, "critical_path": True},
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def test_cyclic_setup_jobs() -> None:
+    """Test finding setup jobs that wait for each other."""
+    assert bootstrap._async_cyclic_jobs({"a": set(), "b": {"a"}}) == set()
+    assert bootstrap._async_cyclic_jobs(
+        {"a": {"c"}, "b": {"a"}, "c": {"b"}, "d": {"a"}, "e": set()}
+    ) == {"a", "b", "c"}
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_via_platform(hass: HomeAssistant) -> None:
     """Test after_dependencies set up via platform."""
@@ -512,6 +714,35 @@ async def test_setup_hass(
     assert hass == async_get_hass()
 
 
+@pytest.mark.parametrize("hass_config", [{"browser": {}, "frontend": {}}])
+async def test_setup_hass_startup_trace(
+    mock_hass_config: None,
+    mock_enable_logging: Mock,
+    mock_is_virtual_env: Mock,
+    mock_mount_local_lib_path: AsyncMock,
+    mock_ensure_config_exists: AsyncMock,
+    mock_process_ha_config_upgrade: Mock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test the timeline of the integration setups is written."""
+    with patch.object(bootstrap, "save_json") as mock_save_json:
+        hass = await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(
+                config_dir=get_test_config_dir(),
+                skip_pip=True,
+                startup_trace=True,
+            ),
+        )
+
+    assert len(mock_save_json.mock_calls) == 1
+    filename, trace = mock_save_json.mock_calls[0][1]
+    assert filename == hass.config.path(bootstrap.STARTUP_TRACE_FILENAME)
+    assert {event["name"] for event in trace["traceEvents"]} >= {
+        "browser",
+        "frontend",
+    }
+
+
 @pytest.mark.parametrize("hass_config", [{"browser": {}, "frontend": {}}])
 async def test_setup_hass_takes_longer_than_log_slow_startup(
     mock_hass_config: None,
@@ -807,6 +1038,43 @@ async def test_warning_logged_on_wrap_up_timeout(
     assert "Setup timed out for bootstrap - moving forward" in caplog.text
 
 
+@pytest.mark.parametrize("load_registries", [False])
+@pytest.mark.parametrize(
+    ("stage_1_integrations", "timeout", "stage"),
+    [
+        ({"slow_integration"}, "STAGE_1_TIMEOUT", "stage 1"),
+        (set(), "STAGE_2_TIMEOUT", "stage 2"),
+    ],
+)
+async def test_warning_logged_on_stage_timeout(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    stage_1_integrations: set[str],
+    timeout: str,
+    stage: str,
+) -> None:
+    """Test we log a warning for the stage that timed out."""
+
+    async def async_setup(hass, config):
+        await asyncio.sleep(0.1)
+        return True
+
+    mock_integration(
+        hass, MockModule(domain="slow_integration", async_setup=async_setup)
+    )
+
+    with patch.object(
+        bootstrap, "STAGE_1_INTEGRATIONS", stage_1_integrations
+    ), patch.object(bootstrap, timeout, 0):
+        await bootstrap._async_set_up_integrations(hass, {"slow_integration": {}})
+        await hass.async_block_till_done()
+
+    assert "slow_integration" in hass.config.components
+    assert f"Setup timed out for {stage} - moving forward" in caplog.text
+    for other_stage in {"stage 1", "stage 2"} - {stage}:
+        assert f"Setup timed out for {other_stage}" not in caplog.text
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_bootstrap_is_cancellation_safe(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
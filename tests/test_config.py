@@ -2,7 +2,9 @@
 from collections import OrderedDict
 import contextlib
 import copy
+from datetime import timedelta
 import os
+from pathlib import Path
 from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock, Mock, patch
@@ -32,6 +34,7 @@ from homeassistant.helpers import config_validation as cv, issue_registry as ir
 import homeassistant.helpers.check_config as check_config
 from homeassistant.helpers.entity import Entity
 from homeassistant.loader import async_get_integration
+import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import (
     _CONF_UNIT_SYSTEM_US_CUSTOMARY,
     METRIC_SYSTEM,
@@ -40,7 +43,7 @@ from homeassistant.util.unit_system import (
 )
 from homeassistant.util.yaml import SECRET_YAML
 
-from .common import MockUser, get_test_config_dir
+from .common import MockUser, async_fire_time_changed, get_test_config_dir
 
 CONFIG_DIR = get_test_config_dir()
 YAML_PATH = os.path.join(CONFIG_DIR, config_util.YAML_CONFIG_FILE)
@@ -777,6 +780,32 @@ async def test_async_hass_config_yaml_merge(
     assert len(conf["light"]) == 1
 
 
+async def test_async_hass_config_yaml_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test the configuration is loaded from the stored snapshot."""
+    config_path = tmp_path / config_util.YAML_CONFIG_FILE
+    config_path.write_text("light:\n  - platform: demo\n")
+
+    with patch.object(config_util, "YAML_CONFIG_FILE", str(config_path)):
+        conf = await config_util.async_hass_config_yaml(hass)
+        assert conf == {"light": [{"platform": "demo"}]}
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow() + timedelta(seconds=config_util.YAML_SNAPSHOT_SAVE_DELAY),
+        )
+        await hass.async_block_till_done()
+        data = hass_storage[config_util.YAML_SNAPSHOT_STORAGE_KEY]["data"]
+        assert str(config_path) in data["files"]
+
+        # Restart
+        hass.data.pop(config_util.DATA_YAML_SNAPSHOT)
+        assert await config_util.async_hass_config_yaml(hass) == conf
+        snapshot, _ = hass.data[config_util.DATA_YAML_SNAPSHOT]
+        assert snapshot.hits == 1
+        assert snapshot.misses == 0
+
+
 @pytest.fixture
 def merge_log_err(hass):
     """Patch _merge_log_error from packages."""
@@ -50,6 +50,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import json_bytes, json_dumps
 import homeassistant.util.dt as dt_util
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
@@ -677,6 +678,29 @@ def test_state_as_dict_json() -> None:
     assert state.as_dict_json() is as_dict_json_1
 
 
+async def test_event_as_dict_json(hass: HomeAssistant) -> None:
+    """Test the JSON of an event embeds the JSON of its states."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 0})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    event = events[0]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
+
+    assert event.data_json_bytes() == json_bytes(
+        {
+            "entity_id": "light.kitchen",
+            "old_state": old_state.as_dict(),
+            "new_state": new_state.as_dict(),
+        }
+    )
+    as_dict_json = event.as_dict_json()
+    assert as_dict_json == json_dumps(event.as_dict())
+    # 2nd time to verify cache
+    assert event.as_dict_json() is as_dict_json
+
+
 def test_state_as_compressed_state() -> None:
     """Test a State as compressed state."""
     last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
@@ -814,6 +838,291 @@ async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     unsub()
 
 
+def _key_getter(event_data):
+    """Return the key of a test event."""
+    return event_data.get("key")
+
+
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners only receive events matching their keys."""
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        other_calls.append(event)
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed("test", _key_getter, ["a", "b"], listener)
+    unsub_other = hass.bus.async_listen_keyed(
+        "test", _key_getter, ["b"], other_listener
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+    assert hass.bus.async_keyed_listeners("test") == {"a": 1, "b": 2}
+
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "b"})
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["key"] for event in calls] == ["a", "b"]
+    assert [event.data["key"] for event in other_calls] == ["b"]
+
+    unsub()
+    assert hass.bus.async_keyed_listeners("test") == {"b": 1}
+    hass.bus.async_fire("test", {"key": "b"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert len(other_calls) == 2
+
+    unsub_other()
+    assert hass.bus.async_keyed_listeners("test") == {}
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+
+async def test_eventbus_keyed_listener_unsubscribe_while_firing(
+    hass: HomeAssistant,
+) -> None:
+    """Test keyed listeners removing themselves do not skip other listeners."""
+    calls = []
+    unsubs = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener that unsubscribes itself."""
+        calls.append(event)
+        unsubs.pop(0)()
+
+    for _ in range(3):
+        unsubs.append(hass.bus.async_listen_keyed("test", _key_getter, ["a"], listener))
+
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert hass.bus.async_keyed_listeners("test") == {}
+
+
+async def test_eventbus_keyed_listener_exception(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an exception in a keyed listener does not stop other listeners."""
+    calls = []
+
+    @ha.callback
+    def bad_listener(event):
+        """Mock listener that raises."""
+        raise ValueError
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    hass.bus.async_listen_keyed("test", _key_getter, ["a"], bad_listener)
+    hass.bus.async_listen_keyed("test", _key_getter, ["a"], listener)
+
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "Error running job" in caplog.text
+
+
+async def test_eventbus_keyed_listener_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test keyed listener misuse is rejected."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    unsub = hass.bus.async_listen_keyed("test", _key_getter, ["a"], listener)
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(
+            "test", lambda data: data.get("other"), ["a"], listener
+        )
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, _key_getter, ["a"], listener)
+
+    unsub()
+    unsub()
+    assert "Unable to remove unknown keyed job listener" in caplog.text
+
+
+async def test_eventbus_batch_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test batch listeners receive events fired together in one call."""
+    batches = []
+    all_batches = []
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        batches.append([event.data["idx"] for event in events])
+
+    @ha.callback
+    def match_all_listener(events):
+        """Mock batch listener for all events."""
+        all_batches.append([event.event_type for event in events])
+
+    events = async_capture_events(hass, "test")
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_batch("test", listener)
+    unsub_all = hass.bus.async_listen_batch(MATCH_ALL, match_all_listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch("test", lambda events: None)
+
+    hass.bus.async_fire("test", {"idx": 0})
+    hass.bus.async_fire_batch(
+        "test", [ha.Event("test", {"idx": idx}) for idx in (1, 2)]
+    )
+    hass.bus.async_fire("other")
+    await hass.async_block_till_done()
+
+    assert [event.data["idx"] for event in events] == [0, 1, 2]
+    assert batches == [[0], [1, 2]]
+    assert all_batches == [["test"], ["test", "test"], ["other"]]
+
+    unsub()
+    unsub_all()
+    hass.bus.async_fire("test", {"idx": 3})
+    assert len(batches) == 2
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    unsub()
+    assert "Unable to remove unknown batch listener" in caplog.text
+
+
+async def test_statemachine_batch(hass: HomeAssistant) -> None:
+    """Test state changes in a batch are fired together when it exits."""
+    batches = []
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        batches.append(
+            [
+                (
+                    event.data["entity_id"],
+                    event.data["new_state"] and event.data["new_state"].state,
+                )
+                for event in events
+            ]
+        )
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, listener)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with hass.states.async_batch():
+        hass.states.async_set("light.bowl", "on")
+        with hass.states.async_batch():
+            hass.states.async_set("light.kitchen", "on")
+        assert hass.states.get("light.kitchen").state == "on"
+        hass.states.async_remove("light.bowl")
+        assert not batches
+    await hass.async_block_till_done()
+
+    assert batches == [
+        [("light.bowl", "on"), ("light.kitchen", "on"), ("light.bowl", None)]
+    ]
+    assert len(events) == 3
+
+    # The batch is fired if the block raises
+    with pytest.raises(ValueError), hass.states.async_batch():
+        hass.states.async_set("light.kitchen", "off")
+        raise ValueError
+    assert batches[-1] == [("light.kitchen", "off")]
+
+    # Empty batches are not fired
+    with hass.states.async_batch():
+        hass.states.async_set("light.kitchen", "off")
+    assert len(batches) == 2
+
+
+async def test_statemachine_batch_defers_run_immediately(hass: HomeAssistant) -> None:
+    """Test run_immediately listeners are called when the batch exits."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["new_state"].state)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener, run_immediately=True)
+
+    hass.states.async_set("light.bowl", "on")
+    assert calls == ["on"]
+
+    with hass.states.async_batch():
+        hass.states.async_set("light.bowl", "off")
+        hass.states.async_set("light.bowl", "on")
+        assert calls == ["on"]
+    assert calls == ["on", "off", "on"]
+
+
+async def test_statemachine_shares_attributes(hass: HomeAssistant) -> None:
+    """Test states with the same attributes share them."""
+    attributes = {"unit_of_measurement": "°C", "device_class": "temperature"}
+    hass.states.async_set("sensor.kitchen", "20", attributes)
+    hass.states.async_set("sensor.bedroom", "19", dict(attributes))
+    kitchen = hass.states.get("sensor.kitchen")
+    bedroom = hass.states.get("sensor.bedroom")
+    assert kitchen.attributes == attributes
+    assert kitchen.attributes is bedroom.attributes
+    assert type(kitchen.attributes) is ReadOnlyDict  # noqa: E721
+    assert kitchen.attributes_json_bytes() is bedroom.attributes_json_bytes()
+
+    # Updates keep the attributes if they did not change
+    hass.states.async_set("sensor.kitchen", "21", attributes)
+    assert hass.states.get("sensor.kitchen").attributes is kitchen.attributes
+
+    # Equal values of another type are not shared
+    hass.states.async_set("sensor.bedroom", "19", {"on": True})
+    hass.states.async_set("sensor.kitchen", "21", {"on": 1})
+    assert hass.states.get("sensor.bedroom").attributes["on"] is True
+    assert hass.states.get("sensor.kitchen").attributes["on"] == 1
+    assert hass.states.get("sensor.kitchen").attributes["on"] is not True
+
+    # Attributes with unhashable values are kept between updates
+    hass.states.async_set("sensor.kitchen", "21", {"options": ["a", "b"]})
+    kitchen = hass.states.get("sensor.kitchen")
+    hass.states.async_set("sensor.kitchen", "22", {"options": ["a", "b"]})
+    assert hass.states.get("sensor.kitchen").attributes is kitchen.attributes
+
+
+async def test_statemachine_keeps_attribute_types(hass: HomeAssistant) -> None:
+    """Test equal attributes of another type are not taken from the old state."""
+    for state, value in (("1", 1), ("2", 1.0), ("3", True), ("4", [1]), ("5", [1.0])):
+        hass.states.async_set("sensor.a", state, {"x": value})
+        attribute = hass.states.get("sensor.a").attributes["x"]
+        assert attribute == value
+        assert type(attribute) is type(value)  # noqa: E721
+        if isinstance(value, list):
+            assert type(attribute[0]) is type(value[0])  # noqa: E721
+
+
+async def test_state_json_with_shared_attributes(hass: HomeAssistant) -> None:
+    """Test the JSON of states embeds the JSON of their shared attributes."""
+    hass.states.async_set("sensor.kitchen", "20", {"unit_of_measurement": "°C"})
+    state = hass.states.get("sensor.kitchen")
+    assert state.as_dict_json() == json_dumps(state.as_dict())
+    assert state.as_compressed_state_json() == (
+        json_dumps({"sensor.kitchen": state.as_compressed_state()})[1:-1]
+    )
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -838,6 +1147,42 @@ async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     assert len(calls) == 1
 
 
+async def test_eventbus_change_listeners_while_firing(hass: HomeAssistant) -> None:
+    """Test listeners changed while firing only apply to the next event."""
+    calls = []
+
+    @ha.callback
+    def added_listener(event):
+        """Mock listener added while firing."""
+        calls.append("added")
+
+    @ha.callback
+    def first_listener(event):
+        """Mock listener that changes the listeners."""
+        calls.append("first")
+        unsub_second()
+        unsubs.append(
+            hass.bus.async_listen("test", added_listener, run_immediately=True)
+        )
+
+    @ha.callback
+    def second_listener(event):
+        """Mock listener removed while firing."""
+        calls.append("second")
+
+    unsubs = [hass.bus.async_listen("test", first_listener, run_immediately=True)]
+    unsub_second = hass.bus.async_listen("test", second_listener, run_immediately=True)
+
+    hass.bus.async_fire("test")
+    assert calls == ["first", "second"]
+
+    calls.clear()
+    unsubs.pop(0)()
+    hass.bus.async_fire("test")
+    assert calls == ["added"]
+    assert hass.bus.async_listeners()["test"] == 1
+
+
 async def test_eventbus_listen_once_event_with_callback(hass: HomeAssistant) -> None:
     """Test listen_once_event method."""
     runs = []
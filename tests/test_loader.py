@@ -1,14 +1,24 @@
 """Test to verify that we can load components."""
-from unittest.mock import patch
+from datetime import timedelta
+import pathlib
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass: HomeAssistant) -> None:
@@ -733,3 +743,98 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: pathlib.Path
+) -> None:
+    """Test manifests and directory listings are cached."""
+    manifest_cache = await loader.async_get_manifest_cache(hass)
+    manifest_path = tmp_path / "test" / "manifest.json"
+    manifest_path.parent.mkdir()
+    assert manifest_cache.get_manifest(manifest_path) is None
+    assert manifest_cache.get_sub_directories(str(tmp_path)) == ["test"]
+
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+    manifest = manifest_cache.get_manifest(manifest_path)
+    assert manifest == {"domain": "test", "name": "Test"}
+    manifest["is_built_in"] = False
+    with patch.object(loader, "json_loads", side_effect=AssertionError):
+        assert manifest_cache.get_manifest(manifest_path) == {
+            "domain": "test",
+            "name": "Test",
+        }
+
+    # Changed files are parsed again
+    manifest_path.write_text('{"domain": "test", "name": "Changed"}')
+    assert manifest_cache.get_manifest(manifest_path) == {
+        "domain": "test",
+        "name": "Changed",
+    }
+    (tmp_path / "other").mkdir()
+    assert sorted(manifest_cache.get_sub_directories(str(tmp_path))) == [
+        "other",
+        "test",
+    ]
+
+    manifest_cache.async_schedule_save()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    assert data["manifests"][str(manifest_path)][2] == {
+        "domain": "test",
+        "name": "Changed",
+    }
+    assert sorted(data["directories"][str(tmp_path)][1]) == ["other", "test"]
+
+
+async def test_manifest_cache_from_storage(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: pathlib.Path
+) -> None:
+    """Test the stored manifest cache is only used for the same version."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+    stat_result = manifest_path.stat()
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "manifests": {
+                str(manifest_path): [
+                    stat_result.st_mtime_ns,
+                    stat_result.st_size,
+                    {"domain": "test", "name": "Cached"},
+                ]
+            },
+            "directories": {},
+        },
+    }
+    manifest_cache = await loader.async_get_manifest_cache(hass)
+    assert manifest_cache.get_manifest(manifest_path) == {
+        "domain": "test",
+        "name": "Cached",
+    }
+
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["ha_version"] = "0.1"
+    manifest_cache = loader.ManifestCache(
+        Mock(), hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    )
+    assert manifest_cache.get_manifest(manifest_path) == {
+        "domain": "test",
+        "name": "Test",
+    }
+
+
+async def test_get_integration_manifest_cache(hass: HomeAssistant) -> None:
+    """Test built-in integrations are resolved with the manifest cache."""
+    integration = await loader.async_get_integration(hass, "hue")
+    manifest_cache = await loader.async_get_manifest_cache(hass)
+    assert manifest_cache.get_manifest(integration.file_path / "manifest.json") == {
+        key: value
+        for key, value in integration.manifest.items()
+        if key != "is_built_in"
+    }
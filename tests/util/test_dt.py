@@ -739,6 +739,43 @@ def test_find_next_time_expression_tenth_second_pattern_does_not_drift_entering_
         prev_target = next_target
 
 
+@pytest.mark.parametrize("time_zone", ["UTC", "Europe/Amsterdam", "America/Chicago"])
+@pytest.mark.parametrize(
+    "hour_minute_second",
+    [
+        (None, "/5", "0"),
+        (None, None, "/10"),
+        ("2", "30", "0"),
+        ([1, 2, 3], "0", "0"),
+        ("23", "59", "59"),
+    ],
+)
+@pytest.mark.parametrize(
+    "start",
+    [datetime(2021, 3, 27, 22, tzinfo=UTC), datetime(2021, 10, 30, 22, tzinfo=UTC)],
+)
+def test_find_next_time_expression_table_time(
+    time_zone: str, hour_minute_second: tuple, start: datetime
+) -> None:
+    """Test the table lookup matches finding the next time around DST changes."""
+    tz = dt_util.get_time_zone(time_zone)
+    matching_hours, matching_minutes, matching_seconds = _get_matches(
+        *hour_minute_second
+    )
+    table = dt_util.time_expression_table(
+        matching_seconds, matching_minutes, matching_hours
+    )
+    for step in range(0, 2 * 24 * 3600, 599):
+        now = (start + timedelta(seconds=step, microseconds=400000)).astimezone(tz)
+        expected = dt_util.find_next_time_expression_time(
+            now, matching_seconds, matching_minutes, matching_hours
+        )
+        next_time = dt_util.find_next_time_expression_table_time(
+            now, table, matching_seconds, matching_minutes, matching_hours
+        )
+        assert (next_time, next_time.utcoffset()) == (expected, expected.utcoffset())
+
+
 def test_monotonic_time_coarse() -> None:
     """Test monotonic time coarse."""
     assert abs(time.monotonic() - dt_util.monotonic_time_coarse()) < 1
@@ -6,7 +6,13 @@ from unittest.mock import patch
 import py
 import pytest
 
-from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
+from homeassistant.util import file as file_util
+from homeassistant.util.file import (
+    WriteError,
+    write_utf8_file,
+    write_utf8_file_atomic,
+    write_utf8_files,
+)
 
 
 @pytest.mark.parametrize("func", [write_utf8_file, write_utf8_file_atomic])
@@ -82,3 +88,71 @@ def test_write_utf8_file_atomic_fails(tmpdir: py.path.local) -> None:
         write_utf8_file_atomic(test_file, '{"some":"data"}', False)
 
     assert not os.path.exists(test_file)
+
+
+def test_write_utf8_files_syncs_together(tmpdir: py.path.local) -> None:
+    """Test durable files are synced after all files are written."""
+    test_dir = tmpdir.mkdir("files")
+    files = [
+        (str(test_dir / f"test{idx}.json"), f'{{"idx":{idx}}}', idx == 2, idx != 1)
+        for idx in range(3)
+    ]
+    calls: list[tuple[str, str]] = []
+    original_fsync_path = file_util._fsync_path
+    original_replace = os.replace
+
+    def _fsync_path(path: str) -> None:
+        calls.append(("fsync", path))
+        original_fsync_path(path)
+
+    def _replace(src: str, dst: str) -> None:
+        calls.append(("replace", dst))
+        original_replace(src, dst)
+
+    with patch("homeassistant.util.file._fsync_path", side_effect=_fsync_path), patch(
+        "homeassistant.util.file.os.replace", side_effect=_replace
+    ):
+        assert write_utf8_files(files) == [None, None, None]
+
+    assert [call for call, _ in calls] == [
+        "fsync",
+        "fsync",
+        "replace",
+        "replace",
+        "replace",
+        "fsync",
+    ]
+    assert calls[-1] == ("fsync", str(test_dir))
+    for filename, data, private, _ in files:
+        with open(filename) as fh:
+            assert fh.read() == data
+        assert os.stat(filename).st_mode & 0o777 == (0o600 if private else 0o644)
+    assert sorted(os.listdir(test_dir)) == ["test0.json", "test1.json", "test2.json"]
+
+
+def test_write_utf8_files_fails_one_file(tmpdir: py.path.local) -> None:
+    """Test a file which cannot be written does not fail the others."""
+    test_dir = tmpdir.mkdir("files")
+    good_file = str(test_dir / "good.json")
+    bad_file = str(test_dir / "missing" / "bad.json")
+
+    errors = write_utf8_files(
+        [(bad_file, '{"some":"data"}', False, True), (good_file, "{}", False, True)]
+    )
+
+    assert isinstance(errors[0], WriteError)
+    assert errors[1] is None
+    assert not os.path.exists(bad_file)
+    assert os.listdir(test_dir) == ["good.json"]
+
+
+def test_write_utf8_files_fails_at_rename(tmpdir: py.path.local) -> None:
+    """Test the temporary files are removed when renaming fails."""
+    test_dir = tmpdir.mkdir("files")
+    test_file = str(test_dir / "test.json")
+
+    with patch("homeassistant.util.file.os.replace", side_effect=OSError):
+        errors = write_utf8_files([(test_file, '{"some":"data"}', False, True)])
+
+    assert isinstance(errors[0], WriteError)
+    assert os.listdir(test_dir) == []
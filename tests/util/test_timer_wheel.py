@@ -0,0 +1,110 @@
+"""Test the timer wheel."""
+import asyncio
+
+import pytest
+
+from homeassistant.util.timer_wheel import TimerWheel
+
+
+async def test_timers_in_a_slot_fire_together() -> None:
+    """Test timers due in the same slot fire in one wakeup in order."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.05)
+    fired: list[str] = []
+    now = loop.time()
+
+    def _fire(name: str) -> None:
+        fired.append(name)
+        loop.call_soon(fired.append, "next iteration")
+
+    wheel.call_at(now + 0.031, "a", _fire, "late")
+    wheel.call_at(now + 0.03, "a", _fire, "early")
+    scheduled = [
+        handle
+        for handle in getattr(loop, "_scheduled")
+        if not handle.cancelled() and handle.when() - now < 1
+    ]
+    assert len(scheduled) == 1
+    assert scheduled[0].when() >= now + 0.031
+
+    await asyncio.sleep(0.15)
+    assert fired == ["late", "early", "next iteration", "next iteration"]
+    assert wheel.pending_timers() == {}
+
+
+async def test_cancel_and_pending_timers() -> None:
+    """Test cancelled timers do not fire and pending timers are counted."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.01)
+    fired: list[str] = []
+
+    first = wheel.call_later(0.02, "sensor", fired.append, "first")
+    wheel.call_later(0.02, "sensor", fired.append, "second")
+    later = wheel.call_later(10, "automation", fired.append, "later")
+    assert wheel.pending_timers() == {"sensor": 2, "automation": 1}
+
+    first.cancel()
+    first.cancel()
+    assert first.cancelled()
+    assert wheel.pending_timers() == {"sensor": 1, "automation": 1}
+
+    await asyncio.sleep(0.05)
+    assert fired == ["second"]
+    assert wheel.pending_timers() == {"automation": 1}
+
+    later.cancel()
+    assert wheel.pending_timers() == {}
+
+
+async def test_timers_scheduled_while_firing() -> None:
+    """Test timers scheduled by a timer that are already due fire next wakeup."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.01)
+    fired: list[int] = []
+
+    def _reschedule(count: int) -> None:
+        fired.append(count)
+        if count < 3:
+            wheel.call_at(loop.time() - 1, "test", _reschedule, count + 1)
+
+    wheel.call_later(0, "test", _reschedule, 0)
+    async with asyncio.timeout(1):
+        while len(fired) < 4:
+            await asyncio.sleep(0)
+    assert fired == [0, 1, 2, 3]
+    assert wheel.pending_timers() == {}
+
+
+async def test_earlier_slot_reschedules_wakeup() -> None:
+    """Test a timer in an earlier slot moves the wakeup forward."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.01)
+    fired: list[str] = []
+
+    later = wheel.call_later(10, "test", fired.append, "later")
+    wheel.call_later(0.01, "test", fired.append, "sooner")
+    await asyncio.sleep(0.05)
+    assert fired == ["sooner"]
+    later.cancel()
+
+
+async def test_exception_in_timer(caplog: pytest.LogCaptureFixture) -> None:
+    """Test an exception in a timer does not stop the other timers."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, 0.01)
+    fired: list[str] = []
+
+    def _raise() -> None:
+        raise ValueError("boom")
+
+    wheel.call_later(0.01, "test", _raise)
+    wheel.call_later(0.01, "test", fired.append, "after")
+    await asyncio.sleep(0.05)
+    assert fired == ["after"]
+    assert "Error running timer" in caplog.text
+
+
+async def test_invalid_resolution() -> None:
+    """Test the resolution must be positive."""
+    with pytest.raises(ValueError):
+        TimerWheel(asyncio.get_running_loop(), 0)
@@ -1,6 +1,8 @@
 """Test Home Assistant yaml loader."""
+from datetime import date
 import importlib
 import io
+import json
 import os
 import pathlib
 from typing import Any
@@ -547,3 +549,117 @@ async def test_loading_actual_file_with_syntax(
             "fixtures", "bad.yaml.txt"
         )
         await hass.async_add_executor_job(load_yaml_config_file, fixture_path)
+
+
+def _write_snapshot_config(config_dir: pathlib.Path) -> str:
+    """Write a configuration that includes files, secrets and variables."""
+    (config_dir / "packages").mkdir()
+    (config_dir / "packages" / "lights.yaml").write_text(
+        "lights:\n  light:\n    - platform: demo\n"
+    )
+    (config_dir / "packages" / "switches.yaml").write_text(
+        "switches:\n  switch:\n    - platform: demo\n"
+    )
+    (config_dir / "sensors.yaml").write_text(
+        "- platform: demo\n  password: !secret password\n"
+    )
+    (config_dir / "secrets.yaml").write_text("password: hunter2\n")
+    (config_dir / YAML_CONFIG_FILE).write_text(
+        "homeassistant:\n"
+        "  packages: !include_dir_merge_named packages\n"
+        "sensor: !include sensors.yaml\n"
+        "password: !secret password\n"
+        "user: !env_var SNAPSHOT_USER\n"
+        "since: 2024-01-01\n"
+    )
+    return str(config_dir / YAML_CONFIG_FILE)
+
+
+def test_yaml_snapshot(
+    try_both_loaders, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test only changed files are parsed again with a snapshot."""
+    monkeypatch.setenv("SNAPSHOT_USER", "paulus")
+    config_path = _write_snapshot_config(tmp_path)
+    secrets = yaml.Secrets(tmp_path)
+    snapshot = yaml.YamlSnapshot()
+
+    conf = load_yaml_config_file(config_path, secrets, snapshot)
+    assert conf == load_yaml_config_file(config_path, secrets)
+    assert conf["password"] == "hunter2"
+    assert conf["sensor"][0]["password"] == "hunter2"
+    assert conf["user"] == "paulus"
+    assert conf["since"] == date(2024, 1, 1)
+    assert snapshot.misses == 4
+    assert snapshot.hits == 0
+    assert snapshot.dirty
+
+    conf["sensor"].append({"platform": "template"})
+    conf = load_yaml_config_file(config_path, secrets, snapshot)
+    assert conf == load_yaml_config_file(config_path, secrets)
+    assert conf["sensor"][0]["password"] == "hunter2"
+    assert conf["sensor"].__config_file__ == config_path
+    assert conf["sensor"][0].__line__ == 0
+    assert snapshot.misses == 4
+    assert snapshot.hits == 1
+
+    # Only the changed file and the file including it are parsed again
+    (tmp_path / "packages" / "lights.yaml").write_text(
+        "lights:\n  light:\n    - platform: template\n"
+    )
+    conf = load_yaml_config_file(config_path, secrets, snapshot)
+    assert conf["homeassistant"]["packages"]["lights"] == {
+        "light": [{"platform": "template"}]
+    }
+    assert snapshot.misses == 6
+    assert snapshot.hits == 3
+
+    (tmp_path / "packages" / "covers.yaml").write_text(
+        "covers:\n  cover:\n    - platform: demo\n"
+    )
+    conf = load_yaml_config_file(config_path, secrets, snapshot)
+    assert "covers" in conf["homeassistant"]["packages"]
+    assert snapshot.misses == 8
+
+    # Secrets and environment variables are resolved again when loaded
+    (tmp_path / "secrets.yaml").write_text("password: changed\n")
+    conf = load_yaml_config_file(config_path, yaml.Secrets(tmp_path), snapshot)
+    assert conf["password"] == "changed"
+    assert conf["sensor"][0]["password"] == "changed"
+    assert snapshot.misses == 8
+
+    monkeypatch.setenv("SNAPSHOT_USER", "balloob")
+    conf = load_yaml_config_file(config_path, yaml.Secrets(tmp_path), snapshot)
+    assert conf["user"] == "balloob"
+    assert snapshot.misses == 8
+
+    monkeypatch.delenv("SNAPSHOT_USER")
+    with pytest.raises(HomeAssistantError):
+        load_yaml_config_file(config_path, yaml.Secrets(tmp_path), snapshot)
+
+
+def test_yaml_snapshot_as_dict(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a snapshot can be restored from its dictionary."""
+    monkeypatch.setenv("SNAPSHOT_USER", "paulus")
+    config_path = _write_snapshot_config(tmp_path)
+    snapshot = yaml.YamlSnapshot()
+    conf = load_yaml_config_file(config_path, yaml.Secrets(tmp_path), snapshot)
+    data = json.loads(json.dumps(snapshot.as_dict()))
+    assert "hunter2" not in json.dumps(data)
+    assert "paulus" not in json.dumps(data)
+
+    snapshot = yaml.YamlSnapshot(data)
+    assert load_yaml_config_file(config_path, yaml.Secrets(tmp_path), snapshot) == conf
+    assert snapshot.misses == 0
+    assert snapshot.hits == 1
+
+    snapshot = yaml.YamlSnapshot({**data, "files": {config_path: "unknown"}})
+    assert load_yaml_config_file(config_path, yaml.Secrets(tmp_path), snapshot) == conf
+    assert snapshot.misses == 4
+
+    data["ha_version"] = "0.1"
+    snapshot = yaml.YamlSnapshot(data)
+    assert load_yaml_config_file(config_path, yaml.Secrets(tmp_path), snapshot) == conf
+    assert snapshot.misses == 4